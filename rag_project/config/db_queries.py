@@ -15,13 +15,45 @@ SQL_INSERT_COMPANY_INFO = (
     "INSERT INTO company_info (document_id, name, industry) VALUES (%s, %s, %s)"
 )
 SQL_DELETE_DOCUMENT = "DELETE FROM documents WHERE id = %s"
-SQL_INSERT_CHUNK = "INSERT INTO chunks (id, document_id, chunk_index, content, token_count, created_at) VALUES (%s, %s, %s, %s, %s, %s)"
-SQL_INSERT_EMBEDDING = "INSERT INTO embeddings (chunk_id, embedding, created_at) VALUES (%s, %s::vector, NOW())"
+# Set-based deletes: one statement per batch; chunks, embeddings and subtype rows
+# go through ON DELETE CASCADE in the same transaction.
+SQL_DELETE_DOCUMENTS = "DELETE FROM documents WHERE id = ANY(%s::uuid[])"
+SQL_DELETE_DOCUMENTS_BY_FILTER = "DELETE FROM documents d WHERE {where_sql}"
+SQL_DELETE_WHERE_DOC_TYPE = "d.doc_type = %s"
+SQL_DELETE_WHERE_CREATED_BEFORE = "d.created_at < %s"
+SQL_DELETE_WHERE_COMPANY = (
+    "EXISTS (SELECT 1 FROM job_postings jp "
+    "WHERE jp.document_id = d.id AND jp.company ILIKE %s)"
+)
+# Multi-row inserts: {values} is one row placeholder per row, so a batch is one
+# statement and the statement-level doc_type_stats triggers run once per batch.
+SQL_INSERT_CHUNKS = "INSERT INTO chunks (id, document_id, chunk_index, content, token_count, created_at) VALUES {values}"
+SQL_INSERT_CHUNK_VALUES = "(%s, %s, %s, %s, %s, %s)"
+SQL_INSERT_EMBEDDINGS = (
+    "INSERT INTO embeddings (chunk_id, embedding, created_at) VALUES {values}"
+)
+SQL_INSERT_EMBEDDING_VALUES = "(%s, %s::vector, NOW())"
 SQL_WHERE_MIN_MATCH = "COALESCE(jp.match_score, 0) >= %s"
 SQL_WHERE_POSTED_AFTER = "jp.posted_at >= TO_TIMESTAMP(%s)"
 SQL_WHERE_DOC_TYPES = "d.doc_type = ANY(%s)"
 SQL_WHERE_COMPANY_FILTER = "jp.company ILIKE %s"
-SQL_VECTOR_SEARCH_QUERY = """
+# Ranking score, computed once per row and shared by SELECT and ORDER BY.
+# Params: query embedding, then weights (similarity, match_score, recency) and
+# the recency decay in days, so callers can tune them without re-formatting SQL.
+_SQL_SEARCH_SCORE_JOIN = """
+                CROSS JOIN LATERAL (
+                    SELECT
+                        e.embedding <=> %s::vector AS distance,
+                        COALESCE(jp.match_score, 0) AS match_score,
+                        GREATEST(0, EXTRACT(EPOCH FROM (NOW() - COALESCE(jp.posted_at, NOW()))) / 86400) AS age_days
+                ) s
+                CROSS JOIN LATERAL (
+                    SELECT %s::float8 * (1 - s.distance)
+                        + %s::float8 * s.match_score
+                        + %s::float8 * EXP(-s.age_days / %s::float8) AS score
+                ) sc"""
+SQL_SEARCH_SELECT = (
+    """
                 SELECT
                     c.id AS chunk_id,
                     c.document_id,
@@ -44,21 +76,61 @@ SQL_VECTOR_SEARCH_QUERY = """
                     pd.category,
                     ci.name,
                     ci.industry,
-                    (e.embedding <=> %s::vector) AS distance,
-                    COALESCE(jp.match_score, 0) AS match_score,
-                    EXTRACT(EPOCH FROM (NOW() - COALESCE(jp.posted_at, NOW()))) / 86400 AS age_days
+                    sc.score
                 FROM embeddings e
                 JOIN chunks c ON c.id = e.chunk_id
                 JOIN documents d ON d.id = c.document_id
                 LEFT JOIN job_postings jp ON jp.document_id = d.id
                 LEFT JOIN personal_documents pd ON pd.document_id = d.id
-                LEFT JOIN company_info ci ON ci.document_id = d.id
+                LEFT JOIN company_info ci ON ci.document_id = d.id"""
+    + _SQL_SEARCH_SCORE_JOIN
+)
+SQL_LEAN_SEARCH_SELECT = (
+    """
+                SELECT
+                    c.id AS chunk_id,
+                    c.document_id,
+                    c.chunk_index,
+                    c.token_count,
+                    d.doc_type,
+                    d.created_at,
+                    jp.title,
+                    jp.company,
+                    jp.url,
+                    pd.category,
+                    sc.score
+                FROM embeddings e
+                JOIN chunks c ON c.id = e.chunk_id
+                JOIN documents d ON d.id = c.document_id
+                LEFT JOIN job_postings jp ON jp.document_id = d.id
+                LEFT JOIN personal_documents pd ON pd.document_id = d.id"""
+    + _SQL_SEARCH_SCORE_JOIN
+)
+_SQL_VECTOR_SEARCH_TAIL = """
                 WHERE {where_sql}
-                ORDER BY ({WEIGHT_SIMILARITY} * (1 - (e.embedding <=> %s::vector))
-                          + {WEIGHT_MATCH_SCORE} * COALESCE(jp.match_score, 0)
-                          + {WEIGHT_RECENCY} * EXP(-GREATEST(0, COALESCE(EXTRACT(EPOCH FROM (NOW() - COALESCE(jp.posted_at, NOW()))) / 86400, 0)) / {RECENCY_DECAY_DAYS})) DESC
+                ORDER BY sc.score DESC
+                LIMIT %s
+            """
+# Lexical arm of hybrid retrieval. The tsquery ORs the de/en/fr stemmed forms with
+# the unstemmed 'simple' form so exact tokens (PySpark, S/4HANA) still match.
+_SQL_KEYWORD_SEARCH_TAIL = """
+                CROSS JOIN (
+                    SELECT websearch_to_tsquery('simple', t.q)
+                        || websearch_to_tsquery('english', t.q)
+                        || websearch_to_tsquery('german', t.q)
+                        || websearch_to_tsquery('french', t.q) AS query
+                    FROM (SELECT %s::text AS q) t
+                ) kq
+                WHERE c.content_tsv @@ kq.query AND {where_sql}
+                ORDER BY ts_rank_cd(c.content_tsv, kq.query) DESC
                 LIMIT %s
             """
+SQL_VECTOR_SEARCH_QUERY = SQL_SEARCH_SELECT + _SQL_VECTOR_SEARCH_TAIL
+SQL_LEAN_VECTOR_SEARCH_QUERY = SQL_LEAN_SEARCH_SELECT + _SQL_VECTOR_SEARCH_TAIL
+SQL_KEYWORD_SEARCH_QUERY = SQL_SEARCH_SELECT + _SQL_KEYWORD_SEARCH_TAIL
+SQL_LEAN_KEYWORD_SEARCH_QUERY = SQL_LEAN_SEARCH_SELECT + _SQL_KEYWORD_SEARCH_TAIL
+SQL_HYDRATE_CHUNK_CONTENT = "SELECT id, content FROM chunks WHERE id = ANY(%s)"
+SQL_HYDRATE_DOCUMENT_METADATA = "SELECT id, metadata FROM documents WHERE id = ANY(%s)"
 
 HEALTHCHECK_DB_PING_QUERY = "SELECT 1"
 HEALTHCHECK_EXT_QUERY = "SELECT extname FROM pg_extension WHERE extname = ANY(%s)"
@@ -103,13 +175,27 @@ __all__ = [
     "SQL_INSERT_PERSONAL_DOCUMENT",
     "SQL_INSERT_COMPANY_INFO",
     "SQL_DELETE_DOCUMENT",
-    "SQL_INSERT_CHUNK",
-    "SQL_INSERT_EMBEDDING",
+    "SQL_DELETE_DOCUMENTS",
+    "SQL_DELETE_DOCUMENTS_BY_FILTER",
+    "SQL_DELETE_WHERE_DOC_TYPE",
+    "SQL_DELETE_WHERE_CREATED_BEFORE",
+    "SQL_DELETE_WHERE_COMPANY",
+    "SQL_INSERT_CHUNKS",
+    "SQL_INSERT_CHUNK_VALUES",
+    "SQL_INSERT_EMBEDDINGS",
+    "SQL_INSERT_EMBEDDING_VALUES",
     "SQL_WHERE_MIN_MATCH",
     "SQL_WHERE_POSTED_AFTER",
     "SQL_WHERE_DOC_TYPES",
     "SQL_WHERE_COMPANY_FILTER",
+    "SQL_SEARCH_SELECT",
+    "SQL_LEAN_SEARCH_SELECT",
     "SQL_VECTOR_SEARCH_QUERY",
+    "SQL_LEAN_VECTOR_SEARCH_QUERY",
+    "SQL_KEYWORD_SEARCH_QUERY",
+    "SQL_LEAN_KEYWORD_SEARCH_QUERY",
+    "SQL_HYDRATE_CHUNK_CONTENT",
+    "SQL_HYDRATE_DOCUMENT_METADATA",
     "HEALTHCHECK_DB_PING_QUERY",
     "HEALTHCHECK_EXT_QUERY",
     "HEALTHCHECK_TABLE_QUERY",
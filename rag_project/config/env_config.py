@@ -40,6 +40,11 @@ DB_PASS = _env_first(
 DB_CONNECT_TIMEOUT = 60
 DB_RETRY_MAX_ATTEMPTS = 3
 DB_RETRY_BACKOFF = 0.2
+# Pooled connections keep their prepared search statements between calls.
+DB_POOL_MIN_SIZE = 1
+DB_POOL_MAX_SIZE = 4
+# Rows per multi-row INSERT (6 bind parameters per chunk row; Postgres allows 65535).
+DB_INSERT_BATCH_ROWS = 1000
 # Backward-compatible aliases
 DB_DEFAULT_HOST = DB_HOST
 DB_DEFAULT_PORT = DB_PORT
@@ -63,6 +68,30 @@ LOG_FORMAT = LOG_FMT
 DEFAULT_LOG_LEVEL = LOG_LEVEL_DEFAULT
 HF_CACHE_DEFAULT_PATH = HF_CACHE_PATH
 
+# Tracing (OTLP/JSON lines; off unless TRACE_EXPORT_PATH is set, e.g. logs/traces.jsonl)
+TRACE_EXPORT_PATH = _env_first(["TRACE_EXPORT_PATH"], "")
+TRACE_SERVICE_NAME = "rag_project"
+
+# Metrics (in-process registry; the OpenMetrics endpoint is off unless METRICS_PORT is set)
+METRICS_PORT = int(_env_first(["METRICS_PORT"], "0"))
+METRICS_HOST = _env_first(["METRICS_HOST"], "127.0.0.1")
+METRICS_DEFAULT_BUCKETS_SECONDS = (
+    0.005,
+    0.01,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+    30.0,
+    60.0,
+    120.0,
+    300.0,
+)
+
 # Ollama / LLM endpoints
 OLLAMA_HOST = "http://127.0.0.1:11434"
 OLLAMA_TIMEOUT = 1200.0
@@ -72,6 +101,21 @@ OLLAMA_NUM_CTX_DEFAULT = 6000
 OLLAMA_STREAM = False
 OLLAMA_NUM_PREDICT = "num_predict"
 OLLAMA_GENERATE_ENDPOINT = "/api/generate"
+OLLAMA_NUM_CTX_KEY = "num_ctx"
+OLLAMA_NUM_THREAD_KEY = "num_thread"
+OLLAMA_TEMPERATURE_KEY = "temperature"
+# How long Ollama keeps a model resident after a call; per-model keep_alive wins.
+OLLAMA_KEEP_ALIVE = _env_first(["OLLAMA_KEEP_ALIVE"], "30m")
+# CPU threads per model (0 = let Ollama decide); per-model num_thread wins.
+OLLAMA_NUM_THREAD = int(_env_first(["OLLAMA_NUM_THREAD"], "0"))
+# Models loaded at startup: comma/space separated ids, "primary" or "none".
+OLLAMA_PREWARM_MODELS = _env_first(["OLLAMA_PREWARM_MODELS"], "primary")
+# LLM call scheduler (groups concurrent calls by model to avoid Ollama swaps)
+LLM_SCHEDULER_ENABLED = _env_first(["LLM_SCHEDULER_ENABLED"], "1") == "1"
+# How many calls of the active model run at once; matches the default
+# STRUCTURED_LLM_CONCURRENCY so chunk-assist threads are not serialized here.
+LLM_SCHEDULER_MAX_CONCURRENCY = int(_env_first(["LLM_SCHEDULER_MAX_CONCURRENCY"], "4"))
+LLM_SCHEDULER_MAX_STREAK = int(_env_first(["LLM_SCHEDULER_MAX_STREAK"], "8"))
 # Backward-compatible aliases
 OLLAMA_DEFAULT_HOST = OLLAMA_HOST
 OLLAMA_HEALTHCHECK_PATH = OLLAMA_HEALTH_PATH
@@ -111,6 +155,9 @@ __all__ = [
     "DB_CONNECT_TIMEOUT",
     "DB_RETRY_MAX_ATTEMPTS",
     "DB_RETRY_BACKOFF",
+    "DB_POOL_MIN_SIZE",
+    "DB_POOL_MAX_SIZE",
+    "DB_INSERT_BATCH_ROWS",
     "TEST_DB_NAME",
     "DB_DEFAULT_HOST",
     "DB_DEFAULT_PORT",
@@ -135,6 +182,15 @@ __all__ = [
     "OLLAMA_STREAM",
     "OLLAMA_NUM_PREDICT",
     "OLLAMA_GENERATE_ENDPOINT",
+    "OLLAMA_NUM_CTX_KEY",
+    "OLLAMA_NUM_THREAD_KEY",
+    "OLLAMA_TEMPERATURE_KEY",
+    "OLLAMA_KEEP_ALIVE",
+    "OLLAMA_NUM_THREAD",
+    "OLLAMA_PREWARM_MODELS",
+    "LLM_SCHEDULER_ENABLED",
+    "LLM_SCHEDULER_MAX_CONCURRENCY",
+    "LLM_SCHEDULER_MAX_STREAK",
     "OLLAMA_DEFAULT_HOST",
     "OLLAMA_HEALTHCHECK_PATH",
     "OLLAMA_HEALTH_TIMEOUT_SECONDS",
@@ -151,6 +207,11 @@ __all__ = [
     "LOG_FORMAT",
     "DEFAULT_LOG_LEVEL",
     "HF_CACHE_DEFAULT_PATH",
+    "TRACE_EXPORT_PATH",
+    "TRACE_SERVICE_NAME",
+    "METRICS_PORT",
+    "METRICS_HOST",
+    "METRICS_DEFAULT_BUCKETS_SECONDS",
     # Router history tuning
     "ROUTER_HISTORY_MAX_MESSAGES",
     "ROUTER_HISTORY_CHAR_BUDGET",
@@ -1,5 +1,8 @@
 """Model, embedding, ingestion, and retrieval configuration."""
 
+import os
+from pathlib import Path
+
 from .env_config import (
     _env_first,
     DB_HOST,
@@ -20,13 +23,24 @@ def _validate_model_selection(model_name: str, registry: dict):
         raise ValueError(f"Unknown model '{model_name}'. Available: {available}")
 
 
+# tokenizer_id: Hugging Face tokenizer matching the Ollama model (prompt token counts).
+# prompt_budget_tokens: cap on prompt size; capped again by the context left after
+# the requested output tokens (see rag_core/retrieval/prompt_budget.py).
+# ollama_num_ctx, keep_alive, temperature, num_thread: runtime options sent with every
+# call. Ollama reloads a model when num_ctx changes, so it is fixed per model; None
+# leaves the option to Ollama (num_thread falls back to OLLAMA_NUM_THREAD).
 LLM_MODEL_REGISTRY = {
     "qwen2.5:7b-instruct-q4_k_m": {
         "id": "qwen2.5:7b-instruct-q4_k_m",
         "timeout_seconds": 1200.0,
         "context_window": 128000,
         "max_output_tokens": 8192,
-        "ollama_num_ctx": 128000,
+        "ollama_num_ctx": 16384,
+        "tokenizer_id": "Qwen/Qwen2.5-7B-Instruct",
+        "prompt_budget_tokens": 12000,
+        "keep_alive": "30m",
+        "temperature": 0.1,
+        "num_thread": None,
     },
     "llama3.1:8b": {
         "id": "llama3.1:8b",
@@ -34,20 +48,35 @@ LLM_MODEL_REGISTRY = {
         "context_window": 128000,
         "max_output_tokens": 2048,
         "ollama_num_ctx": 16384,
+        "tokenizer_id": "unsloth/Meta-Llama-3.1-8B-Instruct",
+        "prompt_budget_tokens": 12000,
+        "keep_alive": "10m",
+        "temperature": 0.0,
+        "num_thread": None,
     },
     "qwen2.5:1.5b-instruct": {
         "id": "qwen2.5:1.5b-instruct",
         "timeout_seconds": 120.0,
         "context_window": 32768,
         "max_output_tokens": 4096,
-        "ollama_num_ctx": 128000,
+        "ollama_num_ctx": 8192,
+        "tokenizer_id": "Qwen/Qwen2.5-1.5B-Instruct",
+        "prompt_budget_tokens": 6000,
+        "keep_alive": "30m",
+        "temperature": 0.0,
+        "num_thread": None,
     },
     "llama3.1:8b-instruct-q8_0": {
         "id": "llama3.1:8b-instruct-q8_0",
         "timeout_seconds": 300.0,
         "context_window": 128000,
         "max_output_tokens": 4096,
-        "ollama_num_ctx": 128000,
+        "ollama_num_ctx": 16384,
+        "tokenizer_id": "unsloth/Meta-Llama-3.1-8B-Instruct",
+        "prompt_budget_tokens": 12000,
+        "keep_alive": "30m",
+        "temperature": 0.0,
+        "num_thread": None,
     },
 }
 
@@ -67,15 +96,40 @@ EMBEDDING_MODEL_REGISTRY = {
         "dim": 1024,
         "max_sequence_length": 8192,
         "target_embedding_tokens": 512,
+        "tokenizer_id": "BAAI/bge-m3",
         "language_support": "multilingual (100+ languages)",
         "proximity_weight_default": 0.3,
     },
 }
 
+RERANKER_MODEL_REGISTRY = {
+    "BAAI/bge-reranker-v2-m3": {
+        "id": "BAAI/bge-reranker-v2-m3",
+        "max_sequence_length": 512,
+        "batch_size": 16,
+        "language_support": "multilingual",
+    },
+    "BAAI/bge-reranker-base": {
+        "id": "BAAI/bge-reranker-base",
+        "max_sequence_length": 512,
+        "batch_size": 32,
+        "language_support": "en/zh",
+    },
+}
+
 EMBEDDING_MODEL_ID = _env_first(["EMBEDDING_MODEL_ID"], "BAAI/bge-m3")
 _validate_model_selection(EMBEDDING_MODEL_ID, EMBEDDING_MODEL_REGISTRY)
 EMBEDDING_MODEL = EMBEDDING_MODEL_REGISTRY[EMBEDDING_MODEL_ID]
 
+RERANKER_MODEL_ID = _env_first(["RERANKER_MODEL_ID"], "BAAI/bge-reranker-v2-m3")
+_validate_model_selection(RERANKER_MODEL_ID, RERANKER_MODEL_REGISTRY)
+RERANKER_MODEL = RERANKER_MODEL_REGISTRY[RERANKER_MODEL_ID]
+RERANKER_BATCH_SIZE = RERANKER_MODEL["batch_size"]
+RERANKER_MAX_LENGTH = RERANKER_MODEL["max_sequence_length"]
+RERANKER_DEPENDENCY_MESSAGE = (
+    "Reranking requires sentence-transformers with CrossEncoder support"
+)
+
 LLM_MODELS = {
     "llm_primary": LLM_MODEL_REGISTRY[PRIMARY_LLM],
     "llm_fallback": LLM_MODEL_REGISTRY[FALLBACK_LLM],
@@ -129,6 +183,17 @@ CHUNKER_DEFAULT_MAX_TOKENS = EMBEDDING_MODEL["target_embedding_tokens"]
 CHUNKER_DEFAULT_OVERLAP_TOKENS = int(CHUNKER_DEFAULT_MAX_TOKENS * 0.20)
 CHUNK_TOKEN_TARGET = CHUNKER_DEFAULT_MAX_TOKENS
 CHUNK_OVERLAP_TOKENS = CHUNKER_DEFAULT_OVERLAP_TOKENS
+# "words" sizes chunks in whitespace words; "tokens" in embedding-model tokens,
+# with word-based profile sizes scaled by CHUNK_TOKENS_PER_WORD unless a profile
+# sets target_tokens / overlap_tokens.
+CHUNK_SIZINGS = ("words", "tokens")
+CHUNK_SIZING = _env_first(["CHUNK_SIZING"], "words")
+if CHUNK_SIZING not in CHUNK_SIZINGS:
+    raise ValueError(
+        f"Unknown chunk sizing '{CHUNK_SIZING}'. "
+        f"Available: {', '.join(CHUNK_SIZINGS)}"
+    )
+CHUNK_TOKENS_PER_WORD = 1.4
 STRUCTURED_MIN_CHUNK_WORDS = 80
 STRUCTURED_MAX_LLM_INPUT_WORDS = 1800
 STRUCTURED_MAX_CHUNK_WORDS_HARD = 600
@@ -136,6 +201,16 @@ STRUCTURED_DEFAULT_PROXIMITY_WEIGHT = EMBEDDING_MODEL["proximity_weight_default"
 CHUNK_ASSIST_MAX_OUTPUT_TOKENS = LLM_MODELS["chunk_assist"]["max_output_tokens"]
 STRUCTURED_MIN_CHUNK_RATIO = 0.4
 STRUCTURED_MAX_CHUNK_RATIO = 1.25
+# Chunk-assist LLM boundary calls for different segments run concurrently in
+# STRUCTURED_LLM_CONCURRENCY threads of the calling process (1 = one at a time).
+# With the LLM scheduler on, at most LLM_SCHEDULER_MAX_CONCURRENCY of them run.
+STRUCTURED_LLM_CONCURRENCY = int(_env_first(["STRUCTURED_LLM_CONCURRENCY"], "4"))
+# Opt-in: texts of at least STRUCTURED_PARALLEL_MIN_WORDS words are chunked by a
+# long-lived pool of STRUCTURED_CHUNK_WORKERS processes (1 = serial, the default).
+# Below ~400k words the ~0.8 s worker start and the pickling (10-15% of the
+# serial time) outweigh the regex work saved (scripts/benchmark_parallel_chunker).
+STRUCTURED_CHUNK_WORKERS = int(_env_first(["STRUCTURED_CHUNK_WORKERS"], "1"))
+STRUCTURED_PARALLEL_MIN_WORDS = 400_000
 CHUNK_OVERSIZE_THRESHOLD_MULTIPLIER = 1.2
 CV_PROMPT_MAX_LINES = 400
 CV_MIN_RESPONSE_TOKENS = 512
@@ -143,6 +218,7 @@ CV_HEADING_KEYWORDS = (
     "skills",
     "fähigkeiten",
     "kompetenzen",
+    "kenntnisse",
     "profile",
     "profil",
     "summary",
@@ -164,6 +240,25 @@ CV_HEADING_KEYWORDS = (
     "languages",
 )
 CV_DATE_REGEX = r"\d{2}\.\d{4}"
+# Rule-based CV sections (chunk_cv only asks the LLM below CV_RULES_MIN_CONFIDENCE)
+CV_DATE_RANGE_REGEX = (
+    r"(?:\b(?:0?[1-9]|1[0-2])[./])?(?:19|20)\d{2}\s*(?:[-–—]|to|bis)\s*"
+    r"(?:(?:(?:0?[1-9]|1[0-2])[./])?(?:19|20)\d{2}|now|present|today|current|heute)"
+)
+CV_ENTRY_SECTION_KEYWORDS = (
+    "experience",
+    "work experience",
+    "berufserfahrung",
+    "projects",
+    "projekte",
+    "education",
+    "studium",
+    "ausbildung",
+)
+CV_HEADING_MAX_WORDS = 4
+CV_RULES_MIN_HEADINGS = 3
+CV_RULES_MAX_SECTION_LINES = 40
+CV_RULES_MIN_CONFIDENCE = float(_env_first(["CV_RULES_MIN_CONFIDENCE"], "0.7"))
 THESIS_SNIPPET_CHARS = 1000
 METADATA_SNIPPET_CHARS = 6000
 
@@ -231,24 +326,77 @@ PDF_PARSER = "pymupdf"
 USE_PYMUPDF_FOR_PDF = True
 GENERAL_FILTER_ENABLED = True
 THESIS_FILTER_ENABLED = True
-PARSER_TEXT_SUFFIXES = {".txt", ".md", ".html", ".htm"}
-PARSER_PDF_SUFFIX = ".pdf"
+# File parsers are registered by MIME type; suffixes map to MIME types and files
+# with an unknown suffix are sniffed from their first PARSER_SNIFF_BYTES bytes.
+PARSER_MIME_DOCX = (
+    "application/vnd.openxmlformats-officedocument.wordprocessingml.document"
+)
+PARSER_SUFFIX_MIME_TYPES = {
+    ".txt": "text/plain",
+    ".md": "text/markdown",
+    ".html": "text/html",
+    ".htm": "text/html",
+    ".pdf": "application/pdf",
+    ".docx": PARSER_MIME_DOCX,
+    ".json": "application/json",
+}
+PARSER_SNIFF_BYTES = 4096
 PARSER_PDF_DEPENDENCY_MESSAGE = "PDF parsing requires pymupdf4llm to be installed"
+PARSER_HTML_DEPENDENCY_MESSAGE = "HTML parsing requires beautifulsoup4 to be installed"
+PARSER_HTML_DROP_TAGS = ("script", "style", "noscript", "template", "svg", "head")
+# JSON feeds: each record of the top-level array (or of the first array-valued
+# key, e.g. {"jobs": [...]}) becomes one page, read PARSER_JSON_READ_CHARS at a time.
+PARSER_JSON_TITLE_KEYS = ("title", "name")
+PARSER_JSON_BODY_KEYS = ("description", "body", "text", "content")
+PARSER_JSON_READ_CHARS = 1 << 16
+PARSER_TEXT_PAGE_LINES = 500  # lines per page when streaming text files
+# PDFs with at least PARSER_PDF_PARALLEL_MIN_PAGES pages are converted in page
+# ranges by PARSER_PDF_WORKERS processes (1 = always sequential).
+PARSER_PDF_WORKERS = int(
+    _env_first(["PARSER_PDF_WORKERS"], str(min(4, os.cpu_count() or 1)))
+)
+PARSER_PDF_PARALLEL_MIN_PAGES = 24
+# Parsed PDF markdown keyed by file hash and parser version ("" disables)
+PARSER_CACHE_DIR = _env_first(
+    ["PARSER_CACHE_DIR"], str(Path.home() / ".cache" / "rag_project" / "parsed")
+)
+PARSER_CACHE_FORMAT_VERSION = "1"  # bump when parsed output changes shape
 
 CHUNK_OVERLAP_RATIO = 0.25
 
 # Chunking strategy selection
+CHUNK_STRATEGIES = ("structured", "semantic", "llm_cv_chunker")
+DEFAULT_CHUNK_STRATEGY = _env_first(["CHUNK_STRATEGY"], "structured")
+if DEFAULT_CHUNK_STRATEGY not in CHUNK_STRATEGIES:
+    raise ValueError(
+        f"Unknown chunk strategy '{DEFAULT_CHUNK_STRATEGY}'. "
+        f"Available: {', '.join(CHUNK_STRATEGIES)}"
+    )
 CHUNK_STRATEGY = {
     "cv": "llm_cv_chunker",
-    "default": "structured",
+    "default": DEFAULT_CHUNK_STRATEGY,
 }
-DEFAULT_CHUNK_STRATEGY = "structured"
+# Semantic chunker: break where the similarity of the SEMANTIC_WINDOW_SENTENCES
+# sentences before and after a gap falls into the lowest
+# (100 - SEMANTIC_BREAKPOINT_PERCENTILE)% of the document's gaps.
+SEMANTIC_WINDOW_SENTENCES = 3
+SEMANTIC_BREAKPOINT_PERCENTILE = 90
+SEMANTIC_EMBED_BATCH_SIZE = 64
+# Store the mean of a chunk's sentence embeddings instead of re-embedding it
+SEMANTIC_COMPOSE_EMBEDDINGS = _env_first(["SEMANTIC_COMPOSE_EMBEDDINGS"], "1") == "1"
 
 # Debug logging (ingestion chunking)
 INGEST_DEBUG_LOG_CHUNKS = False
 INGEST_DEBUG_LOG_PATH = _env_first(
     ["INGEST_DEBUG_LOG_PATH"], "logs/ingest_chunk_debug.log"
 )
+# Per-ingest JSON summaries (stage timings, throughput), one JSON object per line
+INGEST_METRICS_SUMMARY_PATH = _env_first(
+    ["INGEST_METRICS_SUMMARY_PATH"], "logs/ingest_metrics.jsonl"
+)
+# Streamed file ingestion: parse, chunk, embed and store page by page
+INGEST_STREAMING = _env_first(["INGEST_STREAMING"], "0") == "1"
+INGEST_STREAM_BATCH_CHUNKS = int(_env_first(["INGEST_STREAM_BATCH_CHUNKS"], "16"))
 
 # Retrieval/search defaults
 DEFAULT_SEARCH_LIMIT = 5
@@ -261,6 +409,22 @@ REPO_SEARCH_DEFAULT_DOC_TYPES = None
 TEST_MIN_MATCH_THRESHOLD = 0.8
 ANSWER_DEFAULT_TOP_K = 5
 
+# Search projections: "full" hydrates every row, "lean" returns ids/scores/doc_type and
+# job title/company/url only; content and metadata are loaded on demand via hydrate().
+SEARCH_PROJECTION_FULL = "full"
+SEARCH_PROJECTION_LEAN = "lean"
+HYDRATE_CONTENT = "content"
+HYDRATE_METADATA = "metadata"
+HYDRATE_ALL_FIELDS = (HYDRATE_CONTENT, HYDRATE_METADATA)
+
+# Retrieval modes (vector-only or vector + full-text fused with reciprocal rank fusion)
+RETRIEVAL_MODE_VECTOR = "vector"
+RETRIEVAL_MODE_HYBRID = "hybrid"
+RETRIEVAL_MODES = (RETRIEVAL_MODE_VECTOR, RETRIEVAL_MODE_HYBRID)
+DEFAULT_RETRIEVAL_MODE = RETRIEVAL_MODE_VECTOR
+HYBRID_RRF_K = 60  # damping constant from the original RRF paper
+HYBRID_CANDIDATE_MULTIPLIER = 4  # each arm fetches limit * multiplier before fusion
+
 # Document types
 SUPPORTED_DOC_TYPES = (
     "job_posting",
@@ -288,6 +452,11 @@ for _dt in CHUNK_PROFILES:
 LLM_DEFAULT_MAX_TOKENS = LLM_MODELS["llm_primary"]["max_output_tokens"]
 LLM_PROVIDER_DEFAULT_MAX_TOKENS = 256
 
+# Prompt token budgeting
+PROMPT_BUDGET_SAFETY_TOKENS = 64  # chat template / special tokens not in the text
+TOKENIZER_FALLBACK_CHARS_PER_TOKEN = 3.0  # conservative estimate without a tokenizer
+TOKENIZER_DEPENDENCY_MESSAGE = "Token counting requires transformers (AutoTokenizer)"
+
 # Health check settings
 REQUIRED_LLM_MODELS = {
     LLM_MODELS["llm_primary"]["id"],
@@ -342,6 +511,19 @@ JOB_MATCHING_MIN_MATCH_SCORE = 0.0  # recall-first
 JOB_MATCHING_EXTRACTION_MAX_TOKENS = 2000
 JOB_MATCHING_EVALUATION_MAX_TOKENS = 256
 JOB_MATCHING_JOB_TEXT_LIMIT = 6000  # characters for extraction prompt
+JOB_MATCHING_RERANK_CANDIDATES = 20  # over-fetch N chunks for the cross-encoder
+JOB_MATCHING_RERANK_TOP_K = 3  # keep best k reranked chunks as evidence
+JOB_MATCHING_EVIDENCE_CHARS = 500  # per-chunk excerpt (reranker input; no tokenizer)
+JOB_MATCHING_EVIDENCE_TOKEN_BUDGET = 1500  # evidence tokens per evaluator prompt
+JOB_MATCHING_PARALLEL_JOBS = 4  # worker threads per analyze_matches phase
+JOB_MATCHING_RETRIEVAL_MODE = _env_first(
+    ["JOB_MATCHING_RETRIEVAL_MODE"], DEFAULT_RETRIEVAL_MODE
+)
+if JOB_MATCHING_RETRIEVAL_MODE not in RETRIEVAL_MODES:
+    raise ValueError(
+        f"Unknown retrieval mode '{JOB_MATCHING_RETRIEVAL_MODE}'. "
+        f"Available: {', '.join(RETRIEVAL_MODES)}"
+    )
 
 # Ingestion progress stage percentages
 PROGRESS_START_STAGE_PCT = 5
@@ -358,6 +540,7 @@ PROGRESS_DONE_STAGE_PCT = 100
 PROGRESS_DONE_DETAIL_PCT = 100
 
 __all__ = [
+    "LLM_MODEL_REGISTRY",
     "LLM_MODELS",
     "MODELS",
     "VECTOR_SETTINGS",
@@ -379,6 +562,12 @@ __all__ = [
     "OLLAMA_TIMEOUT_SECONDS",
     "OLLAMA_DEFAULT_NUM_CTX",
     "EMBEDDING_MODEL_ID",
+    "EMBEDDING_MODEL_REGISTRY",
+    "RERANKER_MODEL_REGISTRY",
+    "RERANKER_MODEL_ID",
+    "RERANKER_BATCH_SIZE",
+    "RERANKER_MAX_LENGTH",
+    "RERANKER_DEPENDENCY_MESSAGE",
     "EMBEDDING_DIM",
     "CHUNK_ASSIST_MODEL_ID",
     "CV_CHUNKER_MODEL_ID",
@@ -386,6 +575,9 @@ __all__ = [
     "CHUNKER_DEFAULT_MAX_TOKENS",
     "CHUNKER_DEFAULT_OVERLAP_TOKENS",
     "CHUNK_TOKEN_TARGET",
+    "CHUNK_SIZING",
+    "CHUNK_SIZINGS",
+    "CHUNK_TOKENS_PER_WORD",
     "CHUNK_OVERLAP_TOKENS",
     "STRUCTURED_MIN_CHUNK_WORDS",
     "STRUCTURED_MAX_LLM_INPUT_WORDS",
@@ -394,11 +586,20 @@ __all__ = [
     "CHUNK_ASSIST_MAX_OUTPUT_TOKENS",
     "STRUCTURED_MIN_CHUNK_RATIO",
     "STRUCTURED_MAX_CHUNK_RATIO",
+    "STRUCTURED_LLM_CONCURRENCY",
+    "STRUCTURED_CHUNK_WORKERS",
+    "STRUCTURED_PARALLEL_MIN_WORDS",
     "CHUNK_OVERSIZE_THRESHOLD_MULTIPLIER",
     "CV_PROMPT_MAX_LINES",
     "CV_MIN_RESPONSE_TOKENS",
     "CV_HEADING_KEYWORDS",
     "CV_DATE_REGEX",
+    "CV_DATE_RANGE_REGEX",
+    "CV_ENTRY_SECTION_KEYWORDS",
+    "CV_HEADING_MAX_WORDS",
+    "CV_RULES_MIN_HEADINGS",
+    "CV_RULES_MAX_SECTION_LINES",
+    "CV_RULES_MIN_CONFIDENCE",
     "THESIS_SNIPPET_CHARS",
     "METADATA_SNIPPET_CHARS",
     "CHUNK_PROFILES",
@@ -406,14 +607,33 @@ __all__ = [
     "USE_PYMUPDF_FOR_PDF",
     "GENERAL_FILTER_ENABLED",
     "THESIS_FILTER_ENABLED",
-    "PARSER_TEXT_SUFFIXES",
-    "PARSER_PDF_SUFFIX",
+    "PARSER_MIME_DOCX",
+    "PARSER_SUFFIX_MIME_TYPES",
+    "PARSER_SNIFF_BYTES",
     "PARSER_PDF_DEPENDENCY_MESSAGE",
+    "PARSER_HTML_DEPENDENCY_MESSAGE",
+    "PARSER_HTML_DROP_TAGS",
+    "PARSER_JSON_TITLE_KEYS",
+    "PARSER_JSON_BODY_KEYS",
+    "PARSER_JSON_READ_CHARS",
+    "PARSER_TEXT_PAGE_LINES",
+    "PARSER_PDF_WORKERS",
+    "PARSER_PDF_PARALLEL_MIN_PAGES",
+    "PARSER_CACHE_DIR",
+    "PARSER_CACHE_FORMAT_VERSION",
     "CHUNK_OVERLAP_RATIO",
     "CHUNK_STRATEGY",
+    "CHUNK_STRATEGIES",
     "DEFAULT_CHUNK_STRATEGY",
+    "SEMANTIC_WINDOW_SENTENCES",
+    "SEMANTIC_BREAKPOINT_PERCENTILE",
+    "SEMANTIC_EMBED_BATCH_SIZE",
+    "SEMANTIC_COMPOSE_EMBEDDINGS",
     "INGEST_DEBUG_LOG_CHUNKS",
     "INGEST_DEBUG_LOG_PATH",
+    "INGEST_METRICS_SUMMARY_PATH",
+    "INGEST_STREAMING",
+    "INGEST_STREAM_BATCH_CHUNKS",
     "DEFAULT_SEARCH_LIMIT",
     "DEFAULT_MIN_MATCH_SCORE",
     "DEFAULT_QUERY_TOP_K",
@@ -423,6 +643,17 @@ __all__ = [
     "REPO_SEARCH_DEFAULT_DOC_TYPES",
     "TEST_MIN_MATCH_THRESHOLD",
     "ANSWER_DEFAULT_TOP_K",
+    "SEARCH_PROJECTION_FULL",
+    "SEARCH_PROJECTION_LEAN",
+    "HYDRATE_CONTENT",
+    "HYDRATE_METADATA",
+    "HYDRATE_ALL_FIELDS",
+    "RETRIEVAL_MODE_VECTOR",
+    "RETRIEVAL_MODE_HYBRID",
+    "RETRIEVAL_MODES",
+    "DEFAULT_RETRIEVAL_MODE",
+    "HYBRID_RRF_K",
+    "HYBRID_CANDIDATE_MULTIPLIER",
     "SUPPORTED_DOC_TYPES",
     "DOC_TYPE_JOB_POSTING",
     "DOC_TYPE_COMPANY",
@@ -433,6 +664,9 @@ __all__ = [
     "DEFAULT_DOC_TYPE",
     "LLM_DEFAULT_MAX_TOKENS",
     "LLM_PROVIDER_DEFAULT_MAX_TOKENS",
+    "PROMPT_BUDGET_SAFETY_TOKENS",
+    "TOKENIZER_FALLBACK_CHARS_PER_TOKEN",
+    "TOKENIZER_DEPENDENCY_MESSAGE",
     "REQUIRED_LLM_MODELS",
     "REQUIRED_EMBEDDING_MODELS",
     "REQUIRED_TABLES",
@@ -448,6 +682,12 @@ __all__ = [
     "JOB_MATCHING_EXTRACTION_MAX_TOKENS",
     "JOB_MATCHING_EVALUATION_MAX_TOKENS",
     "JOB_MATCHING_JOB_TEXT_LIMIT",
+    "JOB_MATCHING_RERANK_CANDIDATES",
+    "JOB_MATCHING_RERANK_TOP_K",
+    "JOB_MATCHING_EVIDENCE_CHARS",
+    "JOB_MATCHING_EVIDENCE_TOKEN_BUDGET",
+    "JOB_MATCHING_PARALLEL_JOBS",
+    "JOB_MATCHING_RETRIEVAL_MODE",
     "PROGRESS_START_STAGE_PCT",
     "PROGRESS_START_DETAIL_PCT",
     "PROGRESS_CHUNK_STAGE_PCT",
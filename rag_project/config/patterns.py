@@ -95,6 +95,7 @@ MIN_SPLIT_RATIO = 0.5
 FORCE_SPLIT_THRESHOLD_RULE = "len(chunk_words) > max_chunk_words_hard"
 SENTENCE_SPLIT_REGEX = r"(?<!\d)(?<=[\.\?!])\s+(?=[A-Z0-9])"
 CHUNK_OVERLAP_RATIO = 0.25
+DEDUP_MIN_OVERLAP_CHARS = 11  # shorter line overlaps are kept
 
 __all__ = [
     "BOUNDARY_PATTERNS",
@@ -123,4 +124,5 @@ __all__ = [
     "FORCE_SPLIT_THRESHOLD_RULE",
     "SENTENCE_SPLIT_REGEX",
     "CHUNK_OVERLAP_RATIO",
+    "DEDUP_MIN_OVERLAP_CHARS",
 ]
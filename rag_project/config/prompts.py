@@ -22,11 +22,12 @@ METADATA_EXTRACTION_PROMPT = """
         """
 MSG_METADATA_EXTRACTION = "Extracting metadata with LLM..."
 MSG_PARSE_PROGRESS = "Parsing input ({word_count} words)"
-DEFAULT_CHUNK_STRATEGY = "structured"
+MSG_STREAM_PARSE_PROGRESS = "Parsing input (streaming)"
 MSG_CV_CHUNK_STRATEGY = "Chunking strategy: cv llm (model={model})"
 CV_CHUNKER_MODEL_PARAM = "model"
 CV_CHUNK_DEBUG_FORMATS = {
     "header": "=== CV CHUNK DEBUG ({doc_id}) ===\n",
+    "split_source": "split_source={split_source} rule_confidence={rule_confidence}\n",
     "split_points": "split_points={split_points}\n",
     "num_chunks": "num_chunks={num_chunks} lines={num_lines}\n",
     "prompt_truncated": "prompt_truncated={prompt_truncated}\n",
@@ -34,11 +35,15 @@ CV_CHUNK_DEBUG_FORMATS = {
     "response_label": "LLM RESPONSE:\n",
 }
 MSG_STRUCTURED_STRATEGY = "Chunking strategy: structured (max={max_chunk}, overlap={overlap}, min={min_chunk}, llm={llm_flag})"
+MSG_SEMANTIC_STRATEGY = "Chunking strategy: semantic (max={max_chunk}, overlap={overlap}, min={min_chunk}, composed embeddings={composed})"
 MSG_CHUNKING_COMPLETE = "Chunking complete: {count} chunks"
 MSG_EMBEDDING_START = "Embedding {count} chunks..."
 EMBED_PROGRESS_FORMULA = "idx/total * 100"
 MSG_EMBEDDING_FINISHED = "Embedding finished"
 MSG_WRITE_STAGE = "Writing to database"
+MSG_STREAM_BATCH_STORED = (
+    "Embedding and writing: {count} chunks stored ({words} words parsed)"
+)
 MSG_INGESTION_DONE = "Ingestion completed in {time:.2f}s ({count} chunks)"
 
 RETRIEVAL_SYSTEM_PROMPT = (
@@ -266,16 +271,18 @@ __all__ = [
     "METADATA_EXTRACTION_PROMPT",
     "MSG_METADATA_EXTRACTION",
     "MSG_PARSE_PROGRESS",
-    "DEFAULT_CHUNK_STRATEGY",
+    "MSG_STREAM_PARSE_PROGRESS",
     "MSG_CV_CHUNK_STRATEGY",
     "CV_CHUNKER_MODEL_PARAM",
     "CV_CHUNK_DEBUG_FORMATS",
     "MSG_STRUCTURED_STRATEGY",
+    "MSG_SEMANTIC_STRATEGY",
     "MSG_CHUNKING_COMPLETE",
     "MSG_EMBEDDING_START",
     "EMBED_PROGRESS_FORMULA",
     "MSG_EMBEDDING_FINISHED",
     "MSG_WRITE_STAGE",
+    "MSG_STREAM_BATCH_STORED",
     "MSG_INGESTION_DONE",
     "RETRIEVAL_SYSTEM_PROMPT",
     "STRUCTURED_BOUNDARY_PROMPT",
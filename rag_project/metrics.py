@@ -0,0 +1,247 @@
+"""In-process metrics registry with an optional OpenMetrics text endpoint.
+
+Counters and histograms are keyed by label values and safe to update from worker
+threads. `REGISTRY.render()` produces the OpenMetrics text exposition format, and
+`start_metrics_server(port)` serves it at /metrics for a Prometheus scraper.
+"""
+
+import bisect
+import math
+import threading
+import time
+from contextlib import contextmanager
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, Iterator, List, Sequence, Tuple
+
+from rag_project.config import METRICS_DEFAULT_BUCKETS_SECONDS, METRICS_HOST
+from rag_project.logger import get_logger
+
+logger = get_logger(__name__)
+
+OPENMETRICS_CONTENT_TYPE = "application/openmetrics-text; version=1.0.0; charset=utf-8"
+
+LabelValues = Tuple[str, ...]
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_labels(names: Sequence[str], values: Sequence[str], extra: str = "") -> str:
+    parts = [f'{n}="{_escape(v)}"' for n, v in zip(names, values)]
+    if extra:
+        parts.append(extra)
+    return "{" + ",".join(parts) + "}" if parts else ""
+
+
+def _format_value(value: float) -> str:
+    if math.isinf(value):
+        return "+Inf"
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+
+class _Metric:
+    type_name = ""
+
+    def __init__(self, name: str, description: str, labelnames: Sequence[str]):
+        self.name = name
+        self.description = description
+        self.labelnames = tuple(labelnames)
+        self._lock = threading.Lock()
+
+    def _key(self, labels: Dict[str, str]) -> LabelValues:
+        if set(labels) != set(self.labelnames):
+            raise ValueError(
+                f"{self.name} expects labels {self.labelnames}, got {tuple(labels)}"
+            )
+        return tuple(str(labels[n]) for n in self.labelnames)
+
+    def render(self) -> List[str]:
+        return [
+            f"# TYPE {self.name} {self.type_name}",
+            f"# HELP {self.name} {_escape(self.description)}",
+            *self._samples(),
+        ]
+
+    def _samples(self) -> List[str]:
+        raise NotImplementedError
+
+
+class Counter(_Metric):
+    """Monotonic counter; `name` is the family name, samples get a `_total` suffix."""
+
+    type_name = "counter"
+
+    def __init__(self, name: str, description: str, labelnames: Sequence[str] = ()):
+        super().__init__(name, description, labelnames)
+        self._values: Dict[LabelValues, float] = {}
+
+    def inc(self, amount: float = 1, **labels: str) -> None:
+        if amount < 0:
+            raise ValueError("Counters can only increase")
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0) + amount
+
+    def value(self, **labels: str) -> float:
+        with self._lock:
+            return self._values.get(self._key(labels), 0)
+
+    def _samples(self) -> List[str]:
+        with self._lock:
+            items = sorted(self._values.items())
+        return [
+            f"{self.name}_total{_format_labels(self.labelnames, key)} {_format_value(val)}"
+            for key, val in items
+        ]
+
+
+class Histogram(_Metric):
+    """Cumulative-bucket histogram with sum and count per label set."""
+
+    type_name = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        description: str,
+        labelnames: Sequence[str] = (),
+        buckets: Sequence[float] = METRICS_DEFAULT_BUCKETS_SECONDS,
+    ):
+        super().__init__(name, description, labelnames)
+        self.buckets = tuple(sorted(buckets)) + (math.inf,)
+        # Per label set: [per-bucket counts..., sum, count]
+        self._values: Dict[LabelValues, List[float]] = {}
+
+    def observe(self, value: float, **labels: str) -> None:
+        key = self._key(labels)
+        idx = bisect.bisect_left(self.buckets, value)
+        with self._lock:
+            state = self._values.setdefault(key, [0] * (len(self.buckets) + 2))
+            state[idx] += 1
+            state[-2] += value
+            state[-1] += 1
+
+    @contextmanager
+    def time(self, **labels: str) -> Iterator[None]:
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(time.perf_counter() - start, **labels)
+
+    def count(self, **labels: str) -> int:
+        with self._lock:
+            state = self._values.get(self._key(labels))
+            return int(state[-1]) if state else 0
+
+    def sum(self, **labels: str) -> float:
+        with self._lock:
+            state = self._values.get(self._key(labels))
+            return state[-2] if state else 0.0
+
+    def _samples(self) -> List[str]:
+        with self._lock:
+            items = sorted((k, list(v)) for k, v in self._values.items())
+        lines = []
+        for key, state in items:
+            cumulative = 0
+            for bound, n in zip(self.buckets, state):
+                cumulative += n
+                le = f'le="{_format_value(float(bound))}"'
+                labels = _format_labels(self.labelnames, key, le)
+                lines.append(f"{self.name}_bucket{labels} {int(cumulative)}")
+            labels = _format_labels(self.labelnames, key)
+            lines.append(f"{self.name}_sum{labels} {_format_value(state[-2])}")
+            lines.append(f"{self.name}_count{labels} {int(state[-1])}")
+        return lines
+
+
+class MetricsRegistry:
+    """Holds metric families by name; registering the same name again returns it."""
+
+    def __init__(self) -> None:
+        self._metrics: Dict[str, _Metric] = {}
+        self._lock = threading.Lock()
+
+    def _register(self, cls, name: str, description: str, labelnames, **kwargs):
+        with self._lock:
+            existing = self._metrics.get(name)
+            if existing is not None:
+                if not isinstance(existing, cls) or existing.labelnames != tuple(
+                    labelnames
+                ):
+                    raise ValueError(f"Metric {name} already registered differently")
+                return existing
+            metric = cls(name, description, labelnames, **kwargs)
+            self._metrics[name] = metric
+            return metric
+
+    def counter(
+        self, name: str, description: str, labelnames: Sequence[str] = ()
+    ) -> Counter:
+        return self._register(Counter, name, description, labelnames)
+
+    def histogram(
+        self,
+        name: str,
+        description: str,
+        labelnames: Sequence[str] = (),
+        buckets: Sequence[float] = METRICS_DEFAULT_BUCKETS_SECONDS,
+    ) -> Histogram:
+        return self._register(Histogram, name, description, labelnames, buckets=buckets)
+
+    def render(self) -> str:
+        """Return all metrics in the OpenMetrics text format."""
+        with self._lock:
+            metrics = [self._metrics[name] for name in sorted(self._metrics)]
+        lines: List[str] = []
+        for metric in metrics:
+            lines.extend(metric.render())
+        lines.append("# EOF")
+        return "\n".join(lines) + "\n"
+
+
+REGISTRY = MetricsRegistry()
+_servers: Dict[Tuple[str, int], ThreadingHTTPServer] = {}
+_servers_lock = threading.Lock()
+
+
+def start_metrics_server(
+    port: int, host: str = METRICS_HOST, registry: MetricsRegistry = REGISTRY
+) -> ThreadingHTTPServer:
+    """Serve registry.render() at /metrics from a daemon thread; returns the server.
+
+    Calling it again for the same host and port returns the running server; port 0
+    binds a free port and always starts a new one.
+    """
+    if port == 0:
+        return _serve(port, host, registry)
+    with _servers_lock:
+        if (host, port) not in _servers:
+            _servers[(host, port)] = _serve(port, host, registry)
+        return _servers[(host, port)]
+
+
+def _serve(port: int, host: str, registry: MetricsRegistry) -> ThreadingHTTPServer:
+
+    class _Handler(BaseHTTPRequestHandler):
+        def do_GET(self):  # noqa: N802 - http.server API
+            if self.path.split("?", 1)[0] != "/metrics":
+                self.send_error(404)
+                return
+            body = registry.render().encode("utf-8")
+            self.send_response(200)
+            self.send_header("Content-Type", OPENMETRICS_CONTENT_TYPE)
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *_args):
+            pass
+
+    server = ThreadingHTTPServer((host, port), _Handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    logger.info("Metrics endpoint listening on http://%s:%d/metrics", host, port)
+    return server
@@ -4,14 +4,39 @@ from rag_project.rag_core.config import AppSettings, get_settings
 from rag_project.rag_core.infra.db_pgvector import PgVectorRepository
 from rag_project.rag_core.infra.embedding_bgem3 import BgeM3EmbeddingProvider
 from rag_project.rag_core.infra.llm_ollama import OllamaLLMProvider
+from rag_project.rag_core.infra.llm_scheduler import ModelAffinityLLMProvider
+from rag_project.rag_core.infra.reranker_bge import BgeRerankerProvider
+from rag_project.rag_core.infra.tokenizer_hf import get_tokenizer
+from rag_project.rag_core.infra.tracing_adapters import (
+    TracedEmbeddingProvider,
+    TracedLLMProvider,
+    TracedRepository,
+    TracedRerankerProvider,
+)
 from rag_project.rag_core.retrieval.job_matching_service import JobMatchingService
 from rag_project.rag_core.retrieval.router_service import RouterService
 from rag_project.rag_core.retrieval.domain_extraction_service import (
     DomainExtractionService,
 )
 from rag_project.rag_core.ingestion.service import IngestionService
+from rag_project.rag_core.retrieval.prompt_budget import PromptBudget
 from rag_project.rag_core.retrieval.service import QueryService
+from rag_project.config import (
+    INGEST_METRICS_SUMMARY_PATH,
+    JOB_MATCHING_EVALUATION_MAX_TOKENS,
+    JOB_MATCHING_EVALUATOR_MODEL,
+    JOB_MATCHING_EXTRACTION_MAX_TOKENS,
+    JOB_MATCHING_EXTRACTION_MODEL,
+    LLM_DEFAULT_MAX_TOKENS,
+    LLM_MODEL_REGISTRY,
+    LLM_SCHEDULER_ENABLED,
+    METRICS_PORT,
+    OLLAMA_PREWARM_MODELS,
+    TRACE_EXPORT_PATH,
+)
 from rag_project.logger import get_logger
+from rag_project.metrics import start_metrics_server
+from rag_project.tracing import configure_tracing
 
 
 logger = get_logger(__name__)
@@ -36,6 +61,18 @@ class RAGApp:
             timeout=self.settings.ollama_timeout,
             num_ctx=self.settings.ollama_num_ctx,
         )
+        prewarm_models = self._prewarm_models()
+        if prewarm_models:
+            self.llm.prewarm(prewarm_models)
+        if LLM_SCHEDULER_ENABLED:
+            self.llm = ModelAffinityLLMProvider(self.llm)
+        if TRACE_EXPORT_PATH:
+            configure_tracing(TRACE_EXPORT_PATH)
+            self.repo = TracedRepository(self.repo)
+            self.embedder = TracedEmbeddingProvider(
+                self.embedder, model_id=self.settings.embedding_model_id
+            )
+            self.llm = TracedLLMProvider(self.llm)
         self.ingestion = IngestionService(
             document_repo=self.repo,
             chunk_repo=self.repo,
@@ -49,24 +86,64 @@ class RAGApp:
             chunk_assist_model_id=self.settings.chunk_assist_model_id,
             llm_provider=self.llm,
             chunk_profiles=self.settings.chunk_profiles,
+            metrics_summary_path=INGEST_METRICS_SUMMARY_PATH,
+            tokenizer=(
+                get_tokenizer(self.settings.embedding_model_id)
+                if self.settings.chunk_sizing == "tokens"
+                else None
+            ),
         )
         self.query = QueryService(
             embedder=self.embedder,
             llm=self.llm,
             chunk_repo=self.repo,
+            prompt_budget=self._prompt_budget(
+                self.settings.ollama_model, LLM_DEFAULT_MAX_TOKENS
+            ),
         )
         self.router = RouterService(llm=self.llm)
         self.domain_extractor = DomainExtractionService(
             self.llm, self.embedder, self.repo
         )
+        self.reranker = (
+            BgeRerankerProvider(self.settings.reranker_model_id)
+            if self.settings.use_reranker
+            else None
+        )
+        if TRACE_EXPORT_PATH and self.reranker is not None:
+            self.reranker = TracedRerankerProvider(self.reranker)
         self.job_matching = JobMatchingService(
             embedder=self.embedder,
             llm=self.llm,
             chunk_repo=self.repo,
             domain_extractor=self.domain_extractor,
+            reranker=self.reranker,
+            extraction_budget=self._prompt_budget(
+                JOB_MATCHING_EXTRACTION_MODEL, JOB_MATCHING_EXTRACTION_MAX_TOKENS
+            ),
+            evaluation_budget=self._prompt_budget(
+                JOB_MATCHING_EVALUATOR_MODEL, JOB_MATCHING_EVALUATION_MAX_TOKENS
+            ),
         )
+        if METRICS_PORT:
+            start_metrics_server(METRICS_PORT)
         logger.info("RAGApp initialized successfully")
 
+    def _prewarm_models(self) -> list[str]:
+        names = OLLAMA_PREWARM_MODELS.replace(",", " ").split()
+        if names == ["none"]:
+            return []
+        return [self.settings.ollama_model if n == "primary" else n for n in names]
+
+    @staticmethod
+    def _prompt_budget(model_id: str, max_output_tokens: int) -> PromptBudget | None:
+        if model_id not in LLM_MODEL_REGISTRY:
+            logger.warning("No prompt budget for unregistered model %s", model_id)
+            return None
+        return PromptBudget.for_model(
+            model_id, max_output_tokens, get_tokenizer(model_id)
+        )
+
     def _dsn(self) -> str:
         password_part = (
             f" password={self.settings.db_password}"
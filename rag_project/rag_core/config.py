@@ -26,8 +26,11 @@ from rag_project.config import (
     TEST_DB_USER,
     CHUNK_ASSIST_MODEL_ID,
     CHUNK_PROFILES,
+    CHUNK_SIZING,
+    CHUNK_SIZINGS,
     EMBEDDING_DIM,
     EMBEDDING_MODEL_ID,
+    RERANKER_MODEL_ID,
     OLLAMA_DEFAULT_FALLBACK_MODEL,
     OLLAMA_TIMEOUT_SECONDS,
     OLLAMA_DEFAULT_HOST,
@@ -99,6 +102,14 @@ class AppSettings:
     embedding_model_id: str = _env("EMBEDDING_MODEL_ID", EMBEDDING_MODEL_ID)
     embedding_dim: int = int(_env("EMBEDDING_DIM", str(EMBEDDING_DIM)))
 
+    # Reranking (job matching evidence)
+    use_reranker: bool = _env("JOB_MATCHING_USE_RERANKER", "0").lower() in {
+        "1",
+        "true",
+        "yes",
+    }
+    reranker_model_id: str = _env("RERANKER_MODEL_ID", RERANKER_MODEL_ID)
+
     # Chunking
     chunk_token_target: int = int(
         _env_first(["CHUNK_TOKEN_TARGET"], str(CHUNK_TOKEN_TARGET))
@@ -106,6 +117,7 @@ class AppSettings:
     chunk_overlap_tokens: int = int(
         _env_first(["CHUNK_OVERLAP_TOKENS"], str(CHUNK_OVERLAP_TOKENS))
     )
+    chunk_sizing: str = _env("CHUNK_SIZING", CHUNK_SIZING)
     use_structured_chunker: bool = _env("USE_STRUCTURED_CHUNKER", "true").lower() in {
         "1",
         "true",
@@ -130,6 +142,11 @@ class AppSettings:
         parsed = urlparse(self.ollama_host)
         if not parsed.scheme:
             self.ollama_host = f"http://{self.ollama_host}"
+        if self.chunk_sizing not in CHUNK_SIZINGS:
+            raise ValueError(
+                f"Unknown chunk sizing '{self.chunk_sizing}'. "
+                f"Available: {', '.join(CHUNK_SIZINGS)}"
+            )
         if self.db_host == "postgres":
             self.db_host = "localhost"
         # Force test DB when running under pytest to avoid touching real data.
@@ -164,8 +181,11 @@ if __name__ == "__main__":
     print(f"ollama_model={settings.ollama_model}")
     print(f"ollama_fallback_model={settings.ollama_fallback_model}")
     print(f"embedding_model_id={settings.embedding_model_id}")
+    print(f"use_reranker={settings.use_reranker}")
+    print(f"reranker_model_id={settings.reranker_model_id}")
     print(f"chunk_token_target={settings.chunk_token_target}")
     print(f"chunk_overlap_tokens={settings.chunk_overlap_tokens}")
+    print(f"chunk_sizing={settings.chunk_sizing}")
     print(f"use_structured_chunker={settings.use_structured_chunker}")
     print(f"structured_min_chunk_words={settings.structured_min_chunk_words}")
     print(f"structured_max_llm_input_words={settings.structured_max_llm_input_words}")
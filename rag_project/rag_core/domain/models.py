@@ -3,7 +3,13 @@ from datetime import UTC, datetime
 from typing import List, Optional
 from uuid import UUID, uuid4
 
-from rag_project.config import DEFAULT_QUERY_TOP_K
+from rag_project.config import (
+    DEFAULT_QUERY_TOP_K,
+    RECENCY_DECAY_DAYS,
+    WEIGHT_MATCH_SCORE,
+    WEIGHT_RECENCY,
+    WEIGHT_SIMILARITY,
+)
 
 
 @dataclass
@@ -58,6 +64,24 @@ class Query:
     top_k: int = DEFAULT_QUERY_TOP_K
 
 
+@dataclass(frozen=True)
+class ScoreWeights:
+    """Weights of the vector search ranking score, sent to SQL as query params."""
+
+    similarity: float = WEIGHT_SIMILARITY
+    match_score: float = WEIGHT_MATCH_SCORE
+    recency: float = WEIGHT_RECENCY
+    recency_decay_days: float = RECENCY_DECAY_DAYS
+
+    def as_params(self) -> list[float]:
+        return [
+            self.similarity,
+            self.match_score,
+            self.recency,
+            self.recency_decay_days,
+        ]
+
+
 @dataclass
 class RetrievedChunk:
     chunk: Chunk
@@ -66,6 +90,9 @@ class RetrievedChunk:
     job_posting: Optional[JobPosting] = None
     personal: Optional[PersonalDocument] = None
     company_info: Optional[CompanyInfo] = None
+    # Fields left out by a lean search projection (e.g. {"content", "metadata"});
+    # ChunkRepository.hydrate loads them in one batch and clears the entries.
+    unloaded_fields: set = field(default_factory=set)
 
 
 @dataclass
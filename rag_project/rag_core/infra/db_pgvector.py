@@ -1,40 +1,32 @@
-import math
 import time
-from typing import List, Optional, Dict, Any
+from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Dict, Any
 from uuid import UUID
 
 import psycopg
-from psycopg.types.json import Json
+from psycopg_pool import ConnectionPool
 from pgvector.psycopg import register_vector
 
 from rag_project.config import (
     DB_CONNECT_TIMEOUT_SECONDS,
+    DB_POOL_MAX_SIZE,
+    DB_POOL_MIN_SIZE,
     DB_RETRY_ATTEMPTS,
     DB_RETRY_BACKOFF_SECONDS,
     DEFAULT_MIN_MATCH_SCORE,
     DEFAULT_SEARCH_LIMIT,
-    RECENCY_DECAY_DAYS,
-    WEIGHT_MATCH_SCORE,
-    WEIGHT_RECENCY,
-    WEIGHT_SIMILARITY,
-    DOC_TYPE_JOB_POSTING,
-    DOC_TYPE_CV,
-    DOC_TYPE_COVER_LETTER,
-    DOC_TYPE_THESIS,
-    DOC_TYPE_PERSONAL_PROJECT,
-    DOC_TYPE_COMPANY,
+    HYBRID_CANDIDATE_MULTIPLIER,
+    HYDRATE_ALL_FIELDS,
+    SEARCH_PROJECTION_FULL,
     SQL_INSERT_DOCUMENT,
     SQL_INSERT_JOB_POSTING,
     SQL_INSERT_PERSONAL_DOCUMENT,
     SQL_INSERT_COMPANY_INFO,
     SQL_DELETE_DOCUMENT,
-    SQL_INSERT_CHUNK,
-    SQL_INSERT_EMBEDDING,
-    SQL_WHERE_MIN_MATCH,
-    SQL_WHERE_POSTED_AFTER,
-    SQL_WHERE_DOC_TYPES,
-    SQL_WHERE_COMPANY_FILTER,
-    SQL_VECTOR_SEARCH_QUERY,
+    SQL_DELETE_DOCUMENTS,
+    SQL_HYDRATE_CHUNK_CONTENT,
+    SQL_HYDRATE_DOCUMENT_METADATA,
 )
 from rag_project.logger import get_logger
 from rag_project.rag_core.domain.models import (
@@ -44,20 +36,51 @@ from rag_project.rag_core.domain.models import (
     JobPosting,
     PersonalDocument,
     RetrievedChunk,
+    ScoreWeights,
 )
+from rag_project.rag_core.infra import pg_sql
 from rag_project.rag_core.ports.repo_port import ChunkRepository, DocumentRepository
 
 logger = get_logger(__name__)
 
 
 class PgVectorRepository(DocumentRepository, ChunkRepository):
-    def __init__(self, dsn: str) -> None:
+    def __init__(
+        self,
+        dsn: str,
+        pool_min_size: int = DB_POOL_MIN_SIZE,
+        pool_max_size: int = DB_POOL_MAX_SIZE,
+    ) -> None:
         self.dsn = dsn
+        self.pool_min_size = pool_min_size
+        self.pool_max_size = pool_max_size
+        self._pool: ConnectionPool | None = None
 
-    def _get_conn(self):
-        conn = psycopg.connect(self.dsn, connect_timeout=DB_CONNECT_TIMEOUT_SECONDS)
+    @staticmethod
+    def _configure_conn(conn) -> None:
         register_vector(conn)
-        return conn
+
+    def _get_pool(self) -> ConnectionPool:
+        if self._pool is None:
+            self._pool = ConnectionPool(
+                self.dsn,
+                min_size=self.pool_min_size,
+                max_size=self.pool_max_size,
+                kwargs={"connect_timeout": DB_CONNECT_TIMEOUT_SECONDS},
+                configure=self._configure_conn,
+                timeout=DB_CONNECT_TIMEOUT_SECONDS,
+                open=True,
+            )
+        return self._pool
+
+    def _get_conn(self):
+        """Borrow a pooled connection; the context commits and returns it to the pool."""
+        return self._get_pool().connection()
+
+    def close(self) -> None:
+        if self._pool is not None:
+            self._pool.close()
+            self._pool = None
 
     # ------------------------------------------------------------------ #
     # Document/subtype inserts
@@ -67,15 +90,7 @@ class PgVectorRepository(DocumentRepository, ChunkRepository):
             "repo.insert_document id=%s type=%s", document.id, document.doc_type
         )
         with self._get_conn() as conn, conn.cursor() as cur:
-            cur.execute(
-                SQL_INSERT_DOCUMENT,
-                (
-                    document.id,
-                    document.doc_type,
-                    Json(document.metadata) if document.metadata else None,
-                    document.created_at,
-                ),
-            )
+            cur.execute(SQL_INSERT_DOCUMENT, pg_sql.document_params(document))
 
     def insert_job_posting(self, job_posting: JobPosting) -> None:
         logger.debug(
@@ -84,21 +99,7 @@ class PgVectorRepository(DocumentRepository, ChunkRepository):
             job_posting.title,
         )
         with self._get_conn() as conn, conn.cursor() as cur:
-            cur.execute(
-                SQL_INSERT_JOB_POSTING,
-                (
-                    job_posting.document_id,
-                    job_posting.related_company_id,
-                    job_posting.title,
-                    job_posting.location_text,
-                    job_posting.salary_range,
-                    job_posting.url,
-                    job_posting.language,
-                    job_posting.posted_at,
-                    job_posting.match_score,
-                    job_posting.company,
-                ),
-            )
+            cur.execute(SQL_INSERT_JOB_POSTING, pg_sql.job_posting_params(job_posting))
 
     def insert_personal_document(self, personal: PersonalDocument) -> None:
         logger.debug(
@@ -109,7 +110,7 @@ class PgVectorRepository(DocumentRepository, ChunkRepository):
         with self._get_conn() as conn, conn.cursor() as cur:
             cur.execute(
                 SQL_INSERT_PERSONAL_DOCUMENT,
-                (personal.document_id, personal.category),
+                pg_sql.personal_document_params(personal),
             )
 
     def insert_company_info(self, company: CompanyInfo) -> None:
@@ -121,7 +122,7 @@ class PgVectorRepository(DocumentRepository, ChunkRepository):
         with self._get_conn() as conn, conn.cursor() as cur:
             cur.execute(
                 SQL_INSERT_COMPANY_INFO,
-                (company.document_id, company.name, company.industry),
+                pg_sql.company_info_params(company),
             )
 
     def delete_document(self, document_id: UUID) -> None:
@@ -129,6 +130,32 @@ class PgVectorRepository(DocumentRepository, ChunkRepository):
         with self._get_conn() as conn, conn.cursor() as cur:
             cur.execute(SQL_DELETE_DOCUMENT, (document_id,))
 
+    def delete_documents(self, document_ids: List[UUID]) -> int:
+        """Delete all ids with one statement and one commit."""
+        if not document_ids:
+            return 0
+        logger.debug("repo.delete_documents count=%d", len(document_ids))
+        with self._get_conn() as conn, conn.cursor() as cur:
+            cur.execute(SQL_DELETE_DOCUMENTS, (list(document_ids),))
+            return cur.rowcount
+
+    def delete_documents_by_filter(
+        self,
+        doc_type: str | None = None,
+        created_before: datetime | None = None,
+        company: str | None = None,
+    ) -> int:
+        sql, params = pg_sql.delete_filter_sql(doc_type, created_before, company)
+        logger.debug(
+            "repo.delete_documents_by_filter doc_type=%s created_before=%s company=%s",
+            doc_type,
+            created_before,
+            company,
+        )
+        with self._get_conn() as conn, conn.cursor() as cur:
+            cur.execute(sql, params)
+            return cur.rowcount
+
     # ------------------------------------------------------------------ #
     # Chunk + embedding
     # ------------------------------------------------------------------ #
@@ -139,22 +166,8 @@ class PgVectorRepository(DocumentRepository, ChunkRepository):
             raise ValueError("chunks and embeddings length mismatch")
         logger.debug("repo.insert_chunks_with_embeddings count=%d", len(chunks))
         with self._get_conn() as conn, conn.cursor() as cur:
-            for chunk, emb in zip(chunks, embeddings):
-                cur.execute(
-                    SQL_INSERT_CHUNK,
-                    (
-                        chunk.id,
-                        chunk.document_id,
-                        chunk.chunk_index,
-                        chunk.content,
-                        chunk.token_count,
-                        chunk.created_at,
-                    ),
-                )
-                cur.execute(
-                    SQL_INSERT_EMBEDDING,
-                    (chunk.id, emb),
-                )
+            for sql, params in pg_sql.chunk_insert_statements(chunks, embeddings):
+                cur.execute(sql, params)
 
     # ------------------------------------------------------------------ #
     # Search
@@ -181,137 +194,131 @@ class PgVectorRepository(DocumentRepository, ChunkRepository):
         min_match_score: float = DEFAULT_MIN_MATCH_SCORE,
         posted_after: float | None = None,
         doc_types: list[str] | None = None,
-        filters: Dict[str, Any] | None = None,  # <--- ADDED ARGUMENT
+        filters: Dict[str, Any] | None = None,
+        projection: str = SEARCH_PROJECTION_FULL,
+        weights: ScoreWeights | None = None,
     ) -> List[RetrievedChunk]:
-        def _query():
-            where_clauses = [SQL_WHERE_MIN_MATCH]
-            params: list = [query_embedding, min_match_score]
-
-            if posted_after is not None:
-                where_clauses.append(SQL_WHERE_POSTED_AFTER)
-                params.append(posted_after)
+        """Vector search. projection="lean" skips content, metadata and the
+        personal/company joins; load what is needed afterwards with hydrate()."""
+        active, where_params = pg_sql.build_where(
+            min_match_score, posted_after, doc_types, filters
+        )
+        params = [
+            *pg_sql.score_params(query_embedding, weights),
+            *where_params,
+            limit,
+        ]
+        sql = pg_sql.search_statement(pg_sql.SEARCH_KIND_VECTOR, projection, active)
+        rows = self._run_with_retry(lambda: self._fetch(sql, params, prepare=True))
+        to_retrieved = pg_sql.row_mapper(projection)
+        return [to_retrieved(row) for row in rows]
 
-            if doc_types:
-                where_clauses.append(SQL_WHERE_DOC_TYPES)
-                params.append(doc_types)
+    def keyword_search(
+        self,
+        query_embedding: List[float],
+        query_text: str,
+        limit: int = DEFAULT_SEARCH_LIMIT,
+        min_match_score: float = DEFAULT_MIN_MATCH_SCORE,
+        posted_after: float | None = None,
+        doc_types: list[str] | None = None,
+        filters: Dict[str, Any] | None = None,
+        projection: str = SEARCH_PROJECTION_FULL,
+        weights: ScoreWeights | None = None,
+    ) -> List[RetrievedChunk]:
+        """Full-text search over chunks.content_tsv ranked by ts_rank_cd.
 
-            # --- NEW: Handle Filters (Company) ---
-            if filters:
-                if "company" in filters and filters["company"]:
-                    # ILIKE for case-insensitive substring match on job_postings.company
-                    where_clauses.append(SQL_WHERE_COMPANY_FILTER)
-                    params.append(f"%{filters['company']}%")
-            # -------------------------------------
+        Terms are OR-ed so a single exact skill token is enough to surface a chunk;
+        ranking rewards chunks that contain more of them.
+        """
+        tsquery_text = pg_sql.tsquery_text(query_text)
+        if not tsquery_text:
+            return []
+        active, where_params = pg_sql.build_where(
+            min_match_score, posted_after, doc_types, filters
+        )
+        params = [
+            *pg_sql.score_params(query_embedding, weights),
+            tsquery_text,
+            *where_params,
+            limit,
+        ]
+        sql = pg_sql.search_statement(pg_sql.SEARCH_KIND_KEYWORD, projection, active)
+        rows = self._run_with_retry(lambda: self._fetch(sql, params, prepare=True))
+        to_retrieved = pg_sql.row_mapper(projection)
+        return [to_retrieved(row) for row in rows]
 
-            where_sql = " AND ".join(where_clauses)
+    def hybrid_search(
+        self,
+        query_embedding: List[float],
+        query_text: str,
+        limit: int = DEFAULT_SEARCH_LIMIT,
+        min_match_score: float = DEFAULT_MIN_MATCH_SCORE,
+        posted_after: float | None = None,
+        doc_types: list[str] | None = None,
+        filters: Dict[str, Any] | None = None,
+        projection: str = SEARCH_PROJECTION_FULL,
+        weights: ScoreWeights | None = None,
+    ) -> List[RetrievedChunk]:
+        """Run vector and full-text search concurrently and fuse them with RRF."""
+        candidates = limit * HYBRID_CANDIDATE_MULTIPLIER
+        kwargs = dict(
+            limit=candidates,
+            min_match_score=min_match_score,
+            posted_after=posted_after,
+            doc_types=doc_types,
+            filters=filters,
+            projection=projection,
+            weights=weights,
+        )
+        with ThreadPoolExecutor(max_workers=2) as pool:
+            vector_future = pool.submit(self.search, query_embedding, **kwargs)
+            keyword_future = pool.submit(
+                self.keyword_search, query_embedding, query_text, **kwargs
+            )
+            vector_hits = vector_future.result()
+            keyword_hits = keyword_future.result()
+        logger.debug(
+            "repo.hybrid_search vector=%d keyword=%d",
+            len(vector_hits),
+            len(keyword_hits),
+        )
+        return pg_sql.reciprocal_rank_fusion([vector_hits, keyword_hits])[:limit]
 
-            # Append the remaining params for ORDER BY and LIMIT
-            params.extend([query_embedding, limit])
+    def hydrate(
+        self,
+        retrieved: List[RetrievedChunk],
+        fields: tuple[str, ...] = HYDRATE_ALL_FIELDS,
+    ) -> List[RetrievedChunk]:
+        """Load lean-projection fields (content, metadata) for the given results in place.
 
-            sql = SQL_VECTOR_SEARCH_QUERY.format(
-                where_sql=where_sql,
-                WEIGHT_SIMILARITY=WEIGHT_SIMILARITY,
-                WEIGHT_MATCH_SCORE=WEIGHT_MATCH_SCORE,
-                WEIGHT_RECENCY=WEIGHT_RECENCY,
-                RECENCY_DECAY_DAYS=RECENCY_DECAY_DAYS,
-            )
+        One query per requested field covers the whole batch; results that already
+        carry the field are skipped.
+        """
+        need_content, need_metadata = pg_sql.pending_hydration(retrieved, fields)
+        if not need_content and not need_metadata:
+            return retrieved
 
+        def _query():
+            contents: Dict[UUID, str] = {}
+            metadata: Dict[UUID, Any] = {}
             with self._get_conn() as conn, conn.cursor() as cur:
-                cur.execute(sql, params)
-                return cur.fetchall()
+                if need_content:
+                    cur.execute(
+                        SQL_HYDRATE_CHUNK_CONTENT,
+                        ([rc.chunk.id for rc in need_content],),
+                    )
+                    contents = dict(cur.fetchall())
+                if need_metadata:
+                    doc_ids = list({rc.document.id for rc in need_metadata})
+                    cur.execute(SQL_HYDRATE_DOCUMENT_METADATA, (doc_ids,))
+                    metadata = dict(cur.fetchall())
+            return contents, metadata
 
-        rows = self._run_with_retry(_query)
+        contents, metadata = self._run_with_retry(_query)
+        pg_sql.apply_hydration(need_content, need_metadata, contents, metadata)
+        return retrieved
 
-        results: List[RetrievedChunk] = []
-        for row in rows:
-            (
-                chunk_id,
-                document_id,
-                chunk_index,
-                content,
-                token_count,
-                doc_id,
-                doc_type,
-                metadata,
-                doc_created_at,
-                title,
-                company,
-                location_text,
-                language,
-                url,
-                posted_at,
-                match_score,
-                related_company_id,
-                salary_range,
-                personal_category,
-                company_name,
-                industry,
-                distance,
-                match_score_val,
-                age_days,
-            ) = row
-            chunk = Chunk(
-                id=chunk_id,
-                document_id=document_id,
-                chunk_index=chunk_index,
-                content=content,
-                token_count=token_count,
-            )
-            document = Document(
-                id=doc_id,
-                doc_type=doc_type,
-                metadata=metadata,
-                created_at=doc_created_at,
-            )
-            jp = None
-            pd = None
-            ci = None
-            if doc_type == DOC_TYPE_JOB_POSTING:
-                jp = JobPosting(
-                    document_id=doc_id,
-                    related_company_id=related_company_id,
-                    title=title,
-                    location_text=location_text,
-                    salary_range=salary_range,
-                    url=url,
-                    language=language,
-                    posted_at=posted_at,
-                    match_score=match_score,
-                    company=company,
-                )
-            if doc_type in {
-                DOC_TYPE_CV,
-                DOC_TYPE_COVER_LETTER,
-                DOC_TYPE_THESIS,
-                DOC_TYPE_PERSONAL_PROJECT,
-            }:
-                pd = PersonalDocument(
-                    document_id=doc_id, category=personal_category or doc_type
-                )
-            if doc_type == DOC_TYPE_COMPANY:
-                ci = CompanyInfo(
-                    document_id=doc_id, name=company_name, industry=industry
-                )
-
-            similarity = 1 - float(distance)
-            recency = (
-                1.0
-                if age_days is None
-                else float(math.exp(-max(0.0, float(age_days)) / RECENCY_DECAY_DAYS))
-            )
-            score = (
-                WEIGHT_SIMILARITY * similarity
-                + WEIGHT_MATCH_SCORE * float(match_score_val)
-                + WEIGHT_RECENCY * recency
-            )
-            results.append(
-                RetrievedChunk(
-                    chunk=chunk,
-                    document=document,
-                    score=score,
-                    job_posting=jp,
-                    personal=pd,
-                    company_info=ci,
-                )
-            )
-        return results
+    def _fetch(self, sql: str, params: list, prepare: bool | None = None) -> list:
+        with self._get_conn() as conn, conn.cursor() as cur:
+            cur.execute(sql, params, prepare=prepare)
+            return cur.fetchall()
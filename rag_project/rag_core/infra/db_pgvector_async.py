@@ -0,0 +1,324 @@
+import asyncio
+from datetime import datetime
+from typing import Any, Dict, List
+from uuid import UUID
+
+import psycopg
+from psycopg_pool import AsyncConnectionPool
+from pgvector.psycopg import register_vector_async
+
+from rag_project.config import (
+    DB_CONNECT_TIMEOUT_SECONDS,
+    DB_POOL_MAX_SIZE,
+    DB_POOL_MIN_SIZE,
+    DB_RETRY_ATTEMPTS,
+    DB_RETRY_BACKOFF_SECONDS,
+    DEFAULT_MIN_MATCH_SCORE,
+    DEFAULT_SEARCH_LIMIT,
+    HYBRID_CANDIDATE_MULTIPLIER,
+    HYDRATE_ALL_FIELDS,
+    SEARCH_PROJECTION_FULL,
+    SQL_INSERT_DOCUMENT,
+    SQL_INSERT_JOB_POSTING,
+    SQL_INSERT_PERSONAL_DOCUMENT,
+    SQL_INSERT_COMPANY_INFO,
+    SQL_DELETE_DOCUMENT,
+    SQL_DELETE_DOCUMENTS,
+    SQL_HYDRATE_CHUNK_CONTENT,
+    SQL_HYDRATE_DOCUMENT_METADATA,
+)
+from rag_project.logger import get_logger
+from rag_project.rag_core.domain.models import (
+    Chunk,
+    CompanyInfo,
+    Document,
+    JobPosting,
+    PersonalDocument,
+    RetrievedChunk,
+    ScoreWeights,
+)
+from rag_project.rag_core.infra import pg_sql
+from rag_project.rag_core.ports.async_repo_port import (
+    AsyncChunkRepository,
+    AsyncDocumentRepository,
+)
+
+logger = get_logger(__name__)
+
+
+class AsyncPgVectorRepository(AsyncDocumentRepository, AsyncChunkRepository):
+    """asyncio adapter over psycopg's AsyncConnectionPool.
+
+    The pool is opened lazily on the running event loop; concurrent coroutines share
+    it instead of each opening a connection. Call close() before the loop stops.
+    SQL, the statement registry, params and row mapping come from pg_sql, shared
+    with PgVectorRepository so both adapters return identical results.
+    """
+
+    def __init__(
+        self,
+        dsn: str,
+        pool_min_size: int = DB_POOL_MIN_SIZE,
+        pool_max_size: int = DB_POOL_MAX_SIZE,
+    ) -> None:
+        self.dsn = dsn
+        self.pool_min_size = pool_min_size
+        self.pool_max_size = pool_max_size
+        self._pool: AsyncConnectionPool | None = None
+
+    @staticmethod
+    async def _configure_conn(conn) -> None:
+        await register_vector_async(conn)
+
+    async def _get_pool(self) -> AsyncConnectionPool:
+        if self._pool is None:
+            self._pool = AsyncConnectionPool(
+                self.dsn,
+                min_size=self.pool_min_size,
+                max_size=self.pool_max_size,
+                kwargs={"connect_timeout": DB_CONNECT_TIMEOUT_SECONDS},
+                configure=self._configure_conn,
+                timeout=DB_CONNECT_TIMEOUT_SECONDS,
+                open=False,
+            )
+            await self._pool.open()
+        return self._pool
+
+    async def _get_conn(self):
+        return (await self._get_pool()).connection()
+
+    async def close(self) -> None:
+        if self._pool is not None:
+            await self._pool.close()
+            self._pool = None
+
+    async def __aenter__(self) -> "AsyncPgVectorRepository":
+        await self._get_pool()
+        return self
+
+    async def __aexit__(self, *_exc) -> None:
+        await self.close()
+
+    async def _execute(self, sql: str, params) -> int:
+        async with await self._get_conn() as conn, conn.cursor() as cur:
+            await cur.execute(sql, params)
+            return cur.rowcount
+
+    # ------------------------------------------------------------------ #
+    # Document/subtype inserts
+    # ------------------------------------------------------------------ #
+    async def insert_document(self, document: Document) -> None:
+        logger.debug(
+            "async_repo.insert_document id=%s type=%s", document.id, document.doc_type
+        )
+        await self._execute(SQL_INSERT_DOCUMENT, pg_sql.document_params(document))
+
+    async def insert_job_posting(self, job_posting: JobPosting) -> None:
+        logger.debug(
+            "async_repo.insert_job_posting doc_id=%s title=%s",
+            job_posting.document_id,
+            job_posting.title,
+        )
+        await self._execute(
+            SQL_INSERT_JOB_POSTING, pg_sql.job_posting_params(job_posting)
+        )
+
+    async def insert_personal_document(self, personal: PersonalDocument) -> None:
+        logger.debug(
+            "async_repo.insert_personal_document doc_id=%s category=%s",
+            personal.document_id,
+            personal.category,
+        )
+        await self._execute(
+            SQL_INSERT_PERSONAL_DOCUMENT, pg_sql.personal_document_params(personal)
+        )
+
+    async def insert_company_info(self, company: CompanyInfo) -> None:
+        logger.debug(
+            "async_repo.insert_company_info doc_id=%s name=%s",
+            company.document_id,
+            company.name,
+        )
+        await self._execute(
+            SQL_INSERT_COMPANY_INFO,
+            pg_sql.company_info_params(company),
+        )
+
+    async def delete_document(self, document_id: UUID) -> None:
+        logger.debug("async_repo.delete_document id=%s", document_id)
+        await self._execute(SQL_DELETE_DOCUMENT, (document_id,))
+
+    async def delete_documents(self, document_ids: List[UUID]) -> int:
+        if not document_ids:
+            return 0
+        logger.debug("async_repo.delete_documents count=%d", len(document_ids))
+        return await self._execute(SQL_DELETE_DOCUMENTS, (list(document_ids),))
+
+    async def delete_documents_by_filter(
+        self,
+        doc_type: str | None = None,
+        created_before: datetime | None = None,
+        company: str | None = None,
+    ) -> int:
+        sql, params = pg_sql.delete_filter_sql(doc_type, created_before, company)
+        logger.debug(
+            "async_repo.delete_documents_by_filter doc_type=%s created_before=%s company=%s",
+            doc_type,
+            created_before,
+            company,
+        )
+        return await self._execute(sql, params)
+
+    # ------------------------------------------------------------------ #
+    # Chunk + embedding
+    # ------------------------------------------------------------------ #
+    async def insert_chunks_with_embeddings(
+        self, chunks: List[Chunk], embeddings: List[List[float]]
+    ) -> None:
+        if len(chunks) != len(embeddings):
+            raise ValueError("chunks and embeddings length mismatch")
+        logger.debug("async_repo.insert_chunks_with_embeddings count=%d", len(chunks))
+        async with await self._get_conn() as conn, conn.cursor() as cur:
+            for sql, params in pg_sql.chunk_insert_statements(chunks, embeddings):
+                await cur.execute(sql, params)
+
+    # ------------------------------------------------------------------ #
+    # Search
+    # ------------------------------------------------------------------ #
+    async def _run_with_retry(self, func):
+        last_exc = None
+        for attempt in range(DB_RETRY_ATTEMPTS):
+            try:
+                return await func()
+            except psycopg.OperationalError as exc:
+                last_exc = exc
+                logger.warning(
+                    "async_repo.search retry %d/%d: %s",
+                    attempt + 1,
+                    DB_RETRY_ATTEMPTS,
+                    exc,
+                )
+                await asyncio.sleep(DB_RETRY_BACKOFF_SECONDS * (attempt + 1))
+        if last_exc:
+            logger.error("async_repo.search failed after retries: %s", last_exc)
+            raise last_exc
+
+    async def _fetch(self, sql: str, params: list) -> list:
+        async with await self._get_conn() as conn, conn.cursor() as cur:
+            await cur.execute(sql, params, prepare=True)
+            return await cur.fetchall()
+
+    async def search(
+        self,
+        query_embedding: List[float],
+        limit: int = DEFAULT_SEARCH_LIMIT,
+        min_match_score: float = DEFAULT_MIN_MATCH_SCORE,
+        posted_after: float | None = None,
+        doc_types: list[str] | None = None,
+        filters: Dict[str, Any] | None = None,
+        projection: str = SEARCH_PROJECTION_FULL,
+        weights: ScoreWeights | None = None,
+    ) -> List[RetrievedChunk]:
+        active, where_params = pg_sql.build_where(
+            min_match_score, posted_after, doc_types, filters
+        )
+        params = [
+            *pg_sql.score_params(query_embedding, weights),
+            *where_params,
+            limit,
+        ]
+        sql = pg_sql.search_statement(pg_sql.SEARCH_KIND_VECTOR, projection, active)
+        rows = await self._run_with_retry(lambda: self._fetch(sql, params))
+        to_retrieved = pg_sql.row_mapper(projection)
+        return [to_retrieved(row) for row in rows]
+
+    async def keyword_search(
+        self,
+        query_embedding: List[float],
+        query_text: str,
+        limit: int = DEFAULT_SEARCH_LIMIT,
+        min_match_score: float = DEFAULT_MIN_MATCH_SCORE,
+        posted_after: float | None = None,
+        doc_types: list[str] | None = None,
+        filters: Dict[str, Any] | None = None,
+        projection: str = SEARCH_PROJECTION_FULL,
+        weights: ScoreWeights | None = None,
+    ) -> List[RetrievedChunk]:
+        tsquery_text = pg_sql.tsquery_text(query_text)
+        if not tsquery_text:
+            return []
+        active, where_params = pg_sql.build_where(
+            min_match_score, posted_after, doc_types, filters
+        )
+        params = [
+            *pg_sql.score_params(query_embedding, weights),
+            tsquery_text,
+            *where_params,
+            limit,
+        ]
+        sql = pg_sql.search_statement(pg_sql.SEARCH_KIND_KEYWORD, projection, active)
+        rows = await self._run_with_retry(lambda: self._fetch(sql, params))
+        to_retrieved = pg_sql.row_mapper(projection)
+        return [to_retrieved(row) for row in rows]
+
+    async def hybrid_search(
+        self,
+        query_embedding: List[float],
+        query_text: str,
+        limit: int = DEFAULT_SEARCH_LIMIT,
+        min_match_score: float = DEFAULT_MIN_MATCH_SCORE,
+        posted_after: float | None = None,
+        doc_types: list[str] | None = None,
+        filters: Dict[str, Any] | None = None,
+        projection: str = SEARCH_PROJECTION_FULL,
+        weights: ScoreWeights | None = None,
+    ) -> List[RetrievedChunk]:
+        """Run both arms on the event loop concurrently and fuse them with RRF."""
+        kwargs = dict(
+            limit=limit * HYBRID_CANDIDATE_MULTIPLIER,
+            min_match_score=min_match_score,
+            posted_after=posted_after,
+            doc_types=doc_types,
+            filters=filters,
+            projection=projection,
+            weights=weights,
+        )
+        vector_hits, keyword_hits = await asyncio.gather(
+            self.search(query_embedding, **kwargs),
+            self.keyword_search(query_embedding, query_text, **kwargs),
+        )
+        logger.debug(
+            "async_repo.hybrid_search vector=%d keyword=%d",
+            len(vector_hits),
+            len(keyword_hits),
+        )
+        return pg_sql.reciprocal_rank_fusion([vector_hits, keyword_hits])[:limit]
+
+    async def hydrate(
+        self,
+        retrieved: List[RetrievedChunk],
+        fields: tuple[str, ...] = HYDRATE_ALL_FIELDS,
+    ) -> List[RetrievedChunk]:
+        need_content, need_metadata = pg_sql.pending_hydration(retrieved, fields)
+        if not need_content and not need_metadata:
+            return retrieved
+
+        async def _query():
+            contents: Dict[UUID, str] = {}
+            metadata: Dict[UUID, Any] = {}
+            async with await self._get_conn() as conn, conn.cursor() as cur:
+                if need_content:
+                    await cur.execute(
+                        SQL_HYDRATE_CHUNK_CONTENT,
+                        ([rc.chunk.id for rc in need_content],),
+                    )
+                    contents = dict(await cur.fetchall())
+                if need_metadata:
+                    doc_ids = list({rc.document.id for rc in need_metadata})
+                    await cur.execute(SQL_HYDRATE_DOCUMENT_METADATA, (doc_ids,))
+                    metadata = dict(await cur.fetchall())
+            return contents, metadata
+
+        contents, metadata = await self._run_with_retry(_query)
+        pg_sql.apply_hydration(need_content, need_metadata, contents, metadata)
+        return retrieved
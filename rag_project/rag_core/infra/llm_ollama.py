@@ -1,17 +1,26 @@
-from typing import Optional
+import threading
+import time
+from typing import Iterable, Optional
 
 import httpx
 
 from rag_project.config import (
     LLM_DEFAULT_MAX_TOKENS,
+    LLM_MODEL_REGISTRY,
     OLLAMA_TIMEOUT_SECONDS,
     OLLAMA_DEFAULT_NUM_CTX,
+    OLLAMA_KEEP_ALIVE,
+    OLLAMA_NUM_CTX_KEY,
+    OLLAMA_NUM_THREAD,
+    OLLAMA_NUM_THREAD_KEY,
     OLLAMA_STREAM_FLAG,
     OLLAMA_NUM_PREDICT_KEY,
     OLLAMA_GENERATE_PATH,
+    OLLAMA_TEMPERATURE_KEY,
 )
 from rag_project.rag_core.ports.llm_port import LLMProvider
 from rag_project.logger import get_logger
+from rag_project.tracing import current_span
 
 
 logger = get_logger(__name__)
@@ -30,6 +39,7 @@ class OllamaLLMProvider(LLMProvider):
         self.model = model
         self.fallback_model = fallback_model or model
         self.timeout = timeout
+        self.num_ctx = num_ctx
 
         self.client = httpx.Client(base_url=self.base_url, timeout=self.timeout)
         logger.info(
@@ -46,12 +56,7 @@ class OllamaLLMProvider(LLMProvider):
         max_tokens: int = LLM_DEFAULT_MAX_TOKENS,
     ) -> str:
         target_model = model or self.model
-        payload = {
-            "model": target_model,
-            "prompt": prompt,
-            "stream": OLLAMA_STREAM_FLAG,
-            "options": {OLLAMA_NUM_PREDICT_KEY: max_tokens},
-        }
+        payload = self._payload(target_model, prompt, max_tokens)
         try:
             resp = httpx.post(
                 f"{self.base_url}{OLLAMA_GENERATE_PATH}",
@@ -63,6 +68,7 @@ class OllamaLLMProvider(LLMProvider):
             logger.debug(
                 "Ollama response ok model=%s tokens=%d", target_model, max_tokens
             )
+            self._annotate_span(data)
             return data.get("response", "")
         except httpx.HTTPError as exc:
             logger.warning(
@@ -71,7 +77,7 @@ class OllamaLLMProvider(LLMProvider):
                 self.fallback_model,
             )
             if target_model != self.fallback_model:
-                payload["model"] = self.fallback_model
+                payload = self._payload(self.fallback_model, prompt, max_tokens)
                 resp = httpx.post(
                     f"{self.base_url}{OLLAMA_GENERATE_PATH}",
                     json=payload,
@@ -80,8 +86,85 @@ class OllamaLLMProvider(LLMProvider):
                 resp.raise_for_status()
                 data = resp.json()
                 logger.info("Fallback Ollama model succeeded: %s", self.fallback_model)
+                self._annotate_span(data)
                 return data.get("response", "")
             logger.error(
                 "Ollama call failed with no fallback remaining: %s", exc, exc_info=True
             )
             raise
+
+    def runtime_options(self, model: str) -> dict:
+        """Ollama options for model; num_ctx is constant per model to avoid reloads."""
+        spec = LLM_MODEL_REGISTRY.get(model, {})
+        num_ctx = (
+            self.num_ctx
+            if model == self.model
+            else spec.get("ollama_num_ctx", self.num_ctx)
+        )
+        options = {OLLAMA_NUM_CTX_KEY: num_ctx}
+        num_thread = spec.get("num_thread") or OLLAMA_NUM_THREAD
+        if num_thread:
+            options[OLLAMA_NUM_THREAD_KEY] = num_thread
+        if spec.get("temperature") is not None:
+            options[OLLAMA_TEMPERATURE_KEY] = spec["temperature"]
+        return options
+
+    def keep_alive(self, model: str) -> str:
+        return LLM_MODEL_REGISTRY.get(model, {}).get("keep_alive", OLLAMA_KEEP_ALIVE)
+
+    def _payload(self, model: str, prompt: str, max_tokens: int) -> dict:
+        return {
+            "model": model,
+            "prompt": prompt,
+            "stream": OLLAMA_STREAM_FLAG,
+            "keep_alive": self.keep_alive(model),
+            "options": {
+                **self.runtime_options(model),
+                OLLAMA_NUM_PREDICT_KEY: max_tokens,
+            },
+        }
+
+    def prewarm(self, models: Iterable[str], background: bool = True) -> None:
+        """Load models with their runtime options so the first real call is warm.
+
+        A generate request without a prompt only loads the model; it uses the same
+        num_ctx as later calls, otherwise Ollama would load it a second time.
+        """
+        models = list(dict.fromkeys(models))
+        if background:
+            threading.Thread(
+                target=self.prewarm, args=(models, False), daemon=True
+            ).start()
+            return
+        for model in models:
+            start = time.perf_counter()
+            try:
+                resp = httpx.post(
+                    f"{self.base_url}{OLLAMA_GENERATE_PATH}",
+                    json={
+                        "model": model,
+                        "keep_alive": self.keep_alive(model),
+                        "options": self.runtime_options(model),
+                    },
+                    timeout=self.timeout,
+                )
+                resp.raise_for_status()
+                logger.info(
+                    "Prewarmed Ollama model %s in %.1fs",
+                    model,
+                    time.perf_counter() - start,
+                )
+            except httpx.HTTPError as exc:
+                logger.warning("Prewarming Ollama model %s failed: %s", model, exc)
+
+    @staticmethod
+    def _annotate_span(data: dict) -> None:
+        """Attach Ollama's token counts and timings to the active trace span."""
+        current_span().set_attributes(
+            {
+                "llm.response_model": data.get("model"),
+                "llm.prompt_tokens": data.get("prompt_eval_count"),
+                "llm.completion_tokens": data.get("eval_count"),
+                "llm.load_ms": (data.get("load_duration") or 0) / 1e6,
+            }
+        )
@@ -0,0 +1,142 @@
+"""Model-affinity scheduling for LLM calls.
+
+On a single local GPU/CPU, Ollama keeps a limited number of models resident and
+swaps when calls alternate between models. ModelAffinityLLMProvider queues
+concurrent generate() calls and grants them so that the model already running
+keeps being served while it has waiting calls (up to max_streak grants in a row,
+for fairness), then switches to the model with the oldest waiting call. Calls for
+the active model run up to its max_concurrency at once; other models wait.
+"""
+
+import itertools
+import threading
+import time
+from collections import deque
+from typing import Deque, Dict, Optional
+
+from rag_project.config import (
+    LLM_MODEL_REGISTRY,
+    LLM_SCHEDULER_MAX_CONCURRENCY,
+    LLM_SCHEDULER_MAX_STREAK,
+)
+from rag_project.logger import get_logger
+from rag_project.metrics import REGISTRY
+from rag_project.rag_core.ports.llm_port import LLMProvider
+from rag_project.tracing import current_span
+
+logger = get_logger(__name__)
+
+LLM_QUEUE_WAIT_SECONDS = REGISTRY.histogram(
+    "rag_llm_queue_wait_seconds",
+    "Time LLM calls waited for the scheduler",
+    ("model",),
+)
+LLM_MODEL_SWITCHES = REGISTRY.counter(
+    "rag_llm_model_switches",
+    "Times the scheduler moved to a different model",
+)
+
+
+class ModelAffinityLLMProvider(LLMProvider):
+    """LLMProvider decorator that serializes calls by model; see module docstring."""
+
+    def __init__(
+        self,
+        inner: LLMProvider,
+        max_concurrency: int = LLM_SCHEDULER_MAX_CONCURRENCY,
+        max_streak: int = LLM_SCHEDULER_MAX_STREAK,
+    ) -> None:
+        self._inner = inner
+        self.max_concurrency = max_concurrency
+        self.max_streak = max_streak
+        self._cond = threading.Condition()
+        self._queues: Dict[str, Deque[int]] = {}
+        self._enqueued_at: Dict[int, float] = {}
+        self._tickets = itertools.count()
+        self._active_model: Optional[str] = None
+        self._running = 0
+        self._streak = 0
+        self.switches = 0
+
+    def __getattr__(self, name):
+        if name == "_inner":
+            raise AttributeError(name)
+        return getattr(self._inner, name)
+
+    def generate(self, prompt: str, model: Optional[str] = None, **kwargs) -> str:
+        target = model or getattr(self._inner, "model", None) or ""
+        waited = self._acquire(target)
+        LLM_QUEUE_WAIT_SECONDS.observe(waited, model=target)
+        current_span().set_attribute("llm.queue_wait_ms", round(waited * 1000, 1))
+        try:
+            return self._inner.generate(prompt, model=model, **kwargs)
+        finally:
+            self._release()
+
+    def concurrency(self, model: str) -> int:
+        spec = LLM_MODEL_REGISTRY.get(model, {})
+        return spec.get("max_concurrency") or self.max_concurrency
+
+    def queued(self) -> Dict[str, int]:
+        """Waiting calls per model."""
+        with self._cond:
+            return {m: len(q) for m, q in self._queues.items() if q}
+
+    # ------------------------------------------------------------------ #
+    def _acquire(self, model: str) -> float:
+        with self._cond:
+            ticket = next(self._tickets)
+            start = time.perf_counter()
+            self._queues.setdefault(model, deque()).append(ticket)
+            self._enqueued_at[ticket] = start
+            while not self._may_run(model, ticket):
+                self._cond.wait()
+            self._queues[model].popleft()
+            del self._enqueued_at[ticket]
+            if model != self._active_model:
+                if self._active_model is not None:
+                    self.switches += 1
+                    LLM_MODEL_SWITCHES.inc()
+                    logger.debug(
+                        "LLM scheduler: switching %s -> %s", self._active_model, model
+                    )
+                self._active_model = model
+                self._streak = 0
+            self._streak += 1
+            self._running += 1
+            # Let the next queued call for this model check for a free slot.
+            self._cond.notify_all()
+            return time.perf_counter() - start
+
+    def _release(self) -> None:
+        with self._cond:
+            self._running -= 1
+            self._cond.notify_all()
+
+    def _may_run(self, model: str, ticket: int) -> bool:
+        if self._queues[model][0] != ticket:
+            return False
+        if self._running:
+            return (
+                model == self._active_model
+                and self._running < self.concurrency(model)
+                and not self._streak_exhausted()
+            )
+        return model == self._next_model()
+
+    def _streak_exhausted(self) -> bool:
+        others_waiting = any(
+            q for m, q in self._queues.items() if m != self._active_model
+        )
+        return others_waiting and self._streak >= self.max_streak
+
+    def _next_model(self) -> str:
+        exhausted = self._streak_exhausted()
+        if self._queues.get(self._active_model) and not exhausted:
+            return self._active_model
+        waiting = [
+            (self._enqueued_at[q[0]], m)
+            for m, q in self._queues.items()
+            if q and not (exhausted and m == self._active_model)
+        ]
+        return min(waiting)[1]
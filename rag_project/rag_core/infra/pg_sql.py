@@ -0,0 +1,410 @@
+import itertools
+from datetime import datetime
+from typing import Any, Dict, List
+from uuid import UUID
+
+from psycopg.types.json import Json
+
+from rag_project.config import (
+    DB_INSERT_BATCH_ROWS,
+    HYBRID_RRF_K,
+    HYDRATE_ALL_FIELDS,
+    HYDRATE_CONTENT,
+    HYDRATE_METADATA,
+    SEARCH_PROJECTION_FULL,
+    SEARCH_PROJECTION_LEAN,
+    DOC_TYPE_JOB_POSTING,
+    DOC_TYPE_CV,
+    DOC_TYPE_COVER_LETTER,
+    DOC_TYPE_THESIS,
+    DOC_TYPE_PERSONAL_PROJECT,
+    DOC_TYPE_COMPANY,
+    SQL_DELETE_DOCUMENTS_BY_FILTER,
+    SQL_DELETE_WHERE_DOC_TYPE,
+    SQL_DELETE_WHERE_CREATED_BEFORE,
+    SQL_DELETE_WHERE_COMPANY,
+    SQL_INSERT_CHUNKS,
+    SQL_INSERT_CHUNK_VALUES,
+    SQL_INSERT_EMBEDDINGS,
+    SQL_INSERT_EMBEDDING_VALUES,
+    SQL_WHERE_MIN_MATCH,
+    SQL_WHERE_POSTED_AFTER,
+    SQL_WHERE_DOC_TYPES,
+    SQL_WHERE_COMPANY_FILTER,
+    SQL_VECTOR_SEARCH_QUERY,
+    SQL_KEYWORD_SEARCH_QUERY,
+    SQL_LEAN_VECTOR_SEARCH_QUERY,
+    SQL_LEAN_KEYWORD_SEARCH_QUERY,
+)
+from rag_project.logger import get_logger
+from rag_project.rag_core.domain.models import (
+    Chunk,
+    CompanyInfo,
+    Document,
+    JobPosting,
+    PersonalDocument,
+    RetrievedChunk,
+    ScoreWeights,
+)
+
+logger = get_logger(__name__)
+
+SEARCH_KIND_VECTOR = "vector"
+SEARCH_KIND_KEYWORD = "keyword"
+_SEARCH_QUERIES = {
+    (SEARCH_KIND_VECTOR, SEARCH_PROJECTION_FULL): SQL_VECTOR_SEARCH_QUERY,
+    (SEARCH_KIND_VECTOR, SEARCH_PROJECTION_LEAN): SQL_LEAN_VECTOR_SEARCH_QUERY,
+    (SEARCH_KIND_KEYWORD, SEARCH_PROJECTION_FULL): SQL_KEYWORD_SEARCH_QUERY,
+    (SEARCH_KIND_KEYWORD, SEARCH_PROJECTION_LEAN): SQL_LEAN_KEYWORD_SEARCH_QUERY,
+}
+# Optional WHERE clauses in the fixed order build_where emits them.
+_OPTIONAL_FILTERS = (
+    ("posted_after", SQL_WHERE_POSTED_AFTER),
+    ("doc_types", SQL_WHERE_DOC_TYPES),
+    ("company", SQL_WHERE_COMPANY_FILTER),
+)
+
+
+def _build_search_statements() -> Dict[tuple, str]:
+    """Render every (kind, projection, active filters) combination once.
+
+    Each key maps to one stable statement text, so psycopg can prepare it once per
+    pooled connection and the server reuses the plan across calls.
+    """
+    statements: Dict[tuple, str] = {}
+    for (kind, projection), query in _SEARCH_QUERIES.items():
+        for enabled in itertools.product((False, True), repeat=len(_OPTIONAL_FILTERS)):
+            active = [f for f, on in zip(_OPTIONAL_FILTERS, enabled) if on]
+            where_sql = " AND ".join([SQL_WHERE_MIN_MATCH] + [sql for _, sql in active])
+            key = (kind, projection, tuple(name for name, _ in active))
+            statements[key] = query.format(where_sql=where_sql)
+    return statements
+
+
+SEARCH_STATEMENTS = _build_search_statements()
+
+
+def document_params(document: Document) -> tuple:
+    return (
+        document.id,
+        document.doc_type,
+        Json(document.metadata) if document.metadata else None,
+        document.created_at,
+    )
+
+
+def job_posting_params(job_posting: JobPosting) -> tuple:
+    return (
+        job_posting.document_id,
+        job_posting.related_company_id,
+        job_posting.title,
+        job_posting.location_text,
+        job_posting.salary_range,
+        job_posting.url,
+        job_posting.language,
+        job_posting.posted_at,
+        job_posting.match_score,
+        job_posting.company,
+    )
+
+
+def personal_document_params(personal: PersonalDocument) -> tuple:
+    return (personal.document_id, personal.category)
+
+
+def company_info_params(company: CompanyInfo) -> tuple:
+    return (company.document_id, company.name, company.industry)
+
+
+def chunk_params(chunk: Chunk) -> tuple:
+    return (
+        chunk.id,
+        chunk.document_id,
+        chunk.chunk_index,
+        chunk.content,
+        chunk.token_count,
+        chunk.created_at,
+    )
+
+
+def chunk_insert_statements(
+    chunks: List[Chunk],
+    embeddings: List[List[float]],
+    batch_rows: int = DB_INSERT_BATCH_ROWS,
+) -> List[tuple]:
+    """(sql, params) pairs inserting chunks and embeddings with multi-row INSERTs."""
+    statements = []
+    for start in range(0, len(chunks), batch_rows):
+        batch = chunks[start : start + batch_rows]
+        batch_embeddings = embeddings[start : start + batch_rows]
+        statements.append(
+            (
+                SQL_INSERT_CHUNKS.format(
+                    values=", ".join([SQL_INSERT_CHUNK_VALUES] * len(batch))
+                ),
+                [param for chunk in batch for param in chunk_params(chunk)],
+            )
+        )
+        statements.append(
+            (
+                SQL_INSERT_EMBEDDINGS.format(
+                    values=", ".join([SQL_INSERT_EMBEDDING_VALUES] * len(batch))
+                ),
+                [
+                    param
+                    for chunk, emb in zip(batch, batch_embeddings)
+                    for param in (chunk.id, emb)
+                ],
+            )
+        )
+    return statements
+
+
+def delete_filter_sql(
+    doc_type: str | None, created_before: datetime | None, company: str | None
+) -> tuple[str, list]:
+    clauses: list[str] = []
+    params: list = []
+    if doc_type:
+        clauses.append(SQL_DELETE_WHERE_DOC_TYPE)
+        params.append(doc_type)
+    if created_before is not None:
+        clauses.append(SQL_DELETE_WHERE_CREATED_BEFORE)
+        params.append(created_before)
+    if company:
+        clauses.append(SQL_DELETE_WHERE_COMPANY)
+        params.append(f"%{company}%")
+    if not clauses:
+        # Refuse an unfiltered DELETE; wiping the table must be explicit.
+        raise ValueError("delete_documents_by_filter requires at least one filter")
+    return (
+        SQL_DELETE_DOCUMENTS_BY_FILTER.format(where_sql=" AND ".join(clauses)),
+        params,
+    )
+
+
+def build_where(
+    min_match_score: float,
+    posted_after: float | None,
+    doc_types: list[str] | None,
+    filters: Dict[str, Any] | None,
+) -> tuple[tuple[str, ...], list]:
+    """Return the active optional filter names (SEARCH_STATEMENTS key) and params."""
+    active: list[str] = []
+    params: list = [min_match_score]
+
+    if posted_after is not None:
+        active.append("posted_after")
+        params.append(posted_after)
+
+    if doc_types:
+        active.append("doc_types")
+        params.append(doc_types)
+
+    if filters:
+        if "company" in filters and filters["company"]:
+            # ILIKE for case-insensitive substring match on job_postings.company
+            active.append("company")
+            params.append(f"%{filters['company']}%")
+
+    return tuple(active), params
+
+
+def score_params(query_embedding: List[float], weights: ScoreWeights | None) -> list:
+    """Params for the score LATERAL join shared by every search query."""
+    return [query_embedding, *(weights or ScoreWeights()).as_params()]
+
+
+def search_statement(kind: str, projection: str, active: tuple[str, ...]) -> str:
+    lean = projection == SEARCH_PROJECTION_LEAN
+    projection = SEARCH_PROJECTION_LEAN if lean else SEARCH_PROJECTION_FULL
+    return SEARCH_STATEMENTS[(kind, projection, active)]
+
+
+def row_mapper(projection: str):
+    if projection == SEARCH_PROJECTION_LEAN:
+        return lean_row_to_retrieved
+    return row_to_retrieved
+
+
+def tsquery_text(query_text: str) -> str:
+    terms = [t.strip('"-') for t in query_text.split()]
+    return " or ".join(t for t in terms if t)
+
+
+def row_to_retrieved(row) -> RetrievedChunk:
+    (
+        chunk_id,
+        document_id,
+        chunk_index,
+        content,
+        token_count,
+        doc_id,
+        doc_type,
+        metadata,
+        doc_created_at,
+        title,
+        company,
+        location_text,
+        language,
+        url,
+        posted_at,
+        match_score,
+        related_company_id,
+        salary_range,
+        personal_category,
+        company_name,
+        industry,
+        score,
+    ) = row
+    chunk = Chunk(
+        id=chunk_id,
+        document_id=document_id,
+        chunk_index=chunk_index,
+        content=content,
+        token_count=token_count,
+    )
+    document = Document(
+        id=doc_id,
+        doc_type=doc_type,
+        metadata=metadata,
+        created_at=doc_created_at,
+    )
+    jp = None
+    pd = None
+    ci = None
+    if doc_type == DOC_TYPE_JOB_POSTING:
+        jp = JobPosting(
+            document_id=doc_id,
+            related_company_id=related_company_id,
+            title=title,
+            location_text=location_text,
+            salary_range=salary_range,
+            url=url,
+            language=language,
+            posted_at=posted_at,
+            match_score=match_score,
+            company=company,
+        )
+    if doc_type in {
+        DOC_TYPE_CV,
+        DOC_TYPE_COVER_LETTER,
+        DOC_TYPE_THESIS,
+        DOC_TYPE_PERSONAL_PROJECT,
+    }:
+        pd = PersonalDocument(
+            document_id=doc_id, category=personal_category or doc_type
+        )
+    if doc_type == DOC_TYPE_COMPANY:
+        ci = CompanyInfo(document_id=doc_id, name=company_name, industry=industry)
+
+    return RetrievedChunk(
+        chunk=chunk,
+        document=document,
+        score=float(score),
+        job_posting=jp,
+        personal=pd,
+        company_info=ci,
+    )
+
+
+def lean_row_to_retrieved(row) -> RetrievedChunk:
+    (
+        chunk_id,
+        document_id,
+        chunk_index,
+        token_count,
+        doc_type,
+        doc_created_at,
+        title,
+        company,
+        url,
+        personal_category,
+        score,
+    ) = row
+    chunk = Chunk(
+        id=chunk_id,
+        document_id=document_id,
+        chunk_index=chunk_index,
+        token_count=token_count,
+    )
+    document = Document(id=document_id, doc_type=doc_type, created_at=doc_created_at)
+    jp = None
+    pd = None
+    if doc_type == DOC_TYPE_JOB_POSTING:
+        jp = JobPosting(document_id=document_id, title=title, url=url, company=company)
+    if doc_type in {
+        DOC_TYPE_CV,
+        DOC_TYPE_COVER_LETTER,
+        DOC_TYPE_THESIS,
+        DOC_TYPE_PERSONAL_PROJECT,
+    }:
+        pd = PersonalDocument(
+            document_id=document_id, category=personal_category or doc_type
+        )
+    return RetrievedChunk(
+        chunk=chunk,
+        document=document,
+        score=float(score),
+        job_posting=jp,
+        personal=pd,
+        unloaded_fields=set(HYDRATE_ALL_FIELDS),
+    )
+
+
+def pending_hydration(
+    retrieved: List[RetrievedChunk], fields: tuple[str, ...]
+) -> tuple[List[RetrievedChunk], List[RetrievedChunk]]:
+    need_content = [
+        rc
+        for rc in retrieved
+        if HYDRATE_CONTENT in fields and HYDRATE_CONTENT in rc.unloaded_fields
+    ]
+    need_metadata = [
+        rc
+        for rc in retrieved
+        if HYDRATE_METADATA in fields and HYDRATE_METADATA in rc.unloaded_fields
+    ]
+    return need_content, need_metadata
+
+
+def apply_hydration(
+    need_content: List[RetrievedChunk],
+    need_metadata: List[RetrievedChunk],
+    contents: Dict[UUID, str],
+    metadata: Dict[UUID, Any],
+) -> None:
+    for rc in need_content:
+        rc.chunk.content = contents.get(rc.chunk.id, "")
+        rc.unloaded_fields.discard(HYDRATE_CONTENT)
+    for rc in need_metadata:
+        rc.document.metadata = metadata.get(rc.document.id)
+        rc.unloaded_fields.discard(HYDRATE_METADATA)
+    logger.debug(
+        "repo.hydrate content=%d metadata=%d", len(need_content), len(need_metadata)
+    )
+
+
+def reciprocal_rank_fusion(
+    ranked_lists: List[List[RetrievedChunk]], k: int = HYBRID_RRF_K
+) -> List[RetrievedChunk]:
+    """Fuse ranked result lists by summing 1 / (k + rank) per chunk.
+
+    The fused score is normalized by its maximum (rank 1 in every list) so it stays
+    in [0, 1] like the vector score it replaces.
+    """
+    if not ranked_lists:
+        return []
+    fused: Dict[UUID, float] = {}
+    by_id: Dict[UUID, RetrievedChunk] = {}
+    for ranked in ranked_lists:
+        for rank, rc in enumerate(ranked, start=1):
+            fused[rc.chunk.id] = fused.get(rc.chunk.id, 0.0) + 1.0 / (k + rank)
+            by_id.setdefault(rc.chunk.id, rc)
+    best_possible = len(ranked_lists) / (k + 1)
+    results = []
+    for chunk_id, rrf in sorted(fused.items(), key=lambda item: item[1], reverse=True):
+        rc = by_id[chunk_id]
+        rc.score = rrf / best_possible
+        results.append(rc)
+    return results
@@ -0,0 +1,39 @@
+from typing import List
+
+from rag_project.config import (
+    RERANKER_BATCH_SIZE,
+    RERANKER_DEPENDENCY_MESSAGE,
+    RERANKER_MAX_LENGTH,
+    RERANKER_MODEL_ID,
+)
+from rag_project.rag_core.ports.reranker_port import RerankerProvider
+from rag_project.logger import get_logger
+
+
+logger = get_logger(__name__)
+
+
+class BgeRerankerProvider(RerankerProvider):
+    def __init__(
+        self,
+        model_id: str = RERANKER_MODEL_ID,
+        batch_size: int = RERANKER_BATCH_SIZE,
+        max_length: int = RERANKER_MAX_LENGTH,
+    ) -> None:
+        try:
+            from sentence_transformers import CrossEncoder  # type: ignore
+        except ImportError:
+            logger.error("Reranker requested but CrossEncoder is unavailable")
+            raise RuntimeError(RERANKER_DEPENDENCY_MESSAGE)
+        self.model = CrossEncoder(model_id, max_length=max_length)
+        self.batch_size = batch_size
+        logger.info("Loaded reranker model %s", model_id)
+
+    def score(self, query: str, passages: List[str]) -> List[float]:
+        if not passages:
+            return []
+        logger.debug("Reranking batch size=%d", len(passages))
+        scores = self.model.predict(
+            [(query, passage) for passage in passages], batch_size=self.batch_size
+        )
+        return [float(s) for s in scores]
@@ -0,0 +1,110 @@
+import math
+import re
+import threading
+from bisect import bisect_right
+from typing import Dict, List
+
+from rag_project.config import (
+    EMBEDDING_MODEL_REGISTRY,
+    LLM_MODEL_REGISTRY,
+    TOKENIZER_DEPENDENCY_MESSAGE,
+    TOKENIZER_FALLBACK_CHARS_PER_TOKEN,
+)
+from rag_project.rag_core.ports.tokenizer_port import Tokenizer
+from rag_project.logger import get_logger
+
+
+logger = get_logger(__name__)
+
+_WORD_RE = re.compile(r"\S+")
+
+
+class HuggingFaceTokenizer(Tokenizer):
+    """Counts tokens with the Hugging Face tokenizer of the served model."""
+
+    def __init__(self, tokenizer_id: str) -> None:
+        try:
+            from transformers import AutoTokenizer  # type: ignore
+        except ImportError:
+            logger.error("Tokenizer requested but transformers is unavailable")
+            raise RuntimeError(TOKENIZER_DEPENDENCY_MESSAGE)
+        self.tokenizer_id = tokenizer_id
+        self._tokenizer = AutoTokenizer.from_pretrained(tokenizer_id)
+        logger.info("Loaded tokenizer %s", tokenizer_id)
+
+    def count(self, text: str) -> int:
+        if not text:
+            return 0
+        return len(self._tokenizer.encode(text, add_special_tokens=False))
+
+    def truncate(self, text: str, max_tokens: int) -> str:
+        if max_tokens <= 0:
+            return ""
+        offsets = self._tokenizer(
+            text, add_special_tokens=False, return_offsets_mapping=True
+        )["offset_mapping"]
+        if len(offsets) <= max_tokens:
+            return text
+        return text[: offsets[max_tokens - 1][1]]
+
+    def word_token_counts(self, text: str) -> List[int]:
+        word_starts = [m.start() for m in _WORD_RE.finditer(text)]
+        counts = [0] * len(word_starts)
+        if not counts:
+            return counts
+        offsets = self._tokenizer(
+            text, add_special_tokens=False, return_offsets_mapping=True
+        )["offset_mapping"]
+        for start, end in offsets:
+            # A token belongs to the word it starts in (or the first word).
+            counts[max(0, bisect_right(word_starts, start) - 1)] += 1
+        return counts
+
+
+class CharEstimateTokenizer(Tokenizer):
+    """Conservative chars-per-token estimate, used when no tokenizer can be loaded."""
+
+    def __init__(
+        self, chars_per_token: float = TOKENIZER_FALLBACK_CHARS_PER_TOKEN
+    ) -> None:
+        self.chars_per_token = chars_per_token
+
+    def count(self, text: str) -> int:
+        return math.ceil(len(text) / self.chars_per_token)
+
+    def truncate(self, text: str, max_tokens: int) -> str:
+        return text[: max(0, int(max_tokens * self.chars_per_token))]
+
+    def word_token_counts(self, text: str) -> List[int]:
+        return [math.ceil(len(word) / self.chars_per_token) for word in text.split()]
+
+
+_tokenizers: Dict[str, Tokenizer] = {}
+_tokenizers_lock = threading.Lock()
+
+
+def get_tokenizer(model_id: str) -> Tokenizer:
+    """Tokenizer for an LLM or embedding registry model, loaded once per tokenizer id.
+
+    Falls back to CharEstimateTokenizer when transformers or the tokenizer files
+    are unavailable, so prompt budgeting and chunk sizing degrade instead of
+    failing.
+    """
+    spec = LLM_MODEL_REGISTRY.get(model_id) or EMBEDDING_MODEL_REGISTRY.get(model_id)
+    tokenizer_id = (spec or {}).get("tokenizer_id")
+    key = tokenizer_id or ""
+    with _tokenizers_lock:
+        if key not in _tokenizers:
+            tokenizer: Tokenizer = CharEstimateTokenizer()
+            if tokenizer_id:
+                try:
+                    tokenizer = HuggingFaceTokenizer(tokenizer_id)
+                except Exception as exc:  # noqa: BLE001
+                    logger.warning(
+                        "Tokenizer %s unavailable, estimating tokens from "
+                        "characters: %s",
+                        tokenizer_id,
+                        exc,
+                    )
+            _tokenizers[key] = tokenizer
+        return _tokenizers[key]
@@ -0,0 +1,117 @@
+from typing import List, Optional
+
+from rag_project.rag_core.ports.embedding_port import EmbeddingProvider
+from rag_project.rag_core.ports.llm_port import LLMProvider
+from rag_project.rag_core.ports.repo_port import ChunkRepository, DocumentRepository
+from rag_project.rag_core.ports.reranker_port import RerankerProvider
+from rag_project.tracing import start_span
+
+
+class _Delegating:
+    """Forward anything not traced explicitly (helpers, settings, close) to inner."""
+
+    def __init__(self, inner) -> None:
+        self._inner = inner
+
+    def __getattr__(self, name):
+        if name == "_inner":
+            raise AttributeError(name)
+        return getattr(self._inner, name)
+
+
+class TracedEmbeddingProvider(_Delegating, EmbeddingProvider):
+    def __init__(self, inner: EmbeddingProvider, model_id: Optional[str] = None):
+        super().__init__(inner)
+        self.model_id = model_id
+
+    def embed(self, texts: List[str]) -> List[List[float]]:
+        with start_span(
+            "embedding.embed", **{"embedding.model": self.model_id}
+        ) as span:
+            span.set_attribute("embedding.batch_size", len(texts))
+            span.set_attribute("embedding.input_chars", sum(len(t) for t in texts))
+            return self._inner.embed(texts)
+
+    def embed_query(self, text: str) -> List[float]:
+        with start_span(
+            "embedding.embed", **{"embedding.model": self.model_id}
+        ) as span:
+            span.set_attribute("embedding.batch_size", 1)
+            span.set_attribute("embedding.input_chars", len(text))
+            return self._inner.embed_query(text)
+
+
+class TracedLLMProvider(_Delegating, LLMProvider):
+    """Span per generate call; adapters may add token counts to the current span."""
+
+    def generate(self, prompt: str, model: Optional[str] = None, **kwargs) -> str:
+        target_model = model or getattr(self._inner, "model", None)
+        with start_span("llm.generate", **{"llm.model": target_model}) as span:
+            span.set_attribute("llm.max_tokens", kwargs.get("max_tokens"))
+            span.set_attribute("llm.prompt_chars", len(prompt))
+            response = self._inner.generate(prompt, model=model, **kwargs)
+            span.set_attribute("llm.response_chars", len(response or ""))
+            return response
+
+
+class TracedRerankerProvider(_Delegating, RerankerProvider):
+    def score(self, query: str, passages: List[str]) -> List[float]:
+        with start_span("reranker.score") as span:
+            span.set_attribute("rerank.passages", len(passages))
+            return self._inner.score(query, passages)
+
+
+class TracedRepository(_Delegating, DocumentRepository, ChunkRepository):
+    """Spans around search, hydrate and write calls with row counts."""
+
+    def _rows(self, name: str, call, *args, **kwargs):
+        with start_span(name) as span:
+            for key in ("limit", "projection"):
+                span.set_attribute(f"db.{key}", kwargs.get(key))
+            rows = call(*args, **kwargs)
+            span.set_attribute("db.rows", len(rows))
+            return rows
+
+    def search(self, *args, **kwargs):
+        return self._rows("repo.search", self._inner.search, *args, **kwargs)
+
+    def hybrid_search(self, *args, **kwargs):
+        return self._rows(
+            "repo.hybrid_search", self._inner.hybrid_search, *args, **kwargs
+        )
+
+    def keyword_search(self, *args, **kwargs):
+        return self._rows(
+            "repo.keyword_search", self._inner.keyword_search, *args, **kwargs
+        )
+
+    def hydrate(self, retrieved, *args, **kwargs):
+        with start_span("repo.hydrate") as span:
+            span.set_attribute("db.rows", len(retrieved))
+            return self._inner.hydrate(retrieved, *args, **kwargs)
+
+    def insert_chunks_with_embeddings(self, chunks, embeddings) -> None:
+        with start_span("repo.insert_chunks") as span:
+            span.set_attribute("db.rows", len(chunks))
+            return self._inner.insert_chunks_with_embeddings(chunks, embeddings)
+
+    def insert_document(self, document) -> None:
+        return self._inner.insert_document(document)
+
+    def insert_job_posting(self, job_posting) -> None:
+        return self._inner.insert_job_posting(job_posting)
+
+    def insert_personal_document(self, personal) -> None:
+        return self._inner.insert_personal_document(personal)
+
+    def insert_company_info(self, company) -> None:
+        return self._inner.insert_company_info(company)
+
+    def delete_document(self, document_id) -> None:
+        return self._inner.delete_document(document_id)
+
+    def delete_documents(self, document_ids) -> int:
+        return self._inner.delete_documents(document_ids)
+
+    def delete_documents_by_filter(self, *args, **kwargs) -> int:
+        return self._inner.delete_documents_by_filter(*args, **kwargs)
@@ -1,5 +1,5 @@
 import re
-from typing import List
+from typing import List, Optional, Tuple
 
 from rag_project.config import (
     CHUNKER_DEFAULT_MAX_TOKENS,
@@ -7,6 +7,7 @@ from rag_project.config import (
     SENTENCE_SPLIT_REGEX,
     CHUNK_OVERLAP_RATIO,
 )
+from rag_project.rag_core.ports.tokenizer_port import Tokenizer
 from rag_project.logger import get_logger
 
 
@@ -26,14 +27,32 @@ def split_into_sentences(text: str) -> List[str]:
     return sentences
 
 
+def tail_words(
+    words: List[str], overlap: int, tokenizer: Optional[Tokenizer]
+) -> Tuple[List[str], int]:
+    """Trailing words of a chunk that fit in overlap words (or tokens)."""
+    if tokenizer is None:
+        tail = words[-overlap:] if len(words) > overlap else words
+        return tail, len(tail)
+    counts = tokenizer.word_token_counts(" ".join(words))
+    size = 0
+    start = len(words)
+    while start > 0 and size + counts[start - 1] <= overlap:
+        start -= 1
+        size += counts[start]
+    return words[start:], size
+
+
 def chunk_text(
     text: str,
     max_tokens: int = CHUNKER_DEFAULT_MAX_TOKENS,
     overlap_tokens: int = CHUNKER_DEFAULT_OVERLAP_TOKENS,
+    tokenizer: Optional[Tokenizer] = None,
 ) -> List[str]:
     """
     Chunk text into roughly max_tokens units with ~{overlap_pct}% overlap.
-    Token proxy is words; avoids splitting inside words and prioritizes sentence boundaries.
+    Token proxy is words unless a tokenizer is given; avoids splitting inside
+    words and prioritizes sentence boundaries.
     """.format(
         overlap_pct=int(CHUNK_OVERLAP_RATIO * 100)
     )
@@ -43,8 +62,7 @@ def chunk_text(
     current_len = 0
 
     for sent in sentences:
-        words = sent.split()
-        sent_len = len(words)
+        sent_len = tokenizer.count(sent) if tokenizer else len(sent.split())
         if current_len + sent_len <= max_tokens:
             current.append(sent)
             current_len += sent_len
@@ -53,14 +71,11 @@ def chunk_text(
                 chunks.append(" ".join(current))
             # start new chunk; include overlap from previous chunk
             if chunks and overlap_tokens > 0:
-                last_words = chunks[-1].split()
-                overlap_slice = (
-                    last_words[-overlap_tokens:]
-                    if len(last_words) > overlap_tokens
-                    else last_words
+                overlap_slice, overlap_len = tail_words(
+                    chunks[-1].split(), overlap_tokens, tokenizer
                 )
-                current = [" ".join(overlap_slice), sent]
-                current_len = len(overlap_slice) + sent_len
+                current = [" ".join(overlap_slice), sent] if overlap_slice else [sent]
+                current_len = overlap_len + sent_len
             else:
                 current = [sent]
                 current_len = sent_len
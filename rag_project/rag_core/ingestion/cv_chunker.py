@@ -1,12 +1,14 @@
 """
-LLM-assisted CV chunker: uses an LLM to identify semantic section boundaries
-and splits the CV by line numbers. Mirrors the QA helper but configured via
-constants.
+CV chunker: splits a CV by line numbers at its sections. A rule-based detector
+(headings, date ranges, layout) finds the sections and scores its confidence;
+only CVs it is unsure about go to an LLM for split points. Mirrors the QA helper
+but configured via constants.
 """
 
 import json
 import re
-from typing import Callable, List, Tuple
+from dataclasses import dataclass
+from typing import Callable, List, Optional, Tuple
 
 from rag_project.logger import get_logger
 from rag_project.config import (
@@ -17,6 +19,12 @@ from rag_project.config import (
     CV_MIN_RESPONSE_TOKENS,
     CV_HEADING_KEYWORDS,
     CV_DATE_REGEX,
+    CV_DATE_RANGE_REGEX,
+    CV_ENTRY_SECTION_KEYWORDS,
+    CV_HEADING_MAX_WORDS,
+    CV_RULES_MAX_SECTION_LINES,
+    CV_RULES_MIN_CONFIDENCE,
+    CV_RULES_MIN_HEADINGS,
 )
 
 logger = get_logger(__name__)
@@ -103,27 +111,124 @@ def _adjust_split_points(lines: List[str], split_points: List[int]) -> List[int]
     return cleaned
 
 
-def _heuristic_split_points(lines: List[str]) -> List[int]:
-    """Fallback deterministic split points based on headings/date hints."""
-    headings = CV_HEADING_KEYWORDS
-    date_pat = re.compile(CV_DATE_REGEX)
-    splits: List[int] = []
-    start = 0
-    for i, line in enumerate(lines):
-        if i == 0:
+_DATE_RE = re.compile(CV_DATE_REGEX)
+_DATE_RANGE_RE = re.compile(CV_DATE_RANGE_REGEX, re.IGNORECASE)
+_BULLET_RE = re.compile(r"^\s*(?:[•▪◦●*\-–]|\d+[.)])\s+")
+# Longest first so "work experience" wins over "experience".
+_HEADING_KEYWORD_RE = re.compile(
+    r"\b("
+    + "|".join(re.escape(k) for k in sorted(CV_HEADING_KEYWORDS, key=len, reverse=True))
+    + r")\b"
+)
+_HEADING_MARKUP = str.maketrans("", "", "#*_:|")
+
+
+@dataclass
+class CvSections:
+    """Rule-based split points for a CV and how far to trust them (0..1)."""
+
+    split_points: List[int]
+    confidence: float
+    headings: List[int]
+
+
+def _is_date_line(line: str) -> bool:
+    return bool(_DATE_RANGE_RE.search(line) or _DATE_RE.search(line))
+
+
+def _heading_keyword(lines: List[str], i: int) -> Optional[str]:
+    """Section keyword if line i is a heading: a short keyword line set apart by
+    layout (blank line before, trailing colon, caps or markdown)."""
+    line = lines[i].strip()
+    if not line or _BULLET_RE.match(line) or _is_date_line(line):
+        return None
+    name = " ".join(line.translate(_HEADING_MARKUP).lower().split())
+    if not name or len(name.split()) > CV_HEADING_MAX_WORDS:
+        return None
+    match = _HEADING_KEYWORD_RE.search(name)
+    if not match:
+        return None
+    set_apart = (
+        i == 0
+        or not lines[i - 1].strip()
+        or line.endswith(":")
+        or line.startswith(("#", "**"))
+        or line.isupper()
+    )
+    return match.group(1) if set_apart else None
+
+
+def _entry_start(lines: List[str], i: int, first: int) -> int:
+    """First line of the entry whose date is on line i (a title line may precede it)."""
+    prev = i - 1
+    if (
+        prev > first
+        and lines[prev].strip()
+        and not _BULLET_RE.match(lines[prev])
+        and not _is_date_line(lines[prev])
+        and (
+            prev - 1 == first
+            or not lines[prev - 1].strip()
+            or _BULLET_RE.match(lines[prev - 1])
+        )
+    ):
+        return prev
+    return i
+
+
+def detect_cv_sections(lines: List[str]) -> CvSections:
+    """
+    Rule-based CV sections:
+    - a heading line (CV_HEADING_KEYWORDS plus layout cues) starts a section
+    - in experience/project/education sections each dated entry starts a chunk
+      (the first entry stays with its heading)
+    - lines before the first heading form the header chunk
+    Confidence weighs how many distinct headings were found, how much of the CV
+    they cover and whether any section is implausibly long.
+    """
+    nonblank = [i for i, line in enumerate(lines) if line.strip()]
+    if not nonblank:
+        return CvSections(split_points=[], confidence=0.0, headings=[])
+    headings = [
+        (i, keyword)
+        for i in nonblank
+        if (keyword := _heading_keyword(lines, i)) is not None
+    ]
+    starts = {i for i, _keyword in headings if i > nonblank[0]}
+    bounds = [i for i, _keyword in headings] + [len(lines)]
+    for (head, keyword), end in zip(headings, bounds[1:]):
+        if keyword not in CV_ENTRY_SECTION_KEYWORDS:
             continue
-        low = line.lower()
-        is_heading = any(low.startswith(h) for h in headings)
-        is_date = bool(date_pat.search(line))
-        if is_heading or is_date:
-            if i - 1 >= start:
-                splits.append(i - 1)
-                start = i
-    if lines and splits and splits[-1] != len(lines) - 1:
-        splits.append(len(lines) - 1)
-    elif lines and not splits:
-        splits.append(len(lines) - 1)
-    return splits
+        body = [i for i in range(head + 1, end) if lines[i].strip()]
+        for i in body[1:]:
+            if not _BULLET_RE.match(lines[i]) and _is_date_line(lines[i]):
+                start = _entry_start(lines, i, head)
+                if start > body[0]:
+                    starts.add(start)
+    split_points = sorted(start - 1 for start in starts)
+
+    edges = [0] + [p + 1 for p in split_points] + [len(lines)]
+    section_sizes = [
+        sum(1 for i in range(lo, hi) if lines[i].strip())
+        for lo, hi in zip(edges, edges[1:])
+    ]
+    oversized = sum(n > CV_RULES_MAX_SECTION_LINES for n in section_sizes)
+    distinct = len({keyword for _i, keyword in headings})
+    covered = (
+        sum(1 for i in nonblank if i >= headings[0][0]) / len(nonblank)
+        if headings
+        else 0.0
+    )
+    confidence = (
+        0.5 * min(1.0, distinct / CV_RULES_MIN_HEADINGS)
+        + 0.3 * covered
+        + 0.2 * (1 - oversized / len(section_sizes))
+    )
+    return CvSections(
+        split_points=split_points,
+        confidence=round(confidence, 3),
+        headings=[i for i, _keyword in headings],
+    )
 
 
 def split_at_points(lines: List[str], split_points: List[int]) -> List[str]:
@@ -149,13 +254,32 @@ def chunk_cv(
     text: str,
     llm_generate: Callable[[str, int], str],
     debug: bool = False,
+    min_confidence: float = CV_RULES_MIN_CONFIDENCE,
 ):
-    """Chunk CV text using an LLM-generated set of split points."""
+    """Chunk CV text at rule-detected sections, asking the LLM for split points
+    only when the rules' confidence is below min_confidence."""
     lines = text.split("\n")
-    split_points, prompt, raw_response, truncated = get_llm_splits(lines, llm_generate)
+    sections = detect_cv_sections(lines)
+    if sections.confidence >= min_confidence:
+        logger.info(
+            "CV sections from rules (confidence=%.2f); skipping LLM",
+            sections.confidence,
+        )
+        source = "rules"
+        split_points, prompt, raw_response, truncated = (
+            sections.split_points,
+            "",
+            "",
+            False,
+        )
+    else:
+        source = "llm"
+        split_points, prompt, raw_response, truncated = get_llm_splits(
+            lines, llm_generate
+        )
     split_points = _adjust_split_points(lines, split_points)
     if not split_points:
-        split_points = _heuristic_split_points(lines)
+        split_points = _adjust_split_points(lines, sections.split_points)
     chunks = split_at_points(lines, split_points)
     chunks = [c for c in chunks if c.strip()]
     debug_info = {
@@ -163,6 +287,8 @@ def chunk_cv(
         "llm_response": raw_response,
         "prompt_truncated": truncated,
         "split_points": split_points,
+        "split_source": source,
+        "rule_confidence": sections.confidence,
         "num_lines": len(lines),
         "num_chunks": len(chunks),
         "model": CV_CHUNKER_MODEL_ID,
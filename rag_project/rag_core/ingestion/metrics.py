@@ -0,0 +1,130 @@
+import json
+import os
+import time
+from contextlib import contextmanager
+from typing import Dict, Iterator, List, Optional
+from uuid import UUID
+
+from rag_project.logger import get_logger
+from rag_project.metrics import REGISTRY
+
+logger = get_logger(__name__)
+
+STAGE_PARSE = "parse"
+STAGE_METADATA = "metadata"
+STAGE_CHUNK = "chunk"
+STAGE_EMBED = "embed"
+STAGE_STORE = "store"
+
+INGEST_STAGE_SECONDS = REGISTRY.histogram(
+    "rag_ingest_stage_seconds",
+    "Wall time per ingestion stage",
+    ("stage", "doc_type"),
+)
+INGEST_DURATION_SECONDS = REGISTRY.histogram(
+    "rag_ingest_duration_seconds",
+    "Wall time per ingested document",
+    ("doc_type",),
+)
+INGEST_DOCUMENTS = REGISTRY.counter(
+    "rag_ingest_documents",
+    "Ingested documents by outcome",
+    ("doc_type", "status"),
+)
+INGEST_STAGE_FAILURES = REGISTRY.counter(
+    "rag_ingest_stage_failures",
+    "Ingestion stages that raised",
+    ("stage",),
+)
+INGEST_WORDS = REGISTRY.counter(
+    "rag_ingest_words", "Words of text ingested", ("doc_type",)
+)
+INGEST_CHUNKS = REGISTRY.counter(
+    "rag_ingest_chunks", "Chunks written by ingestion", ("doc_type",)
+)
+PARSE_SECONDS = REGISTRY.histogram(
+    "rag_parse_seconds", "Wall time per parsed file", ("parser",)
+)
+PARSE_OUTPUT_CHARS = REGISTRY.counter(
+    "rag_parse_output_chars", "Characters of text produced by parsers", ("parser",)
+)
+
+
+class IngestRun:
+    """Stage timings and counts for one ingest.
+
+    Wrap each stage in `with run.stage(name):`; repeated stages accumulate and
+    nested stages are exclusive (time in the inner stage is not counted for the
+    outer one), which keeps streamed ingests, where chunking pulls pages from
+    the parser, from counting parse time twice.
+    finish() records everything in the metrics registry and returns the JSON
+    summary, optionally appending it as one line to a JSONL file.
+    """
+
+    def __init__(self, source: Optional[str] = None) -> None:
+        self.source = source
+        self.document_id: Optional[UUID] = None
+        self.doc_type: Optional[str] = None
+        self.words = 0
+        self.chunks = 0
+        self.stages: Dict[str, float] = {}
+        self.failed_stage: Optional[str] = None
+        self._start = time.perf_counter()
+        self._inner_seconds: List[float] = []  # per open stage, innermost last
+
+    @contextmanager
+    def stage(self, name: str) -> Iterator[None]:
+        start = time.perf_counter()
+        self._inner_seconds.append(0.0)
+        try:
+            yield
+        except Exception:
+            # An error raised in a nested stage is attributed to that stage only.
+            if self.failed_stage is None:
+                self.failed_stage = name
+                INGEST_STAGE_FAILURES.inc(stage=name)
+            raise
+        finally:
+            elapsed = time.perf_counter() - start
+            inner = self._inner_seconds.pop()
+            self.stages[name] = self.stages.get(name, 0.0) + elapsed - inner
+            if self._inner_seconds:
+                self._inner_seconds[-1] += elapsed
+
+    def summary(self, status: str) -> dict:
+        total = time.perf_counter() - self._start
+        return {
+            "document_id": str(self.document_id) if self.document_id else None,
+            "source": self.source,
+            "doc_type": self.doc_type,
+            "status": status,
+            "failed_stage": self.failed_stage,
+            "words": self.words,
+            "chunks": self.chunks,
+            "total_seconds": round(total, 4),
+            "words_per_second": round(self.words / total, 1) if total > 0 else None,
+            "stages": {name: round(sec, 4) for name, sec in self.stages.items()},
+        }
+
+    def finish(self, ok: bool = True, summary_path: Optional[str] = None) -> dict:
+        status = "ok" if ok else "error"
+        summary = self.summary(status)
+        doc_type = self.doc_type or "unknown"
+        for name, seconds in self.stages.items():
+            INGEST_STAGE_SECONDS.observe(seconds, stage=name, doc_type=doc_type)
+        INGEST_DOCUMENTS.inc(doc_type=doc_type, status=status)
+        if ok:
+            INGEST_DURATION_SECONDS.observe(summary["total_seconds"], doc_type=doc_type)
+            INGEST_WORDS.inc(self.words, doc_type=doc_type)
+            INGEST_CHUNKS.inc(self.chunks, doc_type=doc_type)
+
+        line = json.dumps(summary, sort_keys=True)
+        logger.info("Ingest summary %s", line)
+        if summary_path:
+            try:
+                os.makedirs(os.path.dirname(summary_path) or ".", exist_ok=True)
+                with open(summary_path, "a", encoding="utf-8") as fh:
+                    fh.write(line + "\n")
+            except OSError as exc:
+                logger.warning("Failed to write ingest summary: %s", exc)
+        return summary
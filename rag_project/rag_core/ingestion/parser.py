@@ -1,40 +1,604 @@
+import hashlib
+import json
+import multiprocessing
+import os
+import re
+import time
+import zipfile
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
 from pathlib import Path
-from typing import Optional
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional
+from xml.etree import ElementTree
 
 from rag_project.config import (
-    PARSER_TEXT_SUFFIXES,
-    PARSER_PDF_SUFFIX,
+    PARSER_CACHE_DIR,
+    PARSER_CACHE_FORMAT_VERSION,
+    PARSER_HTML_DEPENDENCY_MESSAGE,
+    PARSER_HTML_DROP_TAGS,
+    PARSER_JSON_BODY_KEYS,
+    PARSER_JSON_READ_CHARS,
+    PARSER_JSON_TITLE_KEYS,
+    PARSER_MIME_DOCX,
+    PARSER_PDF_PARALLEL_MIN_PAGES,
+    PARSER_PDF_WORKERS,
+    PARSER_SNIFF_BYTES,
+    PARSER_SUFFIX_MIME_TYPES,
+    PARSER_TEXT_PAGE_LINES,
     PARSER_PDF_DEPENDENCY_MESSAGE,
 )
+from rag_project.rag_core.ingestion.metrics import PARSE_OUTPUT_CHARS, PARSE_SECONDS
 from rag_project.logger import get_logger
 
 
 logger = get_logger(__name__)
 
+_HTML_MARKUP_RE = re.compile(
+    r"<(?:p|div|br|li|ul|ol|h[1-6]|span|a|b|strong|em|table|html|body)\b", re.I
+)
+
 
 def parse_job(title: str, body: str, metadata: Optional[dict] = None) -> str:
-    """Simple job text parser; can be extended with HTML stripping/cleanup."""
+    """Simple job text parser; HTML bodies (scraped postings) are reduced to text."""
     parts = [title.strip()] if title else []
+    if body and _HTML_MARKUP_RE.search(body):
+        body = html_to_text(body)
     parts.append(body.strip())
     if metadata and metadata.get("location"):
         parts.append(f"Location: {metadata['location']}")
     return "\n\n".join(filter(None, parts))
 
 
+@dataclass(frozen=True)
+class FileParser:
+    """How one file format is read.
+
+    iter_pages yields the text page by page for streamed ingestion; parse, when
+    set, returns the whole text faster than joining the pages would.
+    """
+
+    name: str
+    iter_pages: Callable[[Path], Iterator[str]]
+    parse: Optional[Callable[[Path], str]] = None
+
+
+_PARSERS: Dict[str, FileParser] = {}
+_SUFFIX_MIME_TYPES: Dict[str, str] = dict(PARSER_SUFFIX_MIME_TYPES)
+
+
+def register_parser(
+    mime_type: str, parser: FileParser, suffixes: Iterable[str] = ()
+) -> None:
+    """Use parser for files of mime_type (and for the given suffixes)."""
+    _PARSERS[mime_type] = parser
+    for suffix in suffixes:
+        _SUFFIX_MIME_TYPES[suffix.lower()] = mime_type
+
+
+def detect_mime_type(file_path: Path) -> str:
+    """MIME type from the suffix, or sniffed from the first bytes if it is unknown."""
+    mime_type = _SUFFIX_MIME_TYPES.get(file_path.suffix.lower())
+    if mime_type:
+        return mime_type
+    with open(file_path, "rb") as fh:
+        head = fh.read(PARSER_SNIFF_BYTES)
+    if head.startswith(b"%PDF-"):
+        return "application/pdf"
+    if head.startswith(b"PK\x03\x04") and _is_docx(file_path):
+        return PARSER_MIME_DOCX
+    start = head.lstrip(b"\xef\xbb\xbf \t\r\n")[:512].lower()
+    if start.startswith((b"<!doctype html", b"<html")) or b"<body" in start:
+        return "text/html"
+    if start.startswith((b"{", b"[")):
+        return "application/json"
+    return "text/plain"
+
+
+def get_parser(file_path: Path) -> FileParser:
+    mime_type = detect_mime_type(file_path)
+    if file_path.suffix.lower() not in _SUFFIX_MIME_TYPES:
+        logger.warning(
+            "Parsing file with unsupported suffix=%s as %s",
+            file_path.suffix.lower(),
+            mime_type,
+        )
+    parser = _PARSERS.get(mime_type)
+    if parser is None:
+        logger.warning("No parser for %s; falling back to text read", mime_type)
+        return _PARSERS["text/plain"]
+    return parser
+
+
 def parse_file(file_path: Path) -> str:
-    """Minimal file loader with basic branching on suffix (txt/md/html/pdf)."""
-    suffix = file_path.suffix.lower()
-    if suffix in PARSER_TEXT_SUFFIXES:
-        return file_path.read_text(encoding="utf-8", errors="ignore")
-    if suffix == PARSER_PDF_SUFFIX:
-        try:
-            import pymupdf4llm  # type: ignore
-        except ImportError:
-            logger.error("PDF parse requested but pymupdf4llm is missing")
-            raise RuntimeError(PARSER_PDF_DEPENDENCY_MESSAGE)
-        return pymupdf4llm.to_markdown(str(file_path))
-    # Fallback: read as text
-    logger.warning(
-        "Parsing file with unsupported suffix=%s; falling back to text read", suffix
+    """Whole text of a file, parsed by the parser registered for its type."""
+    parser = get_parser(file_path)
+    start = time.perf_counter()
+    if parser.parse is not None:
+        text = parser.parse(file_path)
+    else:
+        text = "".join(parser.iter_pages(file_path))
+    _report_parse(parser, file_path, time.perf_counter() - start, len(text))
+    return text
+
+
+def iter_file_pages(file_path: Path) -> Iterator[str]:
+    """Yield a file's text page by page instead of as one string.
+
+    PDFs are converted one page at a time with header levels detected once for
+    the whole document (or read back from the parse cache); text files are read
+    in blocks of PARSER_TEXT_PAGE_LINES lines, DOCX files in blocks of as many
+    paragraphs and JSON feeds one record per page. Joining the pages gives the
+    same text parse_file would return.
+    """
+    parser = get_parser(file_path)
+    pages = parser.iter_pages(file_path)
+    seconds = 0.0
+    chars = 0
+    try:
+        while True:
+            start = time.perf_counter()
+            page = next(pages, None)
+            seconds += time.perf_counter() - start
+            if page is None:
+                break
+            chars += len(page)
+            yield page
+    finally:
+        _report_parse(parser, file_path, seconds, chars)
+
+
+def _report_parse(parser: FileParser, file_path: Path, seconds: float, chars: int):
+    PARSE_SECONDS.observe(seconds, parser=parser.name)
+    PARSE_OUTPUT_CHARS.inc(chars, parser=parser.name)
+    logger.info(
+        "Parsed %s with %s parser: %d chars in %.3fs",
+        file_path,
+        parser.name,
+        chars,
+        seconds,
     )
+
+
+def _text_pages(file_path: Path) -> Iterator[str]:
+    yield from _read_line_blocks(file_path)
+
+
+def _parse_text(file_path: Path) -> str:
     return file_path.read_text(encoding="utf-8", errors="ignore")
+
+
+def _read_line_blocks(path: Path, newline: Optional[str] = None) -> Iterator[str]:
+    # Cached markdown is read with newline="" to get back exactly what was written.
+    with open(path, "r", encoding="utf-8", errors="ignore", newline=newline) as fh:
+        yield from _line_blocks(fh)
+
+
+# --- PDF parsing: page-range process pool + parsed-markdown cache ---
+
+
+def _pdf_pages(file_path: Path) -> Iterator[str]:
+    try:
+        import pymupdf4llm  # type: ignore
+    except ImportError:
+        logger.error("PDF parse requested but pymupdf4llm is missing")
+        raise RuntimeError(PARSER_PDF_DEPENDENCY_MESSAGE)
+    cache_path = _parse_cache_path(file_path, pymupdf4llm)
+    if cache_path is not None and cache_path.exists():
+        logger.info("Parse cache hit for %s", file_path)
+        yield from _read_line_blocks(cache_path, newline="")
+        return
+    import pymupdf  # type: ignore  # installed with pymupdf4llm
+
+    with pymupdf.open(str(file_path)) as doc:
+        hdr_info = pymupdf4llm.IdentifyHeaders(doc)
+        pages = (
+            pymupdf4llm.to_markdown(doc, pages=[page_number], hdr_info=hdr_info)
+            for page_number in range(doc.page_count)
+        )
+        if cache_path is not None:
+            pages = _caching_pages(pages, cache_path)
+        yield from pages
+
+
+def _parse_pdf(file_path: Path) -> str:
+    try:
+        import pymupdf4llm  # type: ignore
+    except ImportError:
+        logger.error("PDF parse requested but pymupdf4llm is missing")
+        raise RuntimeError(PARSER_PDF_DEPENDENCY_MESSAGE)
+    cache_path = _parse_cache_path(file_path, pymupdf4llm)
+    if cache_path is not None and cache_path.exists():
+        logger.info("Parse cache hit for %s", file_path)
+        return "".join(_read_line_blocks(cache_path, newline=""))
+
+    page_count = _pdf_page_count(file_path) if PARSER_PDF_WORKERS > 1 else 0
+    if page_count >= PARSER_PDF_PARALLEL_MIN_PAGES:
+        text = _parse_pdf_parallel(file_path, page_count, PARSER_PDF_WORKERS)
+    else:
+        text = pymupdf4llm.to_markdown(str(file_path))
+    if cache_path is not None:
+        for _ in _caching_pages([text], cache_path):
+            pass
+    return text
+
+
+def _pdf_page_count(file_path: Path) -> int:
+    """Page count, or 0 when PyMuPDF cannot tell (the sequential parse reports why)."""
+    try:
+        import pymupdf  # type: ignore
+
+        with pymupdf.open(str(file_path)) as doc:
+            return doc.page_count
+    except Exception as exc:  # noqa: BLE001
+        logger.debug("Page count unavailable for %s: %s", file_path, exc)
+        return 0
+
+
+def _pdf_pages_markdown(path: str, pages: List[int]) -> str:
+    """Process-pool task: markdown for a page range of one PDF."""
+    import pymupdf  # type: ignore
+    import pymupdf4llm  # type: ignore
+
+    with pymupdf.open(path) as doc:
+        # Header levels come from the whole document so every range agrees.
+        hdr_info = pymupdf4llm.IdentifyHeaders(doc)
+        return pymupdf4llm.to_markdown(doc, pages=pages, hdr_info=hdr_info)
+
+
+def _parse_pdf_parallel(file_path: Path, page_count: int, workers: int) -> str:
+    """Convert contiguous page ranges in worker processes and join them in order."""
+    workers = min(workers, page_count)
+    ranges = [
+        list(range(i * page_count // workers, (i + 1) * page_count // workers))
+        for i in range(workers)
+    ]
+    logger.info("Parsing %s (%d pages) in %d processes", file_path, page_count, workers)
+    # spawn: the GUI and ingestion workers run threads, which fork does not copy.
+    with ProcessPoolExecutor(
+        max_workers=workers, mp_context=multiprocessing.get_context("spawn")
+    ) as pool:
+        parts = pool.map(_pdf_pages_markdown, [str(file_path)] * workers, ranges)
+        return "".join(parts)
+
+
+def _parse_cache_path(file_path: Path, parser_module) -> Optional[Path]:
+    """Cache file for this PDF's content and parser version, or None if disabled.
+
+    Without a parser version the key could not tell outputs apart, so nothing is
+    cached.
+    """
+    version = getattr(parser_module, "__version__", None)
+    if not PARSER_CACHE_DIR or not version:
+        return None
+    digest = hashlib.sha256()
+    with open(file_path, "rb") as fh:
+        for block in iter(lambda: fh.read(1 << 20), b""):
+            digest.update(block)
+    key = f"{digest.hexdigest()}-{version}-{PARSER_CACHE_FORMAT_VERSION}"
+    return Path(PARSER_CACHE_DIR) / f"{key}.md"
+
+
+def _caching_pages(pages: Iterable[str], cache_path: Path) -> Iterator[str]:
+    """Yield pages while writing them to cache_path.
+
+    The file only appears once every page was written, so an interrupted parse
+    never leaves a partial entry. Cache write errors are logged, not raised.
+    """
+    tmp_path = cache_path.with_name(f"{cache_path.name}.{os.getpid()}.tmp")
+    try:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        fh = open(tmp_path, "w", encoding="utf-8", newline="")
+    except OSError as exc:
+        logger.warning("Parse cache disabled for %s: %s", cache_path, exc)
+        yield from pages
+        return
+    complete = False
+    try:
+        for page in pages:
+            if fh is not None:
+                try:
+                    fh.write(page)
+                except OSError as exc:
+                    logger.warning("Parse cache write failed: %s", exc)
+                    fh.close()
+                    fh = None
+            yield page
+        complete = fh is not None
+    finally:
+        if fh is not None:
+            fh.close()
+        try:
+            if complete:
+                os.replace(tmp_path, cache_path)
+                logger.info("Cached parsed markdown at %s", cache_path)
+            else:
+                tmp_path.unlink(missing_ok=True)
+        except OSError as exc:
+            logger.warning("Parse cache write failed: %s", exc)
+
+
+# --- HTML: markup stripped to text, headings and list items kept as markdown ---
+
+_HTML_BLOCK_TAGS = (
+    "address",
+    "article",
+    "aside",
+    "blockquote",
+    "dd",
+    "div",
+    "dl",
+    "dt",
+    "figcaption",
+    "footer",
+    "form",
+    "header",
+    "main",
+    "nav",
+    "ol",
+    "p",
+    "pre",
+    "section",
+    "table",
+    "tr",
+    "ul",
+)
+# Placeholders for breaks, so source whitespace can be collapsed as browsers do.
+_PARAGRAPH_BREAK = "\u2029"
+_LINE_BREAK = "\u2028"
+_HTML_SPACE_RE = re.compile(r"[ \t\r\n\f\v\xa0]+")
+
+
+def html_to_text(html: str) -> str:
+    """Readable text of an HTML document: no markup, scripts or styles.
+
+    Block elements become paragraphs, <br> and list items become lines, and
+    headings and list items keep markdown markers for the structured chunker.
+    """
+    try:
+        from bs4 import BeautifulSoup  # type: ignore
+    except ImportError:
+        logger.error("HTML parse requested but beautifulsoup4 is missing")
+        raise RuntimeError(PARSER_HTML_DEPENDENCY_MESSAGE)
+    soup = BeautifulSoup(html, "html.parser")
+    for tag in soup.find_all(PARSER_HTML_DROP_TAGS):
+        tag.decompose()
+    for tag in soup.find_all(re.compile(r"^h[1-6]$")):
+        tag.insert_before(_PARAGRAPH_BREAK + "#" * int(tag.name[1]) + " ")
+        tag.insert_after(_PARAGRAPH_BREAK)
+    for tag in soup.find_all(_HTML_BLOCK_TAGS):
+        tag.insert_before(_PARAGRAPH_BREAK)
+        tag.insert_after(_PARAGRAPH_BREAK)
+    for tag in soup.find_all("li"):
+        tag.insert_before(_LINE_BREAK + "- ")
+    for tag in soup.find_all("br"):
+        tag.replace_with(_LINE_BREAK)
+    for tag in soup.find_all(("td", "th")):
+        tag.insert_before(" ")
+
+    paragraphs = []
+    for block in _HTML_SPACE_RE.sub(" ", soup.get_text()).split(_PARAGRAPH_BREAK):
+        lines = [line.strip() for line in block.split(_LINE_BREAK)]
+        paragraph = "\n".join(line for line in lines if line and line != "-")
+        if paragraph:
+            paragraphs.append(paragraph)
+    return "\n\n".join(paragraphs) + "\n" if paragraphs else ""
+
+
+def _parse_html(file_path: Path) -> str:
+    return html_to_text(_parse_text(file_path))
+
+
+def _html_pages(file_path: Path) -> Iterator[str]:
+    # The HTML tree is built whole; only the extracted text is paged.
+    yield from _line_blocks(_parse_html(file_path).splitlines(keepends=True))
+
+
+def _line_blocks(lines: Iterable[str]) -> Iterator[str]:
+    block: List[str] = []
+    for line in lines:
+        block.append(line)
+        if len(block) >= PARSER_TEXT_PAGE_LINES:
+            yield "".join(block)
+            block = []
+    if block:
+        yield "".join(block)
+
+
+# --- DOCX: paragraphs streamed from word/document.xml (standard library only) ---
+
+_W = "{http://schemas.openxmlformats.org/wordprocessingml/2006/main}"
+# German Word stores "Überschrift 1" under the style id "berschrift1".
+_DOCX_HEADING_RE = re.compile(r"^(?:heading|berschrift)([1-9])$", re.IGNORECASE)
+
+
+def _is_docx(file_path: Path) -> bool:
+    try:
+        with zipfile.ZipFile(file_path) as archive:
+            return "word/document.xml" in archive.namelist()
+    except zipfile.BadZipFile:
+        return False
+
+
+def _docx_paragraph(paragraph: ElementTree.Element) -> str:
+    parts = []
+    for node in paragraph.iter():
+        if node.tag == f"{_W}t":
+            parts.append(node.text or "")
+        elif node.tag == f"{_W}tab":
+            parts.append("\t")
+        elif node.tag in (f"{_W}br", f"{_W}cr"):
+            parts.append("\n")
+    text = "".join(parts).strip()
+    if not text:
+        return ""
+    properties = paragraph.find(f"{_W}pPr")
+    if properties is not None:
+        style = properties.find(f"{_W}pStyle")
+        style_id = style.get(f"{_W}val", "") if style is not None else ""
+        heading = _DOCX_HEADING_RE.match(style_id)
+        if style_id.lower() == "title":
+            return f"# {text}"
+        if heading:
+            return "#" * int(heading.group(1)) + " " + text
+        if properties.find(f"{_W}numPr") is not None:
+            return f"- {text}"
+    return text
+
+
+def _docx_pages(file_path: Path) -> Iterator[str]:
+    """Paragraphs of the main document part, PARSER_TEXT_PAGE_LINES per page."""
+    with zipfile.ZipFile(file_path) as archive, archive.open(
+        "word/document.xml"
+    ) as xml:
+        paragraphs = []
+        for _event, node in ElementTree.iterparse(xml):
+            if node.tag != f"{_W}p":
+                continue
+            text = _docx_paragraph(node)
+            node.clear()
+            if text:
+                paragraphs.append(text + "\n\n")
+                if len(paragraphs) >= PARSER_TEXT_PAGE_LINES:
+                    yield "".join(paragraphs)
+                    paragraphs = []
+        if paragraphs:
+            yield "".join(paragraphs)
+
+
+# --- JSON feeds: records streamed one at a time ---
+
+_JSON_DECODER = json.JSONDecoder()
+_JSON_NUMBER_TAIL_RE = re.compile(r"[0-9.eE+-]*\Z")
+
+
+class _JsonStream:
+    """Incremental reader over a JSON text file that decodes one value at a time,
+    so a feed is never loaded whole."""
+
+    def __init__(self, fh, block_chars: int) -> None:
+        self.fh = fh
+        self.block_chars = block_chars
+        self.buf = ""
+        self.pos = 0
+        self.eof = False
+
+    def _fill(self) -> bool:
+        if self.eof:
+            return False
+        data = self.fh.read(self.block_chars)
+        if not data:
+            self.eof = True
+            return False
+        self.buf = self.buf[self.pos :] + data
+        self.pos = 0
+        return True
+
+    def peek(self) -> str:
+        """Next non-whitespace character ("" at the end of the file)."""
+        while True:
+            while self.pos < len(self.buf) and self.buf[self.pos] in " \t\r\n\ufeff":
+                self.pos += 1
+            if self.pos < len(self.buf):
+                return self.buf[self.pos]
+            if not self._fill():
+                return ""
+
+    def take(self, expected: str) -> None:
+        found = self.peek()
+        if found != expected:
+            raise ValueError(f"Expected {expected!r} in JSON feed, found {found!r}")
+        self.pos += 1
+
+    def value(self) -> Any:
+        self.peek()
+        while True:
+            try:
+                value, end = _JSON_DECODER.raw_decode(self.buf, self.pos)
+            except json.JSONDecodeError:
+                if not self._fill():
+                    raise
+                continue
+            # A number cut off at the end of the buffer ("12" of "12.5e3") may
+            # continue in the next block; every other value ends with a delimiter.
+            if (
+                isinstance(value, (int, float))
+                and _JSON_NUMBER_TAIL_RE.match(self.buf, end)
+                and self._fill()
+            ):
+                continue
+            self.pos = end
+            return value
+
+    def items(self) -> Iterator[Any]:
+        """Values of the array whose "[" is next."""
+        self.take("[")
+        if self.peek() == "]":
+            self.pos += 1
+            return
+        while True:
+            yield self.value()
+            separator = self.peek()
+            self.pos += 1
+            if separator == "]":
+                return
+            if separator != ",":
+                raise ValueError(
+                    f"Expected ',' or ']' in JSON feed, found {separator!r}"
+                )
+
+
+def iter_json_records(file_path: Path) -> Iterator[Any]:
+    """Records of a JSON feed: the items of a top-level array or of the first
+    array-valued key of a top-level object; any other document is one record."""
+    with open(file_path, "r", encoding="utf-8", errors="ignore") as fh:
+        stream = _JsonStream(fh, PARSER_JSON_READ_CHARS)
+        if stream.peek() == "[":
+            yield from stream.items()
+            return
+        if stream.peek() != "{":
+            yield stream.value()
+            return
+        stream.take("{")
+        fields: Dict[str, Any] = {}
+        while stream.peek() not in ("}", ""):
+            key = stream.value()
+            stream.take(":")
+            if stream.peek() == "[":
+                yield from stream.items()
+                return
+            fields[key] = stream.value()
+            if stream.peek() == ",":
+                stream.pos += 1
+        yield fields
+
+
+def json_record_text(record: Any) -> str:
+    """Text of one feed record; job-like records are normalized like parse_job."""
+    if not isinstance(record, dict):
+        return record if isinstance(record, str) else json.dumps(record)
+    title = next((record[k] for k in PARSER_JSON_TITLE_KEYS if record.get(k)), "")
+    body = next((record[k] for k in PARSER_JSON_BODY_KEYS if record.get(k)), "")
+    if not body:
+        body = "\n".join(
+            f"{key}: {value}"
+            for key, value in record.items()
+            if key not in PARSER_JSON_TITLE_KEYS
+            and key != "location"  # parse_job adds it
+            and value not in (None, "")
+        )
+    return parse_job(str(title), str(body), record)
+
+
+def _json_pages(file_path: Path) -> Iterator[str]:
+    for record in iter_json_records(file_path):
+        text = json_record_text(record)
+        if text:
+            yield text + "\n\n"
+
+
+register_parser("text/plain", FileParser("text", _text_pages, _parse_text))
+register_parser("text/markdown", FileParser("markdown", _text_pages, _parse_text))
+register_parser("text/html", FileParser("html", _html_pages, _parse_html))
+register_parser("application/pdf", FileParser("pdf", _pdf_pages, _parse_pdf))
+register_parser(PARSER_MIME_DOCX, FileParser("docx", _docx_pages))
+register_parser("application/json", FileParser("json", _json_pages))
@@ -0,0 +1,233 @@
+"""
+Semantic chunker: embeds every sentence once (in batches) and starts a new chunk
+where the similarity between the sentence windows before and after a gap drops.
+The sentence embeddings are reused to compose each chunk's embedding, so a
+document costs one batched embedding pass and no LLM call.
+"""
+
+import math
+import operator
+from dataclasses import dataclass
+from typing import Callable, List, Optional, Sequence, Tuple
+
+from rag_project.config import (
+    SEMANTIC_BREAKPOINT_PERCENTILE,
+    SEMANTIC_EMBED_BATCH_SIZE,
+    SEMANTIC_WINDOW_SENTENCES,
+)
+from rag_project.rag_core.ingestion.chunker import split_into_sentences
+from rag_project.rag_core.ingestion.structured_chunker import (
+    ChunkConfig,
+    _size,
+    _split_to_size,
+)
+from rag_project.logger import get_logger
+
+
+logger = get_logger(__name__)
+
+Vector = List[float]
+
+
+@dataclass
+class SemanticChunk:
+    text: str
+    # Normalized mean of the chunk's sentence embeddings (None if not composed).
+    embedding: Optional[Vector] = None
+
+
+def _sentences(text: str, config: ChunkConfig) -> List[Tuple[str, bool]]:
+    """Sentences of text with whether each starts a paragraph.
+
+    Sentences longer than a chunk (e.g. unpunctuated PDF text) are cut to size
+    first so every sentence fits in one chunk.
+    """
+    sentences: List[Tuple[str, bool]] = []
+    for paragraph in text.split("\n\n"):
+        first = True
+        for sentence in split_into_sentences(paragraph):
+            pieces = (
+                _split_to_size([sentence], config)
+                if _size(sentence, config) > config.max_chunk_words
+                else [sentence]
+            )
+            for piece in pieces:
+                sentences.append((piece, first))
+                first = False
+    return sentences
+
+
+def _embed_batched(
+    texts: Sequence[str],
+    embed: Callable[[List[str]], List[Vector]],
+    batch_size: int,
+) -> List[Vector]:
+    vectors: List[Vector] = []
+    for i in range(0, len(texts), batch_size):
+        vectors.extend(embed(list(texts[i : i + batch_size])))
+    return vectors
+
+
+def _add(a: Vector, b: Vector) -> Vector:
+    return list(map(operator.add, a, b))
+
+
+def _sub(a: Vector, b: Vector) -> Vector:
+    return list(map(operator.sub, a, b))
+
+
+def _cosine(a: Vector, b: Vector) -> float:
+    norm = math.sqrt(sum(map(operator.mul, a, a)) * sum(map(operator.mul, b, b)))
+    return sum(map(operator.mul, a, b)) / norm if norm else 0.0
+
+
+def _normalized_mean(vectors: Sequence[Vector]) -> Vector:
+    total = vectors[0]
+    for vector in vectors[1:]:
+        total = _add(total, vector)
+    norm = math.sqrt(sum(map(operator.mul, total, total))) or 1.0
+    return [x / norm for x in total]
+
+
+def _window_distances(vectors: Sequence[Vector], window: int) -> List[float]:
+    """Cosine distance across each sentence gap between the `window` sentences
+    before and after it (sliding sums, so each gap costs O(dim))."""
+    n = len(vectors)
+    if n < 2:
+        return []
+    left = vectors[0]
+    right = vectors[1]
+    for vector in vectors[2 : 1 + window]:
+        right = _add(right, vector)
+    distances = [1.0 - _cosine(left, right)]
+    for gap in range(1, n - 1):
+        # gap i separates sentence i from sentence i + 1
+        left = _add(left, vectors[gap])
+        if gap - window >= 0:
+            left = _sub(left, vectors[gap - window])
+        right = _sub(right, vectors[gap])
+        if gap + window < n:
+            right = _add(right, vectors[gap + window])
+        distances.append(1.0 - _cosine(left, right))
+    return distances
+
+
+def _percentile(values: Sequence[float], percentile: float) -> float:
+    ordered = sorted(values)
+    return ordered[int(round(percentile / 100 * (len(ordered) - 1)))]
+
+
+def _is_peak(distances: Sequence[float], i: int) -> bool:
+    # Windows overlap, so gaps next to a topic shift are elevated too; only the
+    # local maximum marks the shift itself.
+    return (i == 0 or distances[i] >= distances[i - 1]) and (
+        i + 1 == len(distances) or distances[i] >= distances[i + 1]
+    )
+
+
+def _chunk_starts(
+    sizes: Sequence[int],
+    distances: Sequence[float],
+    threshold: float,
+    config: ChunkConfig,
+) -> List[int]:
+    """Index of the first sentence of every chunk.
+
+    A chunk ends at a gap whose distance is a local peak reaching threshold once
+    it holds min_chunk_words; when the next sentence would overflow max_chunk_words it
+    ends at its most dissimilar gap that still leaves min_chunk_words before it.
+    """
+    starts = [0]
+    start = 0
+    size = 0
+    i = 0
+    while i < len(sizes) - 1:
+        size += sizes[i]
+        if size + sizes[i + 1] > config.max_chunk_words:
+            best = i
+            prefix = 0
+            for gap in range(start, i + 1):
+                prefix += sizes[gap]
+                if prefix >= config.min_chunk_words and (
+                    distances[gap] > distances[best] or best == i
+                ):
+                    best = gap
+            start = i = best + 1
+            starts.append(start)
+            size = 0
+            continue
+        if (
+            distances[i] >= threshold
+            and size >= config.min_chunk_words
+            and _is_peak(distances, i)
+        ):
+            start = i + 1
+            starts.append(start)
+            size = 0
+        i += 1
+    return starts
+
+
+def _overlap_start(sizes: Sequence[int], start: int, overlap: int, floor: int) -> int:
+    """First sentence of the trailing sentences before start that fit in overlap."""
+    total = 0
+    while start > floor and total + sizes[start - 1] <= overlap:
+        start -= 1
+        total += sizes[start]
+    return start
+
+
+def chunk_semantic(
+    text: str,
+    embed: Callable[[List[str]], List[Vector]],
+    config: ChunkConfig,
+    compose_embeddings: bool = True,
+    window: int = SEMANTIC_WINDOW_SENTENCES,
+    breakpoint_percentile: float = SEMANTIC_BREAKPOINT_PERCENTILE,
+    batch_size: int = SEMANTIC_EMBED_BATCH_SIZE,
+) -> List[SemanticChunk]:
+    """
+    Semantic chunking:
+    - split into sentences and embed them in batches of batch_size
+    - measure the cosine distance between the window sentences on either side of
+      every gap and break at peaks in the top (100 - breakpoint_percentile)%
+    - keep chunks between min_chunk_words and max_chunk_words (words or tokens)
+    - carry up to overlap_words of trailing sentences into the next chunk
+    - optionally compose chunk embeddings from the sentence embeddings
+    """
+    sentences = _sentences(text, config)
+    if not sentences:
+        return []
+    texts = [s for s, _para in sentences]
+    vectors = _embed_batched(texts, embed, batch_size)
+    distances = _window_distances(vectors, window)
+    threshold = _percentile(distances, breakpoint_percentile) if distances else math.inf
+    sizes = [_size(s, config) for s in texts]
+    starts = _chunk_starts(sizes, distances, threshold, config)
+
+    chunks: List[SemanticChunk] = []
+    for idx, start in enumerate(starts):
+        end = starts[idx + 1] if idx + 1 < len(starts) else len(texts)
+        if idx > 0 and config.overlap_words > 0:
+            start = _overlap_start(sizes, start, config.overlap_words, starts[idx - 1])
+        parts: List[str] = []
+        for i in range(start, end):
+            if parts:
+                parts.append("\n\n" if sentences[i][1] else " ")
+            parts.append(texts[i])
+        chunks.append(
+            SemanticChunk(
+                text="".join(parts),
+                embedding=(
+                    _normalized_mean(vectors[start:end]) if compose_embeddings else None
+                ),
+            )
+        )
+    logger.info(
+        "Semantic chunking: %s sentences -> %s chunks (threshold=%.3f, sizes=%s)",
+        len(texts),
+        len(chunks),
+        threshold,
+        [len(c.text.split()) for c in chunks][:20],
+    )
+    return chunks
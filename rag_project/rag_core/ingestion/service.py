@@ -2,8 +2,9 @@ import time
 import json
 import re
 import os
+from itertools import chain
 from pathlib import Path
-from typing import Callable, List, Optional
+from typing import Callable, Iterable, Iterator, List, Optional, Tuple
 from uuid import UUID
 
 from rag_project.rag_core.domain.models import (
@@ -17,11 +18,26 @@ from rag_project.rag_core.ingestion.chunker import chunk_text
 from rag_project.rag_core.ingestion.structured_chunker import (
     ChunkConfig,
     chunk_structured,
+    chunk_structured_stream,
     _clean_segment_text,
     _dedup_lines,
 )
 from rag_project.rag_core.ingestion.cv_chunker import chunk_cv
-from rag_project.rag_core.ingestion.parser import parse_file, parse_job
+from rag_project.rag_core.ingestion.semantic_chunker import chunk_semantic
+from rag_project.rag_core.ports.tokenizer_port import Tokenizer
+from rag_project.rag_core.ingestion.metrics import (
+    STAGE_CHUNK,
+    STAGE_EMBED,
+    STAGE_METADATA,
+    STAGE_PARSE,
+    STAGE_STORE,
+    IngestRun,
+)
+from rag_project.rag_core.ingestion.parser import (
+    iter_file_pages,
+    parse_file,
+    parse_job,
+)
 from rag_project.rag_core.ports.embedding_port import EmbeddingProvider
 from rag_project.rag_core.ports.repo_port import ChunkRepository, DocumentRepository
 from rag_project.config import (
@@ -52,19 +68,28 @@ from rag_project.config import (
     DOC_TYPE_COMPANY,
     STRUCTURED_MIN_CHUNK_RATIO,
     STRUCTURED_MAX_CHUNK_RATIO,
+    STRUCTURED_CHUNK_WORKERS,
+    CHUNK_TOKENS_PER_WORD,
+    SEMANTIC_COMPOSE_EMBEDDINGS,
+    CV_RULES_MIN_CONFIDENCE,
     METADATA_EXTRACTION_PROMPT,
     CHUNK_STRATEGY,
     CV_CHUNKER_MODEL_ID,
     CV_CHUNKER_MAX_OUTPUT_TOKENS,
     INGEST_DEBUG_LOG_CHUNKS,
     INGEST_DEBUG_LOG_PATH,
+    INGEST_STREAM_BATCH_CHUNKS,
+    INGEST_STREAMING,
     METADATA_SNIPPET_CHARS,
     MSG_METADATA_EXTRACTION,
     MSG_PARSE_PROGRESS,
+    MSG_STREAM_BATCH_STORED,
+    MSG_STREAM_PARSE_PROGRESS,
     DEFAULT_CHUNK_STRATEGY,
     MSG_CV_CHUNK_STRATEGY,
     CV_CHUNK_DEBUG_FORMATS,
     MSG_STRUCTURED_STRATEGY,
+    MSG_SEMANTIC_STRATEGY,
     MSG_CHUNKING_COMPLETE,
     MSG_EMBEDDING_START,
     EMBED_PROGRESS_FORMULA,
@@ -92,6 +117,13 @@ class IngestionService:
         chunk_assist_model_id: str = CHUNK_ASSIST_MODEL_ID,
         llm_provider=None,
         chunk_profiles: Optional[dict] = None,
+        metrics_summary_path: Optional[str] = None,
+        streaming: bool = INGEST_STREAMING,
+        stream_batch_chunks: int = INGEST_STREAM_BATCH_CHUNKS,
+        chunk_workers: int = STRUCTURED_CHUNK_WORKERS,
+        tokenizer: Optional[Tokenizer] = None,
+        semantic_compose_embeddings: bool = SEMANTIC_COMPOSE_EMBEDDINGS,
+        cv_rules_min_confidence: float = CV_RULES_MIN_CONFIDENCE,
     ) -> None:
         self.document_repo = document_repo
         self.chunk_repo = chunk_repo
@@ -105,6 +137,15 @@ class IngestionService:
         self.chunk_assist_model_id = chunk_assist_model_id
         self.llm_provider = llm_provider
         self.chunk_profiles = chunk_profiles or {}
+        self.metrics_summary_path = metrics_summary_path
+        self.streaming = streaming
+        self.stream_batch_chunks = stream_batch_chunks
+        self.chunk_workers = chunk_workers
+        # Embedding-model tokenizer: chunks are sized and counted in its tokens.
+        self.tokenizer = tokenizer
+        self.semantic_compose_embeddings = semantic_compose_embeddings
+        # CVs whose rule-based sections score below this go to the LLM.
+        self.cv_rules_min_confidence = cv_rules_min_confidence
 
     def _clean_json(self, text: str) -> str:
         """Helper to extract JSON from LLM response."""
@@ -149,30 +190,66 @@ class IngestionService:
         metadata: Optional[dict] = None,
         progress_cb: Optional[Callable[[str, dict], None]] = None,
     ) -> UUID:
-        text = parse_job(title, body, metadata)
+        run = IngestRun(source=title)
+        try:
+            with run.stage(STAGE_PARSE):
+                text = parse_job(title, body, metadata)
 
-        # For jobs, we might want extraction too if metadata is sparse
-        self._emit(progress_cb, "extracting", {"message": MSG_METADATA_EXTRACTION})
-        extracted_meta = self._extract_metadata_with_llm(text)
+            # For jobs, we might want extraction too if metadata is sparse
+            self._emit(progress_cb, "extracting", {"message": MSG_METADATA_EXTRACTION})
+            with run.stage(STAGE_METADATA):
+                extracted_meta = self._extract_metadata_with_llm(text)
 
-        final_metadata = extracted_meta.copy()
-        if metadata:
-            final_metadata.update(metadata)
+            final_metadata = extracted_meta.copy()
+            if metadata:
+                final_metadata.update(metadata)
 
-        return self._ingest_text(text, final_metadata, progress_cb)
+            document_id = self._chunk_embed_store(
+                text, final_metadata, progress_cb, run
+            )
+        except Exception:
+            run.finish(ok=False, summary_path=self.metrics_summary_path)
+            raise
+        run.finish(summary_path=self.metrics_summary_path)
+        return document_id
 
     def ingest_file(
         self,
         file_path: str,
         metadata: Optional[dict] = None,
         progress_cb: Optional[Callable[[str, dict], None]] = None,
+    ) -> UUID:
+        run = IngestRun(source=str(file_path))
+        try:
+            if self.streaming:
+                document_id = self._ingest_file_streamed(
+                    Path(file_path), metadata, progress_cb, run
+                )
+            else:
+                document_id = self._ingest_file_whole(
+                    Path(file_path), metadata, progress_cb, run
+                )
+        except Exception:
+            run.finish(ok=False, summary_path=self.metrics_summary_path)
+            raise
+        run.finish(summary_path=self.metrics_summary_path)
+        return document_id
+
+    def _ingest_file_whole(
+        self,
+        path: Path,
+        metadata: Optional[dict],
+        progress_cb: Optional[Callable[[str, dict], None]],
+        run: IngestRun,
     ) -> UUID:
         # 1. Parse
-        text = parse_file(Path(file_path))
+        with run.stage(STAGE_PARSE):
+            text = parse_file(path)
 
         # 2. LLM Extraction (The New Step)
         self._emit(progress_cb, "extracting", {"message": MSG_METADATA_EXTRACTION})
-        extracted_meta = self._extract_metadata_with_llm(text)
+        with run.stage(STAGE_METADATA):
+            extracted_meta = self._extract_metadata_with_llm(text)
 
         logger.info(f"LLM Extracted Metadata: {extracted_meta}")
 
@@ -182,23 +259,60 @@ class IngestionService:
             final_metadata.update(metadata)
 
         # 4. Ingest as normal
-        return self._ingest_text(text, final_metadata, progress_cb)
+        return self._chunk_embed_store(text, final_metadata, progress_cb, run)
 
-    def _emit(
-        self, progress_cb: Optional[Callable[[str, dict], None]], stage: str, info: dict
-    ):
-        if progress_cb:
-            progress_cb(stage, info)
+    def _ingest_file_streamed(
+        self,
+        path: Path,
+        metadata: Optional[dict],
+        progress_cb: Optional[Callable[[str, dict], None]],
+        run: IngestRun,
+    ) -> UUID:
+        """ingest_file that embeds and stores chunks while the file is still parsed.
 
-    def _ingest_text(
+        Only the leading pages used for metadata extraction and the segment being
+        chunked are held in memory. Documents chunked by the CV LLM chunker or the
+        semantic chunker need their full text and are joined and ingested as usual.
+        """
+        pages = _timed(iter_file_pages(path), run, STAGE_PARSE)
+        head: List[str] = []
+        for page in pages:
+            head.append(page)
+            if sum(len(p) for p in head) >= METADATA_SNIPPET_CHARS:
+                break
+
+        self._emit(progress_cb, "extracting", {"message": MSG_METADATA_EXTRACTION})
+        with run.stage(STAGE_METADATA):
+            extracted_meta = self._extract_metadata_with_llm("".join(head))
+        logger.info(f"LLM Extracted Metadata: {extracted_meta}")
+        final_metadata = extracted_meta.copy()
+        if metadata:
+            final_metadata.update(metadata)
+
+        doc_type = (
+            final_metadata.get("doc_type") if final_metadata else DEFAULT_DOC_TYPE
+        )
+        chunk_strategy = CHUNK_STRATEGY.get(
+            doc_type, CHUNK_STRATEGY.get("default", DEFAULT_CHUNK_STRATEGY)
+        )
+        if chunk_strategy in ("llm_cv_chunker", "semantic"):
+            text = "".join(chain(head, pages))
+            return self._chunk_embed_store(text, final_metadata, progress_cb, run)
+
+        return self._chunk_embed_store_streamed(
+            chain(head, pages), doc_type, final_metadata, progress_cb, run
+        )
+
+    def _chunk_embed_store_streamed(
         self,
-        text: str,
+        pages: Iterable[str],
+        doc_type: Optional[str],
         metadata: Optional[dict],
         progress_cb: Optional[Callable[[str, dict], None]],
+        run: IngestRun,
     ) -> UUID:
         t0 = time.time()
-        word_count = len(text.split())
-        doc_type = metadata.get("doc_type") if metadata else DEFAULT_DOC_TYPE
+        run.doc_type = doc_type
         if doc_type not in SUPPORTED_DOC_TYPES:
             raise ValueError(
                 f"Unsupported doc_type '{doc_type}'. Supported: {SUPPORTED_DOC_TYPES}"
@@ -207,13 +321,102 @@ class IngestionService:
             progress_cb,
             "start",
             {
-                "message": MSG_PARSE_PROGRESS.format(word_count=word_count),
+                "message": MSG_STREAM_PARSE_PROGRESS,
                 "stage_pct": PROGRESS_START_STAGE_PCT,
                 "detail_pct": PROGRESS_START_DETAIL_PCT,
             },
         )
+        with run.stage(STAGE_STORE):
+            document = self._insert_document(doc_type, metadata)
+        run.document_id = document.id
+        cfg, llm_call = self._structured_chunking(doc_type, progress_cb)
+
+        def lines() -> Iterator[str]:
+            for page in pages:
+                run.words += len(page.split())
+                yield from page.splitlines()
+
+        chunks_text = chunk_structured_stream(lines(), cfg, llm_generate=llm_call)
+        batch: List[Chunk] = []
+        try:
+            for ctext in _timed(chunks_text, run, STAGE_CHUNK):
+                batch.append(
+                    Chunk(
+                        document_id=document.id,
+                        chunk_index=run.chunks,
+                        content=ctext,
+                        token_count=self._token_count(ctext),
+                    )
+                )
+                run.chunks += 1
+                if len(batch) >= self.stream_batch_chunks:
+                    self._embed_store_batch(batch, run, progress_cb)
+                    batch = []
+            if batch:
+                self._embed_store_batch(batch, run, progress_cb)
+        except Exception:
+            # Do not leave a half-ingested document behind.
+            self.document_repo.delete_document(document.id)
+            raise
+
+        self._emit(
+            progress_cb,
+            "chunk",
+            {
+                "message": MSG_CHUNKING_COMPLETE.format(count=run.chunks),
+                "stage_pct": PROGRESS_CHUNK_STAGE_PCT,
+                "detail_pct": PROGRESS_CHUNK_DETAIL_PCT,
+            },
+        )
+        logger.info(
+            "Streamed ingestion complete: %s chunks (doc_type=%s)",
+            run.chunks,
+            doc_type,
+        )
+        self._emit(
+            progress_cb,
+            "done",
+            {
+                "message": MSG_INGESTION_DONE.format(
+                    time=time.time() - t0, count=run.chunks
+                ),
+                "stage_pct": PROGRESS_DONE_STAGE_PCT,
+                "detail_pct": PROGRESS_DONE_DETAIL_PCT,
+            },
+        )
+        return document.id
+
+    def _embed_store_batch(
+        self,
+        chunks: List[Chunk],
+        run: IngestRun,
+        progress_cb: Optional[Callable[[str, dict], None]],
+    ) -> None:
+        with run.stage(STAGE_EMBED):
+            embeddings = self.embedder.embed([c.content for c in chunks])
+        with run.stage(STAGE_STORE):
+            self.chunk_repo.insert_chunks_with_embeddings(chunks, embeddings)
+        self._emit(
+            progress_cb,
+            "embed_progress",
+            {
+                "message": MSG_STREAM_BATCH_STORED.format(
+                    count=run.chunks, words=run.words
+                ),
+                "stage_pct": PROGRESS_EMBED_STAGE_PCT,
+                "detail_pct": PROGRESS_EMBED_DETAIL_PCT,
+            },
+        )
+
+    def _emit(
+        self, progress_cb: Optional[Callable[[str, dict], None]], stage: str, info: dict
+    ):
+        if progress_cb:
+            progress_cb(stage, info)
+
+    def _insert_document(self, doc_type: str, metadata: Optional[dict]) -> Document:
+        """Insert the document row and its doc_type-specific subtype row."""
         document = Document(doc_type=doc_type, metadata=metadata)
-        # Insert document + subtype
         self.document_repo.insert_document(document)
         if doc_type == DOC_TYPE_JOB_POSTING:
             jp = JobPosting(
@@ -258,112 +461,247 @@ class IngestionService:
                 industry=metadata.get("industry") if metadata else None,
             )
             self.document_repo.insert_company_info(ci)
-        chunk_strategy = CHUNK_STRATEGY.get(
-            doc_type, CHUNK_STRATEGY.get("default", DEFAULT_CHUNK_STRATEGY)
+        return document
+
+    def _token_count(self, text: str) -> int:
+        if self.tokenizer is not None:
+            return self.tokenizer.count(text)
+        return len(text.split())
+
+    def _chunk_config(self, doc_type: str) -> ChunkConfig:
+        """ChunkConfig for doc_type's chunk profile (sizes in tokens with a tokenizer)."""
+        profile = self.chunk_profiles.get(
+            doc_type, self.chunk_profiles.get("default", {})
         )
-        text_for_chunk = (
-            text if doc_type == DOC_TYPE_CV else _dedup_lines(_clean_segment_text(text))
+        target_words = profile.get("target_words", self.max_tokens)
+        overlap_words = profile.get("overlap_words", self.overlap_tokens)
+        proximity_weight = profile.get(
+            "proximity_weight", STRUCTURED_DEFAULT_PROXIMITY_WEIGHT
         )
-
-        if chunk_strategy == "llm_cv_chunker":
-            if self.llm_provider is None:
-                raise ValueError("LLM provider is required for CV chunking.")
-            self._emit(
-                progress_cb,
-                "chunk_strategy",
-                {"message": MSG_CV_CHUNK_STRATEGY.format(model=CV_CHUNKER_MODEL_ID)},
+        use_llm_flag = profile.get("use_llm", self.structured_use_llm)
+        max_llm_input = profile.get(
+            "max_llm_input_words", self.structured_max_llm_input_words
+        )
+        min_words = self.structured_min_chunk_words
+        if self.tokenizer is not None:
+            target_words = profile.get(
+                "target_tokens", int(target_words * CHUNK_TOKENS_PER_WORD)
+            )
+            overlap_words = profile.get(
+                "overlap_tokens", int(overlap_words * CHUNK_TOKENS_PER_WORD)
             )
+            min_words = int(min_words * CHUNK_TOKENS_PER_WORD)
+        return ChunkConfig(
+            max_chunk_words=target_words,
+            overlap_words=overlap_words,
+            min_chunk_words=max(
+                min_words, int(target_words * STRUCTURED_MIN_CHUNK_RATIO)
+            ),
+            max_chunk_words_hard=int(target_words * STRUCTURED_MAX_CHUNK_RATIO),
+            use_llm=use_llm_flag,
+            max_llm_input_words=max_llm_input,
+            proximity_weight=proximity_weight,
+            tokenizer=self.tokenizer,
+        )
 
-            def llm_call(prompt: str, max_tokens: int = CV_CHUNKER_MAX_OUTPUT_TOKENS):
-                return self.llm_provider.generate(
-                    prompt, model=CV_CHUNKER_MODEL_ID, max_tokens=max_tokens
+    def _structured_chunking(
+        self,
+        doc_type: str,
+        progress_cb: Optional[Callable[[str, dict], None]],
+    ) -> Tuple[ChunkConfig, Optional[Callable[[str, int], str]]]:
+        """ChunkConfig for doc_type's chunk profile and the chunk-assist LLM call."""
+        cfg = self._chunk_config(doc_type)
+        self._emit(
+            progress_cb,
+            "chunk_strategy",
+            {
+                "message": MSG_STRUCTURED_STRATEGY.format(
+                    max_chunk=cfg.max_chunk_words,
+                    overlap=cfg.overlap_words,
+                    min_chunk=cfg.min_chunk_words,
+                    llm_flag="on" if cfg.use_llm else "off",
                 )
+            },
+        )
+        llm_call = None
+        if cfg.use_llm and self.llm_provider is not None:
+            llm_call = lambda prompt, max_tokens=CHUNK_ASSIST_MAX_TOKENS_OVERRIDE: self.llm_provider.generate(  # noqa: E731
+                prompt, model=self.chunk_assist_model_id, max_tokens=max_tokens
+            )
+        logger.info(
+            "Structured chunking | doc_type=%s target=%s overlap=%s min=%s llm=%s",
+            doc_type,
+            cfg.max_chunk_words,
+            cfg.overlap_words,
+            cfg.min_chunk_words,
+            cfg.use_llm,
+        )
+        return cfg, llm_call
 
-            chunks_text, cv_debug = chunk_cv(
-                text_for_chunk, llm_generate=llm_call, debug=INGEST_DEBUG_LOG_CHUNKS
+    def _ingest_text(
+        self,
+        text: str,
+        metadata: Optional[dict],
+        progress_cb: Optional[Callable[[str, dict], None]],
+        run: Optional[IngestRun] = None,
+    ) -> UUID:
+        """Chunk, embed and store text; stage timings go to the metrics registry."""
+        run = run or IngestRun()
+        try:
+            document_id = self._chunk_embed_store(text, metadata, progress_cb, run)
+        except Exception:
+            run.finish(ok=False, summary_path=self.metrics_summary_path)
+            raise
+        run.finish(summary_path=self.metrics_summary_path)
+        return document_id
+
+    def _chunk_embed_store(
+        self,
+        text: str,
+        metadata: Optional[dict],
+        progress_cb: Optional[Callable[[str, dict], None]],
+        run: IngestRun,
+    ) -> UUID:
+        t0 = time.time()
+        word_count = len(text.split())
+        doc_type = metadata.get("doc_type") if metadata else DEFAULT_DOC_TYPE
+        run.words = word_count
+        run.doc_type = doc_type
+        if doc_type not in SUPPORTED_DOC_TYPES:
+            raise ValueError(
+                f"Unsupported doc_type '{doc_type}'. Supported: {SUPPORTED_DOC_TYPES}"
+            )
+        self._emit(
+            progress_cb,
+            "start",
+            {
+                "message": MSG_PARSE_PROGRESS.format(word_count=word_count),
+                "stage_pct": PROGRESS_START_STAGE_PCT,
+                "detail_pct": PROGRESS_START_DETAIL_PCT,
+            },
+        )
+        with run.stage(STAGE_STORE):
+            document = self._insert_document(doc_type, metadata)
+        run.document_id = document.id
+        # Chunk embeddings the chunker already produced (semantic strategy).
+        composed: Optional[List[List[float]]] = None
+        with run.stage(STAGE_CHUNK):
+            chunk_strategy = CHUNK_STRATEGY.get(
+                doc_type, CHUNK_STRATEGY.get("default", DEFAULT_CHUNK_STRATEGY)
+            )
+            text_for_chunk = (
+                text
+                if doc_type == DOC_TYPE_CV
+                else _dedup_lines(_clean_segment_text(text))
             )
 
-            if INGEST_DEBUG_LOG_CHUNKS:
-                try:
-                    os.makedirs(os.path.dirname(INGEST_DEBUG_LOG_PATH), exist_ok=True)
-                    with open(INGEST_DEBUG_LOG_PATH, "a", encoding="utf-8") as dbg:
-                        dbg.write("\n")
-                        dbg.write(
-                            CV_CHUNK_DEBUG_FORMATS["header"].format(doc_id=document.id)
+            if chunk_strategy == "llm_cv_chunker":
+                if self.llm_provider is None:
+                    raise ValueError("LLM provider is required for CV chunking.")
+                self._emit(
+                    progress_cb,
+                    "chunk_strategy",
+                    {
+                        "message": MSG_CV_CHUNK_STRATEGY.format(
+                            model=CV_CHUNKER_MODEL_ID
                         )
-                        dbg.write(
-                            CV_CHUNK_DEBUG_FORMATS["split_points"].format(
-                                split_points=cv_debug.get("split_points")
-                            )
+                    },
+                )
+
+                def llm_call(
+                    prompt: str, max_tokens: int = CV_CHUNKER_MAX_OUTPUT_TOKENS
+                ):
+                    return self.llm_provider.generate(
+                        prompt, model=CV_CHUNKER_MODEL_ID, max_tokens=max_tokens
+                    )
+
+                chunks_text, cv_debug = chunk_cv(
+                    text_for_chunk,
+                    llm_generate=llm_call,
+                    debug=INGEST_DEBUG_LOG_CHUNKS,
+                    min_confidence=self.cv_rules_min_confidence,
+                )
+
+                if INGEST_DEBUG_LOG_CHUNKS:
+                    try:
+                        os.makedirs(
+                            os.path.dirname(INGEST_DEBUG_LOG_PATH), exist_ok=True
                         )
-                        dbg.write(
-                            CV_CHUNK_DEBUG_FORMATS["num_chunks"].format(
-                                num_chunks=cv_debug.get("num_chunks"),
-                                num_lines=cv_debug.get("num_lines"),
+                        with open(INGEST_DEBUG_LOG_PATH, "a", encoding="utf-8") as dbg:
+                            dbg.write("\n")
+                            dbg.write(
+                                CV_CHUNK_DEBUG_FORMATS["header"].format(
+                                    doc_id=document.id
+                                )
                             )
-                        )
-                        dbg.write(
-                            CV_CHUNK_DEBUG_FORMATS["prompt_truncated"].format(
-                                prompt_truncated=cv_debug.get("prompt_truncated")
+                            dbg.write(
+                                CV_CHUNK_DEBUG_FORMATS["split_source"].format(
+                                    split_source=cv_debug.get("split_source"),
+                                    rule_confidence=cv_debug.get("rule_confidence"),
+                                )
+                            )
+                            dbg.write(
+                                CV_CHUNK_DEBUG_FORMATS["split_points"].format(
+                                    split_points=cv_debug.get("split_points")
+                                )
                             )
+                            dbg.write(
+                                CV_CHUNK_DEBUG_FORMATS["num_chunks"].format(
+                                    num_chunks=cv_debug.get("num_chunks"),
+                                    num_lines=cv_debug.get("num_lines"),
+                                )
+                            )
+                            dbg.write(
+                                CV_CHUNK_DEBUG_FORMATS["prompt_truncated"].format(
+                                    prompt_truncated=cv_debug.get("prompt_truncated")
+                                )
+                            )
+                            dbg.write(CV_CHUNK_DEBUG_FORMATS["prompt_label"])
+                            dbg.write(cv_debug.get("prompt", "") + "\n---\n")
+                            dbg.write(CV_CHUNK_DEBUG_FORMATS["response_label"])
+                            dbg.write(cv_debug.get("llm_response", "") + "\n")
+                    except Exception as log_exc:  # noqa: BLE001
+                        logger.warning(
+                            "Failed to write CV chunk debug log: %s", log_exc
                         )
-                        dbg.write(CV_CHUNK_DEBUG_FORMATS["prompt_label"])
-                        dbg.write(cv_debug.get("prompt", "") + "\n---\n")
-                        dbg.write(CV_CHUNK_DEBUG_FORMATS["response_label"])
-                        dbg.write(cv_debug.get("llm_response", "") + "\n")
-                except Exception as log_exc:  # noqa: BLE001
-                    logger.warning("Failed to write CV chunk debug log: %s", log_exc)
-        else:
-            profile = self.chunk_profiles.get(
-                doc_type, self.chunk_profiles.get("default", {})
-            )
-            target_words = profile.get("target_words", self.max_tokens)
-            overlap_words = profile.get("overlap_words", self.overlap_tokens)
-            proximity_weight = profile.get(
-                "proximity_weight", STRUCTURED_DEFAULT_PROXIMITY_WEIGHT
-            )
-            use_llm_flag = profile.get("use_llm", self.structured_use_llm)
-            max_llm_input = profile.get(
-                "max_llm_input_words", self.structured_max_llm_input_words
-            )
-            cfg = ChunkConfig(
-                max_chunk_words=target_words,
-                overlap_words=overlap_words,
-                min_chunk_words=max(
-                    self.structured_min_chunk_words,
-                    int(target_words * STRUCTURED_MIN_CHUNK_RATIO),
-                ),
-                max_chunk_words_hard=int(target_words * STRUCTURED_MAX_CHUNK_RATIO),
-                use_llm=use_llm_flag,
-                max_llm_input_words=max_llm_input,
-                proximity_weight=proximity_weight,
-            )
-            self._emit(
-                progress_cb,
-                "chunk_strategy",
-                {
-                    "message": MSG_STRUCTURED_STRATEGY.format(
-                        max_chunk=cfg.max_chunk_words,
-                        overlap=cfg.overlap_words,
-                        min_chunk=cfg.min_chunk_words,
-                        llm_flag="on" if cfg.use_llm else "off",
-                    )
-                },
-            )
-            llm_call = None
-            if cfg.use_llm and self.llm_provider is not None:
-                llm_call = lambda prompt, max_tokens=CHUNK_ASSIST_MAX_TOKENS_OVERRIDE: self.llm_provider.generate(  # noqa: E731
-                    prompt, model=self.chunk_assist_model_id, max_tokens=max_tokens
+            elif chunk_strategy == "semantic":
+                cfg = self._chunk_config(doc_type)
+                self._emit(
+                    progress_cb,
+                    "chunk_strategy",
+                    {
+                        "message": MSG_SEMANTIC_STRATEGY.format(
+                            max_chunk=cfg.max_chunk_words,
+                            overlap=cfg.overlap_words,
+                            min_chunk=cfg.min_chunk_words,
+                            composed=(
+                                "on" if self.semantic_compose_embeddings else "off"
+                            ),
+                        )
+                    },
+                )
+
+                def embed_sentences(texts: List[str]) -> List[List[float]]:
+                    with run.stage(STAGE_EMBED):
+                        return self.embedder.embed(texts)
+
+                semantic_chunks = chunk_semantic(
+                    text_for_chunk,
+                    embed_sentences,
+                    cfg,
+                    compose_embeddings=self.semantic_compose_embeddings,
+                )
+                chunks_text = [c.text for c in semantic_chunks]
+                if self.semantic_compose_embeddings:
+                    composed = [c.embedding for c in semantic_chunks]
+            else:
+                cfg, llm_call = self._structured_chunking(doc_type, progress_cb)
+                chunks_text = chunk_structured(
+                    text_for_chunk,
+                    cfg,
+                    llm_generate=llm_call,
+                    workers=self.chunk_workers,
                 )
-            logger.info(
-                "Structured chunking | doc_type=%s target=%s overlap=%s min=%s llm=%s",
-                doc_type,
-                cfg.max_chunk_words,
-                cfg.overlap_words,
-                cfg.min_chunk_words,
-                cfg.use_llm,
-            )
-            chunks_text = chunk_structured(text_for_chunk, cfg, llm_generate=llm_call)
         self._emit(
             progress_cb,
             "chunk",
@@ -376,6 +714,7 @@ class IngestionService:
         logger.info(
             "Chunking complete: %s chunks (doc_type=%s)", len(chunks_text), doc_type
         )
+        run.chunks = len(chunks_text)
         chunks: List[Chunk] = []
         for idx, ctext in enumerate(chunks_text):
             chunks.append(
@@ -383,7 +722,7 @@ class IngestionService:
                     document_id=document.id,
                     chunk_index=idx,
                     content=ctext,
-                    token_count=len(ctext.split()),
+                    token_count=self._token_count(ctext),
                 )
             )
 
@@ -398,22 +737,23 @@ class IngestionService:
         )
         texts = [c.content for c in chunks]
         total_embeddings = len(texts)
-        embeddings: List[List[float]] = []
+        embeddings: List[List[float]] = composed or []
 
         # Emit per-chunk progress during embedding
-        for idx, text in enumerate(texts, start=1):
-            if progress_cb:
-                self._emit(
-                    progress_cb,
-                    "embed_progress",
-                    {
-                        "message": f"Embedding {idx}/{total_embeddings}",
-                        "stage_pct": PROGRESS_EMBED_STAGE_PCT,
-                        "detail_pct": int(idx / total_embeddings * 100),
-                    },
-                )
-            emb = self.embedder.embed([text])[0]
-            embeddings.append(emb)
+        with run.stage(STAGE_EMBED):
+            for idx, text in enumerate([] if composed else texts, start=1):
+                if progress_cb:
+                    self._emit(
+                        progress_cb,
+                        "embed_progress",
+                        {
+                            "message": f"Embedding {idx}/{total_embeddings}",
+                            "stage_pct": PROGRESS_EMBED_STAGE_PCT,
+                            "detail_pct": int(idx / total_embeddings * 100),
+                        },
+                    )
+                emb = self.embedder.embed([text])[0]
+                embeddings.append(emb)
 
         self._emit(
             progress_cb,
@@ -434,7 +774,8 @@ class IngestionService:
                 "detail_pct": PROGRESS_STORE_DETAIL_PCT,
             },
         )
-        self.chunk_repo.insert_chunks_with_embeddings(chunks, embeddings)
+        with run.stage(STAGE_STORE):
+            self.chunk_repo.insert_chunks_with_embeddings(chunks, embeddings)
         total_time = time.time() - t0
         self._emit(
             progress_cb,
@@ -448,3 +789,14 @@ class IngestionService:
             },
         )
         return document.id
+
+
+def _timed(items: Iterable[str], run: IngestRun, stage: str) -> Iterator[str]:
+    """Yield items, counting the time spent producing each one toward stage."""
+    it = iter(items)
+    while True:
+        with run.stage(stage):
+            item = next(it, None)
+        if item is None:
+            return
+        yield item
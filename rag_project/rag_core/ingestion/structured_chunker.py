@@ -1,10 +1,16 @@
 from __future__ import annotations
 
 import logging
+import multiprocessing
 import re
+import threading
+from bisect import bisect_left, bisect_right
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 from dataclasses import dataclass
 from enum import IntEnum
-from typing import Callable, List, Optional, Sequence
+from itertools import chain
+from typing import Callable, Iterable, Iterator, List, Optional, Sequence
 
 from rag_project.config import (
     BOUNDARY_PATTERN_WEIGHTS,
@@ -13,6 +19,7 @@ from rag_project.config import (
     BOUNDARY_CONFIDENCE_THRESHOLD,
     CHUNK_ASSIST_MAX_OUTPUT_TOKENS,
     CHUNK_BOUNDARY_PATTERNS,
+    DEDUP_MIN_OVERLAP_CHARS,
     MIN_SPLIT_RATIO,
     NOISE_ARTIFACT_REGEX,
     NOISE_CAPTION_TOKENS,
@@ -32,10 +39,13 @@ from rag_project.config import (
     STRUCTURED_MAX_LLM_INPUT_WORDS,
     STRUCTURED_MIN_CHUNK_WORDS,
     STRUCTURED_OVERSIZE_FACTOR,
+    STRUCTURED_LLM_CONCURRENCY,
+    STRUCTURED_PARALLEL_MIN_WORDS,
     PRIORITY_SPLIT_PATTERNS,
     BOUNDARY_INCLUSIVE_OFFSET,
 )
-from rag_project.rag_core.ingestion.chunker import chunk_text
+from rag_project.rag_core.ingestion.chunker import chunk_text, tail_words
+from rag_project.rag_core.ports.tokenizer_port import Tokenizer
 from rag_project.logger import get_logger
 
 
@@ -48,6 +58,8 @@ class ChunkConfig:
     use_llm: bool = False
     max_llm_input_words: int = STRUCTURED_MAX_LLM_INPUT_WORDS
     proximity_weight: float = STRUCTURED_DEFAULT_PROXIMITY_WEIGHT
+    # When set, the *_words sizes count this tokenizer's tokens instead of words.
+    tokenizer: Optional[Tokenizer] = None
 
 
 @dataclass
@@ -90,117 +102,99 @@ BOUNDARY_SIGNALS: dict[str, tuple[re.Pattern, float]] = {
 logger = get_logger(__name__)
 
 # --- NOISE FILTERING & CLEANING LOGIC ---
+# Patterns are compiled once here and text is cleaned in a single pass over its
+# lines. Cheap substring checks decide which patterns can apply to a line, so most
+# body lines cost one or two regex matches.
+
+_CODE_LINE_RE = re.compile(
+    r"(?:def |class |import |from |return |print\(|logger\.|@"
+    r"|[a-zA-Z_][a-zA-Z0-9_]*\s*=\s*[^=])"
+)
+_INDENTED_CODE_RE = re.compile(r"(?:if |for |while |try:|except:|else:|elif |with )")
+# Page numbers, tables and "_Chapter_" artifacts (all anchored at line start).
+_LINE_NOISE_RE = re.compile(
+    "|".join(
+        f"(?:{pattern})"
+        for pattern in (
+            NOISE_PAGE_REGEX,
+            r"\|",
+            NOISE_TABLE_REGEX,
+            NOISE_ARTIFACT_REGEX,
+        )
+    )
+)
+_DOTTED_TOC_RE = re.compile(NOISE_DOTTED_TOC_REGEX)
+# Captions (prefix), reference/TOC headers (exact or numbered prefix).
+_CONTENT_NOISE_RE = re.compile(
+    "|".join(
+        [
+            "(?:" + "|".join(re.escape(t) for t in NOISE_CAPTION_TOKENS) + ")",
+            "(?:" + "|".join(re.escape(t) for t in NOISE_REFERENCE_TOKENS) + ")$",
+            f"(?:{NOISE_REFERENCE_REGEX})",
+        ]
+    )
+)
+_MARKUP_CHARS = str.maketrans("", "", "*#_")
+_SCRUB_TABLE_RE = re.compile(SCRUB_TABLE_REGEX)
+_SCRUB_CAPTION_RE = re.compile(SCRUB_CAPTION_REGEX, re.IGNORECASE)
+_SCRUB_PAGE_RE = re.compile(SCRUB_PAGE_REGEX, re.IGNORECASE)
 
 
 def _is_code_line(line: str) -> bool:
     """Returns True if the line looks like Python/SQL/C++ code to protect it from filtering."""
     l = line.strip()
-
-    # 1. Common Keywords (Python/General)
-    if l.startswith(
-        ("def ", "class ", "import ", "from ", "return ", "print(", "logger.", "@")
-    ):
+    # Keywords, decorators and assignments; block keywords only when indented.
+    if _CODE_LINE_RE.match(l):
         return True
+    return line.startswith((" ", "\t")) and _INDENTED_CODE_RE.match(l) is not None
 
-    # 2. Indentation + Keywords (e.g. "    if x:", "  return")
-    if line.startswith((" ", "\t")):
-        if l.startswith(
-            ("if ", "for ", "while ", "try:", "except:", "else:", "elif ", "with ")
-        ):
-            return True
-
-    # 3. Variable assignments (e.g. "x = 5", "df = pd.read_csv")
-    if re.match(r"^[a-zA-Z_][a-zA-Z0-9_]*\s*=\s*[^=]", l):
-        return True
-
-    return False
 
-
-def _scrub_raw_text(text: str) -> str:
+def _scrub_line(line: str) -> str:
     """
-    Aggressively removes tables and captions from the raw text block
-    BEFORE splitting into lines.
+    Aggressively removes table rows, figure/table captions ("**Figure 8.7:** ...")
+    and "Page 12" markers from a raw line before it is classified.
     """
-    # 1. Remove Markdown Tables (Lines starting with |)
-    # Regex: Start of line, optional whitespace, pipe, anything, end of line
-    text = re.sub(SCRUB_TABLE_REGEX, "", text, flags=re.MULTILINE)
-
-    # 2. Remove Figure/Table Captions (even if inline)
-    # Matches "**Figure 8.7:**" or "**Table 1:**" and the rest of the line
-    text = re.sub(SCRUB_CAPTION_REGEX, "", text, flags=re.IGNORECASE)
-
-    # 3. Remove specific academic noise artifacts
-    text = re.sub(SCRUB_PAGE_REGEX, "", text, flags=re.IGNORECASE)
-
-    return text
+    if "|" in line and _SCRUB_TABLE_RE.match(line):
+        return ""
+    if "**" in line:
+        line = _SCRUB_CAPTION_RE.sub("", line)
+    lower = line.lower()
+    if "page " in lower or "seite " in lower:
+        line = _SCRUB_PAGE_RE.sub("", line)
+    return line
 
 
 def _is_noise_line(line: str) -> bool:
     """Detects likely PDF artifacts, page numbers, or caption noise."""
-
-    # --- SAFETY CHECK: PROTECT CODE ---
-    # We must check this first to avoid deleting code that prints "Figure..."
+    # Code is checked first so a line that prints "Figure..." is kept.
     if _is_code_line(line):
         return False
-    # ----------------------------------
 
     l = line.strip().lower()
-
-    # 1. Empty lines
     if not l:
         return False
-
-    # 2. Page numbers (Aggressive)
-    # Matches "Page 85", "85", "Page 10 of 20"
-    if re.match(NOISE_PAGE_REGEX, l):
+    if _LINE_NOISE_RE.match(l):
         return True
-
-    # 3. Table of Contents Dotted Lines (Visual Noise)
-    # Matches lines that are mostly dots: "Introduction ........... 5"
-    if re.search(NOISE_DOTTED_TOC_REGEX, l):
+    # Table of contents leaders: "Introduction ........... 5"
+    if "...." in l and _DOTTED_TOC_RE.search(l):
         return True
 
-    # 4. Markdown/ASCII Tables
-    # Matches "|---|---|" or lines starting with pipe
-    if l.startswith("|") or re.match(NOISE_TABLE_REGEX, l):
-        return True
+    # Bold/italic/heading markup often wraps captions and reference headers.
+    clean_text = l.translate(_MARKUP_CHARS).strip()
+    return _CONTENT_NOISE_RE.match(clean_text) is not None
 
-    # 5. Artifact Headers/Footers
-    # Matches "_Chapter Name_" often generated by pymupdf4llm
-    if re.match(NOISE_ARTIFACT_REGEX, l):
-        return True
-
-    # --- CONTENT ANALYSIS (Clean up markdown syntax) ---
-    # Remove *, #, and _ (Italics/Bold often wrap references)
-    clean_text = l.replace("*", "").replace("#", "").replace("_", "").strip()
-
-    # 6. Explicit Blocklist (Captions)
-    # Check if line STARTS with these (e.g. "Abbildung 8.1:")
-    if clean_text.startswith(NOISE_CAPTION_TOKENS):
-        return True
-
-    # 7. References, Bibliography & TOC Headers
-    # Exact match (e.g. "References")
-    if clean_text in NOISE_REFERENCE_TOKENS:
-        return True
-
-    # Matches numbered headers: "10. Attachment" or "A. List of Figures"
-    if re.match(NOISE_REFERENCE_REGEX, clean_text):
-        return True
 
-    return False
+def _clean_line_stream(lines: Iterable[str]) -> Iterator[str]:
+    """Scrub each line and drop noise lines, one line at a time."""
+    for line in lines:
+        line = _scrub_line(line)
+        if not _is_noise_line(line):
+            yield line
 
 
 def _clean_segment_text(text: str) -> str:
-    """Pipeline to clean text before chunking."""
-    # Step 1: Scrub patterns (Tables, Inline Captions) using Regex
-    text = _scrub_raw_text(text)
-
-    # Step 2: Filter specific lines (Page numbers, Headers)
-    lines = text.splitlines()
-    cleaned = [line for line in lines if not _is_noise_line(line)]
-
-    return "\n".join(cleaned)
+    """Pipeline to clean text before chunking: scrub, then drop noise lines."""
+    return "\n".join(_clean_line_stream(text.splitlines()))
 
 
 # ------------------------------------
@@ -213,52 +207,87 @@ def _best_signal_score(line: str) -> float:
     return max(scores) if scores else 0.0
 
 
-def _dedup_lines(text: str) -> str:
-    """Remove exact consecutive duplicates and overlapping prefix/suffix patterns."""
-
-    def find_overlap(line1: str, line2: str) -> str:
-        max_overlap = min(len(line1), len(line2))
-        for length in range(max_overlap, 0, -1):
-            if line1[-length:] == line2[:length]:
-                return line1[-length:]
-        return ""
+def _overlap_length(line1: str, line2: str, min_length: int = 1) -> int:
+    """Length of the longest suffix of line1 that is a prefix of line2.
 
-    lines = text.split("\n")
-    cleaned: List[str] = []
-    i = 0
-    while i < len(lines):
-        current = lines[i].strip()
+    Overlaps shorter than min_length count as 0. Any longer overlap starts at an
+    occurrence of line2[:min_length] in line1 and needs line1's last min_length
+    characters inside line2; both are cheap substring checks, and only then
+    is the tail of line1 scanned with the KMP automaton of line2 (linear time).
+    """
+    start = line1.find(line2[:min_length], max(0, len(line1) - len(line2)))
+    if start < 0 or not line2 or min_length > len(line2):
+        return 0
+    tail = line1[start:]
+    pattern = line2[: len(tail)]
+    if line1[len(line1) - min_length :] not in pattern:
+        return 0
+    failure = [0] * len(pattern)
+    k = 0
+    for i in range(1, len(pattern)):
+        while k and pattern[i] != pattern[k]:
+            k = failure[k - 1]
+        if pattern[i] == pattern[k]:
+            k += 1
+        failure[i] = k
+    k = 0
+    for ch in tail:
+        while k and (k == len(pattern) or ch != pattern[k]):
+            k = failure[k - 1]
+        if ch == pattern[k]:
+            k += 1
+    return k if k >= min_length else 0
+
+
+def _dedup_line_stream(lines: Iterable[str]) -> Iterator[str]:
+    """Yield stripped lines without consecutive duplicates or overlapping repeats.
+
+    Looks one line ahead; runs of blank lines collapse to a single "".
+    """
+    it = iter(lines)
+    last: Optional[str] = None
+    pending = next(it, None)
+    while pending is not None:
+        current = pending.strip()
+        following = next(it, None)
         if not current:
-            if not cleaned or cleaned[-1] != "":
-                cleaned.append("")
-            i += 1
+            if last != "":
+                last = ""
+                yield last
+            pending = following
             continue
 
-        if i + 1 < len(lines):
-            next_line = lines[i + 1].strip()
+        if following is not None:
+            next_line = following.strip()
             # Case: next starts with current, trim prefix from next
             if next_line.startswith(current) and next_line != current:
-                cleaned.append(current)
-                lines[i + 1] = next_line[len(current) :].strip()
-                i += 1
+                last = current
+                yield last
+                pending = next_line[len(current) :].strip()
                 continue
             # Case: current contains next (skip next if it's short)
             if next_line and next_line in current and len(next_line) > 5:
-                cleaned.append(current)
-                i += 2
+                last = current
+                yield last
+                pending = next(it, None)
                 continue
             # Case: overlapping suffix/prefix
-            overlap = find_overlap(current, next_line)
-            if overlap and len(overlap) > 10:
-                cleaned.append(current[: -len(overlap)].strip())
-                i += 1
+            overlap = _overlap_length(current, next_line, DEDUP_MIN_OVERLAP_CHARS)
+            if overlap:
+                last = current[:-overlap].strip()
+                yield last
+                pending = following
                 continue
 
-        if not cleaned or current != cleaned[-1]:
-            cleaned.append(current)
-        i += 1
+        if current != last:
+            last = current
+            yield last
+        pending = following
 
-    return "\n".join([line for line in cleaned if line is not None]).strip()
+
+def _dedup_lines(text: str) -> str:
+    """Remove exact consecutive duplicates and overlapping prefix/suffix patterns."""
+    return "\n".join(_dedup_line_stream(text.split("\n"))).strip()
 
 
 def detect_boundaries(lines: Sequence[str]) -> List[Boundary]:
@@ -279,29 +308,85 @@ def detect_boundaries(lines: Sequence[str]) -> List[Boundary]:
     return boundaries
 
 
-def _word_positions(text: str) -> List[int]:
-    return [m.start() for m in re.finditer(r"\S+", text)]
-
-
-def _find_all_priority_boundaries(
-    text: str, min_pos: int, target_pos: int
-) -> List[BoundaryCandidate]:
-    candidates: List[BoundaryCandidate] = []
-    patterns = {
-        BoundaryPriority.SECTION_HEADER: PRIORITY_SPLIT_PATTERNS["section_header"],
-        BoundaryPriority.DATE_ROLE_BLOCK: PRIORITY_SPLIT_PATTERNS["date_role_block"],
-        BoundaryPriority.PARAGRAPH_BREAK: PRIORITY_SPLIT_PATTERNS["paragraph_break"],
-        BoundaryPriority.SENTENCE_END: PRIORITY_SPLIT_PATTERNS["sentence_end"],
-        BoundaryPriority.BULLET_END: PRIORITY_SPLIT_PATTERNS["bullet_end"],
-    }
-    for priority, pattern in patterns.items():
-        for match in re.finditer(pattern, text):
-            pos = (
-                match.end()
-                if priority == BoundaryPriority.PARAGRAPH_BREAK
-                else match.start()
-            )
-            if min_pos <= pos <= target_pos:
+def _size(text: str, config: ChunkConfig) -> int:
+    """Length of text in the unit config sizes chunks in (words or tokens)."""
+    if config.tokenizer is not None:
+        return config.tokenizer.count(text)
+    return len(text.split())
+
+
+_WORD_RE = re.compile(r"\S+")
+_PRIORITY_SPLIT_RES = tuple(
+    (priority, re.compile(PRIORITY_SPLIT_PATTERNS[name]))
+    for priority, name in (
+        (BoundaryPriority.SECTION_HEADER, "section_header"),
+        (BoundaryPriority.DATE_ROLE_BLOCK, "date_role_block"),
+        (BoundaryPriority.PARAGRAPH_BREAK, "paragraph_break"),
+        (BoundaryPriority.SENTENCE_END, "sentence_end"),
+        (BoundaryPriority.BULLET_END, "bullet_end"),
+    )
+)
+
+
+class _BoundaryIndex:
+    """Word starts and priority split points of a chunk, found in one scan.
+
+    Splitting an oversized chunk only ever looks at its remaining tail, which
+    starts at a word. No split pattern can match across a word start, so the
+    matches in the tail are exactly the whole-chunk matches that start inside it,
+    and each split step is a bisect into these sorted arrays.
+    """
+
+    def __init__(self, text: str, tokenizer: Optional[Tokenizer] = None) -> None:
+        self.word_starts = [m.start() for m in _WORD_RE.finditer(text)]
+        # Token sizing: running token totals per word, from one tokenizer pass.
+        self.token_prefix: Optional[List[int]] = None
+        if tokenizer is not None:
+            self.token_prefix = [0]
+            for count in tokenizer.word_token_counts(text):
+                self.token_prefix.append(self.token_prefix[-1] + count)
+        self.splits: List[tuple[BoundaryPriority, List[int], List[int]]] = []
+        for priority, pattern in _PRIORITY_SPLIT_RES:
+            starts: List[int] = []
+            positions: List[int] = []
+            for match in pattern.finditer(text):
+                starts.append(match.start())
+                positions.append(
+                    match.end()
+                    if priority == BoundaryPriority.PARAGRAPH_BREAK
+                    else match.start()
+                )
+            self.splits.append((priority, starts, positions))
+
+    def first_word(self, offset: int) -> int:
+        """Index into word_starts of the first word at or after offset."""
+        return bisect_left(self.word_starts, offset)
+
+    def size_from(self, first: int) -> int:
+        """Words (or tokens) from word index first to the end."""
+        if self.token_prefix is None:
+            return len(self.word_starts) - first
+        return self.token_prefix[-1] - self.token_prefix[first]
+
+    def words_within(self, first: int, budget: int) -> int:
+        """How many words from word index first fit in budget words (or tokens)."""
+        if self.token_prefix is None:
+            return budget
+        limit = self.token_prefix[first] + budget
+        return bisect_right(self.token_prefix, limit) - 1 - first
+
+    def candidates(
+        self, offset: int, min_pos: int, target_pos: int
+    ) -> List[BoundaryCandidate]:
+        """Split candidates in [min_pos, target_pos], relative to offset."""
+        candidates: List[BoundaryCandidate] = []
+        for priority, starts, positions in self.splits:
+            lo = bisect_left(positions, offset + min_pos)
+            hi = bisect_right(positions, offset + target_pos)
+            for i in range(lo, hi):
+                if starts[i] < offset:
+                    continue
+                pos = positions[i] - offset
                 candidates.append(
                     BoundaryCandidate(
                         position=pos,
@@ -309,13 +394,15 @@ def _find_all_priority_boundaries(
                         distance_to_target=abs(target_pos - pos),
                     )
                 )
-    return candidates
+        return candidates
 
 
 def _find_safe_split_point(
-    text: str, target_pos: int, min_pos: int, proximity_weight: float
+    candidates: List[BoundaryCandidate],
+    target_pos: int,
+    min_pos: int,
+    proximity_weight: float,
 ) -> int:
-    candidates = _find_all_priority_boundaries(text, min_pos, target_pos)
     if not candidates:
         return target_pos
     max_distance = max(1, target_pos - min_pos)
@@ -358,7 +445,9 @@ def _split_by_boundaries(
     return [c for c in chunks if c]
 
 
-def _apply_overlap(chunks: List[str], overlap_words: int) -> List[str]:
+def _apply_overlap(
+    chunks: List[str], overlap_words: int, tokenizer: Optional[Tokenizer] = None
+) -> List[str]:
     if overlap_words <= 0 or len(chunks) <= 1:
         return chunks
     overlapped: List[str] = []
@@ -370,7 +459,7 @@ def _apply_overlap(chunks: List[str], overlap_words: int) -> List[str]:
             overlapped.append(" ".join(combined))
         else:
             overlapped.append(chunk)
-        prev_tail = words[-overlap_words:] if len(words) > overlap_words else words
+        prev_tail = tail_words(words, overlap_words, tokenizer)[0]
     return overlapped
 
 
@@ -448,52 +537,73 @@ def _split_to_size(chunks: List[str], config: ChunkConfig) -> List[str]:
     """Ensure chunks respect target size using priority-based splits."""
     sized: List[str] = []
     for chunk in chunks:
-        remaining = chunk
+        if _size(chunk, config) <= config.max_chunk_words:
+            sized.append(chunk.strip())
+            continue
+        index = _BoundaryIndex(chunk, config.tokenizer)
+        word_starts = index.word_starts
+        offset = 0  # start of the remaining text within chunk
         while True:
-            words = remaining.split()
-            if len(words) <= config.max_chunk_words:
-                sized.append(remaining.strip())
+            first = index.first_word(offset)
+            word_count = len(word_starts) - first
+            if index.size_from(first) <= config.max_chunk_words:
+                sized.append(chunk[offset:].strip())
                 break
-            positions = _word_positions(remaining)
-            if not positions:
-                sized.append(remaining.strip())
-                break
-            target_idx = min(len(positions) - 1, config.max_chunk_words)
-            target_pos = positions[target_idx]
+            target_idx = min(
+                word_count - 1, index.words_within(first, config.max_chunk_words)
+            )
+            target_pos = word_starts[first + target_idx] - offset
             min_idx = min(
-                len(positions) - 1,
-                max(
-                    config.min_chunk_words,
-                    int(config.max_chunk_words * MIN_SPLIT_RATIO),
+                word_count - 1,
+                index.words_within(
+                    first,
+                    max(
+                        config.min_chunk_words,
+                        int(config.max_chunk_words * MIN_SPLIT_RATIO),
+                    ),
                 ),
             )
-            min_pos = positions[min_idx]
+            min_pos = word_starts[first + min_idx] - offset
             split_pos = _find_safe_split_point(
-                remaining, target_pos, min_pos, config.proximity_weight
+                index.candidates(offset, min_pos, target_pos),
+                target_pos,
+                min_pos,
+                config.proximity_weight,
             )
             # guard against bad splits
-            if split_pos <= 0 or split_pos >= len(remaining) - 1:
+            if split_pos <= 0 or split_pos >= len(chunk) - offset - 1:
                 # fallback to sentence-aware split
                 fallback_chunks = chunk_text(
-                    remaining, max_tokens=config.max_chunk_words, overlap_tokens=0
+                    chunk[offset:],
+                    max_tokens=config.max_chunk_words,
+                    overlap_tokens=0,
+                    tokenizer=config.tokenizer,
                 )
                 sized.extend([c.strip() for c in fallback_chunks if c.strip()])
                 break
-            sized.append(remaining[:split_pos].strip())
-            remaining = remaining[split_pos:].lstrip()
-            if not remaining:
+            sized.append(chunk[offset : offset + split_pos].strip())
+            # The remaining text continues at the next word (lstrip).
+            next_word = index.first_word(offset + split_pos)
+            if next_word == len(word_starts):
                 break
+            offset = word_starts[next_word]
     # If nothing split (still oversized), force fallback split
     forced: List[str] = []
     for item in sized:
-        if len(item.split()) > config.max_chunk_words_hard:
+        item_size = _size(item, config)
+        if item_size > config.max_chunk_words_hard:
             logger.warning(
-                "Forcing split of oversized chunk (%s words > %s)",
-                len(item.split()),
+                "Forcing split of oversized chunk (%s > %s)",
+                item_size,
                 config.max_chunk_words_hard,
             )
             forced.extend(
-                chunk_text(item, max_tokens=config.max_chunk_words, overlap_tokens=0)
+                chunk_text(
+                    item,
+                    max_tokens=config.max_chunk_words,
+                    overlap_tokens=0,
+                    tokenizer=config.tokenizer,
+                )
             )
         else:
             forced.append(item)
@@ -507,10 +617,182 @@ def _split_to_size(chunks: List[str], config: ChunkConfig) -> List[str]:
     return forced
 
 
+def _segment_limit(config: ChunkConfig) -> int:
+    return config.max_llm_input_words if config.use_llm else config.max_chunk_words * 3
+
+
+def _segment_lines(segment: str) -> tuple[List[str], List[Boundary]]:
+    """Deduplicated lines of a segment and their pattern boundaries."""
+    lines = _dedup_lines(segment).splitlines()
+    return lines, detect_boundaries(lines)
+
+
+def _wants_llm(
+    segment: str,
+    config: ChunkConfig,
+    llm_generate: Optional[Callable[[str, int], str]],
+) -> bool:
+    return bool(
+        config.use_llm
+        and llm_generate
+        and len(segment.split()) <= config.max_llm_input_words
+    )
+
+
+def _refine_boundaries(
+    lines: Sequence[str],
+    boundaries: List[Boundary],
+    llm_generate: Callable[[str, int], str],
+) -> List[Boundary]:
+    llm_bounds = _llm_boundaries(lines, boundaries, llm_generate)
+    if llm_bounds:
+        logger.info("Applied LLM boundaries: %s", [b.index for b in llm_bounds])
+        return llm_bounds
+    return boundaries
+
+
+def _chunk_lines(
+    lines: Sequence[str], boundaries: Sequence[Boundary], config: ChunkConfig
+) -> List[str]:
+    """Sizing, overlap and tail merging for one segment's lines."""
+    initial_chunks = _split_by_boundaries(lines, boundaries)
+    sized_chunks = _split_to_size(initial_chunks, config)
+    overlapped = _apply_overlap(sized_chunks, config.overlap_words, config.tokenizer)
+    # Merge too-short tails with previous chunk to avoid tiny fragments.
+    merged: List[str] = []
+    for chunk in overlapped:
+        if (
+            merged
+            and _size(chunk, config) < config.min_chunk_words
+            and _size(merged[-1], config) < config.min_chunk_words
+        ):
+            merged[-1] = merged[-1] + "\n\n" + chunk
+        else:
+            merged.append(chunk)
+    merged = [_dedup_lines(c) for c in merged]
+    logger.info(
+        "Segment produced %s chunks (sizes=%s)",
+        len(merged),
+        [len(c.split()) for c in merged],
+    )
+    return merged
+
+
+def _chunk_segment(
+    segment: str,
+    config: ChunkConfig,
+    llm_generate: Optional[Callable[[str, int], str]] = None,
+) -> List[str]:
+    """Boundary detection, sizing, overlap and tail merging for one segment."""
+    lines, boundaries = _segment_lines(segment)
+    if _wants_llm(segment, config, llm_generate):
+        boundaries = _refine_boundaries(lines, boundaries, llm_generate)
+    return _chunk_lines(lines, boundaries, config)
+
+
+_pool_lock = threading.Lock()
+_pool: Optional[ProcessPoolExecutor] = None
+_pool_workers = 0
+_pool_broken = False  # e.g. the main module cannot be re-imported (python -)
+
+
+def _chunk_pool(workers: int) -> ProcessPoolExecutor:
+    """The process pool shared by all chunk_structured calls, started on first use.
+
+    Starting spawn workers costs far more than chunking a typical document, so
+    the pool lives as long as the process (or until workers changes).
+    """
+    global _pool, _pool_workers
+    with _pool_lock:
+        if _pool is None or _pool_workers != workers:
+            if _pool is not None:
+                _pool.shutdown(wait=False)
+            # spawn: the GUI and ingestion workers run threads, which fork does not copy.
+            _pool = ProcessPoolExecutor(
+                max_workers=workers, mp_context=multiprocessing.get_context("spawn")
+            )
+            _pool_workers = workers
+        return _pool
+
+
+def _discard_chunk_pool(pool: ProcessPoolExecutor, broken: bool = False) -> None:
+    global _pool, _pool_broken
+    with _pool_lock:
+        _pool_broken = _pool_broken or broken
+        if _pool is pool:
+            _pool = None
+    pool.shutdown(wait=False)
+
+
+def _chunk_segments(
+    segments: List[str],
+    config: ChunkConfig,
+    llm_generate: Optional[Callable[[str, int], str]],
+    llm_concurrency: int,
+    pool: Optional[ProcessPoolExecutor] = None,
+    workers: int = 1,
+) -> List[str]:
+    """_chunk_segment over all segments, with LLM boundary calls in threads.
+
+    Segments are chunked independently (overlap never crosses a segment edge),
+    so joining the per-segment results in segment order gives exactly the
+    one-segment-at-a-time output. With a pool the regex work runs in its
+    processes; if the pool breaks it runs here instead.
+    """
+
+    def run(fn, *iterables):
+        nonlocal pool
+        if pool is not None:
+            # One task batch per worker, so the config is pickled once per batch.
+            chunksize = -(-len(segments) // workers)
+            try:
+                return list(pool.map(fn, *iterables, chunksize=chunksize))
+            except BrokenProcessPool as exc:
+                logger.warning(
+                    "Chunk process pool broke (%s); chunking in this process from now on",
+                    exc,
+                )
+                _discard_chunk_pool(pool, broken=True)
+                pool = None
+        return list(map(fn, *iterables))
+
+    analysed = run(_segment_lines, segments)
+    wanted = [
+        i
+        for i, segment in enumerate(segments)
+        if _wants_llm(segment, config, llm_generate)
+    ]
+    if llm_concurrency > 1 and len(wanted) > 1:
+        with ThreadPoolExecutor(
+            max_workers=min(llm_concurrency, len(wanted))
+        ) as threads:
+            futures = {
+                i: threads.submit(_refine_boundaries, *analysed[i], llm_generate)
+                for i in wanted
+            }
+            for i, future in futures.items():
+                analysed[i] = (analysed[i][0], future.result())
+    else:
+        for i in wanted:
+            analysed[i] = (
+                analysed[i][0],
+                _refine_boundaries(*analysed[i], llm_generate),
+            )
+    results = run(
+        _chunk_lines,
+        [lines for lines, _bounds in analysed],
+        [bounds for _lines, bounds in analysed],
+        [config] * len(analysed),
+    )
+    return [chunk for chunks in results for chunk in chunks]
+
+
 def chunk_structured(
     text: str,
     config: ChunkConfig,
     llm_generate: Optional[Callable[[str, int], str]] = None,
+    workers: int = 1,
+    llm_concurrency: int = STRUCTURED_LLM_CONCURRENCY,
 ) -> List[str]:
     """
     Structure-aware chunking:
@@ -520,48 +802,66 @@ def chunk_structured(
     - enforce max size with sentence-aware fallback
     - apply overlap between chunks
     - optionally refine boundaries with a lightweight LLM when enabled and below size limits
+
+    LLM boundary calls for up to llm_concurrency segments run concurrently in
+    threads. With workers > 1, texts of at least STRUCTURED_PARALLEL_MIN_WORDS
+    words are chunked in a shared process pool. The output is always identical
+    to the serial path.
     """
 
     # --- STEP 1: CLEANING PASS ---
     text = _clean_segment_text(text)
     # -----------------------------
 
-    segments = _segment_large_text(
-        text,
-        config.max_llm_input_words if config.use_llm else config.max_chunk_words * 3,
+    segments = _segment_large_text(text, _segment_limit(config))
+    pool = None
+    if workers > 1 and len(segments) > 1:
+        words = len(text.split())
+        if words >= STRUCTURED_PARALLEL_MIN_WORDS and not _pool_broken:
+            logger.info(
+                "Chunking %s segments (%s words) in %s processes",
+                len(segments),
+                words,
+                workers,
+            )
+            pool = _chunk_pool(workers)
+    return _chunk_segments(
+        segments, config, llm_generate, llm_concurrency, pool, workers
     )
-    all_chunks: List[str] = []
-    for segment in segments:
-        lines = _dedup_lines(segment).splitlines()
-        boundaries = detect_boundaries(lines)
-        if (
-            config.use_llm
-            and llm_generate
-            and len(segment.split()) <= config.max_llm_input_words
-        ):
-            llm_bounds = _llm_boundaries(lines, boundaries, llm_generate)
-            if llm_bounds:
-                boundaries = llm_bounds
-                logger.info("Applied LLM boundaries: %s", [b.index for b in boundaries])
-        initial_chunks = _split_by_boundaries(lines, boundaries)
-        sized_chunks = _split_to_size(initial_chunks, config)
-        overlapped = _apply_overlap(sized_chunks, config.overlap_words)
-        # Merge too-short tails with previous chunk to avoid tiny fragments.
-        merged: List[str] = []
-        for chunk in overlapped:
-            if (
-                merged
-                and len(chunk.split()) < config.min_chunk_words
-                and len(merged[-1].split()) < config.min_chunk_words
-            ):
-                merged[-1] = merged[-1] + "\n\n" + chunk
-            else:
-                merged.append(chunk)
-        merged = [_dedup_lines(c) for c in merged]
-        all_chunks.extend(merged)
-        logger.info(
-            "Segment produced %s chunks (sizes=%s)",
-            len(merged),
-            [len(c.split()) for c in merged],
-        )
-    return all_chunks
+
+
+def chunk_structured_stream(
+    lines: Iterable[str],
+    config: ChunkConfig,
+    llm_generate: Optional[Callable[[str, int], str]] = None,
+) -> Iterator[str]:
+    """
+    Streaming form of chunk_structured for large documents.
+
+    Lines are cleaned and deduplicated as they arrive and grouped into paragraphs
+    and segments with the same word limit as _segment_large_text; each segment's
+    chunks are yielded as soon as it is complete. Only the current segment is
+    held in memory, so callers can embed and store chunks while the source is
+    still being parsed.
+    """
+    limit = _segment_limit(config)
+    segment: List[str] = []  # paragraphs of the current segment
+    segment_words = 0
+    paragraph: List[str] = []
+    paragraph_words = 0
+    # A trailing blank line closes the last paragraph.
+    for line in chain(_dedup_line_stream(_clean_line_stream(lines)), [""]):
+        if line:
+            paragraph.append(line)
+            paragraph_words += len(line.split())
+            continue
+        if not paragraph:
+            continue
+        if segment_words + paragraph_words > limit and segment:
+            yield from _chunk_segment("\n\n".join(segment), config, llm_generate)
+            segment, segment_words = [], 0
+        segment.append("\n".join(paragraph))
+        segment_words += paragraph_words
+        paragraph, paragraph_words = [], 0
+    if segment:
+        yield from _chunk_segment("\n\n".join(segment), config, llm_generate)
@@ -0,0 +1,123 @@
+from abc import ABC, abstractmethod
+from datetime import datetime
+from typing import List
+from uuid import UUID
+
+from rag_project.rag_core.domain.models import (
+    Chunk,
+    CompanyInfo,
+    Document,
+    JobPosting,
+    PersonalDocument,
+    RetrievedChunk,
+    ScoreWeights,
+)
+from rag_project.config import (
+    REPO_SEARCH_DEFAULT_LIMIT,
+    REPO_SEARCH_DEFAULT_MIN_MATCH,
+    REPO_SEARCH_DEFAULT_POSTED_AFTER,
+    REPO_SEARCH_DEFAULT_DOC_TYPES,
+    HYDRATE_ALL_FIELDS,
+    SEARCH_PROJECTION_FULL,
+)
+from rag_project.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+class AsyncDocumentRepository(ABC):
+    """Coroutine counterpart of DocumentRepository for asyncio-based services."""
+
+    @abstractmethod
+    async def insert_document(self, document: Document) -> None:
+        raise NotImplementedError
+
+    @abstractmethod
+    async def insert_job_posting(self, job_posting: JobPosting) -> None:
+        raise NotImplementedError
+
+    @abstractmethod
+    async def insert_personal_document(self, personal: PersonalDocument) -> None:
+        raise NotImplementedError
+
+    @abstractmethod
+    async def insert_company_info(self, company: CompanyInfo) -> None:
+        raise NotImplementedError
+
+    @abstractmethod
+    async def delete_document(self, document_id: UUID) -> None:
+        raise NotImplementedError
+
+    async def delete_documents(self, document_ids: List[UUID]) -> int:
+        """Same contract as DocumentRepository.delete_documents."""
+        for document_id in document_ids:
+            await self.delete_document(document_id)
+        return len(document_ids)
+
+    @abstractmethod
+    async def delete_documents_by_filter(
+        self,
+        doc_type: str | None = None,
+        created_before: datetime | None = None,
+        company: str | None = None,
+    ) -> int:
+        """Same contract as DocumentRepository.delete_documents_by_filter."""
+        raise NotImplementedError
+
+
+class AsyncChunkRepository(ABC):
+    """Coroutine counterpart of ChunkRepository for asyncio-based services."""
+
+    @abstractmethod
+    async def insert_chunks_with_embeddings(
+        self, chunks: List[Chunk], embeddings: List[List[float]]
+    ) -> None:
+        raise NotImplementedError
+
+    @abstractmethod
+    async def search(
+        self,
+        query_embedding: List[float],
+        limit: int = REPO_SEARCH_DEFAULT_LIMIT,
+        min_match_score: float = REPO_SEARCH_DEFAULT_MIN_MATCH,
+        posted_after: float | None = REPO_SEARCH_DEFAULT_POSTED_AFTER,
+        doc_types: list[str] | None = REPO_SEARCH_DEFAULT_DOC_TYPES,
+        projection: str = SEARCH_PROJECTION_FULL,
+        weights: ScoreWeights | None = None,
+    ) -> List[RetrievedChunk]:
+        """Same contract as ChunkRepository.search."""
+        raise NotImplementedError
+
+    async def hybrid_search(
+        self,
+        query_embedding: List[float],
+        query_text: str,
+        limit: int = REPO_SEARCH_DEFAULT_LIMIT,
+        min_match_score: float = REPO_SEARCH_DEFAULT_MIN_MATCH,
+        posted_after: float | None = REPO_SEARCH_DEFAULT_POSTED_AFTER,
+        doc_types: list[str] | None = REPO_SEARCH_DEFAULT_DOC_TYPES,
+        projection: str = SEARCH_PROJECTION_FULL,
+        weights: ScoreWeights | None = None,
+    ) -> List[RetrievedChunk]:
+        """Same contract (and vector-only fallback) as ChunkRepository.hybrid_search."""
+        logger.warning(
+            "%s has no hybrid_search; falling back to vector search",
+            type(self).__name__,
+        )
+        return await self.search(
+            query_embedding,
+            limit=limit,
+            min_match_score=min_match_score,
+            posted_after=posted_after,
+            doc_types=doc_types,
+            projection=projection,
+            weights=weights,
+        )
+
+    async def hydrate(
+        self,
+        retrieved: List[RetrievedChunk],
+        fields: tuple[str, ...] = HYDRATE_ALL_FIELDS,
+    ) -> List[RetrievedChunk]:
+        """Same contract as ChunkRepository.hydrate."""
+        return retrieved
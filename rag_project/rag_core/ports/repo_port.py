@@ -1,4 +1,5 @@
 from abc import ABC, abstractmethod
+from datetime import datetime
 from typing import List
 from uuid import UUID
 
@@ -9,13 +10,19 @@ from rag_project.rag_core.domain.models import (
     JobPosting,
     PersonalDocument,
     RetrievedChunk,
+    ScoreWeights,
 )
 from rag_project.config import (
     REPO_SEARCH_DEFAULT_LIMIT,
     REPO_SEARCH_DEFAULT_MIN_MATCH,
     REPO_SEARCH_DEFAULT_POSTED_AFTER,
     REPO_SEARCH_DEFAULT_DOC_TYPES,
+    HYDRATE_ALL_FIELDS,
+    SEARCH_PROJECTION_FULL,
 )
+from rag_project.logger import get_logger
+
+logger = get_logger(__name__)
 
 
 class DocumentRepository(ABC):
@@ -39,6 +46,22 @@ class DocumentRepository(ABC):
     def delete_document(self, document_id: UUID) -> None:
         raise NotImplementedError
 
+    def delete_documents(self, document_ids: List[UUID]) -> int:
+        """Delete many documents (and their cascades); returns the number deleted."""
+        for document_id in document_ids:
+            self.delete_document(document_id)
+        return len(document_ids)
+
+    @abstractmethod
+    def delete_documents_by_filter(
+        self,
+        doc_type: str | None = None,
+        created_before: datetime | None = None,
+        company: str | None = None,
+    ) -> int:
+        """Delete every document matching all given filters; at least one is required."""
+        raise NotImplementedError
+
 
 class ChunkRepository(ABC):
     @abstractmethod
@@ -55,6 +78,50 @@ class ChunkRepository(ABC):
         min_match_score: float = REPO_SEARCH_DEFAULT_MIN_MATCH,
         posted_after: float | None = REPO_SEARCH_DEFAULT_POSTED_AFTER,
         doc_types: list[str] | None = REPO_SEARCH_DEFAULT_DOC_TYPES,
+        projection: str = SEARCH_PROJECTION_FULL,
+        weights: ScoreWeights | None = None,
     ) -> List[RetrievedChunk]:
-        """Return retrieved chunks with associated document/subtype info. posted_after is a unix timestamp (seconds)."""
+        """Return retrieved chunks with associated document/subtype info. posted_after is a unix timestamp (seconds).
+
+        projection="lean" may leave content/metadata unloaded (see RetrievedChunk.unloaded_fields).
+        weights overrides the default ranking weights for this call.
+        """
         raise NotImplementedError
+
+    def hybrid_search(
+        self,
+        query_embedding: List[float],
+        query_text: str,
+        limit: int = REPO_SEARCH_DEFAULT_LIMIT,
+        min_match_score: float = REPO_SEARCH_DEFAULT_MIN_MATCH,
+        posted_after: float | None = REPO_SEARCH_DEFAULT_POSTED_AFTER,
+        doc_types: list[str] | None = REPO_SEARCH_DEFAULT_DOC_TYPES,
+        projection: str = SEARCH_PROJECTION_FULL,
+        weights: ScoreWeights | None = None,
+    ) -> List[RetrievedChunk]:
+        """Vector + full-text search fused by rank.
+
+        Optional: repos without a full-text index inherit this fallback, which runs
+        the vector search alone.
+        """
+        logger.warning(
+            "%s has no hybrid_search; falling back to vector search",
+            type(self).__name__,
+        )
+        return self.search(
+            query_embedding,
+            limit=limit,
+            min_match_score=min_match_score,
+            posted_after=posted_after,
+            doc_types=doc_types,
+            projection=projection,
+            weights=weights,
+        )
+
+    def hydrate(
+        self,
+        retrieved: List[RetrievedChunk],
+        fields: tuple[str, ...] = HYDRATE_ALL_FIELDS,
+    ) -> List[RetrievedChunk]:
+        """Batch-load fields left out by a lean projection. Full-projection repos return as-is."""
+        return retrieved
@@ -0,0 +1,11 @@
+from abc import ABC, abstractmethod
+from typing import List
+
+
+class RerankerProvider(ABC):
+    """Abstraction for scoring (query, passage) pairs with a cross-encoder."""
+
+    @abstractmethod
+    def score(self, query: str, passages: List[str]) -> List[float]:
+        """Return one relevance score per passage; higher is more relevant."""
+        raise NotImplementedError
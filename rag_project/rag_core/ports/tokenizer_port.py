@@ -0,0 +1,23 @@
+from abc import ABC, abstractmethod
+from typing import List
+
+
+class Tokenizer(ABC):
+    """Abstraction for counting and cutting text in a model's tokens."""
+
+    @abstractmethod
+    def count(self, text: str) -> int:
+        """Number of tokens the model sees for text (no special tokens)."""
+        raise NotImplementedError
+
+    @abstractmethod
+    def truncate(self, text: str, max_tokens: int) -> str:
+        """Longest prefix of text that is at most max_tokens tokens."""
+        raise NotImplementedError
+
+    def word_token_counts(self, text: str) -> List[int]:
+        """Tokens attributed to each whitespace-separated word of text.
+
+        Adapters with offset mappings override this to tokenize text once.
+        """
+        return [self.count(word) for word in text.split()]
@@ -9,6 +9,8 @@ from rag_project.config import (
     DOMAIN_MAPPING_EXTRACTION_PROMPT,
     DOMAIN_MAPPING_MAX_TOKENS,
     DOMAIN_MAPPING_CANDIDATE_LIMIT,
+    HYDRATE_CONTENT,
+    SEARCH_PROJECTION_LEAN,
 )
 from rag_project.rag_core.ports.embedding_port import EmbeddingProvider
 from rag_project.rag_core.ports.llm_port import LLMProvider
@@ -78,7 +80,9 @@ class DomainExtractionService:
             query_embedding=query_embedding,
             limit=DOMAIN_MAPPING_CANDIDATE_LIMIT,
             doc_types=[DOC_TYPE_CV, DOC_TYPE_THESIS, DOC_TYPE_PERSONAL_PROJECT],
+            projection=SEARCH_PROJECTION_LEAN,
         )
+        self.chunk_repo.hydrate(chunks, fields=(HYDRATE_CONTENT,))
         return "\n\n".join([rc.chunk.content for rc in chunks]) if chunks else ""
 
     @staticmethod
@@ -6,8 +6,10 @@ Orchestrates job-candidate matching:
 3) Evaluate evidence against each requirement (LLM)
 """
 
+import contextvars
 import json
 import re
+from concurrent.futures import ThreadPoolExecutor
 from typing import List
 
 from rag_project.config import (
@@ -21,11 +23,23 @@ from rag_project.config import (
     JOB_MATCHING_EXTRACTION_MAX_TOKENS,
     JOB_MATCHING_EVALUATION_MAX_TOKENS,
     JOB_MATCHING_JOB_TEXT_LIMIT,
+    JOB_MATCHING_RETRIEVAL_MODE,
+    JOB_MATCHING_PARALLEL_JOBS,
+    JOB_MATCHING_RERANK_CANDIDATES,
+    JOB_MATCHING_RERANK_TOP_K,
+    JOB_MATCHING_EVIDENCE_CHARS,
+    JOB_MATCHING_EVIDENCE_TOKEN_BUDGET,
+    RETRIEVAL_MODE_HYBRID,
+    RETRIEVAL_MODES,
+    SEARCH_PROJECTION_LEAN,
+    HYDRATE_CONTENT,
+    HYDRATE_METADATA,
     JOB_MATCHING_EXTRACTION_PROMPT,
     JOB_MATCHING_EVALUATION_PROMPT,
 )
 from rag_project.config import DOMAIN_MAPPINGS, INFERENCE_RULES, CITATION_TOP_K
 from rag_project.logger import get_logger
+from rag_project.tracing import current_span, start_span, traced
 from rag_project.rag_core.domain.models import (
     JobRequirement,
     RequirementEvaluation,
@@ -34,10 +48,12 @@ from rag_project.rag_core.domain.models import (
 from rag_project.rag_core.ports.embedding_port import EmbeddingProvider
 from rag_project.rag_core.ports.llm_port import LLMProvider
 from rag_project.rag_core.ports.repo_port import ChunkRepository
+from rag_project.rag_core.ports.reranker_port import RerankerProvider
 from rag_project.rag_core.retrieval.domain_extraction_service import (
     DomainExtractionService,
     DomainMapping,
 )
+from rag_project.rag_core.retrieval.prompt_budget import PromptBudget
 
 logger = get_logger(__name__)
 
@@ -59,6 +75,12 @@ class JobMatchingService:
         search_limit: int = JOB_MATCHING_SEARCH_LIMIT,
         min_match_score: float = JOB_MATCHING_MIN_MATCH_SCORE,
         domain_extractor: DomainExtractionService | None = None,
+        retrieval_mode: str = JOB_MATCHING_RETRIEVAL_MODE,
+        reranker: RerankerProvider | None = None,
+        rerank_candidates: int = JOB_MATCHING_RERANK_CANDIDATES,
+        rerank_top_k: int = JOB_MATCHING_RERANK_TOP_K,
+        extraction_budget: PromptBudget | None = None,
+        evaluation_budget: PromptBudget | None = None,
     ) -> None:
         self.embedder = embedder
         self.llm = llm
@@ -68,9 +90,22 @@ class JobMatchingService:
         self.search_limit = search_limit
         self.min_match_score = min_match_score
         self.domain_extractor = domain_extractor
-
-    def analyze_match(self, job_text: str) -> JobMatchResult:
-        """Analyze candidate match against a job posting."""
+        self.retrieval_mode = retrieval_mode
+        self.reranker = reranker
+        self.rerank_candidates = rerank_candidates
+        self.rerank_top_k = rerank_top_k
+        self.extraction_budget = extraction_budget
+        self.evaluation_budget = evaluation_budget
+
+    @traced("job_matching.analyze_match")
+    def analyze_match(
+        self, job_text: str, retrieval_mode: str | None = None
+    ) -> JobMatchResult:
+        """Analyze candidate match against a job posting.
+
+        retrieval_mode overrides the service default ("vector" or "hybrid") for this call.
+        """
+        mode = self._retrieval_mode(retrieval_mode)
         logger.info(
             "Job matching: starting extraction (model=%s)", self.extraction_model
         )
@@ -94,8 +129,70 @@ class JobMatchingService:
             logger.debug(
                 "Job matching: evaluating %s (%d/%d)", req.name, idx, len(requirements)
             )
-            evaluations.append(self._evaluate_requirement(req, domain_mappings))
+            with start_span(
+                "job_matching.evaluate_requirement",
+                **{"requirement.name": req.name, "requirement.category": req.category},
+            ):
+                evaluations.append(
+                    self._evaluate_requirement(
+                        req, domain_mappings, retrieval_mode=mode
+                    )
+                )
+
+        return self._summarize(job_text, requirements, evaluations)
+
+    @traced("job_matching.analyze_matches")
+    def analyze_matches(
+        self,
+        job_texts: List[str],
+        retrieval_mode: str | None = None,
+        max_workers: int = JOB_MATCHING_PARALLEL_JOBS,
+    ) -> List[JobMatchResult]:
+        """Analyze several job postings, one model phase at a time.
+
+        All extraction calls run first, then every requirement evaluation, so the
+        extraction and evaluator models are each loaded once instead of alternating
+        per job. Calls within a phase run concurrently on max_workers threads.
+        """
+        mode = self._retrieval_mode(retrieval_mode)
+        with ThreadPoolExecutor(max_workers=max_workers) as pool:
+
+            def run_all(fn, *iterables):
+                futures = [
+                    pool.submit(contextvars.copy_context().run, fn, *args)
+                    for args in zip(*iterables)
+                ]
+                return [f.result() for f in futures]
+
+            domains = run_all(self.extract_domain_knowledge, job_texts)
+            requirements = run_all(self._extract_requirements, job_texts)
+            pairs = [
+                (req, domain)
+                for reqs, domain in zip(requirements, domains)
+                for req in reqs
+            ]
+            flat = run_all(
+                lambda req, domain: self._evaluate_requirement(
+                    req, domain, retrieval_mode=mode
+                ),
+                [req for req, _domain in pairs],
+                [domain for _req, domain in pairs],
+            )
+
+        results = []
+        offset = 0
+        for job_text, reqs in zip(job_texts, requirements):
+            evaluations = flat[offset : offset + len(reqs)]
+            offset += len(reqs)
+            results.append(self._summarize(job_text, reqs, evaluations))
+        return results
 
+    def _summarize(
+        self,
+        job_text: str,
+        requirements: List[JobRequirement],
+        evaluations: List[RequirementEvaluation],
+    ) -> JobMatchResult:
         match_count = sum(
             1
             for e in evaluations
@@ -110,6 +207,12 @@ class JobMatchingService:
             len(evaluations),
             match_rate,
         )
+        current_span().set_attributes(
+            {
+                "job_matching.requirements": len(requirements),
+                "job_matching.matches": match_count,
+            }
+        )
 
         return JobMatchResult(
             job_text=job_text,
@@ -120,9 +223,15 @@ class JobMatchingService:
             match_rate=match_rate,
         )
 
+    @traced("job_matching.extract_requirements")
     def _extract_requirements(self, job_text: str) -> List[JobRequirement]:
         """Extract requirements from job posting using an LLM."""
-        limited_text = job_text[:JOB_MATCHING_JOB_TEXT_LIMIT]
+        if self.extraction_budget:
+            budget = self.extraction_budget
+            fixed = JOB_MATCHING_EXTRACTION_PROMPT.format(job_text="")
+            limited_text = budget.fit(job_text, budget.remaining(fixed))
+        else:
+            limited_text = job_text[:JOB_MATCHING_JOB_TEXT_LIMIT]
         prompt = JOB_MATCHING_EXTRACTION_PROMPT.format(job_text=limited_text)
 
         try:
@@ -146,20 +255,24 @@ class JobMatchingService:
             logger.error("Job matching: extraction failed: %s", exc, exc_info=True)
             return []
 
+    def _retrieval_mode(self, retrieval_mode: str | None) -> str:
+        """The per-call mode, else the service default; unknown modes raise."""
+        mode = retrieval_mode or self.retrieval_mode
+        if mode not in RETRIEVAL_MODES:
+            raise ValueError(
+                f"Unknown retrieval mode '{mode}'. "
+                f"Available: {', '.join(RETRIEVAL_MODES)}"
+            )
+        return mode
+
     def _evaluate_requirement(
-        self, req: JobRequirement, domain_mappings: DomainMapping | None = None
+        self,
+        req: JobRequirement,
+        domain_mappings: DomainMapping | None = None,
+        retrieval_mode: str | None = None,
     ) -> RequirementEvaluation:
         """Search evidence and evaluate a single requirement."""
-        query_embedding = self.embedder.embed_query(req.search_query)
-        chunks = self.chunk_repo.search(
-            query_embedding=query_embedding,
-            limit=self.search_limit,
-            doc_types=[DOC_TYPE_CV, DOC_TYPE_THESIS, DOC_TYPE_PERSONAL_PROJECT],
-            min_match_score=self.min_match_score,
-        )
-
-        evidence_lines = [f"- {rc.chunk.content[:500]}..." for rc in chunks]
-        evidence_str = "\n".join(evidence_lines)
+        chunks = self._search_evidence(req, self._retrieval_mode(retrieval_mode))
 
         if not chunks:
             return RequirementEvaluation(
@@ -179,16 +292,21 @@ class JobMatchingService:
             self._format_domain_mappings(domain_mappings)
         )
 
-        prompt = JOB_MATCHING_EVALUATION_PROMPT.format(
+        prompt_fields = dict(
             domain_mappings=DOMAIN_MAPPINGS,
             requirement_name=req.name,
             category=req.category,
             inference_rule=inference_rule,
-            evidence=evidence_str,
             language_mappings=language_mappings,
             skill_demonstrations=skill_demonstrations,
             credential_mappings=credential_mappings,
         )
+        evidence_str = self._format_evidence(
+            chunks, JOB_MATCHING_EVALUATION_PROMPT.format(evidence="", **prompt_fields)
+        )
+        prompt = JOB_MATCHING_EVALUATION_PROMPT.format(
+            evidence=evidence_str, **prompt_fields
+        )
 
         try:
             response = self.llm.generate(
@@ -204,6 +322,7 @@ class JobMatchingService:
                 reasoning_raw.splitlines()[0] if reasoning_raw else reasoning_raw
             )
 
+            self.chunk_repo.hydrate(chunks[:CITATION_TOP_K], fields=(HYDRATE_METADATA,))
             citations = self._build_citations(chunks)
             return RequirementEvaluation(
                 requirement=req,
@@ -224,6 +343,74 @@ class JobMatchingService:
                 citations=[],
             )
 
+    def _search_evidence(self, req: JobRequirement, retrieval_mode: str) -> list:
+        """Retrieve evidence chunks; with a reranker, over-fetch and keep the best k."""
+        chunks = self._retrieve_candidates(
+            req,
+            retrieval_mode,
+            self.rerank_candidates if self.reranker else self.search_limit,
+        )
+        if self.reranker and chunks:
+            chunks = self._rerank(req.search_query, chunks)
+        return chunks
+
+    def _retrieve_candidates(
+        self, req: JobRequirement, retrieval_mode: str, limit: int
+    ) -> list:
+        """Lean search plus one batched content fetch; metadata is left for citations."""
+        query_embedding = self.embedder.embed_query(req.search_query)
+        doc_types = [DOC_TYPE_CV, DOC_TYPE_THESIS, DOC_TYPE_PERSONAL_PROJECT]
+        if retrieval_mode == RETRIEVAL_MODE_HYBRID:
+            chunks = self.chunk_repo.hybrid_search(
+                query_embedding=query_embedding,
+                query_text=req.search_query,
+                limit=limit,
+                doc_types=doc_types,
+                min_match_score=self.min_match_score,
+                projection=SEARCH_PROJECTION_LEAN,
+            )
+        else:
+            chunks = self.chunk_repo.search(
+                query_embedding=query_embedding,
+                limit=limit,
+                doc_types=doc_types,
+                min_match_score=self.min_match_score,
+                projection=SEARCH_PROJECTION_LEAN,
+            )
+        return self.chunk_repo.hydrate(chunks, fields=(HYDRATE_CONTENT,))
+
+    def _rerank(self, query: str, chunks: list) -> list:
+        """Score candidates with the cross-encoder in one batch and keep the top k."""
+        scores = self.reranker.score(
+            query, [rc.chunk.content[:JOB_MATCHING_EVIDENCE_CHARS] for rc in chunks]
+        )
+        ranked = sorted(zip(scores, chunks), key=lambda pair: pair[0], reverse=True)
+        kept = []
+        for score, rc in ranked[: self.rerank_top_k]:
+            rc.score = score
+            kept.append(rc)
+        logger.debug(
+            "Job matching: reranked %d candidates -> kept %d", len(chunks), len(kept)
+        )
+        return kept
+
+    def _format_evidence(self, chunks: list, fixed_prompt: str = "") -> str:
+        """Evidence bullets; with a budget, whole chunks packed in ranking order."""
+        if not self.evaluation_budget:
+            return "\n".join(
+                f"- {rc.chunk.content[:JOB_MATCHING_EVIDENCE_CHARS]}..."
+                for rc in chunks
+            )
+        budget = self.evaluation_budget
+        max_tokens = min(
+            JOB_MATCHING_EVIDENCE_TOKEN_BUDGET, budget.remaining(fixed_prompt)
+        )
+        packed = budget.pack(
+            [f"- {rc.chunk.content}" for rc in chunks], max_tokens, separator="\n"
+        )
+        return "\n".join(part for part in packed if part is not None)
+
+    @traced("job_matching.extract_domain_knowledge")
     def extract_domain_knowledge(self, job_text: str) -> DomainMapping | None:
         if not self.domain_extractor:
             return None
@@ -0,0 +1,88 @@
+"""Fit prompts into a model's token budget.
+
+The budget for a model is its `prompt_budget_tokens` from LLM_MODEL_REGISTRY,
+capped by the context Ollama allocates minus the tokens reserved for the answer.
+Context passages are packed best-first until the budget is spent, so prompts are
+neither cut off by the server nor padded with low-value evidence.
+"""
+
+from typing import List, Optional
+
+from rag_project.config import LLM_MODEL_REGISTRY, PROMPT_BUDGET_SAFETY_TOKENS
+from rag_project.logger import get_logger
+from rag_project.rag_core.ports.tokenizer_port import Tokenizer
+
+logger = get_logger(__name__)
+
+
+class PromptBudget:
+    def __init__(self, tokenizer: Tokenizer, budget_tokens: int) -> None:
+        self.tokenizer = tokenizer
+        self.budget_tokens = budget_tokens
+
+    @classmethod
+    def for_model(
+        cls, model_id: str, max_output_tokens: int, tokenizer: Tokenizer
+    ) -> "PromptBudget":
+        spec = LLM_MODEL_REGISTRY[model_id]
+        window = min(spec["context_window"], spec["ollama_num_ctx"])
+        available = window - max_output_tokens - PROMPT_BUDGET_SAFETY_TOKENS
+        budget = min(spec.get("prompt_budget_tokens", available), available)
+        if budget <= 0:
+            raise ValueError(
+                f"No prompt budget left for {model_id}: window={window} "
+                f"max_output_tokens={max_output_tokens}"
+            )
+        return cls(tokenizer, budget)
+
+    def count(self, text: str) -> int:
+        return self.tokenizer.count(text)
+
+    def remaining(self, *fixed_parts: str) -> int:
+        """Tokens left after the fixed parts of a prompt (template, question)."""
+        return self.budget_tokens - sum(self.count(p) for p in fixed_parts)
+
+    def fit(self, text: str, max_tokens: int) -> str:
+        """text cut to max_tokens, logging when anything is dropped."""
+        fitted = self.tokenizer.truncate(text, max_tokens)
+        if len(fitted) < len(text):
+            logger.info(
+                "Prompt budget: truncated text to %d tokens (%d of %d chars kept)",
+                max_tokens,
+                len(fitted),
+                len(text),
+            )
+        return fitted
+
+    def pack(
+        self, parts: List[str], max_tokens: int, separator: str = "\n\n"
+    ) -> List[Optional[str]]:
+        """Pack parts (best first) into max_tokens.
+
+        Returns one entry per part: the text to use, or None when it did not fit.
+        Parts that do not fit are skipped so smaller, lower-ranked ones can still
+        be used; if even the best part is too large it is truncated instead.
+        """
+        sep_tokens = self.count(separator) if parts else 0
+        used = 0
+        packed: List[Optional[str]] = []
+        for part in parts:
+            cost = self.count(part) + (sep_tokens if used else 0)
+            if used + cost <= max_tokens:
+                packed.append(part)
+                used += cost
+            elif not used and max_tokens > 0:
+                packed.append(self.fit(part, max_tokens))
+                used = max_tokens
+            else:
+                packed.append(None)
+        dropped = packed.count(None)
+        if dropped:
+            logger.info(
+                "Prompt budget: packed %d/%d parts into %d tokens (budget %d)",
+                len(parts) - dropped,
+                len(parts),
+                used,
+                max_tokens,
+            )
+        return packed
@@ -11,6 +11,7 @@ from rag_project.config import (
 )
 from rag_project.rag_core.ports.llm_port import LLMProvider
 from rag_project.logger import get_logger
+from rag_project.tracing import traced
 
 
 logger = get_logger(__name__)
@@ -33,6 +34,7 @@ class RouterService:
     def __init__(self, llm: LLMProvider):
         self._llm = llm
 
+    @traced("router.route")
     def route(self, user_input: str, context: Optional[dict] = None) -> RouteDecision:
         """Run the router LLM and return a decision."""
         prompt = self._build_prompt(user_input, context or {})
@@ -1,14 +1,18 @@
-from typing import List
+from typing import List, Tuple
 
 from rag_project.rag_core.domain.models import Citation, RAGAnswer, RetrievedChunk
 from rag_project.rag_core.ports.embedding_port import EmbeddingProvider
 from rag_project.rag_core.ports.llm_port import LLMProvider
 from rag_project.rag_core.ports.repo_port import ChunkRepository
+from rag_project.rag_core.retrieval.prompt_budget import PromptBudget
 from rag_project.config import (
     DEFAULT_MIN_MATCH_SCORE,
     DEFAULT_SEARCH_LIMIT,
     RETRIEVAL_SYSTEM_PROMPT,
     ANSWER_DEFAULT_TOP_K,
+    DEFAULT_RETRIEVAL_MODE,
+    RETRIEVAL_MODE_HYBRID,
+    RETRIEVAL_MODES,
 )
 from rag_project.logger import get_logger
 
@@ -24,48 +28,87 @@ def vector_search(
     min_match_score: float = DEFAULT_MIN_MATCH_SCORE,
     posted_after: float | None = None,
     doc_types: list[str] | None = None,
+    mode: str = DEFAULT_RETRIEVAL_MODE,
 ) -> List[RetrievedChunk]:
+    if mode not in RETRIEVAL_MODES:
+        raise ValueError(
+            f"Unknown retrieval mode '{mode}'. Available: {', '.join(RETRIEVAL_MODES)}"
+        )
     logger.debug(
-        "Vector search start: query_len=%d limit=%d min_score=%.2f doc_types=%s",
+        "Vector search start: query_len=%d limit=%d min_score=%.2f doc_types=%s mode=%s",
         len(query),
         limit,
         min_match_score,
         doc_types,
+        mode,
     )
     q_emb = embedder.embed([query])[0]
-    results = chunk_repo.search(
-        q_emb,
-        limit=limit,
-        min_match_score=min_match_score,
-        posted_after=posted_after,
-        doc_types=doc_types,
-    )
-    logger.info("Vector search returned %d chunks", len(results))
+    if mode == RETRIEVAL_MODE_HYBRID:
+        results = chunk_repo.hybrid_search(
+            q_emb,
+            query,
+            limit=limit,
+            min_match_score=min_match_score,
+            posted_after=posted_after,
+            doc_types=doc_types,
+        )
+    else:
+        results = chunk_repo.search(
+            q_emb,
+            limit=limit,
+            min_match_score=min_match_score,
+            posted_after=posted_after,
+            doc_types=doc_types,
+        )
+    logger.info("Vector search returned %d chunks (mode=%s)", len(results), mode)
     return results
 
 
-def build_prompt(question: str, retrieved: List[RetrievedChunk]) -> str:
-    context_parts = []
-    for rc in retrieved:
-        meta = f"doc_type={rc.document.doc_type or 'unknown'}"
-        title = None
-        company = None
-        url = None
-        if rc.job_posting:
-            title = rc.job_posting.title
-            company = rc.job_posting.company
-            url = rc.job_posting.url
-        if title:
-            meta += f" | title={title}"
-        if company:
-            meta += f" | company={company}"
-        if url:
-            meta += f" | url={url}"
-        context_parts.append(f"[{meta}] {rc.chunk.content}")
-    context = "\n\n".join(context_parts)
+def _context_part(rc: RetrievedChunk) -> str:
+    meta = f"doc_type={rc.document.doc_type or 'unknown'}"
+    title = None
+    company = None
+    url = None
+    if rc.job_posting:
+        title = rc.job_posting.title
+        company = rc.job_posting.company
+        url = rc.job_posting.url
+    if title:
+        meta += f" | title={title}"
+    if company:
+        meta += f" | company={company}"
+    if url:
+        meta += f" | url={url}"
+    return f"[{meta}] {rc.chunk.content}"
+
+
+def select_context(
+    question: str,
+    retrieved: List[RetrievedChunk],
+    budget: PromptBudget | None = None,
+) -> List[Tuple[RetrievedChunk, str]]:
+    """Context passages for the prompt; with a budget, packed by score until full."""
+    if budget is None:
+        return [(rc, _context_part(rc)) for rc in retrieved]
+    ranked = sorted(retrieved, key=lambda rc: rc.score, reverse=True)
+    fixed = RETRIEVAL_SYSTEM_PROMPT.format(context="", question=question)
+    packed = budget.pack([_context_part(rc) for rc in ranked], budget.remaining(fixed))
+    return [(rc, part) for rc, part in zip(ranked, packed) if part is not None]
+
+
+def _format_prompt(question: str, selected: List[Tuple[RetrievedChunk, str]]) -> str:
+    context = "\n\n".join(part for _rc, part in selected)
     return RETRIEVAL_SYSTEM_PROMPT.format(context=context, question=question)
 
 
+def build_prompt(
+    question: str,
+    retrieved: List[RetrievedChunk],
+    budget: PromptBudget | None = None,
+) -> str:
+    return _format_prompt(question, select_context(question, retrieved, budget))
+
+
 def answer_question(
     question: str,
     embedder: EmbeddingProvider,
@@ -75,6 +118,7 @@ def answer_question(
     min_match_score: float = DEFAULT_MIN_MATCH_SCORE,
     posted_after: float | None = None,
     doc_types: list[str] | None = None,
+    budget: PromptBudget | None = None,
 ) -> RAGAnswer:
     retrieved = vector_search(
         question,
@@ -85,7 +129,10 @@ def answer_question(
         posted_after=posted_after,
         doc_types=doc_types,
     )
-    prompt = build_prompt(question, retrieved)
+    # Prompt from the packed (possibly truncated) parts; citations from their chunks.
+    selected = select_context(question, retrieved, budget)
+    retrieved = [rc for rc, _part in selected]
+    prompt = _format_prompt(question, selected)
     logger.debug("Sending retrieval prompt to LLM with %d contexts", len(retrieved))
     response = llm.generate(prompt)
     citations = []
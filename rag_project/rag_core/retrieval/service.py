@@ -5,8 +5,10 @@ from rag_project.rag_core.retrieval.search import answer_question, vector_search
 from rag_project.rag_core.ports.embedding_port import EmbeddingProvider
 from rag_project.rag_core.ports.llm_port import LLMProvider
 from rag_project.rag_core.ports.repo_port import ChunkRepository
+from rag_project.rag_core.retrieval.prompt_budget import PromptBudget
 from rag_project.config import DEFAULT_MIN_MATCH_SCORE, DEFAULT_SEARCH_LIMIT
 from rag_project.logger import get_logger
+from rag_project.tracing import traced
 
 
 logger = get_logger(__name__)
@@ -18,11 +20,14 @@ class QueryService:
         embedder: EmbeddingProvider,
         llm: LLMProvider,
         chunk_repo: ChunkRepository,
+        prompt_budget: PromptBudget | None = None,
     ) -> None:
         self.embedder = embedder
         self.llm = llm
         self.chunk_repo = chunk_repo
+        self.prompt_budget = prompt_budget
 
+    @traced("query.search")
     def search(
         self,
         question: str,
@@ -47,6 +52,7 @@ class QueryService:
             doc_types=doc_types,
         )
 
+    @traced("query.answer")
     def answer(
         self,
         question: str,
@@ -70,4 +76,5 @@ class QueryService:
             min_match_score=min_match_score,
             posted_after=posted_after,
             doc_types=doc_types,
+            budget=self.prompt_budget,
         )
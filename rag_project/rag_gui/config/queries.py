@@ -9,9 +9,13 @@ GUI_JOBLOADER_QUERY = """
                             d.created_at
                         FROM documents d
                         JOIN job_postings jp ON d.id = jp.document_id
-                        WHERE d.doc_type = 'job_posting'
-                        ORDER BY d.created_at DESC
+                        WHERE d.doc_type = 'job_posting' AND {where_sql}
+                        ORDER BY d.created_at DESC, d.id DESC
+                        LIMIT %s
                     """
+# Substring match served by the pg_trgm GIN indexes on title/company.
+GUI_JOB_SEARCH_FILTER = "(jp.title ILIKE %s OR jp.company ILIKE %s)"
+GUI_JOB_AFTER_FILTER = "(d.created_at, d.id) < (%s, %s)"
 
 GUI_CHUNK_COUNT_QUERY = """
                         SELECT d.doc_type, COUNT(c.id) 
@@ -25,6 +29,18 @@ GUI_DELETE_STATS_QUERIES = {
     "chunks": "SELECT COUNT(*) FROM chunks",
     "embeds": "SELECT COUNT(*) FROM embeddings",
 }
+GUI_DELETE_STATS_TABLES = {
+    "docs": "documents",
+    "chunks": "chunks",
+    "embeds": "embeddings",
+}
+# Planner estimate instead of a full scan; reltuples is -1 until the table has
+# been vacuumed/analyzed, in which case the exact COUNT(*) above is used.
+GUI_APPROX_COUNT_QUERY = """
+                        SELECT t.name, c.reltuples::bigint
+                        FROM unnest(%s::text[]) AS t(name)
+                        JOIN pg_class c ON c.oid = to_regclass(t.name)
+                    """
 
 GUI_DOC_LIST_QUERY_BASE = """
                         SELECT d.id, d.doc_type, d.created_at,
@@ -36,17 +52,39 @@ GUI_DOC_LIST_QUERY_BASE = """
                                ) AS label
                         FROM documents d
                     """
-GUI_DOC_LIST_FILTER_QUERY = "WHERE d.doc_type = %s ORDER BY d.created_at DESC"
+# Keyset page: rows strictly after the (created_at, id) cursor, newest first.
+GUI_DOC_PAGE_QUERY = (
+    GUI_DOC_LIST_QUERY_BASE
+    + " WHERE {where_sql} ORDER BY d.created_at DESC, d.id DESC LIMIT %s"
+)
+GUI_DOC_PAGE_TYPE_FILTER = "d.doc_type = %s"
+GUI_DOC_PAGE_AFTER_FILTER = "(d.created_at, d.id) < (%s, %s)"
 
 GUI_DB_SIZE_QUERY = "SELECT pg_database_size(current_database())"
 GUI_DOC_COUNT_QUERY = "SELECT doc_type, COUNT(*) FROM documents GROUP BY doc_type"
+# Trigger-maintained per-type totals (see doc_type_stats in scripts/rag_schema.sql);
+# databases created before it existed fall back to the two counting queries above.
+GUI_DOC_TYPE_STATS_AVAILABLE_QUERY = "SELECT to_regclass('doc_type_stats') IS NOT NULL"
+GUI_DOC_TYPE_STATS_QUERY = """
+                        SELECT doc_type, doc_count, chunk_count, embedding_count,
+                               chunk_bytes, embedding_bytes
+                        FROM doc_type_stats
+                    """
 
 __all__ = [
     "GUI_JOBLOADER_QUERY",
+    "GUI_JOB_SEARCH_FILTER",
+    "GUI_JOB_AFTER_FILTER",
     "GUI_CHUNK_COUNT_QUERY",
     "GUI_DELETE_STATS_QUERIES",
     "GUI_DOC_LIST_QUERY_BASE",
-    "GUI_DOC_LIST_FILTER_QUERY",
+    "GUI_DELETE_STATS_TABLES",
+    "GUI_APPROX_COUNT_QUERY",
+    "GUI_DOC_PAGE_QUERY",
+    "GUI_DOC_PAGE_TYPE_FILTER",
+    "GUI_DOC_PAGE_AFTER_FILTER",
     "GUI_DB_SIZE_QUERY",
     "GUI_DOC_COUNT_QUERY",
+    "GUI_DOC_TYPE_STATS_AVAILABLE_QUERY",
+    "GUI_DOC_TYPE_STATS_QUERY",
 ]
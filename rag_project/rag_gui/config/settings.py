@@ -14,12 +14,15 @@ GUI_JOBLOADER_DB_TIMEOUT = 10
 GUI_CHAT_SIMULATED_DELAY = 1.5
 GUI_DISK_USAGE_PATH = "/"
 GUI_DB_OVERVIEW_TIMEOUT = 10
+GUI_JOB_SEARCH_DEBOUNCE_MS = 300
 
 # Regex / parsing
 GUI_CHUNK_COUNT_REGEX = r"Chunking complete: (\d+) chunks"
 
 # Options
 GUI_DELETE_FILTER_OPTIONS = ["Choose document type", "All Documents"]
+GUI_DELETE_PAGE_SIZE = 200
+GUI_JOB_PAGE_SIZE = 100
 
 __all__ = [
     "DOC_TYPE_OPTIONS",
@@ -30,6 +33,9 @@ __all__ = [
     "GUI_CHAT_SIMULATED_DELAY",
     "GUI_DISK_USAGE_PATH",
     "GUI_DB_OVERVIEW_TIMEOUT",
+    "GUI_JOB_SEARCH_DEBOUNCE_MS",
     "GUI_CHUNK_COUNT_REGEX",
     "GUI_DELETE_FILTER_OPTIONS",
+    "GUI_DELETE_PAGE_SIZE",
+    "GUI_JOB_PAGE_SIZE",
 ]
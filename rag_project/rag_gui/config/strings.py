@@ -23,7 +23,8 @@ GUI_DETAIL_STATUS_DEFAULT = "Current step: Ready"
 GUI_DETAIL_STATUS_COLOR_DEFAULT = "color: gray;"
 GUI_LOG_HEADER_TEXT = "Process Log"
 GUI_FILE_DIALOG_FILTERS = (
-    "All Supported (*.pdf *.docx *.txt *.md);;PDF (*.pdf);;Word (*.docx);;Text (*.txt)"
+    "All Supported (*.pdf *.docx *.txt *.md *.html *.htm *.json);;PDF (*.pdf);;"
+    "Word (*.docx);;Text (*.txt *.md);;HTML (*.html *.htm);;JSON feed (*.json)"
 )
 GUI_DOC_TYPE_WARNING_TEXT = {
     "title": "Missing Info",
@@ -82,6 +83,7 @@ GUI_DB_ERROR_PREFIX = "Error: "
 GUI_DELETE_TITLE = "Delete Documents"
 GUI_DELETE_LOAD_LABEL = "Load"
 GUI_DELETE_BUTTON_LABEL = "Delete Selected"
+GUI_DELETE_TYPE_BUTTON_LABEL = "Delete All of Type"
 GUI_DELETE_SELECTION_WARNING = {
     "title": "No Selection",
     "message": "Please select at least one document.",
@@ -90,24 +92,26 @@ GUI_DELETE_CONFIRM_TEXT = {
     "title": "Confirm Delete",
     "template": "Delete {count} document(s)?",
 }
+GUI_DELETE_TYPE_CONFIRM_TEXT = {
+    "title": "Confirm Delete",
+    "template": "Delete all '{doc_type}' documents?",
+}
 GUI_DELETE_FAIL_TITLE = "Deletion Failed"
 GUI_CHATAREA_PLACEHOLDER = "Type your message here..."
 GUI_CONTEXT_HEADER_TEXT = "Context"
 GUI_CONTEXT_EMPTY_TEXT = "No context available"
 GUI_CHAT_USER_STYLE_FLAG = True
-GUI_JOB_CARD_CHECKBOX_STYLE = ""
-GUI_JOB_TITLE_FALLBACK = "Untitled Job"
-GUI_JOB_COMPANY_FALLBACK = "Unknown Company"
-GUI_JOB_LOCATION_FALLBACK = "Unknown Location"
 GUI_CONTEXT_SCORE_FORMAT = "Score: {score:.2f}"
 GUI_CONTEXT_TITLE_FALLBACK = "Source"
 GUI_DROPZONE_TEXT = "Drag & drop files here\nor click to browse"
 GUI_DROPZONE_FILE_FILTER = "All Files (*)"
 GUI_DB_TABLE_HEADERS = ["Doc Type", "Count", "Chunks"]
+GUI_DB_TYPE_SIZES_FORMAT = " ({text_size} text, {embedding_size} embeddings)"
 GUI_DELETE_TABLE_HEADERS = ["", "ID", "Type", "Created", "Title/Company"]
 DELETE_TABLE_HEADERS = GUI_DELETE_TABLE_HEADERS  # backward-compatible alias
 GUI_LOADING_JOBS_TEXT = "Loading jobs..."
 GUI_NO_JOBS_TEXT = "No job postings found."
+GUI_JOB_SEARCH_PLACEHOLDER = "Search title or company..."
 GUI_JOB_LOAD_ERROR_PREFIX = "Error: "
 GUI_NO_CONTEXT_TEXT = "No specific context found."
 
@@ -0,0 +1,4 @@
+from .document_table_model import DocumentTableModel
+from .job_list_model import JOB_ROLE, JobListModel
+
+__all__ = ["DocumentTableModel", "JOB_ROLE", "JobListModel"]
@@ -0,0 +1,114 @@
+from typing import List, Optional
+
+from PyQt5 import QtCore
+
+from rag_project.rag_gui.config import GUI_DELETE_TABLE_HEADERS
+
+# Column order matches GUI_DELETE_TABLE_HEADERS: checkbox, ID, Type, Created, Label
+_COLUMN_KEYS = (None, "id", "doc_type", "created_at", "label")
+
+
+class DocumentTableModel(QtCore.QAbstractTableModel):
+    """Keyset-paged document list for the Delete view.
+
+    Rows are appended page by page. When the view scrolls to the end, Qt calls
+    fetchMore(), which emits fetch_requested with the (created_at, id) cursor of
+    the last loaded row; the owner loads the next page and calls append_page().
+    """
+
+    fetch_requested = QtCore.pyqtSignal(object)
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._docs: List[dict] = []
+        self._checked: set[str] = set()
+        self._has_more = False
+        self._fetching = False
+
+    # --- Paging ---
+
+    def reset(self, docs: List[dict], has_more: bool) -> None:
+        self.beginResetModel()
+        self._docs = list(docs)
+        self._checked.clear()
+        self._has_more = has_more
+        self._fetching = False
+        self.endResetModel()
+
+    def append_page(self, docs: List[dict], has_more: bool) -> None:
+        self._fetching = False
+        self._has_more = has_more
+        if not docs:
+            return
+        first = len(self._docs)
+        self.beginInsertRows(QtCore.QModelIndex(), first, first + len(docs) - 1)
+        self._docs.extend(docs)
+        self.endInsertRows()
+
+    def next_cursor(self) -> Optional[tuple]:
+        if not self._docs:
+            return None
+        last = self._docs[-1]
+        return last["created_at_value"], last["id"]
+
+    def canFetchMore(self, parent=QtCore.QModelIndex()) -> bool:
+        return not parent.isValid() and self._has_more and not self._fetching
+
+    def fetchMore(self, parent=QtCore.QModelIndex()) -> None:
+        if not self.canFetchMore(parent):
+            return
+        self._fetching = True
+        self.fetch_requested.emit(self.next_cursor())
+
+    # --- Selection ---
+
+    def checked_ids(self) -> List[str]:
+        return [doc["id"] for doc in self._docs if doc["id"] in self._checked]
+
+    # --- Qt model API ---
+
+    def rowCount(self, parent=QtCore.QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self._docs)
+
+    def columnCount(self, parent=QtCore.QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(_COLUMN_KEYS)
+
+    def data(self, index, role=QtCore.Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        doc = self._docs[index.row()]
+        key = _COLUMN_KEYS[index.column()]
+        if key is None:
+            if role == QtCore.Qt.CheckStateRole:
+                checked = doc["id"] in self._checked
+                return QtCore.Qt.Checked if checked else QtCore.Qt.Unchecked
+            return None
+        if role == QtCore.Qt.DisplayRole:
+            return str(doc.get(key) or "")
+        return None
+
+    def setData(self, index, value, role=QtCore.Qt.EditRole) -> bool:
+        if not index.isValid() or index.column() != 0:
+            return False
+        if role != QtCore.Qt.CheckStateRole:
+            return False
+        doc_id = self._docs[index.row()]["id"]
+        if value == QtCore.Qt.Checked:
+            self._checked.add(doc_id)
+        else:
+            self._checked.discard(doc_id)
+        self.dataChanged.emit(index, index, [QtCore.Qt.CheckStateRole])
+        return True
+
+    def flags(self, index):
+        if not index.isValid():
+            return QtCore.Qt.NoItemFlags
+        flags = QtCore.Qt.ItemIsEnabled | QtCore.Qt.ItemIsSelectable
+        if index.column() == 0:
+            flags |= QtCore.Qt.ItemIsUserCheckable
+        return flags
+
+    def headerData(self, section, orientation, role=QtCore.Qt.DisplayRole):
+        if orientation == QtCore.Qt.Horizontal and role == QtCore.Qt.DisplayRole:
+            return GUI_DELETE_TABLE_HEADERS[section]
+        return None
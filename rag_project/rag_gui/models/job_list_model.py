@@ -0,0 +1,106 @@
+from typing import List, Optional
+
+from PyQt5 import QtCore
+
+JOB_ROLE = QtCore.Qt.UserRole
+
+
+class JobListModel(QtCore.QAbstractListModel):
+    """Keyset-paged, checkable job postings for the chat view's job selector.
+
+    Works like DocumentTableModel: fetchMore() emits fetch_requested with the
+    (created_at, id) cursor of the last row and the owner calls append_page().
+    Checked ids survive reset() so a selection is kept across searches.
+    """
+
+    fetch_requested = QtCore.pyqtSignal(object)
+    selection_changed = QtCore.pyqtSignal(str, bool)
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._jobs: List[dict] = []
+        self._checked: set[str] = set()
+        self._has_more = False
+        self._fetching = False
+
+    # --- Paging ---
+
+    def reset(self, jobs: List[dict], has_more: bool) -> None:
+        self.beginResetModel()
+        self._jobs = list(jobs)
+        self._has_more = has_more
+        self._fetching = False
+        self.endResetModel()
+
+    def append_page(self, jobs: List[dict], has_more: bool) -> None:
+        self._fetching = False
+        self._has_more = has_more
+        if not jobs:
+            return
+        first = len(self._jobs)
+        self.beginInsertRows(QtCore.QModelIndex(), first, first + len(jobs) - 1)
+        self._jobs.extend(jobs)
+        self.endInsertRows()
+
+    def next_cursor(self) -> Optional[tuple]:
+        if not self._jobs:
+            return None
+        last = self._jobs[-1]
+        return last["created_at_value"], last["id"]
+
+    def canFetchMore(self, parent=QtCore.QModelIndex()) -> bool:
+        return not parent.isValid() and self._has_more and not self._fetching
+
+    def fetchMore(self, parent=QtCore.QModelIndex()) -> None:
+        if not self.canFetchMore(parent):
+            return
+        self._fetching = True
+        self.fetch_requested.emit(self.next_cursor())
+
+    # --- Selection ---
+
+    def checked_ids(self) -> List[str]:
+        return list(self._checked)
+
+    # --- Qt model API ---
+
+    def rowCount(self, parent=QtCore.QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self._jobs)
+
+    def data(self, index, role=QtCore.Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        job = self._jobs[index.row()]
+        if role == QtCore.Qt.DisplayRole:
+            meta = f"{job['location']} • {job['date']}" if job["date"] else ""
+            return "\n".join(filter(None, (job["title"], job["company"], meta)))
+        if role == QtCore.Qt.ToolTipRole:
+            return job["title"]
+        if role == QtCore.Qt.CheckStateRole:
+            checked = job["id"] in self._checked
+            return QtCore.Qt.Checked if checked else QtCore.Qt.Unchecked
+        if role == JOB_ROLE:
+            return job
+        return None
+
+    def setData(self, index, value, role=QtCore.Qt.EditRole) -> bool:
+        if not index.isValid() or role != QtCore.Qt.CheckStateRole:
+            return False
+        job_id = self._jobs[index.row()]["id"]
+        is_checked = value == QtCore.Qt.Checked
+        if is_checked:
+            self._checked.add(job_id)
+        else:
+            self._checked.discard(job_id)
+        self.dataChanged.emit(index, index, [QtCore.Qt.CheckStateRole])
+        self.selection_changed.emit(job_id, is_checked)
+        return True
+
+    def flags(self, index):
+        if not index.isValid():
+            return QtCore.Qt.NoItemFlags
+        return (
+            QtCore.Qt.ItemIsEnabled
+            | QtCore.Qt.ItemIsSelectable
+            | QtCore.Qt.ItemIsUserCheckable
+        )
@@ -305,34 +305,14 @@ class DarkTheme:
         }}
     """
 
-    JOB_CARD_STYLE = f"""
-        QFrame#JobCard {{
-            background-color: {COLOR_DARK_WIDGET};
-            border: 1px solid {COLOR_DARK_BORDER};
-            border-radius: {BORDER_RADIUS}px;
-        }}
-        QFrame#JobCard:hover {{
-            border: 1px solid {COLOR_DARK_ACCENT};
+    JOB_LIST_STYLE = f"""
+        QListView#JobList::item {{
+            padding: 6px;
+            border-bottom: 1px solid {COLOR_DARK_BORDER};
         }}
-        QFrame#JobCard[selected="true"] {{
-            background-color: {COLOR_DARK_WIDGET};
-            border: 1px solid {COLOR_DARK_ACCENT};
+        QListView#JobList::item:hover {{
             border-left: 4px solid {COLOR_DARK_ACCENT};
         }}
-        QLabel#JobTitle {{ font-weight: {FONT_WEIGHT_SEMIBOLD}; font-size: 13px; color: {COLOR_DARK_TEXT}; background-color: {COLOR_DARK_WIDGET}; }}
-        QLabel#JobCompany {{ font-size: 11px; color: {COLOR_DARK_MUTED}; background-color: {COLOR_DARK_WIDGET}; }}
-        QLabel#JobMeta {{ font-size: 10px; color: {COLOR_DARK_MUTED}; background-color: {COLOR_DARK_WIDGET}; }}
-        QCheckBox#JobCardCheckbox::indicator {{
-            width: 16px; 
-            height: 16px;
-            border-radius: {BORDER_RADIUS_SMALL}px;
-            border: 1px solid {COLOR_DARK_BORDER};
-            background-color: {COLOR_DARK_BG};
-        }}
-        QCheckBox#JobCardCheckbox::indicator:checked {{
-            background-color: {COLOR_DARK_ACCENT};
-            border-color: {COLOR_DARK_ACCENT};
-        }}
     """
 
     PANEL_STYLE = f"""
@@ -489,7 +469,7 @@ class DarkTheme:
             cls.HEADERVIEW_STYLE,
             cls.SCROLLBAR_STYLE,
             cls.CHECKBOX_STYLE,
-            cls.JOB_CARD_STYLE,
+            cls.JOB_LIST_STYLE,
             cls.PANEL_STYLE,
             cls.CHAT_STYLES,
             f"StatsCard {{ background-color: {COLOR_DARK_WIDGET}; color: {COLOR_CARD_TEXT_DARK}; border-radius: {BORDER_RADIUS}px; }}",
@@ -748,34 +728,14 @@ class LightTheme:
         }}
     """
 
-    JOB_CARD_STYLE = f"""
-        QFrame#JobCard {{
-            background-color: {COLOR_LIGHT_WIDGET};
-            border: 1px solid {COLOR_LIGHT_BORDER};
-            border-radius: {BORDER_RADIUS}px;
-        }}
-        QFrame#JobCard:hover {{
-            border: 1px solid {COLOR_LIGHT_ACCENT};
+    JOB_LIST_STYLE = f"""
+        QListView#JobList::item {{
+            padding: 6px;
+            border-bottom: 1px solid {COLOR_LIGHT_BORDER};
         }}
-        QFrame#JobCard[selected="true"] {{
-            background-color: #f0f9ff;
-            border: 1px solid {COLOR_LIGHT_ACCENT};
+        QListView#JobList::item:hover {{
             border-left: 4px solid {COLOR_LIGHT_ACCENT};
         }}
-        QLabel#JobTitle {{ font-weight: {FONT_WEIGHT_SEMIBOLD}; font-size: 13px; color: {COLOR_LIGHT_TEXT}; background-color: {COLOR_LIGHT_WIDGET}; }}
-        QLabel#JobCompany {{ font-size: 11px; color: {COLOR_LIGHT_MUTED}; background-color: {COLOR_LIGHT_WIDGET}; }}
-        QLabel#JobMeta {{ font-size: 10px; color: {COLOR_LIGHT_MUTED}; background-color: {COLOR_LIGHT_WIDGET}; }}
-        QCheckBox#JobCardCheckbox::indicator {{
-            width: 16px; 
-            height: 16px;
-            border-radius: {BORDER_RADIUS_SMALL}px;
-            border: 1px solid {COLOR_LIGHT_BORDER};
-            background-color: {COLOR_LIGHT_WIDGET};
-        }}
-        QCheckBox#JobCardCheckbox::indicator:checked {{
-            background-color: {COLOR_LIGHT_ACCENT};
-            border-color: {COLOR_LIGHT_ACCENT};
-        }}
     """
 
     PANEL_STYLE = f"""
@@ -933,7 +893,7 @@ class LightTheme:
             cls.HEADERVIEW_STYLE,
             cls.SCROLLBAR_STYLE,
             cls.CHECKBOX_STYLE,
-            cls.JOB_CARD_STYLE,
+            cls.JOB_LIST_STYLE,
             cls.PANEL_STYLE,
             cls.CHAT_STYLES,
             f"StatsCard {{ background-color: {COLOR_LIGHT_WIDGET}; color: {COLOR_CARD_TEXT_LIGHT}; border-radius: {BORDER_RADIUS}px; }}",
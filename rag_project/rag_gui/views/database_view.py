@@ -14,6 +14,7 @@ from rag_project.rag_gui.config import (
     GUI_REFRESH_LABEL,
     GUI_DB_STATUS_CHECKING,
     GUI_DB_ERROR_PREFIX,
+    GUI_DB_TYPE_SIZES_FORMAT,
 )
 from rag_project.rag_gui.widgets import StatsCard, StatusIndicator
 from rag_project.rag_gui.workers.database_worker import DatabaseOverviewWorker
@@ -122,10 +123,20 @@ class DatabaseView(QtWidgets.QWidget):
         doc_counts = results.get("doc_counts", {})
         chunk_counts = results.get("chunk_counts", {})
 
+        # Sizes are only reported by the trigger-maintained stats table
+        chunk_bytes = results.get("chunk_bytes")
+        embedding_bytes = results.get("embedding_bytes", {})
+
         for dt, label_widget in self.doc_type_stats.items():
             d_count = doc_counts.get(dt, 0)
             c_count = chunk_counts.get(dt, 0)
-            label_widget.setText(f"{d_count} docs / {c_count} chunks")
+            text = f"{d_count} docs / {c_count} chunks"
+            if chunk_bytes is not None:
+                text += GUI_DB_TYPE_SIZES_FORMAT.format(
+                    text_size=self._pretty_size(chunk_bytes.get(dt, 0)),
+                    embedding_size=self._pretty_size(embedding_bytes.get(dt, 0)),
+                )
+            label_widget.setText(text)
 
     def on_worker_error(self, error_msg: str):
         logger.error("DatabaseView worker error: %s", error_msg)
@@ -18,14 +18,17 @@ from rag_project.rag_gui.config import (
     GUI_REFRESH_LABEL,
     GUI_DELETE_LOAD_LABEL,
     GUI_DELETE_BUTTON_LABEL,
+    GUI_DELETE_TYPE_BUTTON_LABEL,
+    GUI_DELETE_TYPE_CONFIRM_TEXT,
     GUI_DELETE_FILTER_OPTIONS,
     GUI_DELETE_SELECTION_WARNING,
     GUI_DELETE_CONFIRM_TEXT,
     GUI_DELETE_FAIL_TITLE,
-    GUI_DELETE_TABLE_HEADERS,
 )
+from rag_project.rag_gui.models import DocumentTableModel
 from rag_project.rag_gui.widgets import StatsCard, StatusIndicator
 from rag_project.rag_gui.workers.database_worker import DataLoaderWorker, DeleteWorker
+from rag_project.rag_gui.workers.tracking import start_tracked
 from rag_project.logger import get_logger
 
 
@@ -39,11 +42,14 @@ class DeleteView(QtWidgets.QWidget):
         super().__init__(parent)
         self._repo = repo
         self._conn_settings = conn_settings
-        self._docs: List[dict] = []
+        self._model = DocumentTableModel(self)
+        self._model.fetch_requested.connect(self.load_next_page)
 
         # Keep references to workers to prevent garbage collection
-        self._load_worker = None
+        self._loaders: set = set()  # running DataLoaderWorkers
         self._delete_worker = None
+        # Bumped on every reload; pages requested under an older one are dropped.
+        self._load_generation = 0
 
         self._build_ui()
 
@@ -105,6 +111,11 @@ class DeleteView(QtWidgets.QWidget):
         self.delete_btn.setFixedSize(BUTTON_MIN_WIDTH, INPUT_HEIGHT)
         self.delete_btn.clicked.connect(self.confirm_and_delete)
 
+        self.delete_type_btn = QtWidgets.QPushButton(GUI_DELETE_TYPE_BUTTON_LABEL)
+        self.delete_type_btn.setFixedSize(BUTTON_MIN_WIDTH, INPUT_HEIGHT)
+        self.delete_type_btn.clicked.connect(self.confirm_and_delete_type)
+        self.delete_type_btn.setEnabled(False)  # enabled once a type is chosen
+
         filter_label = QtWidgets.QLabel("Filter")
         filter_label.setFont(QtGui.QFont(FONT_FAMILY, FONT_SIZE_LABEL))
 
@@ -113,29 +124,27 @@ class DeleteView(QtWidgets.QWidget):
             self.browse_type_combo, stretch=1, alignment=QtCore.Qt.AlignVCenter
         )
         filter_layout.addStretch()
+        filter_layout.addWidget(self.delete_type_btn, alignment=QtCore.Qt.AlignVCenter)
         filter_layout.addWidget(self.delete_btn, alignment=QtCore.Qt.AlignVCenter)
         layout.addLayout(filter_layout)
 
         layout.addSpacing(PADDING_SMALL)
 
         # --- Table ---
-        self.doc_table = QtWidgets.QTableWidget()
-        self.doc_table.setColumnCount(len(GUI_DELETE_TABLE_HEADERS))
-        self.doc_table.setHorizontalHeaderLabels(GUI_DELETE_TABLE_HEADERS)
+        # Model/view: rows are paged in from the DB as the table scrolls.
+        self.doc_table = QtWidgets.QTableView()
+        self.doc_table.setModel(self._model)
         self.doc_table.verticalHeader().setVisible(False)  # Hide row numbers
         self.doc_table.verticalHeader().setDefaultSectionSize(TABLE_ROW_HEIGHT)
 
-        # Header Resizing
+        # Header Resizing (fixed modes; ResizeToContents would measure every row)
         h_header = self.doc_table.horizontalHeader()
-        h_header.setSectionResizeMode(
-            0, QtWidgets.QHeaderView.ResizeToContents
-        )  # Checkbox
+        h_header.setSectionResizeMode(0, QtWidgets.QHeaderView.Fixed)  # Checkbox
         h_header.setSectionResizeMode(1, QtWidgets.QHeaderView.Interactive)  # ID
-        h_header.setSectionResizeMode(2, QtWidgets.QHeaderView.ResizeToContents)  # Type
-        h_header.setSectionResizeMode(
-            3, QtWidgets.QHeaderView.ResizeToContents
-        )  # Created
+        h_header.setSectionResizeMode(2, QtWidgets.QHeaderView.Interactive)  # Type
+        h_header.setSectionResizeMode(3, QtWidgets.QHeaderView.Interactive)  # Created
         h_header.setSectionResizeMode(4, QtWidgets.QHeaderView.Stretch)  # Label
+        self.doc_table.setColumnWidth(0, TABLE_ROW_HEIGHT)
         self.doc_table.setColumnWidth(1, TABLE_COLUMN_ID_WIDTH)
 
         self.doc_table.setSelectionBehavior(QtWidgets.QAbstractItemView.SelectRows)
@@ -150,6 +159,10 @@ class DeleteView(QtWidgets.QWidget):
         """Toggle UI state during async operations."""
         self.refresh_btn.setEnabled(not is_loading)
         self.delete_btn.setEnabled(not is_loading)
+        self.delete_type_btn.setEnabled(
+            not is_loading
+            and self.browse_type_combo.currentText() not in GUI_DELETE_FILTER_OPTIONS
+        )
         self.browse_type_combo.setEnabled(not is_loading)
         self.doc_table.setEnabled(not is_loading)
 
@@ -168,14 +181,48 @@ class DeleteView(QtWidgets.QWidget):
         # Store silent flag for error handler
         self._silent_error = silent
 
-        # Initialize Worker
-        self._load_worker = DataLoaderWorker(self._conn_settings, filter_val)
-        self._load_worker.finished.connect(self.on_data_loaded)
-        self._load_worker.error.connect(self.on_worker_error)
-        self._load_worker.start()
-
-    def on_data_loaded(self, stats: dict, docs: list):
+        # Initialize Worker (stats + first page)
+        self._load_generation += 1
+        generation = self._load_generation
+        worker = DataLoaderWorker(self._conn_settings, filter_val)
+        worker.finished.connect(
+            lambda stats, docs, has_more: self.on_data_loaded(
+                stats, docs, has_more, generation
+            )
+        )
+        worker.error.connect(self.on_worker_error)
+        start_tracked(worker, self._loaders)
+
+    def load_next_page(self, cursor: tuple):
+        """Fetch the page after cursor when the table scrolls to the end."""
+        logger.info("DeleteView loading next page after=%s", cursor)
+        generation = self._load_generation
+        worker = DataLoaderWorker(
+            self._conn_settings,
+            self.browse_type_combo.currentText(),
+            after=cursor,
+            include_stats=False,
+        )
+        worker.finished.connect(
+            lambda _stats, docs, has_more: self.on_page_loaded(
+                docs, has_more, generation
+            )
+        )
+        worker.error.connect(self.on_worker_error)
+        start_tracked(worker, self._loaders)
+
+    def on_page_loaded(self, docs: list, has_more: bool, generation: int = 0):
+        if generation != self._load_generation:
+            return  # Requested before the filter changed or the table reloaded
+        logger.info("DeleteView page loaded docs=%d more=%s", len(docs), has_more)
+        self._model.append_page(docs, has_more)
+
+    def on_data_loaded(
+        self, stats: dict, docs: list, has_more: bool, generation: int = 0
+    ):
         """Callback when data is fetched successfully."""
+        if generation != self._load_generation:
+            return  # Superseded by a newer reload
         logger.info("DeleteView data loaded docs=%d", len(docs))
         self.set_loading(False)
         self.db_indicator.set_status(True)
@@ -187,8 +234,7 @@ class DeleteView(QtWidgets.QWidget):
         self.used_card.update_value(stats.get("embeds", "0"))
 
         # Update Table
-        self._docs = docs
-        self._populate_table(docs)
+        self._model.reset(docs, has_more)
 
     def on_worker_error(self, error_msg: str):
         """Callback for any worker failure."""
@@ -208,44 +254,9 @@ class DeleteView(QtWidgets.QWidget):
                 self, "Database Error", f"An error occurred:\n{error_msg}"
             )
 
-    def _populate_table(self, docs: List[dict]):
-        """Fill table, handling the empty state correctly."""
-        self.doc_table.setRowCount(len(docs))
-
-        for row, doc in enumerate(docs):
-            # Checkbox
-            checkbox_item = QtWidgets.QTableWidgetItem()
-            checkbox_item.setFlags(
-                QtCore.Qt.ItemIsUserCheckable | QtCore.Qt.ItemIsEnabled
-            )
-            checkbox_item.setCheckState(QtCore.Qt.Unchecked)
-            self.doc_table.setItem(row, 0, checkbox_item)
-
-            # Data items (Read only)
-            id_item = QtWidgets.QTableWidgetItem(doc["id"])
-            id_item.setFlags(id_item.flags() ^ QtCore.Qt.ItemIsEditable)
-            self.doc_table.setItem(row, 1, id_item)
-
-            type_item = QtWidgets.QTableWidgetItem(doc["doc_type"])
-            type_item.setFlags(type_item.flags() ^ QtCore.Qt.ItemIsEditable)
-            self.doc_table.setItem(row, 2, type_item)
-
-            date_item = QtWidgets.QTableWidgetItem(str(doc["created_at"]))
-            date_item.setFlags(date_item.flags() ^ QtCore.Qt.ItemIsEditable)
-            self.doc_table.setItem(row, 3, date_item)
-
-            label_item = QtWidgets.QTableWidgetItem(doc["label"])
-            label_item.setFlags(label_item.flags() ^ QtCore.Qt.ItemIsEditable)
-            self.doc_table.setItem(row, 4, label_item)
-
     def confirm_and_delete(self):
         """Validate selection and show confirmation dialog."""
-        doc_ids = []
-        for row in range(self.doc_table.rowCount()):
-            item = self.doc_table.item(row, 0)
-            if item and item.checkState() == QtCore.Qt.Checked:
-                doc_id = self.doc_table.item(row, 1).text()
-                doc_ids.append(doc_id)
+        doc_ids = self._model.checked_ids()
 
         if not doc_ids:
             QtWidgets.QMessageBox.information(
@@ -267,15 +278,32 @@ class DeleteView(QtWidgets.QWidget):
         if reply == QtWidgets.QMessageBox.Yes:
             self.start_delete_process(doc_ids)
 
-    def start_delete_process(self, doc_ids: List[str]):
+    def confirm_and_delete_type(self):
+        """Delete every document of the selected type with one set-based DELETE."""
+        doc_type = self.browse_type_combo.currentText()
+        if doc_type in GUI_DELETE_FILTER_OPTIONS:
+            return
+        reply = QtWidgets.QMessageBox.question(
+            self,
+            GUI_DELETE_TYPE_CONFIRM_TEXT["title"],
+            GUI_DELETE_TYPE_CONFIRM_TEXT["template"].format(doc_type=doc_type),
+            QtWidgets.QMessageBox.Yes | QtWidgets.QMessageBox.No,
+            QtWidgets.QMessageBox.No,
+        )
+        if reply == QtWidgets.QMessageBox.Yes:
+            logger.info("DeleteView delete by type requested doc_type=%s", doc_type)
+            self.start_delete_process([], filters={"doc_type": doc_type})
+
+    def start_delete_process(self, doc_ids: List[str], filters: dict | None = None):
         """Start background delete worker."""
         logger.info("DeleteView starting delete worker count=%d", len(doc_ids))
-        self.set_loading(True, f"Deleting {len(doc_ids)} items...")
+        label = f"Deleting {len(doc_ids)} items..." if doc_ids else "Deleting..."
+        self.set_loading(True, label)
 
         # Deletion is never silent, we always want feedback
         self._silent_error = False
 
-        self._delete_worker = DeleteWorker(self._repo, doc_ids)
+        self._delete_worker = DeleteWorker(self._repo, doc_ids, filters=filters)
         self._delete_worker.finished.connect(self.on_delete_finished)
         self._delete_worker.error.connect(self.on_worker_error)
         self._delete_worker.start()
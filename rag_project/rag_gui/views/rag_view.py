@@ -19,6 +19,8 @@ from rag_project.rag_gui.config import (
     GUI_RAG_JOBLIST_LABEL,
     GUI_LOADING_JOBS_TEXT,
     GUI_NO_JOBS_TEXT,
+    GUI_JOB_SEARCH_PLACEHOLDER,
+    GUI_JOB_SEARCH_DEBOUNCE_MS,
     GUI_JOB_LOAD_ERROR_PREFIX,
     GUI_NO_CONTEXT_TEXT,
     GUI_CONTEXT_TOGGLE_LABEL,
@@ -48,7 +50,8 @@ from rag_project.config import (
 from rag_project.rag_gui.workers import JobMatchingWorker
 from rag_project.rag_gui.styles.theme import DarkTheme, LightTheme
 from rag_project.rag_gui.workers.rag_worker import JobLoaderWorker
-from rag_project.rag_gui.widgets.rag.job_card import JobCard
+from rag_project.rag_gui.workers.tracking import start_tracked
+from rag_project.rag_gui.models import JobListModel
 from rag_project.rag_gui.widgets.rag.chat_area import ChatArea
 from rag_project.rag_gui.widgets.rag.context_card import ContextCard
 from rag_project.rag_gui.widgets import StatusIndicator
@@ -68,9 +71,10 @@ class RAGView(QtWidgets.QWidget):
         self._app = app
         self._conn_settings = conn_settings
 
-        self._jobs: List[dict] = []
+        self._jobs_loaded = False
+        self._job_search = ""
         self._selected_job_ids: set = set()
-        self._worker = None
+        self._job_loaders: set = set()  # running JobLoaderWorkers
         self._job_worker = None
         self._retrieval_worker = None
         self._router_worker = None
@@ -120,26 +124,37 @@ class RAGView(QtWidgets.QWidget):
         title.setFont(QtGui.QFont(FONT_FAMILY, FONT_SIZE_TITLE, QtGui.QFont.DemiBold))
         left_layout.addWidget(title)
 
+        # Search (debounced; filtering happens server-side)
+        self.job_search_input = QtWidgets.QLineEdit()
+        self.job_search_input.setPlaceholderText(GUI_JOB_SEARCH_PLACEHOLDER)
+        self.job_search_input.setClearButtonEnabled(True)
+        left_layout.addWidget(self.job_search_input)
+
+        self._search_timer = QtCore.QTimer(self)
+        self._search_timer.setSingleShot(True)
+        self._search_timer.setInterval(GUI_JOB_SEARCH_DEBOUNCE_MS)
+        self._search_timer.timeout.connect(self.load_jobs)
+        self.job_search_input.textChanged.connect(self._search_timer.start)
+
         # Loading Indicator (Hidden by default)
         self.loading_label = QtWidgets.QLabel(GUI_LOADING_JOBS_TEXT)
         self.loading_label.setAlignment(QtCore.Qt.AlignCenter)
         self.loading_label.setVisible(False)
         left_layout.addWidget(self.loading_label)
 
-        # Scroll Area for Cards
-        self.job_scroll = QtWidgets.QScrollArea()
-        self.job_scroll.setWidgetResizable(True)
-        self.job_scroll.setFrameShape(QtWidgets.QFrame.NoFrame)
-        self.job_scroll.setHorizontalScrollBarPolicy(QtCore.Qt.ScrollBarAlwaysOff)
+        # Virtualized job list; further pages load as it scrolls
+        self._job_model = JobListModel(self)
+        self._job_model.fetch_requested.connect(self.load_next_job_page)
+        self._job_model.selection_changed.connect(self.on_job_selection_change)
 
-        self.job_container = QtWidgets.QWidget()
-        self.job_card_layout = QtWidgets.QVBoxLayout(self.job_container)
-        self.job_card_layout.setContentsMargins(0, 0, 0, 0)
-        self.job_card_layout.setSpacing(PADDING_SMALL)
-        self.job_card_layout.addStretch()  # Push items up
-
-        self.job_scroll.setWidget(self.job_container)
-        left_layout.addWidget(self.job_scroll)
+        self.job_list = QtWidgets.QListView()
+        self.job_list.setObjectName("JobList")
+        self.job_list.setModel(self._job_model)
+        self.job_list.setUniformItemSizes(True)
+        self.job_list.setWordWrap(True)
+        self.job_list.setFrameShape(QtWidgets.QFrame.NoFrame)
+        self.job_list.setHorizontalScrollBarPolicy(QtCore.Qt.ScrollBarAlwaysOff)
+        left_layout.addWidget(self.job_list)
 
         # ==========================
         # COL 2: Chat Area
@@ -204,8 +219,8 @@ class RAGView(QtWidgets.QWidget):
 
     def refresh_data(self):
         """Called by Main Window. Starts background loader."""
-        # Only load if empty to prevent flickering, or force refresh if needed
-        if not self._jobs:
+        # Only load once to prevent flickering; searching reloads on its own
+        if not self._jobs_loaded:
             self.load_jobs()
         self.refresh_status()
 
@@ -341,43 +356,52 @@ class RAGView(QtWidgets.QWidget):
         self._router_worker = None
 
     def load_jobs(self):
-        logger.info("RAGView loading jobs")
+        """Load the first page for the current search text."""
+        self._job_search = self.job_search_input.text().strip()
+        logger.info("RAGView loading jobs search=%r", self._job_search)
+        self.loading_label.setText(GUI_LOADING_JOBS_TEXT)
+        self.loading_label.setStyleSheet("")
         self.loading_label.setVisible(True)
-        self.job_scroll.setVisible(False)
-
-        self._worker = JobLoaderWorker(self._conn_settings)
-        self._worker.finished.connect(self.on_jobs_loaded)
-        self._worker.error.connect(self.on_worker_error)
-        self._worker.start()
-
-    def on_jobs_loaded(self, jobs: list):
-        logger.info("RAGView jobs loaded count=%d", len(jobs))
-        self.loading_label.setVisible(False)
-        self.job_scroll.setVisible(True)
-        self._jobs = jobs
-
-        # Clear existing cards (except the stretch item)
-        while self.job_card_layout.count() > 1:
-            item = self.job_card_layout.takeAt(0)
-            if item.widget():
-                item.widget().deleteLater()
 
-        if not jobs:
-            lbl = QtWidgets.QLabel(GUI_NO_JOBS_TEXT)
-            lbl.setAlignment(QtCore.Qt.AlignCenter)
-            self.job_card_layout.insertWidget(0, lbl)
+        search = self._job_search
+        worker = JobLoaderWorker(self._conn_settings, search=search)
+        worker.finished.connect(
+            lambda jobs, has_more: self.on_jobs_loaded(jobs, has_more, search)
+        )
+        worker.error.connect(self.on_worker_error)
+        start_tracked(worker, self._job_loaders)
+
+    def load_next_job_page(self, cursor: tuple):
+        """Fetch the page after cursor when the list scrolls to the end."""
+        search = self._job_search
+        logger.info("RAGView loading next job page after=%s", cursor)
+        worker = JobLoaderWorker(self._conn_settings, search=search, after=cursor)
+        worker.finished.connect(
+            lambda jobs, has_more: self.on_job_page_loaded(jobs, has_more, search)
+        )
+        worker.error.connect(self.on_worker_error)
+        start_tracked(worker, self._job_loaders)
+
+    def on_jobs_loaded(self, jobs: list, has_more: bool = False, search: str = ""):
+        if search != self._job_search:
+            return  # Superseded by a newer search
+        logger.info("RAGView jobs loaded count=%d more=%s", len(jobs), has_more)
+        self._jobs_loaded = True
+        self._job_model.reset(jobs, has_more)
+        self.loading_label.setText(GUI_NO_JOBS_TEXT)
+        self.loading_label.setVisible(not jobs)
+
+    def on_job_page_loaded(self, jobs: list, has_more: bool, search: str = ""):
+        if search != self._job_search:
             return
-
-        # Create Cards
-        for job in jobs:
-            card = JobCard(job)
-            card.selection_changed.connect(self.on_job_selection_change)
-            self.job_card_layout.insertWidget(self.job_card_layout.count() - 1, card)
+        logger.info("RAGView job page loaded count=%d more=%s", len(jobs), has_more)
+        self._job_model.append_page(jobs, has_more)
 
     def on_worker_error(self, err: str):
         logger.error("RAGView job load error: %s", err)
         self.loading_label.setText(f"{GUI_JOB_LOAD_ERROR_PREFIX}{err}")
         self.loading_label.setStyleSheet("color: red;")
+        self.loading_label.setVisible(True)
 
     # --- Job Matching ---
     def run_job_matching(self, question: str):
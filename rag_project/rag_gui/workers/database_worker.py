@@ -8,10 +8,16 @@ from rag_project.rag_gui.config import (
     GUI_DB_SIZE_QUERY,
     GUI_DOC_COUNT_QUERY,
     GUI_CHUNK_COUNT_QUERY,
+    GUI_DOC_TYPE_STATS_AVAILABLE_QUERY,
+    GUI_DOC_TYPE_STATS_QUERY,
     GUI_DELETE_STATS_QUERIES,
-    GUI_DOC_LIST_QUERY_BASE,
+    GUI_DELETE_STATS_TABLES,
+    GUI_APPROX_COUNT_QUERY,
     GUI_DELETE_FILTER_OPTIONS,
-    GUI_DOC_LIST_FILTER_QUERY,
+    GUI_DELETE_PAGE_SIZE,
+    GUI_DOC_PAGE_QUERY,
+    GUI_DOC_PAGE_TYPE_FILTER,
+    GUI_DOC_PAGE_AFTER_FILTER,
 )
 from rag_project.logger import get_logger
 
@@ -50,11 +56,11 @@ class DatabaseOverviewWorker(QThread):
                     cur.execute(GUI_DB_SIZE_QUERY)
                     results["db_size"] = cur.fetchone()[0]
 
-                    cur.execute(GUI_DOC_COUNT_QUERY)
-                    results["doc_counts"] = {row[0]: row[1] for row in cur.fetchall()}
-
-                    cur.execute(GUI_CHUNK_COUNT_QUERY)
-                    results["chunk_counts"] = {row[0]: row[1] for row in cur.fetchall()}
+                    cur.execute(GUI_DOC_TYPE_STATS_AVAILABLE_QUERY)
+                    if cur.fetchone()[0]:
+                        results.update(self._type_stats(cur))
+                    else:
+                        results.update(self._counted_stats(cur))
 
             self.finished.emit(results)
             logger.info("DatabaseOverviewWorker completed")
@@ -62,91 +68,144 @@ class DatabaseOverviewWorker(QThread):
             logger.error("DatabaseOverviewWorker failed: %s", e, exc_info=True)
             self.error.emit(str(e))
 
+    @staticmethod
+    def _type_stats(cur) -> dict:
+        """Read the trigger-maintained per-type totals (one row per doc_type)."""
+        cur.execute(GUI_DOC_TYPE_STATS_QUERY)
+        rows = cur.fetchall()
+        return {
+            "doc_counts": {r[0]: r[1] for r in rows},
+            "chunk_counts": {r[0]: r[2] for r in rows},
+            "embedding_counts": {r[0]: r[3] for r in rows},
+            "chunk_bytes": {r[0]: r[4] for r in rows},
+            "embedding_bytes": {r[0]: r[5] for r in rows},
+        }
+
+    @staticmethod
+    def _counted_stats(cur) -> dict:
+        """Count documents and chunks directly (schemas without doc_type_stats)."""
+        cur.execute(GUI_DOC_COUNT_QUERY)
+        doc_counts = {row[0]: row[1] for row in cur.fetchall()}
+        cur.execute(GUI_CHUNK_COUNT_QUERY)
+        chunk_counts = {row[0]: row[1] for row in cur.fetchall()}
+        return {"doc_counts": doc_counts, "chunk_counts": chunk_counts}
+
 
 # ==========================================
 # CLASS 2: Used by DeleteView (Loads Data)
 # ==========================================
 class DataLoaderWorker(QThread):
-    """Worker thread to fetch statistics and document list."""
+    """Worker thread to fetch one keyset page of documents (and optionally stats).
+
+    finished emits (stats, docs, has_more); stats is empty when include_stats is False.
+    """
 
-    finished = pyqtSignal(dict, list)
+    finished = pyqtSignal(dict, list, bool)
     error = pyqtSignal(str)
 
-    def __init__(self, connection_settings: dict, filter_type: str):
+    def __init__(
+        self,
+        connection_settings: dict,
+        filter_type: str,
+        after: tuple | None = None,
+        include_stats: bool = True,
+        page_size: int = GUI_DELETE_PAGE_SIZE,
+    ):
         super().__init__()
         self.conn_settings = connection_settings
         self.filter_type = filter_type
+        self.after = after
+        self.include_stats = include_stats
+        self.page_size = page_size
 
     def run(self):
         try:
-            logger.info("DataLoaderWorker loading docs filter=%s", self.filter_type)
+            logger.info(
+                "DataLoaderWorker loading page filter=%s after=%s",
+                self.filter_type,
+                self.after,
+            )
             stats = {}
-            docs = []
 
             with psycopg.connect(
                 connect_timeout=GUI_DB_OVERVIEW_TIMEOUT, **self.conn_settings
             ) as conn:
                 register_vector(conn)
                 with conn.cursor() as cur:
-                    # Stats
-                    cur.execute(GUI_DELETE_STATS_QUERIES["docs"])
-                    stats["docs"] = str(cur.fetchone()[0])
-                    cur.execute(GUI_DELETE_STATS_QUERIES["chunks"])
-                    stats["chunks"] = str(cur.fetchone()[0])
-                    cur.execute(GUI_DELETE_STATS_QUERIES["embeds"])
-                    stats["embeds"] = str(cur.fetchone()[0])
-
-                    # Documents List
-                    query_base = GUI_DOC_LIST_QUERY_BASE
-
-                    if self.filter_type in GUI_DELETE_FILTER_OPTIONS:
-                        query = query_base + " ORDER BY d.created_at DESC"
-                        cur.execute(query)
-                    else:
-                        query = query_base + f" {GUI_DOC_LIST_FILTER_QUERY}"
-                        cur.execute(query, (self.filter_type,))
-
+                    if self.include_stats:
+                        stats = self._approx_counts(cur)
+                    query, params = self._page_query()
+                    cur.execute(query, params)
                     rows = cur.fetchall()
-                    docs = [
-                        {
-                            "id": str(r[0]),
-                            "doc_type": r[1],
-                            "created_at": (
-                                r[2].strftime("%Y-%m-%d %H:%M:%S") if r[2] else ""
-                            ),
-                            "label": r[3] or "",
-                        }
-                        for r in rows
-                    ]
-
-            self.finished.emit(stats, docs)
-            logger.info("DataLoaderWorker loaded %d docs", len(docs))
+
+            has_more = len(rows) > self.page_size
+            docs = [
+                {
+                    "id": str(r[0]),
+                    "doc_type": r[1],
+                    "created_at": (r[2].strftime("%Y-%m-%d %H:%M:%S") if r[2] else ""),
+                    "created_at_value": r[2],
+                    "label": r[3] or "",
+                }
+                for r in rows[: self.page_size]
+            ]
+            self.finished.emit(stats, docs, has_more)
+            logger.info("DataLoaderWorker loaded %d docs more=%s", len(docs), has_more)
         except Exception as e:
             logger.error("DataLoaderWorker failed: %s", e, exc_info=True)
             self.error.emit(str(e))
 
+    def _page_query(self) -> tuple[str, list]:
+        clauses: list[str] = []
+        params: list = []
+        if self.filter_type not in GUI_DELETE_FILTER_OPTIONS:
+            clauses.append(GUI_DOC_PAGE_TYPE_FILTER)
+            params.append(self.filter_type)
+        if self.after is not None:
+            clauses.append(GUI_DOC_PAGE_AFTER_FILTER)
+            params.extend(self.after)
+        where_sql = " AND ".join(clauses) or "TRUE"
+        # One extra row tells whether another page exists.
+        params.append(self.page_size + 1)
+        return GUI_DOC_PAGE_QUERY.format(where_sql=where_sql), params
+
+    @staticmethod
+    def _approx_counts(cur) -> dict:
+        cur.execute(GUI_APPROX_COUNT_QUERY, (list(GUI_DELETE_STATS_TABLES.values()),))
+        estimates = dict(cur.fetchall())
+        stats = {}
+        for key, table in GUI_DELETE_STATS_TABLES.items():
+            estimate = estimates.get(table, -1)
+            if estimate < 0:
+                cur.execute(GUI_DELETE_STATS_QUERIES[key])
+                estimate = cur.fetchone()[0]
+            stats[key] = str(estimate)
+        return stats
+
 
 # ==========================================
 # CLASS 3: Used by DeleteView (Deletes Data)
 # ==========================================
 class DeleteWorker(QThread):
-    """Worker thread to delete documents."""
+    """Worker thread to delete documents, by id list or by filter, in one statement."""
 
     finished = pyqtSignal(int)
     error = pyqtSignal(str)
 
-    def __init__(self, repo, doc_ids: list):
+    def __init__(self, repo, doc_ids: list | None = None, filters: dict | None = None):
         super().__init__()
         self.repo = repo
-        self.doc_ids = doc_ids
+        self.doc_ids = doc_ids or []
+        self.filters = filters
 
     def run(self):
         try:
-            logger.info("DeleteWorker deleting %d documents", len(self.doc_ids))
-            count = 0
-            for doc_id in self.doc_ids:
-                self.repo.delete_document(doc_id)
-                count += 1
+            if self.filters:
+                logger.info("DeleteWorker deleting by filter %s", self.filters)
+                count = self.repo.delete_documents_by_filter(**self.filters)
+            else:
+                logger.info("DeleteWorker deleting %d documents", len(self.doc_ids))
+                count = self.repo.delete_documents(self.doc_ids)
             self.finished.emit(count)
             logger.info("DeleteWorker deleted %d documents", count)
         except Exception as e:
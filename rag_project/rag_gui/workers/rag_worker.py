@@ -5,6 +5,9 @@ from pgvector.psycopg import register_vector
 from rag_project.rag_gui.config import (
     GUI_JOBLOADER_DB_TIMEOUT,
     GUI_JOBLOADER_QUERY,
+    GUI_JOB_SEARCH_FILTER,
+    GUI_JOB_AFTER_FILTER,
+    GUI_JOB_PAGE_SIZE,
     GUI_JOB_FALLBACK_LABELS,
     GUI_CHAT_SIMULATED_DELAY,
     GUI_CHAT_FAKE_ANSWER,
@@ -16,46 +19,83 @@ from rag_project.logger import get_logger
 logger = get_logger(__name__)
 
 
-# ... (Keep JobLoaderWorker exactly as it was) ...
 class JobLoaderWorker(QtCore.QThread):
-    # ... (No changes here, keep existing code) ...
-    finished = QtCore.pyqtSignal(list)
+    """Fetch one keyset page of job postings, optionally filtered by title/company.
+
+    finished emits (jobs, has_more).
+    """
+
+    finished = QtCore.pyqtSignal(list, bool)
     error = QtCore.pyqtSignal(str)
 
-    def __init__(self, connection_settings: dict):
+    def __init__(
+        self,
+        connection_settings: dict,
+        search: str = "",
+        after: tuple | None = None,
+        page_size: int = GUI_JOB_PAGE_SIZE,
+    ):
         super().__init__()
         self.conn_settings = connection_settings
+        self.search = search.strip()
+        self.after = after
+        self.page_size = page_size
 
     def run(self):
         try:
-            logger.info("JobLoaderWorker connecting to DB")
-            jobs = []
+            logger.info(
+                "JobLoaderWorker loading page search=%r after=%s",
+                self.search,
+                self.after,
+            )
+            query, params = self._page_query()
             with psycopg.connect(
                 connect_timeout=GUI_JOBLOADER_DB_TIMEOUT, **self.conn_settings
             ) as conn:
                 register_vector(conn)
                 with conn.cursor() as cur:
-                    cur.execute(GUI_JOBLOADER_QUERY)
+                    cur.execute(query, params)
                     rows = cur.fetchall()
 
-                    for r in rows:
-                        jobs.append(
-                            {
-                                "id": str(r[0]),
-                                "title": r[1] or GUI_JOB_FALLBACK_LABELS["title"],
-                                "company": r[2] or GUI_JOB_FALLBACK_LABELS["company"],
-                                "location": r[3] or GUI_JOB_FALLBACK_LABELS["location"],
-                                "date": r[4].strftime("%Y-%m-%d") if r[4] else "",
-                            }
-                        )
-
-            self.finished.emit(jobs)
-            logger.info("JobLoaderWorker fetched %d jobs", len(jobs))
+            has_more = len(rows) > self.page_size
+            jobs = [
+                {
+                    "id": str(r[0]),
+                    "title": r[1] or GUI_JOB_FALLBACK_LABELS["title"],
+                    "company": r[2] or GUI_JOB_FALLBACK_LABELS["company"],
+                    "location": r[3] or GUI_JOB_FALLBACK_LABELS["location"],
+                    "date": r[4].strftime("%Y-%m-%d") if r[4] else "",
+                    "created_at_value": r[4],
+                }
+                for r in rows[: self.page_size]
+            ]
+            self.finished.emit(jobs, has_more)
+            logger.info("JobLoaderWorker fetched %d jobs more=%s", len(jobs), has_more)
 
         except Exception as e:
             logger.error("JobLoaderWorker failed: %s", e, exc_info=True)
             self.error.emit(str(e))
 
+    def _page_query(self) -> tuple[str, list]:
+        clauses: list[str] = []
+        params: list = []
+        if self.search:
+            pattern = f"%{_escape_like(self.search)}%"
+            clauses.append(GUI_JOB_SEARCH_FILTER)
+            params.extend([pattern, pattern])
+        if self.after is not None:
+            clauses.append(GUI_JOB_AFTER_FILTER)
+            params.extend(self.after)
+        where_sql = " AND ".join(clauses) or "TRUE"
+        # One extra row tells whether another page exists.
+        params.append(self.page_size + 1)
+        return GUI_JOBLOADER_QUERY.format(where_sql=where_sql), params
+
+
+def _escape_like(text: str) -> str:
+    """Match %, _ and \\ in user input literally."""
+    return text.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+
 
 # --- WORKER 2: Handles the Chat (MOCK VERSION) ---
 class RAGQueryWorker(QtCore.QThread):
@@ -0,0 +1,19 @@
+from PyQt5 import QtCore
+
+
+def start_tracked(worker: QtCore.QThread, running: set) -> None:
+    """Start worker and keep it in running until its thread has stopped.
+
+    Views replace loaders while an older one may still run (a newer search, a
+    filter change); dropping the last reference to a running QThread destroys it
+    mid-run. Workers shadow QThread.finished with their result signal, so the
+    thread's own finished signal is bound explicitly.
+    """
+    running.add(worker)
+
+    def _release():
+        running.discard(worker)
+        worker.deleteLater()
+
+    QtCore.QThread.finished.__get__(worker, type(worker)).connect(_release)
+    worker.start()
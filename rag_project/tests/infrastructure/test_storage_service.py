@@ -202,3 +202,88 @@ def test_storage_schema_creation_allows_inserts():
     doc = Document(id=uuid4(), doc_type=SUPPORTED_DOC_TYPES[0])
     repo.insert_document(doc)
     repo.delete_document(doc.id)
+
+
+def test_storage_delete_documents_removes_batch_and_cascades():
+    if not _db_available():
+        pytest.skip("Database not reachable")
+    repo = _repo()
+    docs = [Document(id=uuid4(), doc_type=SUPPORTED_DOC_TYPES[0]) for _ in range(3)]
+    chunks = []
+    for doc in docs:
+        repo.insert_document(doc)
+        chunks.append(Chunk(id=uuid4(), document_id=doc.id, chunk_index=0, content="x"))
+    repo.insert_chunks_with_embeddings(chunks, [_vector(0.3)] * len(chunks))
+
+    deleted = repo.delete_documents([str(docs[0].id), str(docs[1].id)])
+
+    assert deleted == 2
+    with psycopg.connect(_dsn(), connect_timeout=30) as conn, conn.cursor() as cur:
+        cur.execute(
+            "SELECT COUNT(*) FROM embeddings WHERE chunk_id = ANY(%s)",
+            ([c.id for c in chunks],),
+        )
+        assert cur.fetchone()[0] == 1
+    repo.delete_document(docs[2].id)
+
+
+def test_storage_delete_documents_by_filter_matches_company_and_type():
+    if not _db_available():
+        pytest.skip("Database not reachable")
+    repo = _repo()
+    stale = Document(id=uuid4(), doc_type=SUPPORTED_DOC_TYPES[0])
+    kept = Document(id=uuid4(), doc_type=SUPPORTED_DOC_TYPES[0])
+    for doc, company in ((stale, "Stale Corp"), (kept, "Other GmbH")):
+        repo.insert_document(doc)
+        repo.insert_job_posting(JobPosting(document_id=doc.id, company=company))
+
+    deleted = repo.delete_documents_by_filter(
+        doc_type=SUPPORTED_DOC_TYPES[0], company="stale"
+    )
+
+    assert deleted == 1
+    with psycopg.connect(_dsn(), connect_timeout=30) as conn, conn.cursor() as cur:
+        cur.execute(
+            "SELECT id FROM documents WHERE id = ANY(%s)", ([stale.id, kept.id],)
+        )
+        assert [row[0] for row in cur.fetchall()] == [kept.id]
+    repo.delete_document(kept.id)
+
+
+def test_storage_delete_by_filter_requires_a_filter():
+    with pytest.raises(ValueError):
+        _repo().delete_documents_by_filter()
+
+
+def _type_stats(doc_type: str):
+    with psycopg.connect(_dsn(), connect_timeout=30) as conn, conn.cursor() as cur:
+        cur.execute(
+            "SELECT doc_count, chunk_count, embedding_count, embedding_bytes > 0 "
+            "FROM doc_type_stats WHERE doc_type = %s",
+            (doc_type,),
+        )
+        return cur.fetchone() or (0, 0, 0, False)
+
+
+def test_storage_doc_type_stats_follow_inserts_and_cascading_deletes():
+    if not _db_available():
+        pytest.skip("Database not reachable")
+    _clear_tables()
+    repo = _repo()
+    doc_type = SUPPORTED_DOC_TYPES[0]
+    doc = Document(id=uuid4(), doc_type=doc_type)
+    repo.insert_document(doc)
+    chunks = [
+        Chunk(id=uuid4(), document_id=doc.id, chunk_index=i, content=f"c{i}")
+        for i in range(2)
+    ]
+    repo.insert_chunks_with_embeddings(chunks, [_vector(0.2)] * 2)
+
+    assert _type_stats(doc_type) == (1, 2, 2, True)
+
+    with psycopg.connect(_dsn(), connect_timeout=30) as conn, conn.cursor() as cur:
+        cur.execute("DELETE FROM chunks WHERE id = %s", (chunks[0].id,))
+    assert _type_stats(doc_type) == (1, 1, 1, True)
+
+    repo.delete_document(doc.id)
+    assert _type_stats(doc_type) == (0, 0, 0, False)
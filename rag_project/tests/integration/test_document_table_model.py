@@ -0,0 +1,65 @@
+from datetime import datetime, timedelta
+from types import SimpleNamespace
+
+from PyQt5 import QtCore
+
+from rag_project.rag_gui.models import DocumentTableModel
+from rag_project.rag_gui.views.delete_view import DeleteView
+
+
+def _docs(start: int, count: int):
+    base = datetime(2024, 1, 1)
+    return [
+        {
+            "id": f"doc-{i}",
+            "doc_type": "job_posting",
+            "created_at": "",
+            "created_at_value": base - timedelta(minutes=i),
+            "label": f"Job {i}",
+        }
+        for i in range(start, start + count)
+    ]
+
+
+def test_model_requests_next_page_with_keyset_cursor(qtbot):
+    model = DocumentTableModel()
+    model.reset(_docs(0, 3), has_more=True)
+
+    with qtbot.waitSignal(model.fetch_requested, timeout=1000) as blocker:
+        model.fetchMore()
+
+    last = _docs(2, 1)[0]
+    assert blocker.args == [(last["created_at_value"], "doc-2")]
+    # No duplicate request while the page is in flight
+    assert not model.canFetchMore()
+
+    model.append_page(_docs(3, 2), has_more=False)
+
+    assert model.rowCount() == 5
+    assert model.data(model.index(4, 4)) == "Job 4"
+    assert not model.canFetchMore()
+
+
+def test_model_tracks_checked_rows_across_pages(qtbot):
+    model = DocumentTableModel()
+    model.reset(_docs(0, 2), has_more=True)
+    model.append_page(_docs(2, 2), has_more=False)
+
+    model.setData(model.index(1, 0), QtCore.Qt.Checked, QtCore.Qt.CheckStateRole)
+    model.setData(model.index(3, 0), QtCore.Qt.Checked, QtCore.Qt.CheckStateRole)
+    model.setData(model.index(1, 0), QtCore.Qt.Unchecked, QtCore.Qt.CheckStateRole)
+
+    assert model.checked_ids() == ["doc-3"]
+    assert model.data(model.index(3, 0), QtCore.Qt.CheckStateRole) == QtCore.Qt.Checked
+
+
+def test_delete_view_drops_pages_requested_before_a_reload(qtbot):
+    view = SimpleNamespace(_load_generation=2, _model=DocumentTableModel())
+    view._model.reset(_docs(0, 2), has_more=True)
+
+    # A page for the previous filter arrives after the model was reset.
+    DeleteView.on_page_loaded(view, _docs(10, 3), False, generation=1)
+    assert view._model.rowCount() == 2
+
+    DeleteView.on_page_loaded(view, _docs(2, 1), False, generation=2)
+    assert view._model.rowCount() == 3
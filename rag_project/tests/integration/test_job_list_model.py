@@ -0,0 +1,90 @@
+import threading
+from datetime import datetime, timedelta
+
+from PyQt5 import QtCore
+
+from rag_project.rag_gui.config import GUI_JOB_SEARCH_FILTER
+from rag_project.rag_gui.models import JobListModel
+from rag_project.rag_gui.workers.rag_worker import JobLoaderWorker
+from rag_project.rag_gui.workers.tracking import start_tracked
+
+
+def _jobs(start: int, count: int):
+    base = datetime(2024, 1, 1)
+    return [
+        {
+            "id": f"job-{i}",
+            "title": f"Engineer {i}",
+            "company": "Acme",
+            "location": "Remote",
+            "date": "2024-01-01",
+            "created_at_value": base - timedelta(minutes=i),
+        }
+        for i in range(start, start + count)
+    ]
+
+
+def test_job_model_pages_with_keyset_cursor(qtbot):
+    model = JobListModel()
+    model.reset(_jobs(0, 2), has_more=True)
+
+    with qtbot.waitSignal(model.fetch_requested, timeout=1000) as blocker:
+        model.fetchMore()
+
+    assert blocker.args == [(_jobs(1, 1)[0]["created_at_value"], "job-1")]
+    assert not model.canFetchMore()
+
+    model.append_page(_jobs(2, 1), has_more=False)
+
+    assert model.rowCount() == 3
+    assert model.data(model.index(2)).startswith("Engineer 2\nAcme")
+
+
+def test_job_model_keeps_selection_across_searches(qtbot):
+    model = JobListModel()
+    model.reset(_jobs(0, 3), has_more=False)
+
+    with qtbot.waitSignal(model.selection_changed, timeout=1000) as blocker:
+        model.setData(model.index(1), QtCore.Qt.Checked, QtCore.Qt.CheckStateRole)
+    assert blocker.args == ["job-1", True]
+
+    model.reset(_jobs(5, 2), has_more=False)
+    model.reset(_jobs(0, 3), has_more=False)
+
+    assert model.checked_ids() == ["job-1"]
+    assert model.data(model.index(1), QtCore.Qt.CheckStateRole) == QtCore.Qt.Checked
+
+
+def test_job_loader_builds_escaped_search_page_query():
+    worker = JobLoaderWorker({}, search=" 50%_off ", after=("ts", "job-9"))
+
+    query, params = worker._page_query()
+
+    assert GUI_JOB_SEARCH_FILTER in query
+    assert params == ["%50\\%\\_off%", "%50\\%\\_off%", "ts", "job-9", 101]
+
+
+class _BlockingLoader(QtCore.QThread):
+    finished = QtCore.pyqtSignal(list, bool)  # shadows QThread.finished, as loaders do
+
+    def __init__(self):
+        super().__init__()
+        self.release = threading.Event()
+
+    def run(self):
+        self.release.wait(5)
+        self.finished.emit([], False)
+
+
+def test_tracked_loader_is_kept_until_its_thread_stops(qtbot):
+    running: set = set()
+    worker = _BlockingLoader()
+    start_tracked(worker, running)
+    del worker  # a newer search replaced it
+
+    assert len(running) == 1
+    (worker,) = running
+    assert worker.isRunning()
+
+    worker.release.set()
+    qtbot.waitUntil(lambda: not running, timeout=5000)
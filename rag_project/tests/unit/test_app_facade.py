@@ -17,10 +17,12 @@ from rag_project.config import (
     OLLAMA_DEFAULT_FALLBACK_MODEL,
     OLLAMA_DEFAULT_HOST,
     OLLAMA_DEFAULT_MODEL,
+    RERANKER_MODEL_ID,
     STRUCTURED_MAX_LLM_INPUT_WORDS,
     STRUCTURED_MIN_CHUNK_WORDS,
 )
 from rag_project.rag_core import app_facade
+from rag_project.rag_core.infra.tokenizer_hf import CharEstimateTokenizer
 
 
 class FakeRepo:
@@ -43,6 +45,10 @@ class FakeLLM:
         self.base_url = base_url
         self.model = model
         self.fallback_model = fallback_model
+        self.prewarmed = []
+
+    def prewarm(self, models):
+        self.prewarmed.extend(models)
 
     def generate(self, prompt, model=None, max_tokens=LLM_PROVIDER_DEFAULT_MAX_TOKENS):
         return "ok"
@@ -61,8 +67,11 @@ def test_app_facade_wires_dependencies(monkeypatch):
         ollama_timeout=OLLAMA_TIMEOUT_SECONDS,
         ollama_num_ctx=MODELS["llm_primary"]["ollama_num_ctx"],
         embedding_model_id=EMBEDDING_MODEL_ID,
+        use_reranker=False,
+        reranker_model_id=RERANKER_MODEL_ID,
         chunk_token_target=10,
         chunk_overlap_tokens=2,
+        chunk_sizing="tokens",
         use_structured_chunker=False,
         structured_min_chunk_words=STRUCTURED_MIN_CHUNK_WORDS,
         structured_max_llm_input_words=STRUCTURED_MAX_LLM_INPUT_WORDS,
@@ -75,11 +84,27 @@ def test_app_facade_wires_dependencies(monkeypatch):
     monkeypatch.setattr(app_facade, "PgVectorRepository", FakeRepo)
     monkeypatch.setattr(app_facade, "BgeM3EmbeddingProvider", FakeEmbedder)
     monkeypatch.setattr(app_facade, "OllamaLLMProvider", FakeLLM)
+    monkeypatch.setattr(app_facade, "OLLAMA_PREWARM_MODELS", "primary")
+    monkeypatch.setattr(app_facade, "LLM_SCHEDULER_ENABLED", False)
+    monkeypatch.setattr(
+        app_facade, "get_tokenizer", lambda model_id: CharEstimateTokenizer()
+    )
 
     rag = app_facade.RAGApp()
 
     assert isinstance(rag.repo, FakeRepo)
     assert isinstance(rag.embedder, FakeEmbedder)
     assert isinstance(rag.llm, FakeLLM)
+    assert rag.llm.prewarmed == [OLLAMA_DEFAULT_MODEL]
     assert rag.ingestion.max_tokens == fake_settings.chunk_token_target
     assert rag.ingestion.overlap_tokens == fake_settings.chunk_overlap_tokens
+    assert isinstance(rag.ingestion.tokenizer, CharEstimateTokenizer)
+    assert rag.reranker is None
+    assert rag.query.prompt_budget.budget_tokens > 0
+
+
+def test_app_settings_rejects_unknown_chunk_sizing():
+    from rag_project.rag_core.config import AppSettings
+
+    with pytest.raises(ValueError, match="Unknown chunk sizing 'Tokens'"):
+        AppSettings(chunk_sizing="Tokens")
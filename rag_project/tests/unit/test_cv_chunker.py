@@ -0,0 +1,93 @@
+import re
+from pathlib import Path
+
+import pytest
+
+from rag_project.config import CV_DATE_RANGE_REGEX
+from rag_project.rag_core.ingestion.cv_chunker import chunk_cv, detect_cv_sections
+
+SAMPLE_CV = Path(__file__).parents[1] / "dummy_tests_documents" / "cv_sample.txt"
+
+
+def _no_llm(prompt, max_tokens):
+    raise AssertionError("LLM must not be called for a well-structured CV")
+
+
+@pytest.mark.parametrize(
+    "line", ["2022-Now", "03/2019 - 12/2021", "2015 – 2018", "01.2020 bis heute"]
+)
+def test_date_range_regex_matches_cv_dates(line):
+    assert re.search(CV_DATE_RANGE_REGEX, line, re.IGNORECASE)
+
+
+def test_date_range_regex_ignores_numbers_in_prose():
+    assert not re.search(CV_DATE_RANGE_REGEX, "Built 20 pipelines", re.IGNORECASE)
+
+
+def test_structured_cv_is_split_by_rules_without_llm():
+    chunks, debug = chunk_cv(SAMPLE_CV.read_text(encoding="utf-8"), _no_llm, True)
+
+    assert debug["split_source"] == "rules" and debug["rule_confidence"] >= 0.7
+    assert [c.splitlines()[0] for c in chunks] == [
+        "John Doe",
+        "Profile:",
+        "Experience:",
+        "Education:",
+        "Skills:",
+    ]
+
+
+def test_dated_entries_in_experience_start_their_own_chunks():
+    lines = [
+        "Jane Roe",
+        "",
+        "EXPERIENCE",
+        "Senior Engineer, Beta GmbH",
+        "03/2021 - heute",
+        "- Led the search team",
+        "",
+        "Data Engineer, Alpha AG",
+        "01/2018 - 02/2021",
+        "- Built ETL jobs",
+        "2016 – 2017 | Gamma | Intern",
+        "- Wrote tests",
+        "",
+        "EDUCATION",
+        "2012 - 2016 | TU Berlin | B.Sc.",
+        "",
+        "SKILLS",
+        "Python, SQL",
+    ]
+
+    sections = detect_cv_sections(lines)
+
+    starts = [p + 1 for p in sections.split_points]
+    assert [lines[i] for i in starts if lines[i]] == [
+        "EXPERIENCE",
+        "Data Engineer, Alpha AG",
+        "2016 – 2017 | Gamma | Intern",
+        "EDUCATION",
+        "SKILLS",
+    ]
+    assert sections.confidence >= 0.7
+
+
+def test_unstructured_cv_falls_back_to_llm():
+    text = "\n".join(
+        [
+            "Jane Roe builds search systems and has led data teams for years.",
+            "She worked at Alpha AG on ETL and later at Beta GmbH on ranking.",
+            "She studied computer science and likes Python and SQL.",
+        ]
+    )
+    calls = []
+
+    def llm_generate(prompt, max_tokens):
+        calls.append(prompt)
+        return '{"split_after_lines": [1]}'
+
+    chunks, debug = chunk_cv(text, llm_generate, debug=True)
+
+    assert len(calls) == 1 and debug["split_source"] == "llm"
+    assert debug["rule_confidence"] < 0.7
+    assert len(chunks) == 2
@@ -58,6 +58,9 @@ class FakeDocumentRepo(DocumentRepository):
     def delete_document(self, document_id):
         return None
 
+    def delete_documents_by_filter(self, **filters):
+        return 0
+
 
 class FakeChunkRepo(ChunkRepository):
     def __init__(self):
@@ -106,6 +109,8 @@ def test_ingestion_cv_uses_llm_chunker():
         use_structured_chunker=True,
         chunk_profiles=deepcopy(CHUNK_PROFILES),
         llm_provider=llm,
+        # The sample CV is well structured; force the LLM path.
+        cv_rules_min_confidence=1.1,
     )
 
     cv_text_path = ROOT / "tests" / "dummy_tests_documents" / "cv_sample.txt"
@@ -127,6 +132,28 @@ def test_ingestion_cv_uses_llm_chunker():
     assert service.chunk_repo.chunks[0].document_id == doc_id
 
 
+def test_ingestion_structured_cv_skips_llm():
+    llm = FakeLLM()
+    service = IngestionService(
+        document_repo=FakeDocumentRepo(),
+        chunk_repo=FakeChunkRepo(),
+        embedder=FakeEmbedder(),
+        max_tokens=50,
+        overlap_tokens=10,
+        use_structured_chunker=True,
+        chunk_profiles=deepcopy(CHUNK_PROFILES),
+        llm_provider=llm,
+    )
+
+    service.ingest_file(
+        str(ROOT / "tests" / "dummy_tests_documents" / "cv_sample.txt"),
+        metadata={"doc_type": DOC_TYPE_CV},
+    )
+
+    assert all(call["model"] != CV_CHUNKER_MODEL_ID for call in llm.calls)
+    assert len(service.chunk_repo.chunks) == 5
+
+
 def test_ingestion_structured_for_thesis():
     llm = FakeLLM()
     profiles = deepcopy(CHUNK_PROFILES)
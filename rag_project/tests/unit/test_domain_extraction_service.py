@@ -30,10 +30,13 @@ class FakeRepo:
         self.chunks = chunks or []
         self.search_calls = []
 
-    def search(self, query_embedding, limit=0, doc_types=None):
+    def search(self, query_embedding, limit=0, doc_types=None, projection=None):
         self.search_calls.append({"limit": limit, "doc_types": doc_types})
         return self.chunks
 
+    def hydrate(self, retrieved, fields=()):
+        return retrieved
+
 
 class _RC:
     def __init__(self, content):
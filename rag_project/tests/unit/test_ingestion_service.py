@@ -3,8 +3,12 @@ from typing import List
 
 import json
 
+import pytest
+
+from rag_project.rag_core.ingestion.metrics import IngestRun
 from rag_project.rag_core.ingestion.service import IngestionService
 from rag_project.rag_core.ingestion.chunker import chunk_text
+from rag_project.rag_core.infra.tokenizer_hf import CharEstimateTokenizer
 from rag_project.rag_core.ports.embedding_port import EmbeddingProvider
 from rag_project.rag_core.ports.repo_port import ChunkRepository, DocumentRepository
 from rag_project.rag_core.domain.models import Chunk, Document
@@ -45,6 +49,9 @@ class FakeDocumentRepo(DocumentRepository):
     def delete_document(self, document_id):
         self.deleted.append(document_id)
 
+    def delete_documents_by_filter(self, **filters):
+        return 0
+
 
 class FakeChunkRepo(ChunkRepository):
     def __init__(self) -> None:
@@ -119,6 +126,71 @@ def test_ingestion_service_creates_job_and_chunks():
         assert chunk.content.strip()
 
 
+def test_ingestion_service_sizes_and_counts_chunks_in_tokens():
+    chunk_repo = FakeChunkRepo()
+    tokenizer = CharEstimateTokenizer(chars_per_token=3.0)
+    service = IngestionService(
+        document_repo=FakeDocumentRepo(),
+        chunk_repo=chunk_repo,
+        embedder=FakeEmbedder(),
+        max_tokens=80,
+        overlap_tokens=20,
+        use_structured_chunker=True,
+        chunk_profiles={"default": {"target_tokens": 150, "overlap_tokens": 20}},
+        tokenizer=tokenizer,
+    )
+    from rag_project.config import DOC_TYPE_JOB_POSTING
+
+    service._ingest_text(
+        load_sample_job_text(),
+        metadata={"source": "test", "doc_type": DOC_TYPE_JOB_POSTING},
+        progress_cb=None,
+    )
+
+    chunks = chunk_repo.inserted_chunks
+    assert len(chunks) > 1
+    for chunk in chunks:
+        assert chunk.token_count == tokenizer.count(chunk.content)
+        assert chunk.token_count <= 150 * 1.25
+
+
+def test_semantic_strategy_stores_composed_embeddings(monkeypatch):
+    from rag_project.config import CHUNK_STRATEGY, DOC_TYPE_JOB_POSTING
+
+    class CountingEmbedder(EmbeddingProvider):
+        def __init__(self) -> None:
+            self.calls: List[int] = []
+
+        def embed(self, texts: List[str]) -> List[List[float]]:
+            self.calls.append(len(texts))
+            return [[1.0, float(len(t) % 7)] for t in texts]
+
+    monkeypatch.setitem(CHUNK_STRATEGY, DOC_TYPE_JOB_POSTING, "semantic")
+    embedder = CountingEmbedder()
+    chunk_repo = FakeChunkRepo()
+    service = IngestionService(
+        document_repo=FakeDocumentRepo(),
+        chunk_repo=chunk_repo,
+        embedder=embedder,
+        max_tokens=80,
+        overlap_tokens=0,
+        chunk_profiles={"default": {"target_words": 80, "overlap_words": 0}},
+    )
+
+    service._ingest_text(
+        load_sample_job_text(),
+        metadata={"source": "test", "doc_type": DOC_TYPE_JOB_POSTING},
+        progress_cb=None,
+    )
+
+    chunks = chunk_repo.inserted_chunks
+    assert len(chunks) > 1
+    assert len(chunk_repo.inserted_embeddings) == len(chunks)
+    # Only the batched sentence pass embeds; chunks reuse its vectors.
+    assert sum(embedder.calls) > len(chunks) and len(embedder.calls) < len(chunks)
+    assert all(len(e) == 2 for e in chunk_repo.inserted_embeddings)
+
+
 def test_ingestion_service_ingests_file_and_chunks():
     tmp = Path("rag_project/tests/unit/tmp_cv.txt")
     tmp.write_text(load_cv_text(), encoding="utf-8")
@@ -147,3 +219,147 @@ def test_ingestion_service_ingests_file_and_chunks():
     assert chunk_repo.inserted_chunks, "No chunks created from file"
     CS["cv"] = original_cv_strategy
     tmp.unlink()
+
+
+def test_ingestion_service_writes_stage_summary(tmp_path):
+    summary_path = tmp_path / "ingest_metrics.jsonl"
+    chunk_repo = FakeChunkRepo()
+    service = IngestionService(
+        document_repo=FakeDocumentRepo(),
+        chunk_repo=chunk_repo,
+        embedder=FakeEmbedder(),
+        max_tokens=80,
+        overlap_tokens=20,
+        metrics_summary_path=str(summary_path),
+    )
+    source = tmp_path / "job.txt"
+    source.write_text(load_sample_job_text(), encoding="utf-8")
+    from rag_project.config import DOC_TYPE_JOB_POSTING
+
+    doc_id = service.ingest_file(
+        str(source), metadata={"doc_type": DOC_TYPE_JOB_POSTING}
+    )
+
+    summary = json.loads(summary_path.read_text(encoding="utf-8").splitlines()[-1])
+    assert summary["document_id"] == str(doc_id)
+    assert summary["status"] == "ok"
+    assert summary["chunks"] == len(chunk_repo.inserted_chunks)
+    assert summary["words"] > 0 and summary["words_per_second"] > 0
+    assert set(summary["stages"]) == {"parse", "metadata", "chunk", "embed", "store"}
+
+
+def _thesis_text(paragraphs: int) -> str:
+    return "\n\n".join(
+        f"## **{i}. Section**\n"
+        + " ".join(
+            f"Sentence {i}.{j} explains part {j} of the method." for j in range(12)
+        )
+        for i in range(paragraphs)
+    )
+
+
+def test_streamed_ingest_stores_chunks_in_batches(tmp_path):
+    from rag_project.config import DOC_TYPE_THESIS
+
+    class CountingChunkRepo(FakeChunkRepo):
+        def __init__(self) -> None:
+            super().__init__()
+            self.calls = 0
+
+        def insert_chunks_with_embeddings(self, chunks, embeddings) -> None:
+            self.calls += 1
+            super().insert_chunks_with_embeddings(chunks, embeddings)
+
+    source = tmp_path / "thesis.md"
+    source.write_text(_thesis_text(60), encoding="utf-8")
+    chunk_repo = CountingChunkRepo()
+    summary_path = tmp_path / "ingest_metrics.jsonl"
+    service = IngestionService(
+        document_repo=FakeDocumentRepo(),
+        chunk_repo=chunk_repo,
+        embedder=FakeEmbedder(),
+        max_tokens=120,
+        overlap_tokens=10,
+        metrics_summary_path=str(summary_path),
+        streaming=True,
+        stream_batch_chunks=4,
+    )
+
+    doc_id = service.ingest_file(str(source), metadata={"doc_type": DOC_TYPE_THESIS})
+
+    chunks = chunk_repo.inserted_chunks
+    assert len(chunks) > 8 and chunk_repo.calls == -(-len(chunks) // 4)
+    assert [c.chunk_index for c in chunks] == list(range(len(chunks)))
+    assert all(c.document_id == doc_id for c in chunks)
+    summary = json.loads(summary_path.read_text(encoding="utf-8").splitlines()[-1])
+    assert summary["chunks"] == len(chunks) and summary["words"] > 0
+    assert set(summary["stages"]) == {"parse", "metadata", "chunk", "embed", "store"}
+
+
+def test_streamed_ingest_deletes_document_when_storing_fails(tmp_path):
+    from rag_project.config import DOC_TYPE_THESIS
+
+    class FailingChunkRepo(FakeChunkRepo):
+        def insert_chunks_with_embeddings(self, chunks, embeddings) -> None:
+            raise RuntimeError("db down")
+
+    source = tmp_path / "thesis.md"
+    source.write_text(_thesis_text(10), encoding="utf-8")
+    doc_repo = FakeDocumentRepo()
+    service = IngestionService(
+        document_repo=doc_repo,
+        chunk_repo=FailingChunkRepo(),
+        embedder=FakeEmbedder(),
+        max_tokens=120,
+        overlap_tokens=10,
+        streaming=True,
+    )
+
+    with pytest.raises(RuntimeError):
+        service.ingest_file(str(source), metadata={"doc_type": DOC_TYPE_THESIS})
+
+    assert doc_repo.deleted == [doc_repo.inserted_docs[0].id]
+
+
+@pytest.mark.parametrize("streaming", [False, True])
+def test_ingest_file_records_failed_run_when_parser_raises(
+    tmp_path, monkeypatch, streaming
+):
+    import rag_project.rag_core.ingestion.service as service_module
+
+    def broken_parse(path):
+        raise ValueError("unreadable")
+
+    def broken_pages(path):
+        raise ValueError("unreadable")
+        yield  # pragma: no cover
+
+    monkeypatch.setattr(service_module, "parse_file", broken_parse)
+    monkeypatch.setattr(service_module, "iter_file_pages", broken_pages)
+    summary_path = tmp_path / "ingest_metrics.jsonl"
+    service = IngestionService(
+        document_repo=FakeDocumentRepo(),
+        chunk_repo=FakeChunkRepo(),
+        embedder=FakeEmbedder(),
+        max_tokens=80,
+        overlap_tokens=20,
+        metrics_summary_path=str(summary_path),
+        streaming=streaming,
+    )
+
+    with pytest.raises(ValueError, match="unreadable"):
+        service.ingest_file(str(tmp_path / "cv.pdf"))
+
+    summary = json.loads(summary_path.read_text(encoding="utf-8").splitlines()[-1])
+    assert summary["status"] == "error"
+    assert summary["failed_stage"] == "parse"
+
+
+def test_ingest_run_nested_stages_are_exclusive():
+    run = IngestRun()
+    with run.stage("chunk"):
+        with run.stage("parse"):
+            sum(range(200000))
+
+    assert run.stages["parse"] > 0
+    assert run.stages["chunk"] < run.stages["parse"]
@@ -2,6 +2,9 @@ import json
 from dataclasses import dataclass
 from uuid import uuid4
 
+import pytest
+
+from rag_project.config import RETRIEVAL_MODE_HYBRID
 from rag_project.rag_core.retrieval.job_matching_service import JobMatchingService
 from rag_project.rag_core.domain.models import (
     JobRequirement,
@@ -73,6 +76,7 @@ class FakeRepo(ChunkRepository):
         posted_after=None,
         doc_types=None,
         filters=None,
+        projection=None,
     ):
         return [
             RetrievedChunk(
@@ -120,3 +124,148 @@ def test_job_matching_service_returns_match_result():
     assert result.extracted_requirements[0].name == "Python"
     assert isinstance(result.evaluations[0], RequirementEvaluation)
     assert "MATCH" in result.evaluations[0].verdict
+
+
+class FakeHybridRepo(FakeRepo):
+    def __init__(self, stored):
+        super().__init__(stored)
+        self.hybrid_queries = []
+
+    def hybrid_search(self, query_embedding, query_text, **kwargs):
+        self.hybrid_queries.append(query_text)
+        return self.search(query_embedding, **kwargs)
+
+
+def test_job_matching_service_hybrid_mode_uses_requirement_query_text():
+    extraction_json = json.dumps(
+        {
+            "requirements": [
+                {
+                    "name": "PySpark",
+                    "category": "Hard Skill",
+                    "search_query": "PySpark data pipelines",
+                    "inference_rule": "",
+                }
+            ]
+        }
+    )
+    llm = FakeLLM([extraction_json, "✅ MATCH | PySpark listed"])
+    doc = Document(id=uuid4(), doc_type="cv")
+    chunk = Chunk(document_id=doc.id, chunk_index=0, content="Built PySpark ETL")
+    repo = FakeHybridRepo(
+        [_Stored(chunk=chunk, doc=doc, jp=JobPosting(document_id=doc.id), score=0.5)]
+    )
+
+    service = JobMatchingService(embedder=FakeEmbedder(), llm=llm, chunk_repo=repo)
+    result = service.analyze_match("job text", retrieval_mode=RETRIEVAL_MODE_HYBRID)
+
+    assert repo.hybrid_queries == ["PySpark data pipelines"]
+    assert result.match_count == 1
+
+
+def test_job_matching_service_rejects_unknown_retrieval_mode():
+    llm = FakeLLM(["{}"])
+    service = JobMatchingService(
+        embedder=FakeEmbedder(), llm=llm, chunk_repo=FakeHybridRepo([])
+    )
+
+    with pytest.raises(ValueError, match="Unknown retrieval mode 'Hybrid'"):
+        service.analyze_match("job text", retrieval_mode="Hybrid")
+    assert llm.responses == ["{}"]  # rejected before any LLM call
+
+
+class FakeReranker:
+    def __init__(self):
+        self.batches = []
+
+    def score(self, query, passages):
+        self.batches.append(list(passages))
+        return [1.0 if "Kubernetes" in p else 0.0 for p in passages]
+
+
+class CountingRepo(FakeRepo):
+    def __init__(self, stored):
+        super().__init__(stored)
+        self.limits = []
+
+    def search(self, query_embedding, limit=5, **kwargs):
+        self.limits.append(limit)
+        return super().search(query_embedding, limit=limit, **kwargs)
+
+
+def test_job_matching_service_reranker_overfetches_and_keeps_top_k():
+    extraction_json = json.dumps(
+        {
+            "requirements": [
+                {
+                    "name": "Kubernetes",
+                    "category": "Hard Skill",
+                    "search_query": "Kubernetes operations",
+                    "inference_rule": "",
+                }
+            ]
+        }
+    )
+    llm = FakeLLM([extraction_json, "✅ MATCH | Kubernetes"])
+    doc = Document(id=uuid4(), doc_type="cv")
+    contents = ["Excel reporting", "Team lead", "Ran Kubernetes clusters", "Docker"]
+    stored = [
+        _Stored(
+            chunk=Chunk(document_id=doc.id, chunk_index=i, content=text),
+            doc=doc,
+            jp=JobPosting(document_id=doc.id),
+            score=0.5,
+        )
+        for i, text in enumerate(contents)
+    ]
+    repo = CountingRepo(stored)
+    reranker = FakeReranker()
+
+    service = JobMatchingService(
+        embedder=FakeEmbedder(),
+        llm=llm,
+        chunk_repo=repo,
+        reranker=reranker,
+        rerank_candidates=10,
+        rerank_top_k=1,
+    )
+    result = service.analyze_match("job text")
+
+    assert repo.limits == [10]
+    assert len(reranker.batches) == 1 and len(reranker.batches[0]) == 4
+    evaluation = result.evaluations[0]
+    assert evaluation.retrieved_chunks_count == 1
+    assert "Kubernetes" in evaluation.evidence_preview
+
+
+class ModelRecordingLLM(LLMProvider):
+    def __init__(self):
+        self.models = []
+
+    def generate(self, prompt: str, model=None, max_tokens: int = 256) -> str:
+        self.models.append(model)
+        if model == "extract":
+            return json.dumps(
+                {"requirements": [{"name": "Python", "search_query": "Python"}]}
+            )
+        return "✅ MATCH | Python shown"
+
+
+def test_analyze_matches_runs_one_model_phase_at_a_time():
+    doc = Document(id=uuid4(), doc_type="cv")
+    chunk = Chunk(document_id=doc.id, chunk_index=0, content="Python developer")
+    repo = FakeRepo([_Stored(chunk, doc, JobPosting(document_id=doc.id), 0.9)])
+    llm = ModelRecordingLLM()
+    service = JobMatchingService(
+        embedder=FakeEmbedder(),
+        llm=llm,
+        chunk_repo=repo,
+        extraction_model="extract",
+        evaluator_model="eval",
+    )
+
+    results = service.analyze_matches(["job one", "job two"], max_workers=1)
+
+    assert llm.models == ["extract", "extract", "eval", "eval"]
+    assert [r.job_text for r in results] == ["job one", "job two"]
+    assert all(r.match_count == 1 for r in results)
@@ -63,9 +63,13 @@ class FakeRepo:
         min_match_score=0.0,
         posted_after=None,
         filters=None,
+        projection=None,
     ):
         return self.retrieved
 
+    def hydrate(self, retrieved, fields=()):
+        return retrieved
+
     def insert_document(self, *args, **kwargs):
         raise NotImplementedError
 
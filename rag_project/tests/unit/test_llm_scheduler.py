@@ -0,0 +1,76 @@
+import threading
+import time
+
+from rag_project.rag_core.infra.llm_scheduler import ModelAffinityLLMProvider
+from rag_project.rag_core.ports.llm_port import LLMProvider
+
+
+class BlockingLLM(LLMProvider):
+    """Records call order; the first call blocks until released."""
+
+    def __init__(self):
+        self.model = "primary"
+        self.calls = []
+        self.release = threading.Event()
+
+    def generate(self, prompt, model=None, max_tokens=0):
+        if not self.calls:
+            self.calls.append(model)
+            self.release.wait(5)
+        else:
+            self.calls.append(model)
+        return prompt
+
+
+def _wait_for(predicate):
+    deadline = time.monotonic() + 5
+    while not predicate():
+        assert time.monotonic() < deadline
+        time.sleep(0.005)
+
+
+def _submit(llm, model, threads):
+    thread = threading.Thread(target=llm.generate, args=("p",), kwargs={"model": model})
+    thread.start()
+    threads.append(thread)
+
+
+def test_scheduler_groups_waiting_calls_by_model():
+    inner = BlockingLLM()
+    llm = ModelAffinityLLMProvider(inner, max_concurrency=1, max_streak=8)
+    threads = []
+
+    _submit(llm, "a", threads)
+    _wait_for(lambda: inner.calls == ["a"])
+    for i, model in enumerate(["b", "a", "b", "a"]):
+        _submit(llm, model, threads)
+        _wait_for(lambda: sum(llm.queued().values()) == i + 1)
+    inner.release.set()
+    for thread in threads:
+        thread.join(5)
+
+    assert inner.calls == ["a", "a", "a", "b", "b"]
+    assert llm.switches == 1
+
+
+def test_scheduler_streak_limit_lets_other_models_run():
+    inner = BlockingLLM()
+    llm = ModelAffinityLLMProvider(inner, max_concurrency=1, max_streak=1)
+    threads = []
+
+    _submit(llm, "a", threads)
+    _wait_for(lambda: inner.calls == ["a"])
+    for i, model in enumerate(["b", "a"]):
+        _submit(llm, model, threads)
+        _wait_for(lambda: sum(llm.queued().values()) == i + 1)
+    inner.release.set()
+    for thread in threads:
+        thread.join(5)
+
+    assert inner.calls == ["a", "b", "a"]
+
+
+def test_scheduler_delegates_provider_attributes():
+    llm = ModelAffinityLLMProvider(BlockingLLM())
+
+    assert llm.model == "primary"
@@ -1,6 +1,7 @@
 import httpx
 import pytest
 
+from rag_project.config import LLM_MODEL_REGISTRY
 from rag_project.rag_core.infra.llm_ollama import OllamaLLMProvider
 
 
@@ -91,3 +92,43 @@ def test_llm_service_handles_empty_prompt(monkeypatch):
     out = provider.generate("", max_tokens=2)
 
     assert out == "ok"
+
+
+def test_llm_service_sends_per_model_runtime_options(monkeypatch):
+    captured = []
+
+    def fake_post(_url, json, timeout):
+        captured.append(json)
+        return _DummyResponse({"response": "ok"})
+
+    monkeypatch.setattr("httpx.post", fake_post)
+    assist = "qwen2.5:1.5b-instruct"
+    spec = LLM_MODEL_REGISTRY[assist]
+    provider = OllamaLLMProvider(
+        base_url="http://ollama.test", model="primary", num_ctx=4096
+    )
+
+    provider.generate("p", max_tokens=8)
+    provider.generate("p", model=assist, max_tokens=8)
+
+    assert captured[0]["options"]["num_ctx"] == 4096
+    assert captured[1]["options"]["num_ctx"] == spec["ollama_num_ctx"]
+    assert captured[1]["options"]["temperature"] == spec["temperature"]
+    assert captured[1]["keep_alive"] == spec["keep_alive"]
+
+
+def test_llm_service_prewarm_loads_models_without_prompt(monkeypatch):
+    captured = []
+
+    def fake_post(_url, json, timeout):
+        captured.append(json)
+        return _DummyResponse({})
+
+    monkeypatch.setattr("httpx.post", fake_post)
+    provider = OllamaLLMProvider(base_url="http://ollama.test", model="primary")
+
+    provider.prewarm(["primary", "llama3.1:8b", "primary"], background=False)
+
+    assert [c["model"] for c in captured] == ["primary", "llama3.1:8b"]
+    assert "prompt" not in captured[0]
+    assert captured[1]["options"] == provider.runtime_options("llama3.1:8b")
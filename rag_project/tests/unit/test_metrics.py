@@ -0,0 +1,40 @@
+import urllib.request
+
+from rag_project.metrics import MetricsRegistry, start_metrics_server
+
+
+def test_registry_renders_counters_and_cumulative_histograms():
+    registry = MetricsRegistry()
+    docs = registry.counter("rag_docs", "Documents", ("doc_type",))
+    stage = registry.histogram("rag_stage_seconds", "Stage time", ("stage",), (1, 5))
+    docs.inc(doc_type="cv")
+    docs.inc(2, doc_type="cv")
+    for seconds in (0.5, 3, 7):
+        stage.observe(seconds, stage="embed")
+
+    text = registry.render()
+
+    assert 'rag_docs_total{doc_type="cv"} 3' in text
+    assert 'rag_stage_seconds_bucket{stage="embed",le="1.0"} 1' in text
+    assert 'rag_stage_seconds_bucket{stage="embed",le="5.0"} 2' in text
+    assert 'rag_stage_seconds_bucket{stage="embed",le="+Inf"} 3' in text
+    assert 'rag_stage_seconds_count{stage="embed"} 3' in text
+    assert text.endswith("# EOF\n")
+    assert registry.counter("rag_docs", "Documents", ("doc_type",)) is docs
+
+
+def test_metrics_server_serves_openmetrics_text():
+    registry = MetricsRegistry()
+    registry.counter("rag_pings", "Pings").inc()
+    server = start_metrics_server(0, registry=registry)
+    try:
+        port = server.server_address[1]
+        with urllib.request.urlopen(f"http://127.0.0.1:{port}/metrics") as resp:
+            body = resp.read().decode("utf-8")
+            content_type = resp.headers["Content-Type"]
+    finally:
+        server.shutdown()
+        server.server_close()
+
+    assert "rag_pings_total 1" in body
+    assert content_type.startswith("application/openmetrics-text")
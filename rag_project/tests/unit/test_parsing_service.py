@@ -1,4 +1,6 @@
+import importlib
 import json
+import random
 import sys
 from dataclasses import dataclass
 from pathlib import Path
@@ -6,7 +8,11 @@ from typing import Any, Dict
 
 import pytest
 
-from rag_project.rag_core.ingestion.parser import parse_file, parse_job
+from rag_project.rag_core.ingestion.parser import (
+    iter_file_pages,
+    parse_file,
+    parse_job,
+)
 from rag_project.config import (
     PDF_PARSER,
     USE_PYMUPDF_FOR_PDF,
@@ -19,6 +25,8 @@ from rag_project.config import (
     INGEST_DEBUG_LOG_PATH,
 )
 
+ROOT_DOCS = Path(__file__).resolve().parents[1] / "dummy_tests_documents"
+
 
 @dataclass
 class ParsedDocument:
@@ -86,6 +94,77 @@ def test_parsing_service_markdown_to_text(tmp_path):
     assert "http://example.com" in text
 
 
+def test_iter_file_pages_joins_to_parse_file_text(tmp_path, monkeypatch):
+    monkeypatch.setattr(
+        "rag_project.rag_core.ingestion.parser.PARSER_TEXT_PAGE_LINES", 3
+    )
+    md_path = tmp_path / "long.md"
+    md_path.write_text(
+        "\n".join(f"line {i}" for i in range(10)) + "\n", encoding="utf-8"
+    )
+
+    pages = list(iter_file_pages(md_path))
+
+    assert len(pages) == 4
+    assert "".join(pages) == parse_file(md_path)
+
+
+class _CountingPdfModule:
+    __version__ = "9.9"
+
+    def __init__(self):
+        self.calls = 0
+
+    def to_markdown(self, path: str):
+        self.calls += 1
+        return f"# Parsed\r\nrun {self.calls}\n"
+
+
+def test_pdf_parse_cache_skips_reparsing_same_content(tmp_path, monkeypatch):
+    fake = _CountingPdfModule()
+    monkeypatch.setitem(sys.modules, "pymupdf4llm", fake)
+    monkeypatch.setattr(
+        "rag_project.rag_core.ingestion.parser.PARSER_CACHE_DIR", str(tmp_path / "c")
+    )
+    pdf_path = tmp_path / "thesis.pdf"
+    pdf_path.write_bytes(b"%PDF-1.4\n%one\n")
+
+    first = parse_file(pdf_path)
+    second = parse_file(pdf_path)
+    streamed = "".join(iter_file_pages(pdf_path))
+    pdf_path.write_bytes(b"%PDF-1.4\n%two\n")
+    changed = parse_file(pdf_path)
+
+    assert first == second == streamed == "# Parsed\r\nrun 1\n"
+    assert changed == "# Parsed\r\nrun 2\n" and fake.calls == 2
+
+
+def test_parallel_pdf_parse_joins_page_ranges_in_order(tmp_path, monkeypatch):
+    from rag_project.rag_core.ingestion import parser
+
+    class InlinePool:
+        def __init__(self, max_workers, mp_context):
+            self.max_workers = max_workers
+
+        def __enter__(self):
+            return self
+
+        def __exit__(self, *exc):
+            return False
+
+        def map(self, fn, *iterables):
+            return list(map(fn, *iterables))
+
+    monkeypatch.setattr(parser, "ProcessPoolExecutor", InlinePool)
+    monkeypatch.setattr(
+        parser, "_pdf_pages_markdown", lambda path, pages: f"[{pages[0]}-{pages[-1]}]"
+    )
+
+    text = parser._parse_pdf_parallel(tmp_path / "big.pdf", 10, 3)
+
+    assert text == "[0-2][3-5][6-9]"
+
+
 def test_parsing_service_json_job_normalized(tmp_path):
     job = {
         "title": "Data Scientist",
@@ -150,8 +229,153 @@ def test_parsing_config_defaults_present():
     assert GENERAL_FILTER_ENABLED is True
     assert THESIS_FILTER_ENABLED is True
     assert CHUNK_STRATEGY.get("cv") == "llm_cv_chunker"
-    assert CHUNK_STRATEGY.get("default") == "structured"
     assert isinstance(CV_CHUNKER_MODEL_ID, str) and CV_CHUNKER_MODEL_ID
     assert isinstance(CV_CHUNKER_MAX_OUTPUT_TOKENS, (int, float))
     assert INGEST_DEBUG_LOG_CHUNKS in (True, False)
     assert isinstance(INGEST_DEBUG_LOG_PATH, str) and INGEST_DEBUG_LOG_PATH
+
+
+@pytest.fixture
+def reload_models(monkeypatch):
+    from rag_project.config import models
+
+    def _reload(**env):
+        for name, value in env.items():
+            if value is None:
+                monkeypatch.delenv(name, raising=False)
+            else:
+                monkeypatch.setenv(name, value)
+        return importlib.reload(models)
+
+    yield _reload
+    monkeypatch.undo()
+    importlib.reload(models)
+
+
+def test_chunk_strategy_default_follows_env(reload_models):
+    assert reload_models(CHUNK_STRATEGY=None).CHUNK_STRATEGY["default"] == "structured"
+    assert reload_models(CHUNK_STRATEGY="semantic").CHUNK_STRATEGY["default"] == (
+        "semantic"
+    )
+
+
+def test_unknown_chunk_strategy_is_rejected_at_import(reload_models):
+    with pytest.raises(ValueError, match="Unknown chunk strategy 'Semantic'"):
+        reload_models(CHUNK_STRATEGY="Semantic")
+
+
+def test_unknown_chunk_sizing_is_rejected_at_import(reload_models):
+    assert reload_models(CHUNK_SIZING="tokens").CHUNK_SIZING == "tokens"
+    with pytest.raises(ValueError, match="Unknown chunk sizing 'token'"):
+        reload_models(CHUNK_SIZING="token")
+
+
+def test_html_is_parsed_to_text_without_markup(tmp_path):
+    html_path = tmp_path / "posting.html"
+    html_path.write_text(
+        "<html><head><style>.x{}</style></head><body>"
+        "<h2>Senior <b>RAG</b> Engineer</h2><p>We build\n<i>search</i>.<br>Remote.</p>"
+        "<ul><li>Python</li><li>SQL</li></ul><script>track()</script></body></html>",
+        encoding="utf-8",
+    )
+
+    text = parse_file(html_path)
+
+    assert text == (
+        "## Senior RAG Engineer\n\nWe build search.\nRemote.\n\n- Python\n- SQL\n"
+    )
+    assert "".join(iter_file_pages(html_path)) == text
+
+
+def _write_docx(path, body_xml):
+    import zipfile
+
+    ns = "http://schemas.openxmlformats.org/wordprocessingml/2006/main"
+    with zipfile.ZipFile(path, "w") as archive:
+        archive.writestr(
+            "word/document.xml",
+            f'<w:document xmlns:w="{ns}"><w:body>{body_xml}</w:body></w:document>',
+        )
+
+
+def test_docx_paragraphs_headings_and_lists(tmp_path):
+    docx_path = tmp_path / "cv.docx"
+    _write_docx(
+        docx_path,
+        '<w:p><w:pPr><w:pStyle w:val="Heading2"/></w:pPr>'
+        "<w:r><w:t>Experience</w:t></w:r></w:p>"
+        '<w:p><w:r><w:t xml:space="preserve">Built </w:t></w:r>'
+        "<w:r><w:t>pipelines.</w:t></w:r></w:p>"
+        "<w:p><w:pPr><w:numPr/></w:pPr><w:r><w:t>Python</w:t></w:r></w:p>"
+        "<w:p/>",
+    )
+
+    assert parse_file(docx_path) == "## Experience\n\nBuilt pipelines.\n\n- Python\n\n"
+
+
+def test_json_feed_is_streamed_record_by_record(monkeypatch):
+    monkeypatch.setattr(
+        "rag_project.rag_core.ingestion.parser.PARSER_JSON_READ_CHARS", 7
+    )
+    feed = ROOT_DOCS / "json_jobs_documents.json"
+    jobs = json.loads(feed.read_text(encoding="utf-8"))["jobs"]
+
+    pages = list(iter_file_pages(feed))
+
+    assert len(pages) == len(jobs)
+    for page, job in zip(pages, jobs):
+        assert page == parse_job(job["title"], job["description"], job) + "\n\n"
+
+
+def test_json_stream_matches_json_load_for_random_documents(tmp_path, monkeypatch):
+    from rag_project.rag_core.ingestion import parser
+
+    rng = random.Random(0)
+
+    def value(depth):
+        roll = rng.random()
+        if depth > 2 or roll < 0.4:
+            return rng.choice(
+                [rng.randint(-999, 99999), 2.5e3, 'a"b \u00e9', None, True]
+            )
+        if roll < 0.7:
+            return [value(depth + 1) for _ in range(rng.randint(0, 3))]
+        return {f"k{i}": value(depth + 1) for i in range(rng.randint(0, 3))}
+
+    path = tmp_path / "feed.json"
+    for _ in range(200):
+        records = [value(1) for _ in range(rng.randint(0, 5))]
+        document = rng.choice([records, {"meta": {"n": value(2)}, "items": records}])
+        path.write_text(json.dumps(document, indent=rng.choice([None, 2])))
+        monkeypatch.setattr(parser, "PARSER_JSON_READ_CHARS", rng.randint(1, 9))
+
+        assert list(parser.iter_json_records(path)) == records
+
+
+def test_unknown_suffix_is_sniffed_and_parse_is_reported(tmp_path):
+    from rag_project.rag_core.ingestion.metrics import (
+        PARSE_OUTPUT_CHARS,
+        PARSE_SECONDS,
+    )
+    from rag_project.rag_core.ingestion.parser import detect_mime_type
+
+    page_path = tmp_path / "download"
+    page_path.write_text("<!DOCTYPE html><p>Hello <b>there</b></p>", encoding="utf-8")
+    parsed_before = PARSE_SECONDS.count(parser="html")
+    chars_before = PARSE_OUTPUT_CHARS.value(parser="html")
+
+    text = parse_file(page_path)
+
+    assert detect_mime_type(page_path) == "text/html" and text == "Hello there\n"
+    assert PARSE_SECONDS.count(parser="html") == parsed_before + 1
+    assert PARSE_OUTPUT_CHARS.value(parser="html") == chars_before + len(text)
+
+
+def test_parse_job_strips_html_from_scraped_bodies():
+    normalized = parse_job(
+        "ML Engineer",
+        "<div><p>Build <b>search</b>.</p><ul><li>Python</li></ul></div>",
+        metadata={"location": "Berlin"},
+    )
+
+    assert normalized == "ML Engineer\n\nBuild search.\n\n- Python\n\nLocation: Berlin"
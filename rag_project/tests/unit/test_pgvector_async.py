@@ -0,0 +1,143 @@
+import asyncio
+from uuid import uuid4
+
+from rag_project.config import (
+    DOC_TYPE_CV,
+    HYDRATE_CONTENT,
+    SEARCH_PROJECTION_LEAN,
+    SQL_HYDRATE_CHUNK_CONTENT,
+)
+from rag_project.rag_core.domain.models import Chunk
+from rag_project.rag_core.infra import pg_sql
+from rag_project.rag_core.infra.db_pgvector_async import AsyncPgVectorRepository
+
+
+class FakeAsyncCursor:
+    def __init__(self, conn):
+        self.conn = conn
+        self._rows = []
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *_):
+        return False
+
+    async def execute(self, sql, params=None, prepare=None):
+        self.conn.executed.append((sql, params))
+        self._rows = self.conn.responses.pop(0) if self.conn.responses else []
+
+    async def executemany(self, sql, params_seq):
+        self.conn.executed.append((sql, list(params_seq)))
+
+    async def fetchall(self):
+        return self._rows
+
+
+class FakeAsyncConn:
+    def __init__(self, responses=None):
+        self.responses = responses or []
+        self.executed = []
+        self.borrowed = 0
+
+    async def __aenter__(self):
+        self.borrowed += 1
+        return self
+
+    async def __aexit__(self, *_):
+        return False
+
+    def cursor(self):
+        return FakeAsyncCursor(self)
+
+
+def _repo_with(conn):
+    repo = AsyncPgVectorRepository("dsn")
+
+    async def _get_conn():
+        return conn
+
+    repo._get_conn = _get_conn
+    return repo
+
+
+def _lean_row(chunk_id, score):
+    return (chunk_id, uuid4(), 0, 12, DOC_TYPE_CV, None, None, None, None, None, score)
+
+
+def _retrieved(chunk_id):
+    return pg_sql.lean_row_to_retrieved(_lean_row(chunk_id, 0.5))
+
+
+def test_async_search_uses_shared_statements_and_hydrates():
+    chunk_id = uuid4()
+    conn = FakeAsyncConn([[_lean_row(chunk_id, 0.7)], [(chunk_id, "PySpark")]])
+    repo = _repo_with(conn)
+
+    async def _run():
+        results = await repo.search(
+            [0.1], doc_types=[DOC_TYPE_CV], projection=SEARCH_PROJECTION_LEAN
+        )
+        return await repo.hydrate(results, fields=(HYDRATE_CONTENT,))
+
+    results = asyncio.run(_run())
+
+    assert (
+        conn.executed[0][0]
+        is pg_sql.SEARCH_STATEMENTS[("vector", "lean", ("doc_types",))]
+    )
+    assert conn.executed[1][0] == SQL_HYDRATE_CHUNK_CONTENT
+    assert results[0].chunk.content == "PySpark"
+    assert results[0].score == 0.7
+
+
+def test_async_hybrid_search_runs_both_arms_and_fuses():
+    shared, vector_only = uuid4(), uuid4()
+    conn = FakeAsyncConn()
+    repo = _repo_with(conn)
+
+    async def _search(query_embedding, **_):
+        await asyncio.sleep(0)
+        return [_retrieved(shared), _retrieved(vector_only)]
+
+    async def _keyword(query_embedding, query_text, **_):
+        await asyncio.sleep(0)
+        return [_retrieved(shared)]
+
+    repo.search = _search
+    repo.keyword_search = _keyword
+
+    fused = asyncio.run(repo.hybrid_search([0.1], "PySpark", limit=2))
+
+    assert [rc.chunk.id for rc in fused] == [shared, vector_only]
+
+
+def test_async_insert_chunks_batches_rows():
+    conn = FakeAsyncConn()
+    repo = _repo_with(conn)
+    chunks = [Chunk(document_id=uuid4(), content=f"c{i}") for i in range(3)]
+
+    asyncio.run(repo.insert_chunks_with_embeddings(chunks, [[0.1]] * 3))
+
+    assert conn.borrowed == 1
+    # One multi-row INSERT per table: the stats triggers run once per statement.
+    assert [sql.split(" (")[0] for sql, _ in conn.executed] == [
+        "INSERT INTO chunks",
+        "INSERT INTO embeddings",
+    ]
+    assert [len(params) for _, params in conn.executed] == [3 * 6, 3 * 2]
+
+
+def test_chunk_insert_statements_split_into_batches():
+    chunks = [Chunk(document_id=uuid4(), content=f"c{i}") for i in range(5)]
+    embeddings = [[float(i)] for i in range(5)]
+
+    statements = pg_sql.chunk_insert_statements(chunks, embeddings, batch_rows=2)
+
+    assert [sql.count("%s::vector") for sql, _ in statements[1::2]] == [2, 2, 1]
+    assert [params[0] for _, params in statements[::2]] == [
+        chunks[0].id,
+        chunks[2].id,
+        chunks[4].id,
+    ]
+    assert statements[-1][1] == [chunks[4].id, [4.0]]
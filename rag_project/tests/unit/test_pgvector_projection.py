@@ -0,0 +1,180 @@
+from datetime import UTC, datetime
+from uuid import uuid4
+
+import pytest
+
+from rag_project.config import (
+    DOC_TYPE_CV,
+    DOC_TYPE_JOB_POSTING,
+    HYDRATE_CONTENT,
+    HYDRATE_METADATA,
+    SEARCH_PROJECTION_LEAN,
+    SQL_HYDRATE_CHUNK_CONTENT,
+    SQL_HYDRATE_DOCUMENT_METADATA,
+)
+from rag_project.rag_core.domain.models import ScoreWeights
+from rag_project.rag_core.infra import pg_sql
+from rag_project.rag_core.infra.db_pgvector import PgVectorRepository
+
+
+class FakeCursor:
+    def __init__(self, conn):
+        self.conn = conn
+        self._rows = []
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *_):
+        return False
+
+    def execute(self, sql, params=None, prepare=None):
+        self.conn.executed.append((sql, params))
+        self.conn.prepared.append(prepare)
+        self._rows = self.conn.responses.pop(0)
+
+    def fetchall(self):
+        return self._rows
+
+
+class FakeConn:
+    def __init__(self, responses):
+        self.responses = responses
+        self.executed = []
+        self.prepared = []
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *_):
+        return False
+
+    def cursor(self):
+        return FakeCursor(self)
+
+
+def _repo_with(conn):
+    repo = PgVectorRepository("dsn")
+    repo._get_conn = lambda: conn
+    return repo
+
+
+def _lean_row(chunk_id, doc_id):
+    return (chunk_id, doc_id, 0, 12, DOC_TYPE_CV, None, None, None, None, None, 0.42)
+
+
+def _full_and_lean_rows(doc_type, category=None, title=None, company=None, url=None):
+    """The same stored chunk as the full and the lean projection return it."""
+    chunk_id, doc_id = uuid4(), uuid4()
+    created = datetime(2024, 5, 1, tzinfo=UTC)
+    full = (
+        chunk_id, doc_id, 3, "content", 12, doc_id, doc_type, {"k": "v"}, created,
+        title, company, "Berlin", "en", url, None, 0.8, None, None,
+        category, None, None, 0.42,
+    )  # fmt: skip
+    lean = (
+        chunk_id, doc_id, 3, 12, doc_type, created, title, company, url,
+        category, 0.42,
+    )  # fmt: skip
+    return full, lean
+
+
+def _shared_fields(rc):
+    jp = rc.job_posting
+    return (
+        rc.chunk.id,
+        rc.chunk.chunk_index,
+        rc.chunk.token_count,
+        rc.document.id,
+        rc.document.doc_type,
+        rc.document.created_at,
+        (jp.title, jp.company, jp.url) if jp else None,
+        rc.personal.category if rc.personal else None,
+        rc.score,
+    )
+
+
+@pytest.mark.parametrize(
+    "row_args",
+    [
+        (DOC_TYPE_CV, "career"),
+        (DOC_TYPE_CV, None),
+        (DOC_TYPE_JOB_POSTING, None, "ML Engineer", "Acme", "https://x.test/1"),
+    ],
+)
+def test_lean_and_full_projection_agree_on_shared_fields(row_args):
+    full, lean = _full_and_lean_rows(*row_args)
+
+    assert _shared_fields(pg_sql.lean_row_to_retrieved(lean)) == (
+        _shared_fields(pg_sql.row_to_retrieved(full))
+    )
+
+
+def test_lean_search_leaves_content_and_metadata_unloaded():
+    chunk_id, doc_id = uuid4(), uuid4()
+    conn = FakeConn([[_lean_row(chunk_id, doc_id)]])
+    repo = _repo_with(conn)
+
+    results = repo.search([0.1], limit=1, projection=SEARCH_PROJECTION_LEAN)
+
+    sql, _ = conn.executed[0]
+    assert "c.content" not in sql and "d.metadata" not in sql
+    assert results[0].chunk.id == chunk_id
+    assert results[0].chunk.content == ""
+    assert results[0].personal.category == DOC_TYPE_CV
+    assert results[0].unloaded_fields == {HYDRATE_CONTENT, HYDRATE_METADATA}
+    assert results[0].score == 0.42
+
+
+def test_search_sends_score_weights_as_params():
+    conn = FakeConn([[]])
+    repo = _repo_with(conn)
+    weights = ScoreWeights(similarity=1.0, match_score=0.0, recency=0.0)
+
+    repo.search([0.1], limit=5, weights=weights)
+
+    sql, params = conn.executed[0]
+    assert sql.count("<=>") == 1
+    assert params[:5] == [[0.1], 1.0, 0.0, 0.0, weights.recency_decay_days]
+    assert params[-1] == 5
+
+
+def test_hydrate_batches_requested_fields_only():
+    rows = [_lean_row(uuid4(), uuid4()), _lean_row(uuid4(), uuid4())]
+    conn = FakeConn([rows])
+    repo = _repo_with(conn)
+    results = repo.search([0.1], limit=2, projection=SEARCH_PROJECTION_LEAN)
+    conn.responses.append([(rc.chunk.id, f"text {i}") for i, rc in enumerate(results)])
+
+    repo.hydrate(results, fields=(HYDRATE_CONTENT,))
+    repo.hydrate(results, fields=(HYDRATE_CONTENT,))
+
+    hydrate_calls = [sql for sql, _ in conn.executed[1:]]
+    assert hydrate_calls == [SQL_HYDRATE_CHUNK_CONTENT]
+    assert [rc.chunk.content for rc in results] == ["text 0", "text 1"]
+    assert all(rc.unloaded_fields == {HYDRATE_METADATA} for rc in results)
+
+    conn.responses.append([(results[0].document.id, {"title": "CV"})])
+    repo.hydrate(results[:1], fields=(HYDRATE_METADATA,))
+
+    assert conn.executed[-1][0] == SQL_HYDRATE_DOCUMENT_METADATA
+    assert results[0].document.metadata == {"title": "CV"}
+    assert results[1].document.metadata is None
+
+
+def test_search_reuses_registered_statement_per_filter_combination():
+    conn = FakeConn([[], [], []])
+    repo = _repo_with(conn)
+
+    repo.search([0.1], doc_types=[DOC_TYPE_CV], filters={"company": "acme"})
+    repo.search([0.2], doc_types=[DOC_TYPE_CV], filters={"company": "other"})
+    repo.search([0.2])
+
+    first, second, third = (sql for sql, _ in conn.executed)
+    assert first is second
+    assert (
+        first is pg_sql.SEARCH_STATEMENTS[("vector", "full", ("doc_types", "company"))]
+    )
+    assert third is pg_sql.SEARCH_STATEMENTS[("vector", "full", ())]
+    assert conn.prepared == [True, True, True]
+    assert all("{" not in sql for sql in pg_sql.SEARCH_STATEMENTS.values())
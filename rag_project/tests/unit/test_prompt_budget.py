@@ -0,0 +1,136 @@
+from uuid import uuid4
+
+from rag_project.config import (
+    LLM_MODEL_REGISTRY,
+    PROMPT_BUDGET_SAFETY_TOKENS,
+    RETRIEVAL_SYSTEM_PROMPT,
+    SUPPORTED_DOC_TYPES,
+)
+from rag_project.rag_core.domain.models import Chunk, Document, RetrievedChunk
+from rag_project.rag_core.infra.tokenizer_hf import (
+    CharEstimateTokenizer,
+    HuggingFaceTokenizer,
+)
+from rag_project.rag_core.ports.tokenizer_port import Tokenizer
+from rag_project.rag_core.retrieval.prompt_budget import PromptBudget
+from rag_project.rag_core.retrieval.search import (
+    answer_question,
+    build_prompt,
+    select_context,
+)
+
+
+class WordTokenizer(Tokenizer):
+    def count(self, text):
+        return len(text.split())
+
+    def truncate(self, text, max_tokens):
+        return " ".join(text.split()[:max_tokens])
+
+
+def _rc(content, score):
+    doc = Document(id=uuid4(), doc_type=SUPPORTED_DOC_TYPES[0])
+    chunk = Chunk(id=uuid4(), document_id=doc.id, chunk_index=0, content=content)
+    return RetrievedChunk(chunk=chunk, document=doc, score=score)
+
+
+def test_budget_for_model_is_capped_by_context_left_for_output():
+    spec = LLM_MODEL_REGISTRY["llama3.1:8b"]
+    window = min(spec["context_window"], spec["ollama_num_ctx"])
+
+    small = PromptBudget.for_model("llama3.1:8b", 256, WordTokenizer())
+    large = PromptBudget.for_model("llama3.1:8b", 8000, WordTokenizer())
+
+    assert small.budget_tokens == spec["prompt_budget_tokens"]
+    assert large.budget_tokens == window - 8000 - PROMPT_BUDGET_SAFETY_TOKENS
+
+
+def test_pack_skips_parts_that_do_not_fit_and_truncates_oversized_best():
+    budget = PromptBudget(WordTokenizer(), 100)
+
+    assert budget.pack(["a b c", "d e f g h", "i"], 6, separator=" ") == [
+        "a b c",
+        None,
+        "i",
+    ]
+    assert budget.pack(["a b c d e"], 2) == ["a b"]
+
+
+def test_build_prompt_packs_highest_scoring_chunks_into_budget():
+    fixed = RETRIEVAL_SYSTEM_PROMPT.format(context="", question="q")
+    low = _rc("low " * 20, 0.2)
+    high = _rc("high " * 20, 0.9)
+    mid = _rc("mid " * 20, 0.5)
+    budget = PromptBudget(WordTokenizer(), WordTokenizer().count(fixed) + 45)
+
+    selected = [rc for rc, _part in select_context("q", [low, high, mid], budget)]
+    prompt = build_prompt("q", [low, high, mid], budget)
+
+    assert selected == [high, mid]
+    assert "high" in prompt and "mid" in prompt and "low" not in prompt
+
+
+class _OneChunkRepo:
+    def __init__(self, retrieved):
+        self.retrieved = retrieved
+
+    def search(self, query_embedding, **kwargs):
+        return self.retrieved
+
+
+class _Embedder:
+    def embed(self, texts):
+        return [[0.0] for _ in texts]
+
+
+class _PromptRecorder:
+    def __init__(self):
+        self.prompts = []
+
+    def generate(self, prompt, **kwargs):
+        self.prompts.append(prompt)
+        return "answer"
+
+
+def test_answer_question_prompt_fits_budget_with_oversized_chunk():
+    tokenizer = WordTokenizer()
+    budget = PromptBudget(tokenizer, 200)
+    oversized = _rc("word " * 5000, 0.9)
+    llm = _PromptRecorder()
+
+    answer = answer_question(
+        "q", _Embedder(), llm, _OneChunkRepo([oversized]), budget=budget
+    )
+
+    assert tokenizer.count(llm.prompts[0]) <= 200
+    assert [c.chunk_id for c in answer.citations] == [oversized.chunk.id]
+
+
+def test_char_estimate_tokenizer_round_trips_budget():
+    tokenizer = CharEstimateTokenizer(chars_per_token=3.0)
+    text = "x" * 100
+
+    assert tokenizer.count(text) == 34
+    assert tokenizer.count(tokenizer.truncate(text, 10)) == 10
+
+
+def test_hf_word_token_counts_attribute_tokens_by_offsets():
+    class FakeFastTokenizer:
+        def __call__(self, text, add_special_tokens, return_offsets_mapping):
+            # "▁retriev" "al" "▁of" "▁re" "rank" "ing"
+            return {
+                "offset_mapping": [
+                    (0, 7),
+                    (7, 9),
+                    (10, 12),
+                    (13, 15),
+                    (15, 19),
+                    (19, 22),
+                ]
+            }
+
+    tokenizer = object.__new__(HuggingFaceTokenizer)
+    tokenizer._tokenizer = FakeFastTokenizer()
+
+    assert tokenizer.word_token_counts("retrieval of reranking") == [2, 1, 3]
+    assert tokenizer.word_token_counts("  ") == []
@@ -23,7 +23,10 @@ from rag_project.rag_core.domain.models import (
 )
 from rag_project.config import (
     DOC_TYPE_JOB_POSTING,
+    RETRIEVAL_MODE_HYBRID,
 )
+from rag_project.rag_core.infra.pg_sql import reciprocal_rank_fusion
+from rag_project.rag_core.ports import repo_port
 from rag_project.rag_core.retrieval.search import build_prompt, vector_search
 from rag_project.rag_core.retrieval.service import QueryService
 
@@ -76,6 +79,16 @@ class FakeChunkRepo:
         return results[:limit]
 
 
+class FakeHybridRepo(FakeChunkRepo):
+    def __init__(self, stored: List[_Stored]):
+        super().__init__(stored)
+        self.hybrid_calls = []
+
+    def hybrid_search(self, query_embedding, query_text, **kwargs):
+        self.hybrid_calls.append(query_text)
+        return self.search(query_embedding, **kwargs)
+
+
 def _chunk_with_score(
     job_title: str,
     score: float,
@@ -152,6 +165,77 @@ def test_retrieval_service_handles_no_results_and_small_k():
     assert results == []
 
 
+def test_vector_search_hybrid_mode_passes_query_text():
+    repo = FakeHybridRepo([_chunk_with_score("PySpark", 0.4)])
+
+    results = vector_search(
+        "PySpark", FakeEmbedder(), repo, limit=3, mode=RETRIEVAL_MODE_HYBRID
+    )
+
+    assert repo.hybrid_calls == ["PySpark"]
+    assert results[0].job_posting.title == "PySpark"
+
+
+@pytest.mark.parametrize("mode", ["Hybrid", "hybird", ""])
+def test_vector_search_rejects_unknown_mode(mode):
+    repo = FakeHybridRepo([_chunk_with_score("PySpark", 0.4)])
+
+    with pytest.raises(ValueError, match="Unknown retrieval mode"):
+        vector_search("PySpark", FakeEmbedder(), repo, mode=mode)
+    assert repo.hybrid_calls == []
+
+
+class FakeVectorOnlyRepo(FakeChunkRepo, repo_port.ChunkRepository):
+    """Implements the port without hybrid_search, so it inherits the fallback."""
+
+    def insert_chunks_with_embeddings(self, chunks, embeddings):
+        raise NotImplementedError
+
+    def search(self, query_embedding, projection=None, weights=None, **kwargs):
+        return super().search(query_embedding, **kwargs)
+
+
+def test_hybrid_search_defaults_to_vector_search_with_warning(monkeypatch):
+    warnings = []
+    monkeypatch.setattr(
+        repo_port.logger, "warning", lambda msg, *args: warnings.append(msg % args)
+    )
+    repo = FakeVectorOnlyRepo([_chunk_with_score("PySpark", 0.4)])
+
+    results = vector_search(
+        "PySpark", FakeEmbedder(), repo, limit=3, mode=RETRIEVAL_MODE_HYBRID
+    )
+
+    assert [r.job_posting.title for r in results] == ["PySpark"]
+    assert warnings == [
+        "FakeVectorOnlyRepo has no hybrid_search; falling back to vector search"
+    ]
+
+
+def _retrieved(stored: _Stored) -> RetrievedChunk:
+    return RetrievedChunk(
+        chunk=stored.chunk, document=stored.doc, job_posting=stored.jp, score=0.0
+    )
+
+
+def test_reciprocal_rank_fusion_rewards_agreement_between_lists():
+    a, b, c = (_retrieved(_chunk_with_score(t, 0.0)) for t in ("a", "b", "c"))
+
+    fused = reciprocal_rank_fusion([[a, b], [c, b]], k=60)
+
+    assert [rc.job_posting.title for rc in fused] == ["b", "a", "c"]
+    assert len({rc.chunk.id for rc in fused}) == 3
+    assert all(0.0 < rc.score <= 1.0 for rc in fused)
+
+
+def test_reciprocal_rank_fusion_top_of_every_list_scores_one():
+    a = _retrieved(_chunk_with_score("a", 0.0))
+
+    fused = reciprocal_rank_fusion([[a], [a]])
+
+    assert fused[0].score == pytest.approx(1.0)
+
+
 def test_retrieval_prompt_builds_context():
     doc = Document(id=uuid4(), doc_type=DOC_TYPE_JOB_POSTING)
     jp = JobPosting(document_id=doc.id, title="Doc", company="Acme")
@@ -0,0 +1,107 @@
+import math
+import random
+
+from rag_project.rag_core.ingestion.semantic_chunker import (
+    _cosine,
+    _window_distances,
+    chunk_semantic,
+)
+from rag_project.rag_core.ingestion.structured_chunker import ChunkConfig
+
+TOPICS = {
+    "ranking": [1.0, 0.0, 0.0],
+    "parsing": [0.0, 1.0, 0.0],
+    "storage": [0.0, 0.0, 1.0],
+}
+
+
+class TopicEmbedder:
+    """Embeds a sentence as its topic's axis plus a little seeded noise."""
+
+    def __init__(self):
+        self.batches = []
+        self.rng = random.Random(0)
+
+    def __call__(self, texts):
+        self.batches.append(len(texts))
+        vectors = []
+        for text in texts:
+            topic = next(t for t in TOPICS if t in text)
+            vectors.append([x + self.rng.uniform(0, 0.1) for x in TOPICS[topic]])
+        return vectors
+
+
+def _topic_text(per_topic=8):
+    paragraphs = []
+    for topic in TOPICS:
+        paragraphs.append(
+            " ".join(
+                f"Sentence {i} on {topic} adds detail number {i}."
+                for i in range(per_topic)
+            )
+        )
+    return "\n\n".join(paragraphs)
+
+
+def test_semantic_chunks_break_at_topic_shifts_and_compose_embeddings():
+    embed = TopicEmbedder()
+    config = ChunkConfig(max_chunk_words=200, overlap_words=0, min_chunk_words=10)
+
+    chunks = chunk_semantic(_topic_text(), embed, config, window=2, batch_size=5)
+
+    assert [c.text.split(" on ")[1].split()[0] for c in chunks] == list(TOPICS)
+    assert all(text.count(" on ") == 8 for text in (c.text for c in chunks))
+    assert embed.batches == [5, 5, 5, 5, 4]
+    for chunk, axis in zip(chunks, TOPICS.values()):
+        assert _cosine(chunk.embedding, axis) > 0.99
+        assert math.isclose(sum(x * x for x in chunk.embedding), 1.0)
+
+
+def test_semantic_chunks_respect_size_limits_and_keep_all_sentences():
+    rng = random.Random(1)
+    sentences = [
+        f"Sentence {i} on {rng.choice(list(TOPICS))} "
+        + " ".join("word" for _ in range(rng.randint(3, 20)))
+        + "."
+        for i in range(300)
+    ]
+    config = ChunkConfig(max_chunk_words=60, overlap_words=0, min_chunk_words=20)
+
+    chunks = chunk_semantic(" ".join(sentences), TopicEmbedder(), config)
+
+    assert all(len(c.text.split()) <= 60 for c in chunks)
+    assert " ".join(c.text for c in chunks).split() == " ".join(sentences).split()
+    assert sum(len(c.text.split()) < 20 for c in chunks) <= 1
+
+
+def test_semantic_overlap_repeats_trailing_sentences():
+    config = ChunkConfig(max_chunk_words=200, overlap_words=9, min_chunk_words=10)
+
+    chunks = chunk_semantic(
+        _topic_text(), TopicEmbedder(), config, compose_embeddings=False
+    )
+
+    assert len(chunks) == 3 and all(c.embedding is None for c in chunks)
+    assert chunks[1].text.startswith("Sentence 7 on ranking")
+    assert chunks[2].text.startswith("Sentence 7 on parsing")
+
+
+def test_window_distances_match_direct_windows():
+    rng = random.Random(2)
+    vectors = [[rng.uniform(-1, 1) for _ in range(4)] for _ in range(15)]
+    window = 3
+
+    def window_sum(lo, hi):
+        return [sum(v[d] for v in vectors[max(0, lo) : hi]) for d in range(4)]
+
+    expected = [
+        1.0
+        - _cosine(window_sum(g - window + 1, g + 1), window_sum(g + 1, g + 1 + window))
+        for g in range(len(vectors) - 1)
+    ]
+
+    assert all(
+        math.isclose(a, b, abs_tol=1e-9)
+        for a, b in zip(_window_distances(vectors, window), expected)
+    )
+    assert len(_window_distances(vectors, window)) == len(expected)
@@ -0,0 +1,352 @@
+import random
+import threading
+import time
+
+import pytest
+
+from rag_project.rag_core.ingestion.chunker import chunk_text
+from rag_project.rag_core.ports.tokenizer_port import Tokenizer
+from rag_project.rag_core.ingestion.structured_chunker import (
+    ChunkConfig,
+    _BoundaryIndex,
+    _clean_segment_text,
+    _dedup_lines,
+    _is_noise_line,
+    _overlap_length,
+    _split_to_size,
+    chunk_structured,
+    chunk_structured_stream,
+)
+
+
+@pytest.mark.parametrize(
+    "line",
+    [
+        "12",
+        "Page 3 of 10",
+        "Introduction ......................... 4",
+        "| Model | Recall |",
+        "|---|---|",
+        "_Chapter 2_",
+        "**Figure 1:** Pipeline overview",
+        "References",
+        "10. List of Figures",
+    ],
+)
+def test_noise_lines_are_detected(line):
+    assert _is_noise_line(line)
+
+
+@pytest.mark.parametrize(
+    "line",
+    [
+        'print("Figure 1")',
+        "    for row in rows:",
+        "figure = build(rows)",
+        "Results indicate that hybrid ranking improves recall.",
+        "",
+    ],
+)
+def test_code_and_body_lines_are_kept(line):
+    assert not _is_noise_line(line)
+
+
+def test_clean_segment_text_scrubs_inline_noise_and_drops_tables():
+    text = "\n".join(
+        [
+            "See Page 5 for the derivation.",
+            "| a | b |",
+            "|---|---|",
+            "Body text **Figure 2: Overview** continues here.",
+            "Closing paragraph.",
+        ]
+    )
+
+    cleaned = [l for l in _clean_segment_text(text).splitlines() if l.strip()]
+
+    assert cleaned[0].startswith("See ") and "Page 5" not in cleaned[0]
+    assert not any("|" in l for l in cleaned)
+    assert "Figure 2" not in cleaned[1] and cleaned[1].startswith("Body text")
+    assert cleaned[-1] == "Closing paragraph."
+
+
+def _reference_overlap(line1, line2):
+    for length in range(min(len(line1), len(line2)), 0, -1):
+        if line1[-length:] == line2[:length]:
+            return length
+    return 0
+
+
+def _reference_dedup_lines(text):
+    lines = text.split("\n")
+    cleaned = []
+    i = 0
+    while i < len(lines):
+        current = lines[i].strip()
+        if not current:
+            if not cleaned or cleaned[-1] != "":
+                cleaned.append("")
+            i += 1
+            continue
+        if i + 1 < len(lines):
+            next_line = lines[i + 1].strip()
+            if next_line.startswith(current) and next_line != current:
+                cleaned.append(current)
+                lines[i + 1] = next_line[len(current) :].strip()
+                i += 1
+                continue
+            if next_line and next_line in current and len(next_line) > 5:
+                cleaned.append(current)
+                i += 2
+                continue
+            overlap = _reference_overlap(current, next_line)
+            if overlap > 10:
+                cleaned.append(current[:-overlap].strip())
+                i += 1
+                continue
+        if not cleaned or current != cleaned[-1]:
+            cleaned.append(current)
+        i += 1
+    return "\n".join(cleaned).strip()
+
+
+def _random_lines(rng, count):
+    # A tiny alphabet makes prefixes, containment and overlaps frequent.
+    lines = []
+    for _ in range(count):
+        roll = rng.random()
+        if roll < 0.15:
+            line = ""
+        elif roll < 0.4 and lines:
+            prev = lines[-1]
+            line = prev[rng.randint(0, len(prev)) :] + "".join(
+                rng.choice("ab ") for _ in range(rng.randint(0, 20))
+            )
+        elif roll < 0.5 and lines:
+            line = lines[-1]
+        else:
+            line = "".join(rng.choice("ab c") for _ in range(rng.randint(1, 40)))
+        lines.append(line)
+    return lines
+
+
+def test_overlap_length_matches_brute_force():
+    rng = random.Random(0)
+    for _ in range(3000):
+        line1 = "".join(rng.choice("ab") for _ in range(rng.randint(0, 30)))
+        line2 = "".join(rng.choice("ab") for _ in range(rng.randint(0, 30)))
+        expected = _reference_overlap(line1, line2)
+        assert _overlap_length(line1, line2) == expected
+        min_length = rng.randint(1, 12)
+        assert _overlap_length(line1, line2, min_length) == (
+            expected if expected >= min_length else 0
+        )
+
+
+def test_dedup_lines_matches_quadratic_reference():
+    rng = random.Random(1)
+    for _ in range(1000):
+        text = "\n".join(_random_lines(rng, rng.randint(0, 12)))
+        assert _dedup_lines(text) == _reference_dedup_lines(text)
+
+
+def test_dedup_lines_trims_pdf_style_overlaps():
+    text = "\n".join(
+        [
+            "The pipeline embeds every chunk before indexing",
+            "before indexing them with pgvector.",
+            "Header",
+            "Header",
+        ]
+    )
+
+    assert _dedup_lines(text) == (
+        "The pipeline embeds every chunk\nbefore indexing them with pgvector.\nHeader"
+    )
+
+
+def _random_chunk(rng, words):
+    pieces = []
+    for _ in range(words):
+        roll = rng.random()
+        if roll < 0.05:
+            pieces.append("\n\n")
+        elif roll < 0.08:
+            pieces.append("\n## **Heading**\n")
+        elif roll < 0.11:
+            pieces.append("\n01/2020 - Role\n")
+        elif roll < 0.15:
+            pieces.append("\n- item")
+        pieces.append(rng.choice(["word", "Word.", "end!", "x"]) + " ")
+    return "".join(pieces).strip()
+
+
+def _candidate_tuples(candidates):
+    return sorted((c.position, c.priority, c.distance_to_target) for c in candidates)
+
+
+def test_boundary_index_on_tail_matches_rescanning_the_tail():
+    rng = random.Random(2)
+    for _ in range(200):
+        text = _random_chunk(rng, 60)
+        index = _BoundaryIndex(text)
+        for offset in index.word_starts[:: rng.randint(3, 9)]:
+            tail = _BoundaryIndex(text[offset:])
+            min_pos = tail.word_starts[len(tail.word_starts) // 4]
+            target_pos = tail.word_starts[-1]
+            assert _candidate_tuples(
+                index.candidates(offset, min_pos, target_pos)
+            ) == _candidate_tuples(tail.candidates(0, min_pos, target_pos))
+
+
+def test_split_to_size_respects_target_and_keeps_all_words():
+    rng = random.Random(3)
+    text = _random_chunk(rng, 2000)
+    config = ChunkConfig(max_chunk_words=120, overlap_words=0, min_chunk_words=40)
+
+    chunks = _split_to_size([text], config)
+
+    assert len(chunks) > 10
+    assert all(len(c.split()) <= config.max_chunk_words for c in chunks)
+    assert " ".join(chunks).split() == text.split()
+
+
+def _findings_text(rng, sections):
+    paragraphs = []
+    for i in range(sections):
+        body = " ".join(
+            f"Result {i}.{j} improves recall by {rng.randint(1, 9)} points."
+            for j in range(rng.randint(3, 15))
+        )
+        paragraphs.append(f"## **{i}. Findings**\n{body}")
+    return "\n\n".join(paragraphs)
+
+
+def test_chunk_structured_stream_matches_batch_chunking():
+    text = _findings_text(random.Random(4), 40)
+    config = ChunkConfig(max_chunk_words=90, overlap_words=10, min_chunk_words=30)
+
+    streamed = list(chunk_structured_stream(iter(text.splitlines()), config))
+
+    assert len(streamed) > 10
+    assert streamed == chunk_structured(text, config)
+
+
+def test_process_pool_chunking_matches_serial_and_reuses_the_pool(monkeypatch):
+    from rag_project.rag_core.ingestion import structured_chunker
+
+    monkeypatch.setattr(structured_chunker, "STRUCTURED_PARALLEL_MIN_WORDS", 0)
+    text = _findings_text(random.Random(5), 60)
+    config = ChunkConfig(max_chunk_words=90, overlap_words=10, min_chunk_words=30)
+
+    parallel = chunk_structured(text, config, workers=2)
+    pool = structured_chunker._pool
+    again = chunk_structured(text, config, workers=2)
+
+    assert pool is not None and structured_chunker._pool is pool
+    structured_chunker._discard_chunk_pool(pool)
+    assert len(parallel) > 10
+    assert parallel == again == chunk_structured(text, config)
+
+
+def test_small_texts_stay_in_process_with_workers():
+    from rag_project.rag_core.ingestion import structured_chunker
+
+    structured_chunker._pool = None
+    text = _findings_text(random.Random(5), 10)
+    config = ChunkConfig(max_chunk_words=90, overlap_words=10, min_chunk_words=30)
+
+    assert chunk_structured(text, config, workers=4) == chunk_structured(text, config)
+    assert structured_chunker._pool is None
+
+
+def test_llm_boundaries_run_concurrently_in_threads():
+    text = _findings_text(random.Random(6), 60)
+    config = ChunkConfig(
+        max_chunk_words=90,
+        overlap_words=10,
+        min_chunk_words=30,
+        use_llm=True,
+        max_llm_input_words=400,
+    )
+    prompts = []
+    lock = threading.Lock()
+    active = [0, 0]  # current, peak
+
+    def llm_generate(prompt, max_tokens):
+        with lock:
+            prompts.append(prompt)
+            active[0] += 1
+            active[1] = max(active)
+        time.sleep(0.01)
+        with lock:
+            active[0] -= 1
+        return '{"boundaries": [3, 7]}'
+
+    serial = chunk_structured(text, config, llm_generate, llm_concurrency=1)
+    serial_prompts = sorted(prompts)
+    prompts.clear()
+    assert active[1] == 1
+
+    assert chunk_structured(text, config, llm_generate, llm_concurrency=3) == serial
+    assert len(serial_prompts) > 3 and sorted(prompts) == serial_prompts
+    assert active[1] > 1
+
+
+class SubwordTokenizer(Tokenizer):
+    """One token per started group of three characters of each word."""
+
+    def count(self, text):
+        return sum(self.word_token_counts(text))
+
+    def truncate(self, text, max_tokens):
+        raise NotImplementedError
+
+    def word_token_counts(self, text):
+        return [(len(word) + 2) // 3 for word in text.split()]
+
+
+class OneTokenPerWord(SubwordTokenizer):
+    def word_token_counts(self, text):
+        return [1] * len(text.split())
+
+
+def test_token_sizing_with_one_token_per_word_matches_word_sizing():
+    text = _findings_text(random.Random(7), 30)
+    config = ChunkConfig(max_chunk_words=90, overlap_words=10, min_chunk_words=30)
+    token_config = ChunkConfig(
+        max_chunk_words=90,
+        overlap_words=10,
+        min_chunk_words=30,
+        tokenizer=OneTokenPerWord(),
+    )
+
+    assert chunk_structured(text, token_config) == chunk_structured(text, config)
+
+
+def test_split_to_size_in_tokens_respects_token_target():
+    rng = random.Random(8)
+    text = _random_chunk(rng, 2000)
+    tokenizer = SubwordTokenizer()
+    config = ChunkConfig(
+        max_chunk_words=120, overlap_words=0, min_chunk_words=40, tokenizer=tokenizer
+    )
+
+    chunks = _split_to_size([text], config)
+
+    assert len(chunks) > 10
+    assert all(tokenizer.count(c) <= config.max_chunk_words for c in chunks)
+    assert " ".join(chunks).split() == text.split()
+
+
+def test_chunk_text_in_tokens_overlaps_by_tokens():
+    tokenizer = SubwordTokenizer()
+    text = " ".join(f"Sentence number {i} about retrieval." for i in range(60))
+
+    chunks = chunk_text(text, max_tokens=40, overlap_tokens=8, tokenizer=tokenizer)
+
+    assert len(chunks) > 5
+    assert all(tokenizer.count(c) <= 40 for c in chunks)
+    for prev, chunk in zip(chunks, chunks[1:]):
+        head = chunk.split(" Sentence", 1)[0]
+        assert prev.endswith(head) and tokenizer.count(head) <= 8
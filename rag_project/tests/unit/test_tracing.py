@@ -0,0 +1,118 @@
+import json
+
+import pytest
+
+from rag_project.rag_core.infra.llm_ollama import OllamaLLMProvider
+from rag_project.rag_core.infra.tracing_adapters import TracedLLMProvider
+from rag_project.tracing import (
+    NOOP_SPAN,
+    Span,
+    configure_tracing,
+    critical_path,
+    load_traces,
+    start_span,
+    traced,
+)
+
+
+@pytest.fixture
+def trace_path(tmp_path):
+    path = tmp_path / "traces.jsonl"
+    configure_tracing(str(path))
+    yield path
+    configure_tracing(None)
+
+
+def test_disabled_tracing_yields_noop_span():
+    with start_span("anything") as span:
+        assert span is NOOP_SPAN
+
+
+def test_nested_spans_export_one_otlp_line_per_trace(trace_path):
+    @traced("outer")
+    def outer():
+        with start_span("inner", step=1) as span:
+            span.set_attribute("rows", 3)
+
+    outer()
+    outer()
+
+    lines = trace_path.read_text().splitlines()
+    assert len(lines) == 2
+    spans = json.loads(lines[0])["resourceSpans"][0]["scopeSpans"][0]["spans"]
+    inner, root = spans
+    assert (inner["name"], root["name"]) == ("inner", "outer")
+    assert inner["parentSpanId"] == root["spanId"]
+    assert "parentSpanId" not in root
+    assert {"key": "rows", "value": {"intValue": "3"}} in inner["attributes"]
+
+    (first, _second) = load_traces(str(trace_path))
+    assert first[0].attributes == {"step": 1, "rows": 3}
+
+
+def test_failed_span_records_error_status(trace_path):
+    with pytest.raises(ValueError):
+        with start_span("boom"):
+            raise ValueError("bad input")
+
+    ((span,),) = load_traces(str(trace_path))
+    assert span.status == 2
+    assert span.status_message == "ValueError: bad input"
+
+
+def _span(name, span_id, parent, start, end):
+    span = Span(name)
+    span.trace_id = "t"
+    span.span_id = span_id
+    span.parent_span_id = parent
+    span.start_ns, span.end_ns = start, end
+    return span
+
+
+def test_critical_path_follows_last_finishing_children():
+    spans = [
+        _span("root", "r", "", 0, 100),
+        _span("extract", "a", "r", 0, 30),
+        _span("eval_1", "b", "r", 30, 60),
+        _span("eval_2", "c", "r", 60, 100),
+        _span("search", "d", "c", 60, 70),
+        _span("llm", "e", "c", 70, 95),
+        _span("side", "f", "r", 5, 20),
+    ]
+
+    names = [s.name for s in critical_path(spans)]
+
+    assert names == ["root", "extract", "eval_1", "eval_2", "search", "llm"]
+
+
+class _FakeResponse:
+    def raise_for_status(self):
+        pass
+
+    def json(self):
+        return {
+            "model": "qwen",
+            "response": "ok",
+            "prompt_eval_count": 42,
+            "eval_count": 7,
+            "load_duration": 2_000_000,
+        }
+
+
+def test_traced_llm_span_carries_ollama_token_counts(trace_path, monkeypatch):
+    inner = OllamaLLMProvider(base_url="http://ollama", model="qwen")
+    monkeypatch.setattr(
+        "rag_project.rag_core.infra.llm_ollama.httpx.post",
+        lambda *a, **k: _FakeResponse(),
+    )
+    llm = TracedLLMProvider(inner)
+
+    assert llm.generate("hello", max_tokens=16) == "ok"
+    assert llm.model == "qwen"
+
+    ((span,),) = load_traces(str(trace_path))
+    assert span.name == "llm.generate"
+    assert span.attributes["llm.prompt_tokens"] == 42
+    assert span.attributes["llm.completion_tokens"] == 7
+    assert span.attributes["llm.max_tokens"] == 16
+    assert span.attributes["llm.load_ms"] == 2.0
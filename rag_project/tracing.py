@@ -0,0 +1,288 @@
+"""Lightweight span tracing with an OTLP/JSON file exporter.
+
+`start_span(name, **attributes)` opens a span as a child of the current one
+(tracked per thread/task with contextvars). When the root span of a trace ends,
+the whole trace is written as one OTLP/JSON `ExportTraceServiceRequest` line, the
+format an OpenTelemetry Collector `otlpjsonfile` receiver reads.
+
+Tracing is off until `configure_tracing(path)` is called (RAGApp does so when
+TRACE_EXPORT_PATH is set); disabled spans are a shared no-op object.
+"""
+
+import json
+import os
+import secrets
+import threading
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from functools import wraps
+from typing import Any, Dict, Iterator, List, Optional
+
+from rag_project.config import TRACE_SERVICE_NAME
+from rag_project.logger import get_logger
+
+logger = get_logger(__name__)
+
+STATUS_UNSET = 0
+STATUS_OK = 1
+STATUS_ERROR = 2
+
+
+class Span:
+    __slots__ = (
+        "trace_id",
+        "span_id",
+        "parent_span_id",
+        "name",
+        "start_ns",
+        "end_ns",
+        "attributes",
+        "status",
+        "status_message",
+    )
+
+    def __init__(self, name: str, parent: Optional["Span"] = None) -> None:
+        self.trace_id = parent.trace_id if parent else secrets.token_hex(16)
+        self.span_id = secrets.token_hex(8)
+        self.parent_span_id = parent.span_id if parent else ""
+        self.name = name
+        self.start_ns = time.time_ns()
+        self.end_ns = 0
+        self.attributes: Dict[str, Any] = {}
+        self.status = STATUS_UNSET
+        self.status_message = ""
+
+    def set_attribute(self, key: str, value: Any) -> None:
+        if value is not None:
+            self.attributes[key] = value
+
+    def set_attributes(self, attributes: Dict[str, Any]) -> None:
+        for key, value in attributes.items():
+            self.set_attribute(key, value)
+
+    @property
+    def duration_ms(self) -> float:
+        return (self.end_ns - self.start_ns) / 1e6
+
+    def to_otlp(self) -> dict:
+        span = {
+            "traceId": self.trace_id,
+            "spanId": self.span_id,
+            "name": self.name,
+            "kind": 1,  # SPAN_KIND_INTERNAL
+            "startTimeUnixNano": str(self.start_ns),
+            "endTimeUnixNano": str(self.end_ns),
+            "attributes": [_otlp_attribute(k, v) for k, v in self.attributes.items()],
+            "status": {"code": self.status},
+        }
+        if self.parent_span_id:
+            span["parentSpanId"] = self.parent_span_id
+        if self.status_message:
+            span["status"]["message"] = self.status_message
+        return span
+
+
+class _NoopSpan:
+    """Returned while tracing is disabled; accepts and drops everything."""
+
+    def set_attribute(self, key: str, value: Any) -> None:
+        pass
+
+    def set_attributes(self, attributes: Dict[str, Any]) -> None:
+        pass
+
+
+NOOP_SPAN = _NoopSpan()
+
+
+def _otlp_attribute(key: str, value: Any) -> dict:
+    if isinstance(value, bool):
+        typed = {"boolValue": value}
+    elif isinstance(value, int):
+        typed = {"intValue": str(value)}
+    elif isinstance(value, float):
+        typed = {"doubleValue": value}
+    else:
+        typed = {"stringValue": str(value)}
+    return {"key": key, "value": typed}
+
+
+def _python_value(typed: dict) -> Any:
+    if "intValue" in typed:
+        return int(typed["intValue"])
+    (value,) = typed.values()
+    return value
+
+
+class FileSpanExporter:
+    """Append each finished trace as one OTLP/JSON line."""
+
+    def __init__(self, path: str, service_name: str = TRACE_SERVICE_NAME) -> None:
+        self.path = path
+        self.service_name = service_name
+        self._lock = threading.Lock()
+
+    def export(self, spans: List[Span]) -> None:
+        request = {
+            "resourceSpans": [
+                {
+                    "resource": {
+                        "attributes": [
+                            _otlp_attribute("service.name", self.service_name)
+                        ]
+                    },
+                    "scopeSpans": [
+                        {
+                            "scope": {"name": __name__},
+                            "spans": [span.to_otlp() for span in spans],
+                        }
+                    ],
+                }
+            ]
+        }
+        line = json.dumps(request, separators=(",", ":"))
+        with self._lock:
+            os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+            with open(self.path, "a", encoding="utf-8") as fh:
+                fh.write(line + "\n")
+
+
+class Tracer:
+    """Collects finished spans per trace and hands complete traces to the exporter."""
+
+    def __init__(self) -> None:
+        self.exporter: Optional[FileSpanExporter] = None
+        self._pending: Dict[str, List[Span]] = {}
+        self._lock = threading.Lock()
+
+    @property
+    def enabled(self) -> bool:
+        return self.exporter is not None
+
+    def on_end(self, span: Span) -> None:
+        with self._lock:
+            spans = self._pending.setdefault(span.trace_id, [])
+            spans.append(span)
+            if span.parent_span_id:
+                return
+            del self._pending[span.trace_id]
+        try:
+            self.exporter.export(spans)
+        except OSError as exc:
+            logger.warning("Trace export failed: %s", exc)
+
+
+TRACER = Tracer()
+_current_span: ContextVar[Optional[Span]] = ContextVar("current_span", default=None)
+
+
+def configure_tracing(path: Optional[str]) -> None:
+    """Export traces to path (JSON lines); None or "" disables tracing."""
+    TRACER.exporter = FileSpanExporter(path) if path else None
+    if path:
+        logger.info("Tracing enabled, exporting to %s", path)
+
+
+def current_span():
+    """The active span, or the no-op span when none is open or tracing is off."""
+    return _current_span.get() or NOOP_SPAN
+
+
+@contextmanager
+def start_span(name: str, **attributes: Any) -> Iterator[Any]:
+    if not TRACER.enabled:
+        yield NOOP_SPAN
+        return
+    span = Span(name, _current_span.get())
+    span.set_attributes(attributes)
+    token = _current_span.set(span)
+    try:
+        yield span
+        span.status = STATUS_OK
+    except BaseException as exc:
+        span.status = STATUS_ERROR
+        span.status_message = f"{type(exc).__name__}: {exc}"
+        raise
+    finally:
+        span.end_ns = time.time_ns()
+        _current_span.reset(token)
+        TRACER.on_end(span)
+
+
+def traced(name: str):
+    """Decorator form of start_span for service entry points."""
+
+    def decorator(func):
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            with start_span(name):
+                return func(*args, **kwargs)
+
+        return wrapper
+
+    return decorator
+
+
+# --------------------------------------------------------------------------- #
+# Reading traces back (used by scripts/trace_report.py)
+# --------------------------------------------------------------------------- #
+def load_traces(path: str) -> List[List[Span]]:
+    """Parse an exported file into one list of spans per trace, oldest first."""
+    traces: List[List[Span]] = []
+    with open(path, "r", encoding="utf-8") as fh:
+        for line in fh:
+            if not line.strip():
+                continue
+            spans: List[Span] = []
+            for resource in json.loads(line).get("resourceSpans", []):
+                for scope in resource.get("scopeSpans", []):
+                    spans.extend(_span_from_otlp(raw) for raw in scope["spans"])
+            traces.append(spans)
+    return traces
+
+
+def _span_from_otlp(raw: dict) -> Span:
+    span = Span.__new__(Span)
+    span.trace_id = raw["traceId"]
+    span.span_id = raw["spanId"]
+    span.parent_span_id = raw.get("parentSpanId", "")
+    span.name = raw["name"]
+    span.start_ns = int(raw["startTimeUnixNano"])
+    span.end_ns = int(raw["endTimeUnixNano"])
+    span.attributes = {a["key"]: _python_value(a["value"]) for a in raw["attributes"]}
+    span.status = raw.get("status", {}).get("code", STATUS_UNSET)
+    span.status_message = raw.get("status", {}).get("message", "")
+    return span
+
+
+def critical_path(spans: List[Span]) -> List[Span]:
+    """Spans that determine the root's end time, in start order.
+
+    Walks back from each span's end: the child finishing last is on the path,
+    then the child finishing before that one started, and so on.
+    """
+    children: Dict[str, List[Span]] = {}
+    root = None
+    for span in spans:
+        if span.parent_span_id:
+            children.setdefault(span.parent_span_id, []).append(span)
+        else:
+            root = span
+    if root is None:
+        return []
+
+    path: List[Span] = []
+
+    def walk(span: Span) -> None:
+        path.append(span)
+        cursor = span.end_ns
+        for child in sorted(
+            children.get(span.span_id, []), key=lambda s: s.end_ns, reverse=True
+        ):
+            if child.end_ns <= cursor:
+                walk(child)
+                cursor = child.start_ns
+
+    walk(root)
+    return sorted(path, key=lambda s: (s.start_ns, -s.end_ns))
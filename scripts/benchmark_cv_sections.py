@@ -0,0 +1,170 @@
+"""LLM calls avoided and boundary agreement of the rule-based CV section detector.
+
+Generates a synthetic CV corpus in several layouts (colon, caps and markdown
+headings, title-over-date entries, German headings, and heading-less prose CVs)
+with known section boundaries. Reports how many CVs reach CV_RULES_MIN_CONFIDENCE
+(LLM calls avoided) and how well the rule boundaries agree with the gold ones
+(a boundary within one line counts as agreeing). With --llm every CV is also
+split by the configured LLM to compare rules against it on the accepted CVs.
+
+Usage:
+    python -m scripts.benchmark_cv_sections [--cvs 200] [--llm]
+"""
+
+import argparse
+import random
+import time
+from typing import List, Set, Tuple
+
+from rag_project.config import (
+    CV_CHUNKER_MAX_OUTPUT_TOKENS,
+    CV_CHUNKER_MODEL_ID,
+    CV_RULES_MIN_CONFIDENCE,
+)
+from rag_project.rag_core.ingestion.cv_chunker import (
+    _adjust_split_points,
+    detect_cv_sections,
+    get_llm_splits,
+)
+
+SECTIONS = {
+    "en": ("Profile", "Experience", "Projects", "Education", "Skills", "Languages"),
+    "de": ("Profil", "Berufserfahrung", "Projekte", "Ausbildung", "Kenntnisse"),
+}
+ENTRY_SECTIONS = {"Experience", "Berufserfahrung", "Projects", "Projekte"}
+COMPANIES = ("ACME AI", "Beta GmbH", "Gamma Labs", "Delta AG", "Epsilon Inc")
+ROLES = ("ML Engineer", "Data Scientist", "Backend Developer", "Team Lead")
+WORDS = (
+    "python retrieval pipelines ranking kubernetes docker sql evaluation "
+    "latency embeddings search teams customers releases monitoring"
+).split()
+
+
+def _sentence(rng: random.Random) -> str:
+    return " ".join(rng.choice(WORDS) for _ in range(rng.randint(6, 14))).capitalize()
+
+
+def _heading(name: str, style: str) -> str:
+    return {"colon": f"{name}:", "caps": name.upper(), "markdown": f"## {name}"}[style]
+
+
+def _entry(rng: random.Random, title_above: bool) -> List[str]:
+    start = rng.randint(2008, 2020)
+    dates = f"{rng.randint(1, 12):02d}/{start} - " + rng.choice(
+        ["Now", "heute", f"{rng.randint(1, 12):02d}/{start + rng.randint(1, 3)}"]
+    )
+    company, role = rng.choice(COMPANIES), rng.choice(ROLES)
+    head = [f"{role}, {company}", dates] if title_above else [f"{dates} | {company}"]
+    return head + [f"- {_sentence(rng)}" for _ in range(rng.randint(1, 4))]
+
+
+def synthetic_cv(rng: random.Random) -> Tuple[List[str], Set[int]]:
+    """CV lines and the gold chunk start lines (header chunk excluded)."""
+    lines = ["Jane Roe", "Senior Engineer", "jane@example.com"]
+    if rng.random() < 0.15:
+        # Heading-less prose: the rules should defer to the LLM.
+        lines += ["", *(_sentence(rng) + "." for _ in range(rng.randint(6, 12)))]
+        return lines, set()
+    style = rng.choice(["colon", "caps", "markdown"])
+    title_above = rng.random() < 0.5
+    starts: Set[int] = set()
+    for name in SECTIONS[rng.choice(["en", "de"])]:
+        lines.append("")
+        starts.add(len(lines))
+        lines.append(_heading(name, style))
+        if name in ENTRY_SECTIONS:
+            for n in range(rng.randint(1, 4)):
+                if n:
+                    lines.append("")
+                    starts.add(len(lines))
+                lines.extend(_entry(rng, title_above))
+        else:
+            lines.extend(_sentence(rng) for _ in range(rng.randint(1, 3)))
+    return lines, starts
+
+
+def _chunk_starts(lines: List[str], split_points: List[int]) -> Set[int]:
+    return {p + 1 for p in split_points if p + 1 < len(lines)}
+
+
+def _matches(found: Set[int], expected: Set[int]) -> int:
+    return sum(any(abs(f - e) <= 1 for e in expected) for f in found)
+
+
+def _agreement(pairs) -> str:
+    found = expected = hit_found = hit_expected = 0
+    for got, want in pairs:
+        found += len(got)
+        expected += len(want)
+        hit_found += _matches(got, want)
+        hit_expected += _matches(want, got)
+    precision = hit_found / found if found else 1.0
+    recall = hit_expected / expected if expected else 1.0
+    f1 = 2 * precision * recall / (precision + recall) if precision + recall else 0.0
+    return f"P={precision:.3f} R={recall:.3f} F1={f1:.3f}"
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark rule-based CV sections")
+    parser.add_argument("--cvs", type=int, default=200)
+    parser.add_argument("--min-confidence", type=float, default=CV_RULES_MIN_CONFIDENCE)
+    parser.add_argument(
+        "--llm", action="store_true", help="Also split every CV with the app's LLM"
+    )
+    args = parser.parse_args()
+
+    rng = random.Random(11)
+    corpus = [synthetic_cv(rng) for _ in range(args.cvs)]
+    t0 = time.perf_counter()
+    detected = [detect_cv_sections(lines) for lines, _gold in corpus]
+    rules_seconds = time.perf_counter() - t0
+    accepted = [d.confidence >= args.min_confidence for d in detected]
+
+    print(f"{args.cvs} CVs, min confidence {args.min_confidence}")
+    print(
+        f"LLM calls avoided: {sum(accepted)}/{args.cvs} "
+        f"({sum(accepted) / args.cvs:.0%}), rules took {rules_seconds * 1000:.1f} ms"
+    )
+    rule_pairs = [
+        (_chunk_starts(lines, _adjust_split_points(lines, d.split_points)), gold)
+        for (lines, gold), d, ok in zip(corpus, detected, accepted)
+        if ok
+    ]
+    print(f"rules vs gold (accepted CVs): {_agreement(rule_pairs)}")
+    prose_accepted = sum(ok for (_l, gold), ok in zip(corpus, accepted) if not gold)
+    print(f"heading-less CVs accepted by rules: {prose_accepted}")
+
+    if args.llm:
+        from rag_project.rag_core.app_facade import RAGApp
+
+        llm = RAGApp().llm
+
+        def llm_generate(prompt, max_tokens=CV_CHUNKER_MAX_OUTPUT_TOKENS):
+            return llm.generate(
+                prompt, model=CV_CHUNKER_MODEL_ID, max_tokens=max_tokens
+            )
+
+        t0 = time.perf_counter()
+        llm_starts = []
+        for lines, _gold in corpus:
+            points = get_llm_splits(lines, llm_generate)[0]
+            llm_starts.append(_chunk_starts(lines, _adjust_split_points(lines, points)))
+        llm_seconds = time.perf_counter() - t0
+        print(f"LLM split {args.cvs} CVs in {llm_seconds:.1f} s")
+        print(
+            "LLM vs gold (all CVs): "
+            + _agreement(zip(llm_starts, (gold for _l, gold in corpus)))
+        )
+        print(
+            "rules vs LLM (accepted CVs): "
+            + _agreement(
+                (rules, llm_found)
+                for (rules, _gold), llm_found in zip(
+                    rule_pairs, (s for s, ok in zip(llm_starts, accepted) if ok)
+                )
+            )
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,130 @@
+"""Microbenchmark of the structured chunker's line dedup.
+
+Times _dedup_lines against the previous implementation, which compared suffix and
+prefix slices for every overlap length of each line pair. Pass PDF or markdown
+files (parsed with parse_file, so PDFs go through pymupdf4llm); without files a
+synthetic PDF-style extraction is used: long wrapped lines, running headers and
+lines that repeat the tail of the previous one. Both must produce identical
+output.
+
+Usage:
+    python -m scripts.benchmark_dedup [paths ...] [--pages 300] [--runs 5]
+"""
+
+import argparse
+import random
+import statistics
+import time
+from pathlib import Path
+from typing import List
+
+from rag_project.rag_core.ingestion.parser import parse_file
+from rag_project.rag_core.ingestion.structured_chunker import (
+    _clean_segment_text,
+    _dedup_lines,
+)
+
+WORDS = (
+    "retrieval ranking embedding evaluation baseline pipeline latency recall "
+    "precision corpus query document thesis method result section analysis"
+).split()
+
+
+def synthetic_extraction(pages: int, lines_per_page: int = 40, seed: int = 7) -> str:
+    rng = random.Random(seed)
+    lines: List[str] = []
+    for page in range(1, pages + 1):
+        lines.append(f"## Master Thesis - Chapter {page // 20 + 1}")
+        for _ in range(lines_per_page):
+            line = " ".join(rng.choice(WORDS) for _ in range(rng.randint(12, 30)))
+            roll = rng.random()
+            if roll < 0.1 and lines[-1]:
+                # PDF extraction repeating the end of the previous line.
+                line = lines[-1][-rng.randint(15, 60) :].lstrip() + " " + line
+            elif roll < 0.15:
+                lines.append(line)
+            elif roll < 0.2:
+                lines.append("")
+            lines.append(line)
+        lines.append("")
+    return "\n".join(lines)
+
+
+# --- previous implementation (quadratic overlap search) ---
+def legacy_dedup_lines(text: str) -> str:
+    def find_overlap(line1: str, line2: str) -> str:
+        max_overlap = min(len(line1), len(line2))
+        for length in range(max_overlap, 0, -1):
+            if line1[-length:] == line2[:length]:
+                return line1[-length:]
+        return ""
+
+    lines = text.split("\n")
+    cleaned: List[str] = []
+    i = 0
+    while i < len(lines):
+        current = lines[i].strip()
+        if not current:
+            if not cleaned or cleaned[-1] != "":
+                cleaned.append("")
+            i += 1
+            continue
+        if i + 1 < len(lines):
+            next_line = lines[i + 1].strip()
+            if next_line.startswith(current) and next_line != current:
+                cleaned.append(current)
+                lines[i + 1] = next_line[len(current) :].strip()
+                i += 1
+                continue
+            if next_line and next_line in current and len(next_line) > 5:
+                cleaned.append(current)
+                i += 2
+                continue
+            overlap = find_overlap(current, next_line)
+            if overlap and len(overlap) > 10:
+                cleaned.append(current[: -len(overlap)].strip())
+                i += 1
+                continue
+        if not cleaned or current != cleaned[-1]:
+            cleaned.append(current)
+        i += 1
+    return "\n".join([line for line in cleaned if line is not None]).strip()
+
+
+def _time(fn, text: str, runs: int) -> float:
+    samples = []
+    for _ in range(runs):
+        t0 = time.perf_counter()
+        fn(text)
+        samples.append(time.perf_counter() - t0)
+    return statistics.median(samples) * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark line dedup")
+    parser.add_argument("paths", nargs="*", type=Path)
+    parser.add_argument("--pages", type=int, default=300)
+    parser.add_argument("--runs", type=int, default=5)
+    args = parser.parse_args()
+
+    if args.paths:
+        sources = [(p.name, _clean_segment_text(parse_file(p))) for p in args.paths]
+    else:
+        sources = [
+            (f"synthetic ({args.pages} pages)", synthetic_extraction(args.pages))
+        ]
+
+    print(f"{'input':<32}{'lines':>8}{'legacy ms':>12}{'kmp ms':>10}{'speedup':>9}")
+    for name, text in sources:
+        if _dedup_lines(text) != legacy_dedup_lines(text):
+            raise SystemExit(f"{name}: output differs from the previous implementation")
+        legacy_ms = _time(legacy_dedup_lines, text, args.runs)
+        current_ms = _time(_dedup_lines, text, args.runs)
+        print(
+            f"{name[:31]:<32}{text.count(chr(10)) + 1:>8}{legacy_ms:>12.1f}"
+            f"{current_ms:>10.1f}{legacy_ms / current_ms:>8.2f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -2,6 +2,10 @@
 
 Usage:
     python -m scripts.benchmark_job_matching --job-file path/to/job.txt
+    python -m scripts.benchmark_job_matching --job-file a.txt b.txt c.txt
+
+With several files the jobs run through analyze_matches (phase-grouped model
+calls) and the scheduler's model switch count is reported.
 """
 
 import argparse
@@ -17,13 +21,20 @@ logger = get_logger(__name__)
 def main():
     parser = argparse.ArgumentParser(description="Benchmark job matching pipeline")
     parser.add_argument(
-        "--job-file", required=True, help="Path to job description text file"
+        "--job-file",
+        required=True,
+        nargs="+",
+        help="Path(s) to job description text files",
     )
     args = parser.parse_args()
 
+    app = RAGApp()
+    if len(args.job_file) > 1:
+        _benchmark_many(app, args.job_file)
+        return
+    args.job_file = args.job_file[0]
     job_text = open(args.job_file, "r", encoding="utf-8").read()
 
-    app = RAGApp()
     logger.info("Benchmark starting for job_file=%s", args.job_file)
     t0 = time.time()
     result = app.job_matching.analyze_match(job_text)
@@ -46,5 +57,21 @@ def main():
             print(f"- {ev.requirement.name}: {ev.verdict} | {ev.reasoning}")
 
 
+def _benchmark_many(app: RAGApp, paths: list[str]) -> None:
+    job_texts = [open(p, "r", encoding="utf-8").read() for p in paths]
+    switches_before = getattr(app.llm, "switches", 0)
+    t0 = time.time()
+    results = app.job_matching.analyze_matches(job_texts)
+    elapsed = time.time() - t0
+    switches = getattr(app.llm, "switches", 0) - switches_before
+
+    print(f"Elapsed: {elapsed:.2f}s for {len(paths)} jobs, model switches: {switches}")
+    for path, result in zip(paths, results):
+        print(
+            f"- {path}: {result.match_rate:.1f}% "
+            f"({result.match_count}/{len(result.evaluations)})"
+        )
+
+
 if __name__ == "__main__":
     main()
@@ -0,0 +1,110 @@
+"""Wall time of chunk_structured in process vs with the shared process pool.
+
+Chunks synthetic theses of several sizes (or the given files, parsed with
+parse_file) serially, with a cold pool (first call starts the spawn workers)
+and with the warm pool that later calls reuse. A one-worker pool measures the
+pickling overhead per text, which decides STRUCTURED_PARALLEL_MIN_WORDS: on k
+cores the pool only wins once serial * (1 - 1/k) exceeds that overhead.
+With --llm-latency a fake boundary LLM sleeps per call, showing the concurrent
+LLM phase (threads in the calling process, no pool needed).
+All runs must produce identical chunks.
+
+Usage:
+    python -m scripts.benchmark_parallel_chunker [paths ...]
+        [--pages 30 300 3000] [--workers 4] [--llm-latency 0]
+"""
+
+import argparse
+import time
+from pathlib import Path
+
+from rag_project.rag_core.ingestion import structured_chunker
+from rag_project.rag_core.ingestion.parser import parse_file
+from rag_project.rag_core.ingestion.structured_chunker import (
+    ChunkConfig,
+    chunk_structured,
+)
+from scripts.benchmark_dedup import synthetic_extraction
+
+
+def _timed(fn):
+    t0 = time.perf_counter()
+    result = fn()
+    return result, time.perf_counter() - t0
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark parallel chunking")
+    parser.add_argument("paths", nargs="*", type=Path)
+    parser.add_argument("--pages", type=int, nargs="+", default=[30, 300, 3000])
+    parser.add_argument("--workers", type=int, default=4)
+    parser.add_argument("--llm-latency", type=float, default=0.0)
+    args = parser.parse_args()
+
+    if args.paths:
+        sources = [(p.name, parse_file(p)) for p in args.paths]
+    else:
+        sources = [
+            (f"synthetic {n} pages", synthetic_extraction(n)) for n in args.pages
+        ]
+    config = ChunkConfig(
+        max_chunk_words=300,
+        overlap_words=40,
+        use_llm=args.llm_latency > 0,
+        max_llm_input_words=1800,
+    )
+    # Measure the pool at every size, not only above the configured threshold.
+    structured_chunker.STRUCTURED_PARALLEL_MIN_WORDS = 0
+
+    def llm_generate(prompt: str, max_tokens: int) -> str:
+        time.sleep(args.llm_latency)
+        return '{"boundaries": []}'
+
+    print(
+        f"{'input':<26}{'words':>9}{'serial s':>10}{'threads s':>10}"
+        f"{'cold pool s':>12}{'warm pool s':>12}{'pool overhead s':>16}"
+    )
+    for name, text in sources:
+        serial, serial_s = _timed(
+            lambda: chunk_structured(text, config, llm_generate, llm_concurrency=1)
+        )
+        threaded, threaded_s = _timed(
+            lambda: chunk_structured(text, config, llm_generate)
+        )
+        structured_chunker._discard_chunk_pool(structured_chunker._chunk_pool(1))
+        cold, cold_s = _timed(
+            lambda: chunk_structured(text, config, llm_generate, workers=args.workers)
+        )
+        warm, warm_s = _timed(
+            lambda: chunk_structured(text, config, llm_generate, workers=args.workers)
+        )
+        structured_chunker._discard_chunk_pool(structured_chunker._chunk_pool(1))
+
+        # Same segments chunked here and in a warm one-worker pool: the
+        # difference is what shipping lines and chunks between processes costs.
+        segments = structured_chunker._segment_large_text(
+            structured_chunker._clean_segment_text(text),
+            structured_chunker._segment_limit(config),
+        )
+        one = structured_chunker._chunk_pool(1)
+
+        def chunk_segments(pool):
+            return structured_chunker._chunk_segments(
+                segments, config, llm_generate, 1, pool, 1
+            )
+
+        chunk_segments(one)  # start the worker
+        here, here_s = _timed(lambda: chunk_segments(None))
+        shipped, shipped_s = _timed(lambda: chunk_segments(one))
+        structured_chunker._discard_chunk_pool(one)
+        if not serial == threaded == cold == warm == here == shipped:
+            raise SystemExit(f"{name}: pooled output differs from serial output")
+        print(
+            f"{name[:25]:<26}{len(text.split()):>9}{serial_s:>10.3f}"
+            f"{threaded_s:>10.3f}{cold_s:>12.3f}{warm_s:>12.3f}"
+            f"{shipped_s - here_s:>16.3f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,144 @@
+"""Parse time and output size per format: raw text read vs the registered parsers.
+
+Writes synthetic HTML postings, a DOCX file and a JSON job feed, then parses
+each with a plain text read (what parse_file did for HTML and unknown suffixes)
+and with parse_file's registered parser. Output size is reported in characters
+and in tokens of the embedding model's tokenizer (what chunking and embedding
+pay for). For the JSON feed it also compares peak traced memory of json.load
+with streaming records through iter_file_pages.
+
+Usage:
+    python -m scripts.benchmark_parsers [--records 5000]
+"""
+
+import argparse
+import json
+import random
+import tempfile
+import time
+import tracemalloc
+import zipfile
+from pathlib import Path
+
+from rag_project.config import EMBEDDING_MODEL_ID
+from rag_project.rag_core.infra.tokenizer_hf import get_tokenizer
+from rag_project.rag_core.ingestion.parser import iter_file_pages, parse_file
+from scripts.benchmark_streaming_chunker import WORDS
+
+_W_NS = "http://schemas.openxmlformats.org/wordprocessingml/2006/main"
+
+
+def _sentence(rng: random.Random) -> str:
+    return " ".join(rng.choice(WORDS) for _ in range(rng.randint(8, 20))).capitalize()
+
+
+def write_html(path: Path, rng: random.Random, sections: int) -> None:
+    parts = [
+        "<!DOCTYPE html><html><head><title>Job</title>",
+        "<style>body{font-family:sans-serif}.c{margin:0}</style>",
+        "<script>window.dataLayer=[];function track(e){dataLayer.push(e)}</script>",
+        '</head><body><nav class="c"><a href="/">Home</a><a href="/jobs">Jobs</a></nav>',
+    ]
+    for i in range(sections):
+        parts.append(f'<section class="c"><h2 id="s{i}">Section {i}</h2>')
+        parts.append(f'<p class="c"><span>{_sentence(rng)}.</span></p>')
+        items = "".join(
+            f'<li class="c"><strong>{rng.choice(WORDS)}</strong> {_sentence(rng)}</li>'
+            for _ in range(4)
+        )
+        parts.append(f"<ul>{items}</ul></section>")
+    parts.append("</body></html>")
+    path.write_text("\n".join(parts), encoding="utf-8")
+
+
+def write_docx(path: Path, rng: random.Random, paragraphs: int) -> None:
+    body = []
+    for i in range(paragraphs):
+        if i % 10 == 0:
+            body.append(
+                '<w:p><w:pPr><w:pStyle w:val="Heading2"/></w:pPr>'
+                f"<w:r><w:t>Section {i // 10}</w:t></w:r></w:p>"
+            )
+        body.append(
+            '<w:p><w:pPr><w:spacing w:after="120"/></w:pPr>'
+            '<w:r><w:rPr><w:rFonts w:ascii="Calibri"/></w:rPr>'
+            f"<w:t>{_sentence(rng)}.</w:t></w:r></w:p>"
+        )
+    xml = f'<w:document xmlns:w="{_W_NS}"><w:body>{"".join(body)}</w:body></w:document>'
+    with zipfile.ZipFile(path, "w", zipfile.ZIP_DEFLATED) as archive:
+        archive.writestr("word/document.xml", xml)
+
+
+def write_feed(path: Path, rng: random.Random, records: int) -> None:
+    with open(path, "w", encoding="utf-8") as fh:
+        fh.write('{"jobs": [')
+        for i in range(records):
+            job = {
+                "title": f"{rng.choice(WORDS).capitalize()} Engineer {i}",
+                "company": f"Company {i % 97}",
+                "location": "Berlin, Germany",
+                "url": f"https://example.com/jobs/{i}",
+                "description": " ".join(_sentence(rng) + "." for _ in range(8)),
+            }
+            fh.write(("," if i else "") + json.dumps(job))
+        fh.write("]}")
+
+
+def _timed(fn):
+    t0 = time.perf_counter()
+    text = fn()
+    return text, time.perf_counter() - t0
+
+
+def _peak_mib(fn) -> float:
+    tracemalloc.start()
+    fn()
+    _current, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return peak / 2**20
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark file parsers")
+    parser.add_argument("--records", type=int, default=5000)
+    parser.add_argument("--sections", type=int, default=300)
+    args = parser.parse_args()
+    rng = random.Random(3)
+    tokenizer = get_tokenizer(EMBEDDING_MODEL_ID)
+    print(f"tokenizer: {type(tokenizer).__name__}")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        files = {
+            "html": Path(tmp) / "posting.html",
+            "docx": Path(tmp) / "cv.docx",
+            "json": Path(tmp) / "feed.json",
+        }
+        write_html(files["html"], rng, args.sections)
+        write_docx(files["docx"], rng, args.sections * 5)
+        write_feed(files["json"], rng, args.records)
+
+        print(
+            f"{'format':<7}{'parser':<8}{'MiB in':>8}{'chars out':>12}"
+            f"{'tokens out':>12}{'seconds':>9}"
+        )
+        for name, path in files.items():
+            size = path.stat().st_size / 2**20
+            raw = lambda p=path: p.read_bytes().decode("utf-8", errors="ignore")
+            for label, fn in (("raw", raw), ("parser", lambda p=path: parse_file(p))):
+                text, seconds = _timed(fn)
+                print(
+                    f"{name:<7}{label:<8}{size:>8.2f}{len(text):>12}"
+                    f"{tokenizer.count(text):>12}{seconds:>9.3f}"
+                )
+
+        feed = files["json"]
+        loaded = _peak_mib(lambda: json.loads(feed.read_text(encoding="utf-8")))
+        streamed = _peak_mib(lambda: sum(1 for _ in iter_file_pages(feed)))
+        print(
+            f"JSON feed ({args.records} records) peak MiB: "
+            f"json.load {loaded:.1f}, streamed {streamed:.1f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,57 @@
+"""Wall time of PDF parsing: sequential vs page-range processes vs parse cache.
+
+Each PDF is converted with a single pymupdf4llm.to_markdown call, with
+_parse_pdf_parallel across --workers processes, and then read back from a
+freshly written parse cache. The parallel output is compared with the
+sequential one; page-range header detection can differ slightly, so a mismatch
+is reported rather than treated as an error.
+
+Usage:
+    python -m scripts.benchmark_pdf_parse thesis.pdf [more.pdf ...] [--workers 4]
+"""
+
+import argparse
+import tempfile
+import time
+from pathlib import Path
+
+from rag_project.rag_core.ingestion import parser as pdf_parser
+
+
+def _seconds(fn) -> tuple:
+    t0 = time.perf_counter()
+    result = fn()
+    return result, time.perf_counter() - t0
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark PDF parsing")
+    parser.add_argument("paths", nargs="+", type=Path)
+    parser.add_argument("--workers", type=int, default=4)
+    args = parser.parse_args()
+
+    import pymupdf4llm  # type: ignore
+
+    print(
+        f"{'file':<32}{'pages':>7}{'sequential s':>14}{'parallel s':>12}"
+        f"{'cached s':>10}{'same':>6}"
+    )
+    for path in args.paths:
+        pages = pdf_parser._pdf_page_count(path)
+        sequential, seq_s = _seconds(lambda: pymupdf4llm.to_markdown(str(path)))
+        parallel, par_s = _seconds(
+            lambda: pdf_parser._parse_pdf_parallel(path, pages, args.workers)
+        )
+        with tempfile.TemporaryDirectory() as cache_dir:
+            pdf_parser.PARSER_CACHE_DIR = cache_dir
+            pdf_parser._parse_pdf(path)
+            _cached, cache_s = _seconds(lambda: pdf_parser._parse_pdf(path))
+        same = "yes" if parallel == sequential else "no"
+        print(
+            f"{path.name[:31]:<32}{pages:>7}{seq_s:>14.2f}{par_s:>12.2f}"
+            f"{cache_s:>10.2f}{same:>6}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,119 @@
+"""Benchmark cross-encoder reranking cost against evaluator prompt savings.
+
+For every requirement extracted from the job posting, compares the baseline
+evidence (top JOB_MATCHING_SEARCH_LIMIT chunks) with reranked evidence
+(JOB_MATCHING_RERANK_CANDIDATES over-fetched, JOB_MATCHING_RERANK_TOP_K kept).
+Prompt size is counted in whitespace words, like Chunk.token_count.
+
+Usage:
+    python -m scripts.benchmark_rerank --job-file path/to/job.txt [--evaluate]
+"""
+
+import argparse
+import time
+
+from rag_project.config import (
+    JOB_MATCHING_RERANK_CANDIDATES,
+    JOB_MATCHING_RERANK_TOP_K,
+    JOB_MATCHING_SEARCH_LIMIT,
+)
+from rag_project.rag_core.app_facade import RAGApp
+from rag_project.rag_core.infra.reranker_bge import BgeRerankerProvider
+from rag_project.rag_core.retrieval.job_matching_service import JobMatchingService
+from rag_project.logger import get_logger
+
+
+logger = get_logger(__name__)
+
+
+def _words(text: str) -> int:
+    return len(text.split())
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark evidence reranking")
+    parser.add_argument(
+        "--job-file", required=True, help="Path to job description text file"
+    )
+    parser.add_argument(
+        "--candidates", type=int, default=JOB_MATCHING_RERANK_CANDIDATES
+    )
+    parser.add_argument("--top-k", type=int, default=JOB_MATCHING_RERANK_TOP_K)
+    parser.add_argument(
+        "--evaluate",
+        action="store_true",
+        help="Also time the evaluator LLM call with baseline vs reranked evidence",
+    )
+    args = parser.parse_args()
+
+    job_text = open(args.job_file, "r", encoding="utf-8").read()
+
+    app = RAGApp()
+    baseline = app.job_matching
+    reranked = JobMatchingService(
+        embedder=app.embedder,
+        llm=app.llm,
+        chunk_repo=app.repo,
+        domain_extractor=app.domain_extractor,
+        retrieval_mode=baseline.retrieval_mode,
+        reranker=app.reranker or BgeRerankerProvider(),
+        rerank_candidates=args.candidates,
+        rerank_top_k=args.top_k,
+        evaluation_budget=baseline.evaluation_budget,
+    )
+    requirements = baseline._extract_requirements(job_text)
+    logger.info("Rerank benchmark: %d requirements", len(requirements))
+
+    rerank_seconds = 0.0
+    baseline_words = 0
+    reranked_words = 0
+    baseline_llm_seconds = 0.0
+    reranked_llm_seconds = 0.0
+    for req in requirements:
+        base_chunks = baseline._retrieve_candidates(
+            req, baseline.retrieval_mode, JOB_MATCHING_SEARCH_LIMIT
+        )
+        candidates = reranked._retrieve_candidates(
+            req, reranked.retrieval_mode, args.candidates
+        )
+        t0 = time.perf_counter()
+        kept = reranked._rerank(req.search_query, candidates) if candidates else []
+        elapsed = time.perf_counter() - t0
+        rerank_seconds += elapsed
+
+        base_words = _words(baseline._format_evidence(base_chunks))
+        kept_words = _words(reranked._format_evidence(kept))
+        baseline_words += base_words
+        reranked_words += kept_words
+        print(
+            f"- {req.name}: rerank {len(candidates)} -> {len(kept)} in {elapsed * 1000:.1f}ms, "
+            f"evidence {base_words} -> {kept_words} words"
+        )
+
+        if args.evaluate:
+            t0 = time.perf_counter()
+            baseline._evaluate_requirement(req)
+            baseline_llm_seconds += time.perf_counter() - t0
+            t0 = time.perf_counter()
+            reranked._evaluate_requirement(req)
+            reranked_llm_seconds += time.perf_counter() - t0
+
+    count = len(requirements) or 1
+    saved = baseline_words - reranked_words
+    print(f"Requirements: {len(requirements)}")
+    print(
+        f"Rerank cost: {rerank_seconds:.2f}s total, {rerank_seconds / count * 1000:.1f}ms/requirement"
+    )
+    print(
+        f"Evidence words: baseline={baseline_words} reranked={reranked_words} "
+        f"saved={saved} ({(saved / baseline_words * 100) if baseline_words else 0.0:.1f}%)"
+    )
+    if args.evaluate:
+        print(
+            f"Evaluate (search + rerank + LLM): baseline={baseline_llm_seconds:.2f}s "
+            f"reranked={reranked_llm_seconds:.2f}s"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,91 @@
+"""Microbenchmark of repository search latency (p50/p95).
+
+Compares the previous access path (new connection per call, unprepared SQL)
+with the pooled repository whose search statements are prepared once per
+connection. Each filter combination is exercised so every registered
+statement shape is measured.
+
+Usage:
+    python -m scripts.benchmark_search [--query "python data engineer"] [--runs 50]
+"""
+
+import argparse
+import statistics
+import time
+
+import psycopg
+from pgvector.psycopg import register_vector
+
+from rag_project.config import (
+    DB_CONNECT_TIMEOUT_SECONDS,
+    DOC_TYPE_CV,
+    DOC_TYPE_JOB_POSTING,
+    JOB_MATCHING_SEARCH_LIMIT,
+)
+from rag_project.rag_core.app_facade import RAGApp
+from rag_project.rag_core.infra.db_pgvector import PgVectorRepository
+from rag_project.logger import get_logger
+
+
+logger = get_logger(__name__)
+
+FILTER_CASES = {
+    "min_match": {},
+    "doc_types": {"doc_types": [DOC_TYPE_CV, DOC_TYPE_JOB_POSTING]},
+    "posted_after": {"posted_after": 0.0},
+    "company": {"filters": {"company": "a"}},
+}
+
+
+class ColdPgVectorRepository(PgVectorRepository):
+    """Pre-pool behaviour: fresh connection per call, no prepared statements."""
+
+    def _get_conn(self):
+        conn = psycopg.connect(self.dsn, connect_timeout=DB_CONNECT_TIMEOUT_SECONDS)
+        register_vector(conn)
+        return conn
+
+    def _fetch(self, sql: str, params: list, prepare: bool | None = None) -> list:
+        return super()._fetch(sql, params, prepare=False)
+
+
+def _percentiles(samples: list[float]) -> tuple[float, float]:
+    cuts = statistics.quantiles(samples, n=20, method="inclusive")
+    return statistics.median(samples), cuts[18]
+
+
+def _measure(repo, embedding, runs: int, kwargs: dict) -> list[float]:
+    timings = []
+    for _ in range(runs):
+        t0 = time.perf_counter()
+        repo.search(embedding, limit=JOB_MATCHING_SEARCH_LIMIT, **kwargs)
+        timings.append((time.perf_counter() - t0) * 1000)
+    return timings
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark search latency")
+    parser.add_argument("--query", default="python data engineering experience")
+    parser.add_argument("--runs", type=int, default=50)
+    parser.add_argument("--warmup", type=int, default=3)
+    args = parser.parse_args()
+
+    app = RAGApp()
+    embedding = app.embedder.embed_query(args.query)
+    repos = {
+        "cold": ColdPgVectorRepository(app._dsn()),
+        "pooled": app.repo,
+    }
+    logger.info("Search benchmark: runs=%d warmup=%d", args.runs, args.warmup)
+
+    print(f"{'filters':<14}{'path':<8}{'p50 ms':>10}{'p95 ms':>10}")
+    for case, kwargs in FILTER_CASES.items():
+        for name, repo in repos.items():
+            _measure(repo, embedding, args.warmup, kwargs)
+            p50, p95 = _percentiles(_measure(repo, embedding, args.runs, kwargs))
+            print(f"{case:<14}{name:<8}{p50:>10.2f}{p95:>10.2f}")
+    app.repo.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,134 @@
+"""Semantic chunking vs structured chunking (+ per-chunk embedding) wall time.
+
+For each input, times:
+- structured: chunk_structured, then one embed call per chunk (as ingestion
+  does), optionally with the chunk-assist LLM when --llm-model is given;
+- semantic: chunk_semantic with its batched sentence pass and composed chunk
+  embeddings.
+
+Without sentence-transformers, --embedder hash uses a bag-of-words hashing
+embedder, which only shows the chunkers' own overhead.
+
+Usage:
+    python -m scripts.benchmark_semantic_chunker [paths ...] [--pages 50]
+        [--embedder bge|hash] [--llm-model qwen2.5:1.5b-instruct]
+"""
+
+import argparse
+import hashlib
+import math
+import time
+from pathlib import Path
+from typing import List
+
+from rag_project.config import CHUNK_PROFILES, EMBEDDING_MODEL_ID
+from rag_project.rag_core.ingestion.parser import parse_file
+from rag_project.rag_core.ingestion.semantic_chunker import chunk_semantic
+from rag_project.rag_core.ingestion.structured_chunker import (
+    ChunkConfig,
+    chunk_structured,
+)
+from scripts.benchmark_streaming_chunker import WORDS
+
+
+def synthetic_document(pages: int) -> str:
+    # Topic blocks so there are real shifts for the semantic chunker to find.
+    paragraphs = []
+    for page in range(pages):
+        topic = WORDS[page % len(WORDS)]
+        for p in range(4):
+            words = WORDS[(page + p) % len(WORDS) :] + WORDS
+            paragraphs.append(
+                " ".join(
+                    f"The {topic} study reports {words[s]} and {words[s + 1]} gains."
+                    for s in range(8)
+                )
+            )
+    return "\n\n".join(paragraphs)
+
+
+class HashEmbedder:
+    dim = 256
+
+    def embed(self, texts: List[str]) -> List[List[float]]:
+        vectors = []
+        for text in texts:
+            vec = [0.0] * self.dim
+            for word in text.lower().split():
+                h = int(hashlib.md5(word.encode()).hexdigest()[:8], 16)
+                vec[h % self.dim] += 1.0
+            norm = math.sqrt(sum(x * x for x in vec)) or 1.0
+            vectors.append([x / norm for x in vec])
+        return vectors
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark semantic chunking")
+    parser.add_argument("paths", nargs="*", type=Path)
+    parser.add_argument("--pages", type=int, default=50)
+    parser.add_argument("--embedder", choices=("bge", "hash"), default="bge")
+    parser.add_argument("--llm-model", default=None)
+    args = parser.parse_args()
+
+    if args.embedder == "bge":
+        from rag_project.rag_core.infra.embedding_bgem3 import (
+            BgeM3EmbeddingProvider,
+        )
+
+        embedder = BgeM3EmbeddingProvider(EMBEDDING_MODEL_ID)
+    else:
+        embedder = HashEmbedder()
+    llm_generate = None
+    if args.llm_model:
+        from rag_project.rag_core.config import get_settings
+        from rag_project.rag_core.infra.llm_ollama import OllamaLLMProvider
+
+        settings = get_settings()
+        llm = OllamaLLMProvider(base_url=settings.ollama_host, model=args.llm_model)
+
+        def llm_generate(prompt: str, max_tokens: int) -> str:
+            return llm.generate(prompt, model=args.llm_model, max_tokens=max_tokens)
+
+    profile = CHUNK_PROFILES["thesis"]
+    config = ChunkConfig(
+        max_chunk_words=profile["target_words"],
+        overlap_words=profile["overlap_words"],
+        use_llm=llm_generate is not None,
+    )
+    sources = (
+        [(p.name, parse_file(p)) for p in args.paths]
+        if args.paths
+        else [(f"synthetic ({args.pages} pages)", synthetic_document(args.pages))]
+    )
+
+    print(f"{'input':<28}{'mode':<12}{'chunks':>8}{'embed calls':>13}{'s':>8}")
+    for name, text in sources:
+        calls = []
+
+        def embed(texts: List[str]) -> List[List[float]]:
+            calls.append(len(texts))
+            return embedder.embed(texts)
+
+        t0 = time.perf_counter()
+        chunks = chunk_structured(text, config, llm_generate)
+        for chunk in chunks:
+            embed([chunk])
+        structured_s = time.perf_counter() - t0
+        mode = "structured" + ("+llm" if llm_generate else "")
+        print(
+            f"{name[:27]:<28}{mode:<12}{len(chunks):>8}{len(calls):>13}"
+            f"{structured_s:>8.2f}"
+        )
+
+        calls.clear()
+        t0 = time.perf_counter()
+        semantic = chunk_semantic(text, embed, config)
+        semantic_s = time.perf_counter() - t0
+        print(
+            f"{'':<28}{'semantic':<12}{len(semantic):>8}{len(calls):>13}"
+            f"{semantic_s:>8.2f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,161 @@
+"""Microbenchmark of _split_to_size on oversized chunks.
+
+Times the boundary-index implementation against the previous one, which re-ran
+the word regex and the five priority split regexes over the remaining text for
+every split. Both must produce identical chunks.
+
+Usage:
+    python -m scripts.benchmark_split_to_size [--words 100000] [--runs 3]
+"""
+
+import argparse
+import random
+import re
+import statistics
+import time
+from typing import List
+
+from rag_project.config import MIN_SPLIT_RATIO, PRIORITY_SPLIT_PATTERNS
+from rag_project.rag_core.ingestion.chunker import chunk_text
+from rag_project.rag_core.ingestion.structured_chunker import (
+    BoundaryCandidate,
+    BoundaryPriority,
+    ChunkConfig,
+    _find_safe_split_point,
+    _split_to_size,
+)
+
+WORDS = (
+    "retrieval ranking embedding evaluation baseline pipeline latency recall "
+    "precision corpus query document thesis method result section analysis"
+).split()
+
+
+def synthetic_chunk(words: int, seed: int = 7) -> str:
+    rng = random.Random(seed)
+    parts: List[str] = []
+    count = 0
+    while count < words:
+        roll = rng.random()
+        if roll < 0.02:
+            parts.append(f"\n## **{rng.randint(1, 9)}. Section**\n")
+        elif roll < 0.04:
+            parts.append(f"\n03/20{rng.randint(10, 24)} - Research assistant\n")
+        elif roll < 0.1:
+            parts.append("\n\n")
+        elif roll < 0.15:
+            parts.append(f"\n- {' '.join(rng.sample(WORDS, 6))}")
+            count += 7
+            continue
+        sentence = " ".join(rng.choice(WORDS) for _ in range(rng.randint(8, 20)))
+        parts.append(sentence.capitalize() + ". ")
+        count += sentence.count(" ") + 1
+    return "".join(parts).strip()
+
+
+# --- previous implementation (rescans the remaining text per split) ---
+def _legacy_candidates(
+    text: str, min_pos: int, target_pos: int
+) -> List[BoundaryCandidate]:
+    candidates: List[BoundaryCandidate] = []
+    patterns = {
+        BoundaryPriority.SECTION_HEADER: PRIORITY_SPLIT_PATTERNS["section_header"],
+        BoundaryPriority.DATE_ROLE_BLOCK: PRIORITY_SPLIT_PATTERNS["date_role_block"],
+        BoundaryPriority.PARAGRAPH_BREAK: PRIORITY_SPLIT_PATTERNS["paragraph_break"],
+        BoundaryPriority.SENTENCE_END: PRIORITY_SPLIT_PATTERNS["sentence_end"],
+        BoundaryPriority.BULLET_END: PRIORITY_SPLIT_PATTERNS["bullet_end"],
+    }
+    for priority, pattern in patterns.items():
+        for match in re.finditer(pattern, text):
+            pos = (
+                match.end()
+                if priority == BoundaryPriority.PARAGRAPH_BREAK
+                else match.start()
+            )
+            if min_pos <= pos <= target_pos:
+                candidates.append(
+                    BoundaryCandidate(
+                        position=pos,
+                        priority=priority,
+                        distance_to_target=abs(target_pos - pos),
+                    )
+                )
+    return candidates
+
+
+def legacy_split(chunks: List[str], config: ChunkConfig) -> List[str]:
+    sized: List[str] = []
+    for chunk in chunks:
+        remaining = chunk
+        while True:
+            if len(remaining.split()) <= config.max_chunk_words:
+                sized.append(remaining.strip())
+                break
+            positions = [m.start() for m in re.finditer(r"\S+", remaining)]
+            target_idx = min(len(positions) - 1, config.max_chunk_words)
+            target_pos = positions[target_idx]
+            min_idx = min(
+                len(positions) - 1,
+                max(
+                    config.min_chunk_words,
+                    int(config.max_chunk_words * MIN_SPLIT_RATIO),
+                ),
+            )
+            min_pos = positions[min_idx]
+            split_pos = _find_safe_split_point(
+                _legacy_candidates(remaining, min_pos, target_pos),
+                target_pos,
+                min_pos,
+                config.proximity_weight,
+            )
+            if split_pos <= 0 or split_pos >= len(remaining) - 1:
+                fallback_chunks = chunk_text(
+                    remaining, max_tokens=config.max_chunk_words, overlap_tokens=0
+                )
+                sized.extend([c.strip() for c in fallback_chunks if c.strip()])
+                break
+            sized.append(remaining[:split_pos].strip())
+            remaining = remaining[split_pos:].lstrip()
+            if not remaining:
+                break
+    return sized
+
+
+def _time(fn, chunks: List[str], config: ChunkConfig, runs: int) -> float:
+    samples = []
+    for _ in range(runs):
+        t0 = time.perf_counter()
+        fn(chunks, config)
+        samples.append(time.perf_counter() - t0)
+    return statistics.median(samples) * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark _split_to_size")
+    parser.add_argument("--words", type=int, default=100_000)
+    parser.add_argument("--max-chunk-words", type=int, default=300)
+    parser.add_argument("--runs", type=int, default=3)
+    args = parser.parse_args()
+
+    chunks = [synthetic_chunk(args.words)]
+    # A hard cap above the input keeps the shared forced-split pass out of the timing.
+    config = ChunkConfig(
+        max_chunk_words=args.max_chunk_words,
+        overlap_words=0,
+        max_chunk_words_hard=args.words * 2,
+    )
+    result = _split_to_size(chunks, config)
+    if result != legacy_split(chunks, config):
+        raise SystemExit("Output differs from the previous implementation")
+
+    legacy_ms = _time(legacy_split, chunks, config, args.runs)
+    current_ms = _time(_split_to_size, chunks, config, args.runs)
+    print(f"{args.words} words -> {len(result)} chunks")
+    print(f"{'implementation':<16}{'median ms':>12}")
+    print(f"{'rescan':<16}{legacy_ms:>12.1f}")
+    print(f"{'index':<16}{current_ms:>12.1f}")
+    print(f"speedup: {legacy_ms / current_ms:.2f}x")
+
+
+if __name__ == "__main__":
+    main()
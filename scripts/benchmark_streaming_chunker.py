@@ -0,0 +1,89 @@
+"""Peak memory and time to first chunk: whole-text vs streamed structured chunking.
+
+Writes a synthetic markdown thesis to a temporary file, then chunks it with
+parse_file + chunk_structured and with iter_file_pages + chunk_structured_stream,
+measuring peak traced allocations (tracemalloc) and when the first chunk is ready.
+
+Usage:
+    python -m scripts.benchmark_streaming_chunker [--pages 2000]
+"""
+
+import argparse
+import random
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+
+from rag_project.rag_core.ingestion.parser import iter_file_pages, parse_file
+from rag_project.rag_core.ingestion.structured_chunker import (
+    ChunkConfig,
+    chunk_structured,
+    chunk_structured_stream,
+)
+
+WORDS = (
+    "retrieval ranking embedding evaluation baseline pipeline latency recall "
+    "precision corpus query document thesis method result section analysis"
+).split()
+
+
+def write_thesis(path: Path, pages: int, seed: int = 7) -> None:
+    rng = random.Random(seed)
+    with open(path, "w", encoding="utf-8") as fh:
+        for page in range(1, pages + 1):
+            fh.write(f"## **{page}. Section**\n\n")
+            for _ in range(6):
+                sentences = (
+                    " ".join(rng.choice(WORDS) for _ in range(rng.randint(8, 20)))
+                    for _ in range(rng.randint(3, 6))
+                )
+                fh.write(". ".join(s.capitalize() for s in sentences) + ".\n\n")
+            fh.write(f"Page {page} of {pages}\n\n")
+
+
+def _measure(make_chunks):
+    tracemalloc.start()
+    t0 = time.perf_counter()
+    first = None
+    count = 0
+    for _chunk in make_chunks():
+        if first is None:
+            first = time.perf_counter() - t0
+        count += 1
+    total = time.perf_counter() - t0
+    _current, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return count, first or total, total, peak / 2**20
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark streamed chunking")
+    parser.add_argument("--pages", type=int, default=2000)
+    args = parser.parse_args()
+    config = ChunkConfig(max_chunk_words=300, overlap_words=40)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / "thesis.md"
+        write_thesis(path, args.pages)
+        size_mb = path.stat().st_size / 2**20
+
+        def whole():
+            return chunk_structured(parse_file(path), config)
+
+        def streamed():
+            lines = (l for page in iter_file_pages(path) for l in page.splitlines())
+            return chunk_structured_stream(lines, config)
+
+        print(f"{args.pages} pages, {size_mb:.1f} MiB")
+        print(
+            f"{'pipeline':<10}{'chunks':>8}{'first chunk s':>15}"
+            f"{'total s':>10}{'peak MiB':>10}"
+        )
+        for name, fn in (("whole", whole), ("streamed", streamed)):
+            count, first, total, peak = _measure(fn)
+            print(f"{name:<10}{count:>8}{first:>15.2f}{total:>10.2f}{peak:>10.1f}")
+
+
+if __name__ == "__main__":
+    main()
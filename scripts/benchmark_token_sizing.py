@@ -0,0 +1,111 @@
+"""Chunk count, chunk token lengths and embed throughput: word vs token sizing.
+
+Chunks the input with the thesis chunk profile twice:
+- in words (CHUNK_SIZING=words);
+- in embedding-model tokens (CHUNK_SIZING=tokens), using the same profile
+  scaling as the ingestion service.
+For each mode it reports how many chunks come out, their real token lengths
+(measured with the embedding model's tokenizer: mean, p95, max) and how many
+exceed --max-tokens, the length the embedder truncates at. Unless --no-embed is passed, it also reports embedding time and
+chunks per second with BgeM3EmbeddingProvider.
+
+Usage:
+    python -m scripts.benchmark_token_sizing [paths ...] [--pages 200]
+        [--max-tokens 8192] [--no-embed]
+"""
+
+import argparse
+import statistics
+import time
+from pathlib import Path
+
+from rag_project.config import (
+    CHUNK_PROFILES,
+    CHUNK_TOKENS_PER_WORD,
+    EMBEDDING_MODEL_ID,
+    EMBEDDING_MODEL_REGISTRY,
+    STRUCTURED_MAX_CHUNK_RATIO,
+    STRUCTURED_MIN_CHUNK_RATIO,
+    STRUCTURED_MIN_CHUNK_WORDS,
+)
+from rag_project.rag_core.infra.tokenizer_hf import get_tokenizer
+from rag_project.rag_core.ingestion.parser import parse_file
+from rag_project.rag_core.ingestion.structured_chunker import (
+    ChunkConfig,
+    chunk_structured,
+)
+from scripts.benchmark_dedup import synthetic_extraction
+
+
+def _config(scale: float, tokenizer=None) -> ChunkConfig:
+    profile = CHUNK_PROFILES["thesis"]
+    target = int(profile["target_words"] * scale)
+    return ChunkConfig(
+        max_chunk_words=target,
+        overlap_words=int(profile["overlap_words"] * scale),
+        min_chunk_words=max(
+            int(STRUCTURED_MIN_CHUNK_WORDS * scale),
+            int(target * STRUCTURED_MIN_CHUNK_RATIO),
+        ),
+        max_chunk_words_hard=int(target * STRUCTURED_MAX_CHUNK_RATIO),
+        proximity_weight=profile["proximity_weight"],
+        tokenizer=tokenizer,
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark token-aware chunk sizing")
+    parser.add_argument("paths", nargs="*", type=Path)
+    parser.add_argument("--pages", type=int, default=200)
+    parser.add_argument(
+        "--max-tokens",
+        type=int,
+        default=EMBEDDING_MODEL_REGISTRY[EMBEDDING_MODEL_ID]["max_sequence_length"],
+    )
+    parser.add_argument("--no-embed", action="store_true")
+    args = parser.parse_args()
+
+    text = (
+        "\n\n".join(parse_file(p) for p in args.paths)
+        if args.paths
+        else synthetic_extraction(args.pages)
+    )
+    tokenizer = get_tokenizer(EMBEDDING_MODEL_ID)
+    print(f"tokenizer: {type(tokenizer).__name__}")
+    embedder = None
+    if not args.no_embed:
+        from rag_project.rag_core.infra.embedding_bgem3 import (
+            BgeM3EmbeddingProvider,
+        )
+
+        embedder = BgeM3EmbeddingProvider(EMBEDDING_MODEL_ID)
+
+    print(
+        f"{'mode':<8}{'chunks':>8}{'mean tok':>10}{'p95 tok':>9}{'max tok':>9}"
+        f"{'> max':>7}{'chunk s':>9}{'embed s':>9}{'chunks/s':>10}"
+    )
+    modes = (
+        ("words", _config(1.0)),
+        ("tokens", _config(CHUNK_TOKENS_PER_WORD, tokenizer)),
+    )
+    for name, config in modes:
+        t0 = time.perf_counter()
+        chunks = chunk_structured(text, config)
+        chunk_s = time.perf_counter() - t0
+        lengths = sorted(tokenizer.count(c) for c in chunks)
+        p95 = lengths[int(0.95 * (len(lengths) - 1))]
+        over = sum(1 for n in lengths if n > args.max_tokens)
+        embed_s = 0.0
+        if embedder is not None:
+            t0 = time.perf_counter()
+            embedder.embed(chunks)
+            embed_s = time.perf_counter() - t0
+        rate = f"{len(chunks) / embed_s:>10.1f}" if embed_s else f"{'-':>10}"
+        print(
+            f"{name:<8}{len(chunks):>8}{statistics.mean(lengths):>10.0f}{p95:>9}"
+            f"{lengths[-1]:>9}{over:>7}{chunk_s:>9.2f}{embed_s:>9.2f}{rate}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -2,13 +2,18 @@
 CREATE EXTENSION IF NOT EXISTS pgcrypto;
 CREATE EXTENSION IF NOT EXISTS "uuid-ossp";
 CREATE EXTENSION IF NOT EXISTS vector;
+CREATE EXTENSION IF NOT EXISTS pg_trgm;
 
 CREATE TABLE IF NOT EXISTS documents (
     id UUID PRIMARY KEY,
     doc_type TEXT NOT NULL,
     metadata JSONB,
-    created_at TIMESTAMPTZ DEFAULT NOW()
+    created_at TIMESTAMPTZ NOT NULL DEFAULT NOW()
 );
+-- Keyset pages compare (created_at, id); a NULL created_at would be skipped or
+-- stall the cursor. Older databases allowed NULL: date those rows to the epoch.
+UPDATE documents SET created_at = 'epoch' WHERE created_at IS NULL;
+ALTER TABLE documents ALTER COLUMN created_at SET NOT NULL;
 
 CREATE TABLE IF NOT EXISTS company_info (
     document_id UUID PRIMARY KEY REFERENCES documents(id) ON DELETE CASCADE,
@@ -44,6 +49,15 @@ CREATE TABLE IF NOT EXISTS chunks (
     metadata JSONB DEFAULT '{}'::jsonb
 );
 
+-- Full-text vector for the lexical arm of hybrid retrieval (de/en/fr stemmed + unstemmed tokens)
+ALTER TABLE chunks ADD COLUMN IF NOT EXISTS content_tsv tsvector
+    GENERATED ALWAYS AS (
+        to_tsvector('simple', content)
+        || to_tsvector('english', content)
+        || to_tsvector('german', content)
+        || to_tsvector('french', content)
+    ) STORED;
+
 CREATE TABLE IF NOT EXISTS embeddings (
     chunk_id UUID PRIMARY KEY REFERENCES chunks(id) ON DELETE CASCADE,
     embedding VECTOR(1024),
@@ -52,7 +66,238 @@ CREATE TABLE IF NOT EXISTS embeddings (
 
 -- Helpful indexes
 CREATE INDEX IF NOT EXISTS idx_chunks_document_id ON chunks(document_id);
+CREATE INDEX IF NOT EXISTS idx_chunks_content_tsv ON chunks USING GIN (content_tsv);
 CREATE INDEX IF NOT EXISTS idx_documents_doc_type ON documents(doc_type);
+-- Keyset pagination of the document list (newest first, optionally per type)
+CREATE INDEX IF NOT EXISTS idx_documents_created_at_id ON documents(created_at DESC, id DESC);
+CREATE INDEX IF NOT EXISTS idx_documents_doc_type_created_at_id ON documents(doc_type, created_at DESC, id DESC);
 CREATE INDEX IF NOT EXISTS idx_job_postings_posted_at ON job_postings(posted_at);
 CREATE INDEX IF NOT EXISTS idx_job_postings_match_score ON job_postings(match_score);
+-- Title/company search in the chat view's job list (ILIKE '%term%')
+CREATE INDEX IF NOT EXISTS idx_job_postings_title_trgm ON job_postings USING GIN (title gin_trgm_ops);
+CREATE INDEX IF NOT EXISTS idx_job_postings_company_trgm ON job_postings USING GIN (company gin_trgm_ops);
 CREATE INDEX IF NOT EXISTS idx_embeddings_embedding_cosine ON embeddings USING ivfflat (embedding vector_cosine_ops) WITH (lists = 100);
+
+-- Per-type statistics for the GUI's Database overview, kept current by triggers so
+-- the overview reads one row per doc_type instead of counting every chunk.
+CREATE TABLE IF NOT EXISTS doc_type_stats (
+    doc_type TEXT PRIMARY KEY,
+    doc_count BIGINT NOT NULL DEFAULT 0,
+    chunk_count BIGINT NOT NULL DEFAULT 0,
+    embedding_count BIGINT NOT NULL DEFAULT 0,
+    chunk_bytes BIGINT NOT NULL DEFAULT 0,
+    embedding_bytes BIGINT NOT NULL DEFAULT 0
+);
+
+CREATE OR REPLACE FUNCTION doc_type_stats_add(
+    p_doc_type TEXT,
+    p_docs BIGINT,
+    p_chunks BIGINT,
+    p_embeddings BIGINT,
+    p_chunk_bytes BIGINT,
+    p_embedding_bytes BIGINT
+) RETURNS void AS $$
+    INSERT INTO doc_type_stats AS s
+        (doc_type, doc_count, chunk_count, embedding_count, chunk_bytes, embedding_bytes)
+    VALUES (p_doc_type, p_docs, p_chunks, p_embeddings, p_chunk_bytes, p_embedding_bytes)
+    ON CONFLICT (doc_type) DO UPDATE SET
+        doc_count = s.doc_count + EXCLUDED.doc_count,
+        chunk_count = s.chunk_count + EXCLUDED.chunk_count,
+        embedding_count = s.embedding_count + EXCLUDED.embedding_count,
+        chunk_bytes = s.chunk_bytes + EXCLUDED.chunk_bytes,
+        embedding_bytes = s.embedding_bytes + EXCLUDED.embedding_bytes;
+$$ LANGUAGE sql;
+
+-- Recompute from scratch: backfills existing databases and repairs drift.
+CREATE OR REPLACE FUNCTION doc_type_stats_rebuild() RETURNS void AS $$
+    DELETE FROM doc_type_stats;
+    INSERT INTO doc_type_stats
+        (doc_type, doc_count, chunk_count, embedding_count, chunk_bytes, embedding_bytes)
+    SELECT d.doc_type,
+           COUNT(DISTINCT d.id),
+           COUNT(c.id),
+           COUNT(e.chunk_id),
+           COALESCE(SUM(pg_column_size(c.content)), 0),
+           COALESCE(SUM(pg_column_size(e.embedding)), 0)
+    FROM documents d
+    LEFT JOIN chunks c ON c.document_id = d.id
+    LEFT JOIN embeddings e ON e.chunk_id = c.id
+    GROUP BY d.doc_type;
+$$ LANGUAGE sql;
+
+-- The stats triggers run once per statement on its transition table and call
+-- doc_type_stats_add once per doc_type (in doc_type order, so concurrent writers
+-- lock stats rows in the same order), not once per inserted or deleted row.
+CREATE OR REPLACE FUNCTION doc_type_stats_documents_insert_trg() RETURNS trigger AS $$
+BEGIN
+    PERFORM doc_type_stats_add(t.doc_type, t.docs, 0, 0, 0, 0)
+    FROM (
+        SELECT doc_type, COUNT(*) AS docs
+        FROM new_rows GROUP BY doc_type ORDER BY doc_type
+    ) t;
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+CREATE OR REPLACE FUNCTION doc_type_stats_chunks_insert_trg() RETURNS trigger AS $$
+BEGIN
+    PERFORM doc_type_stats_add(t.doc_type, 0, t.chunks, 0, t.chunk_bytes, 0)
+    FROM (
+        SELECT d.doc_type, COUNT(*) AS chunks,
+               COALESCE(SUM(pg_column_size(n.content)), 0) AS chunk_bytes
+        FROM new_rows n JOIN documents d ON d.id = n.document_id
+        GROUP BY d.doc_type ORDER BY d.doc_type
+    ) t;
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+CREATE OR REPLACE FUNCTION doc_type_stats_embeddings_insert_trg() RETURNS trigger AS $$
+BEGIN
+    PERFORM doc_type_stats_add(t.doc_type, 0, 0, t.embeddings, 0, t.embedding_bytes)
+    FROM (
+        SELECT d.doc_type, COUNT(*) AS embeddings,
+               COALESCE(SUM(pg_column_size(n.embedding)), 0) AS embedding_bytes
+        FROM new_rows n
+        JOIN chunks c ON c.id = n.chunk_id
+        JOIN documents d ON d.id = c.document_id
+        GROUP BY d.doc_type ORDER BY d.doc_type
+    ) t;
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+-- A delete is counted once, at the level where it started. Transition tables
+-- only exist on AFTER triggers, which run after ON DELETE CASCADE has removed the
+-- dependents, so rows whose parent is already gone (cascaded) are not counted
+-- themselves: their totals are parked here under the parent's id and picked up
+-- by the parent's delete trigger later in the same statement.
+CREATE UNLOGGED TABLE IF NOT EXISTS doc_type_stats_cascaded (
+    parent_id UUID NOT NULL,
+    chunk_count BIGINT NOT NULL DEFAULT 0,
+    embedding_count BIGINT NOT NULL DEFAULT 0,
+    chunk_bytes BIGINT NOT NULL DEFAULT 0,
+    embedding_bytes BIGINT NOT NULL DEFAULT 0
+);
+CREATE INDEX IF NOT EXISTS idx_doc_type_stats_cascaded_parent
+    ON doc_type_stats_cascaded(parent_id);
+
+CREATE OR REPLACE FUNCTION doc_type_stats_documents_delete_trg() RETURNS trigger AS $$
+BEGIN
+    PERFORM doc_type_stats_add(
+        t.doc_type, -t.docs, -t.chunks, -t.embeddings, -t.chunk_bytes, -t.embedding_bytes
+    )
+    FROM (
+        SELECT o.doc_type, COUNT(DISTINCT o.id) AS docs,
+               COALESCE(SUM(h.chunk_count), 0) AS chunks,
+               COALESCE(SUM(h.embedding_count), 0) AS embeddings,
+               COALESCE(SUM(h.chunk_bytes), 0) AS chunk_bytes,
+               COALESCE(SUM(h.embedding_bytes), 0) AS embedding_bytes
+        FROM old_rows o LEFT JOIN doc_type_stats_cascaded h ON h.parent_id = o.id
+        GROUP BY o.doc_type ORDER BY o.doc_type
+    ) t;
+    DELETE FROM doc_type_stats_cascaded h USING old_rows o WHERE h.parent_id = o.id;
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+CREATE OR REPLACE FUNCTION doc_type_stats_chunks_delete_trg() RETURNS trigger AS $$
+BEGIN
+    -- Direct deletes: the document is still there.
+    PERFORM doc_type_stats_add(
+        t.doc_type, 0, -t.chunks, -t.embeddings, -t.chunk_bytes, -t.embedding_bytes
+    )
+    FROM (
+        SELECT d.doc_type, COUNT(DISTINCT o.id) AS chunks,
+               COALESCE(SUM(pg_column_size(o.content)), 0) AS chunk_bytes,
+               COALESCE(SUM(h.embedding_count), 0) AS embeddings,
+               COALESCE(SUM(h.embedding_bytes), 0) AS embedding_bytes
+        FROM old_rows o
+        JOIN documents d ON d.id = o.document_id
+        LEFT JOIN doc_type_stats_cascaded h ON h.parent_id = o.id
+        GROUP BY d.doc_type ORDER BY d.doc_type
+    ) t;
+    -- Cascaded from a document delete: hand the totals to its trigger.
+    INSERT INTO doc_type_stats_cascaded
+        (parent_id, chunk_count, embedding_count, chunk_bytes, embedding_bytes)
+    SELECT o.document_id, COUNT(DISTINCT o.id),
+           COALESCE(SUM(h.embedding_count), 0),
+           COALESCE(SUM(pg_column_size(o.content)), 0),
+           COALESCE(SUM(h.embedding_bytes), 0)
+    FROM old_rows o LEFT JOIN doc_type_stats_cascaded h ON h.parent_id = o.id
+    WHERE NOT EXISTS (SELECT 1 FROM documents d WHERE d.id = o.document_id)
+    GROUP BY o.document_id;
+    DELETE FROM doc_type_stats_cascaded h USING old_rows o WHERE h.parent_id = o.id;
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+CREATE OR REPLACE FUNCTION doc_type_stats_embeddings_delete_trg() RETURNS trigger AS $$
+BEGIN
+    -- Direct deletes: the chunk is still there.
+    PERFORM doc_type_stats_add(t.doc_type, 0, 0, -t.embeddings, 0, -t.embedding_bytes)
+    FROM (
+        SELECT d.doc_type, COUNT(*) AS embeddings,
+               COALESCE(SUM(pg_column_size(o.embedding)), 0) AS embedding_bytes
+        FROM old_rows o
+        JOIN chunks c ON c.id = o.chunk_id
+        JOIN documents d ON d.id = c.document_id
+        GROUP BY d.doc_type ORDER BY d.doc_type
+    ) t;
+    -- Cascaded from a chunk delete: hand the totals to its trigger.
+    INSERT INTO doc_type_stats_cascaded (parent_id, embedding_count, embedding_bytes)
+    SELECT o.chunk_id, COUNT(*), COALESCE(SUM(pg_column_size(o.embedding)), 0)
+    FROM old_rows o
+    WHERE NOT EXISTS (SELECT 1 FROM chunks c WHERE c.id = o.chunk_id)
+    GROUP BY o.chunk_id;
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+CREATE OR REPLACE FUNCTION doc_type_stats_truncate_trg() RETURNS trigger AS $$
+BEGIN
+    PERFORM doc_type_stats_rebuild();
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+DROP TRIGGER IF EXISTS trg_documents_stats_insert ON documents;
+CREATE TRIGGER trg_documents_stats_insert AFTER INSERT ON documents
+    REFERENCING NEW TABLE AS new_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION doc_type_stats_documents_insert_trg();
+DROP TRIGGER IF EXISTS trg_documents_stats_delete ON documents;
+CREATE TRIGGER trg_documents_stats_delete AFTER DELETE ON documents
+    REFERENCING OLD TABLE AS old_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION doc_type_stats_documents_delete_trg();
+DROP TRIGGER IF EXISTS trg_chunks_stats_insert ON chunks;
+CREATE TRIGGER trg_chunks_stats_insert AFTER INSERT ON chunks
+    REFERENCING NEW TABLE AS new_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION doc_type_stats_chunks_insert_trg();
+DROP TRIGGER IF EXISTS trg_chunks_stats_delete ON chunks;
+CREATE TRIGGER trg_chunks_stats_delete AFTER DELETE ON chunks
+    REFERENCING OLD TABLE AS old_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION doc_type_stats_chunks_delete_trg();
+DROP TRIGGER IF EXISTS trg_embeddings_stats_insert ON embeddings;
+CREATE TRIGGER trg_embeddings_stats_insert AFTER INSERT ON embeddings
+    REFERENCING NEW TABLE AS new_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION doc_type_stats_embeddings_insert_trg();
+DROP TRIGGER IF EXISTS trg_embeddings_stats_delete ON embeddings;
+CREATE TRIGGER trg_embeddings_stats_delete AFTER DELETE ON embeddings
+    REFERENCING OLD TABLE AS old_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION doc_type_stats_embeddings_delete_trg();
+DROP TRIGGER IF EXISTS trg_documents_stats_truncate ON documents;
+CREATE TRIGGER trg_documents_stats_truncate AFTER TRUNCATE ON documents
+    FOR EACH STATEMENT EXECUTE FUNCTION doc_type_stats_truncate_trg();
+DROP TRIGGER IF EXISTS trg_chunks_stats_truncate ON chunks;
+CREATE TRIGGER trg_chunks_stats_truncate AFTER TRUNCATE ON chunks
+    FOR EACH STATEMENT EXECUTE FUNCTION doc_type_stats_truncate_trg();
+DROP TRIGGER IF EXISTS trg_embeddings_stats_truncate ON embeddings;
+CREATE TRIGGER trg_embeddings_stats_truncate AFTER TRUNCATE ON embeddings
+    FOR EACH STATEMENT EXECUTE FUNCTION doc_type_stats_truncate_trg();
+
+-- Row-level trigger functions replaced by the statement-level ones above.
+DROP FUNCTION IF EXISTS doc_type_stats_documents_trg();
+DROP FUNCTION IF EXISTS doc_type_stats_chunks_trg();
+DROP FUNCTION IF EXISTS doc_type_stats_embeddings_trg();
+
+SELECT doc_type_stats_rebuild();
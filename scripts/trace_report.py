@@ -0,0 +1,90 @@
+"""Print the span tree and critical path of an exported trace.
+
+Reads the OTLP/JSON lines written when TRACE_EXPORT_PATH is set and shows, for
+one trace, every span with its duration, then the critical path (the chain of
+spans that determined the end-to-end latency) and total time per operation.
+
+Usage:
+    python -m scripts.trace_report [--path logs/traces.jsonl]
+        [--root job_matching.analyze_match] [--trace-id <hex>]
+"""
+
+import argparse
+from collections import defaultdict
+
+from rag_project.config import TRACE_EXPORT_PATH
+from rag_project.tracing import critical_path, load_traces
+
+DEFAULT_ROOT = "job_matching.analyze_match"
+SHOWN_ATTRIBUTES = (
+    "requirement.name",
+    "llm.model",
+    "llm.prompt_tokens",
+    "llm.completion_tokens",
+    "embedding.batch_size",
+    "db.rows",
+)
+
+
+def _pick_trace(traces, trace_id: str | None, root_name: str):
+    for spans in reversed(traces):
+        if trace_id and spans and spans[0].trace_id == trace_id:
+            return spans
+        if not trace_id and any(
+            s.name == root_name and not s.parent_span_id for s in spans
+        ):
+            return spans
+    return None
+
+
+def _print_tree(spans, on_path: set) -> None:
+    children = defaultdict(list)
+    for span in spans:
+        children[span.parent_span_id].append(span)
+
+    def show(span, depth: int) -> None:
+        marker = "*" if span.span_id in on_path else " "
+        attrs = " ".join(
+            f"{k}={span.attributes[k]}"
+            for k in SHOWN_ATTRIBUTES
+            if k in span.attributes
+        )
+        print(
+            f"{marker} {span.duration_ms:>9.1f} ms  {'  ' * depth}{span.name}  {attrs}"
+        )
+        for child in sorted(children[span.span_id], key=lambda s: s.start_ns):
+            show(child, depth + 1)
+
+    for root in children[""]:
+        show(root, 0)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Show a trace's critical path")
+    parser.add_argument("--path", default=TRACE_EXPORT_PATH or "logs/traces.jsonl")
+    parser.add_argument("--root", default=DEFAULT_ROOT, help="root span name")
+    parser.add_argument("--trace-id", help="trace to show instead of the latest")
+    args = parser.parse_args()
+
+    spans = _pick_trace(load_traces(args.path), args.trace_id, args.root)
+    if not spans:
+        raise SystemExit(f"No matching trace in {args.path}")
+
+    path = critical_path(spans)
+    print(f"trace {spans[0].trace_id}  (* = critical path)")
+    _print_tree(spans, {s.span_id for s in path})
+
+    # Self time on the path: a span's duration minus its children on the path.
+    self_ms = defaultdict(float)
+    for span in path:
+        covered = sum(c.duration_ms for c in path if c.parent_span_id == span.span_id)
+        self_ms[span.name] += span.duration_ms - covered
+    total = path[0].duration_ms if path else 0.0
+    print(f"\n{'operation':<40}{'ms':>10}{'share':>8}")
+    for name, ms in sorted(self_ms.items(), key=lambda kv: kv[1], reverse=True):
+        share = ms / total * 100 if total else 0.0
+        print(f"{name:<40}{ms:>10.1f}{share:>7.1f}%")
+
+
+if __name__ == "__main__":
+    main()